@@ -32,6 +32,12 @@ def get_cognitive_hub() -> CognitiveHub:
     return _cognitive_hub
 
 
+def shutdown_cognitive_hub() -> None:
+    """Flush the cognitive hub, if one was created (call during app shutdown)."""
+    if _cognitive_hub is not None:
+        _cognitive_hub.shutdown()
+
+
 # Request/Response Models
 class DecisionRequest(BaseModel):
     """Request for cognitive decision enhancement."""
@@ -69,6 +75,9 @@ class OutcomeRecord(BaseModel):
     outcome_pnl_percent: float
     holding_period_hours: float
     current_prices: dict[str, float]
+    price_path: list[float] | None = Field(
+        None, description="Prices after entry, one per bar, for grid counterfactuals"
+    )
 
 
 # API Endpoints
@@ -153,6 +162,7 @@ async def record_outcome(record: OutcomeRecord) -> dict[str, str]:
             outcome_pnl_percent=record.outcome_pnl_percent,
             holding_period_hours=record.holding_period_hours,
             current_prices=record.current_prices,
+            price_path=record.price_path,
         )
 
         return {"status": "success", "message": f"Outcome recorded for {record.ticker}"}
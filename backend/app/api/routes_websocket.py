@@ -38,7 +38,7 @@ async def websocket_market_data(websocket: WebSocket):
                 symbols = data.get("symbols", [])
                 if symbols:
                     logger.info(f"WebSocket subscribing to symbols: {symbols}")
-                    await market_streamer.start_streaming(symbols)
+                    await market_streamer.subscribe(websocket, symbols)
 
                     # Send acknowledgment
                     await connection_manager.send_json_personal(
@@ -55,7 +55,7 @@ async def websocket_market_data(websocket: WebSocket):
                 symbols = data.get("symbols", [])
                 if symbols:
                     logger.info(f"WebSocket unsubscribing from symbols: {symbols}")
-                    await market_streamer.stop_streaming(symbols)
+                    await market_streamer.unsubscribe(websocket, symbols)
 
                     # Send acknowledgment
                     await connection_manager.send_json_personal(
@@ -78,6 +78,7 @@ async def websocket_market_data(websocket: WebSocket):
     except Exception as e:
         logger.error(f"WebSocket market data error: {e}")
     finally:
+        await market_streamer.unsubscribe(websocket)
         connection_manager.disconnect(websocket)
 
 
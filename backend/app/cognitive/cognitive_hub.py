@@ -188,6 +188,7 @@ class CognitiveHub:
         outcome_pnl_percent: float,
         holding_period_hours: float,
         current_prices: dict[str, float],
+        price_path: list[float] | None = None,
     ) -> None:
         """
         Record a completed decision and its outcome across all cognitive systems.
@@ -204,6 +205,7 @@ class CognitiveHub:
             outcome_pnl_percent: P&L percentage
             holding_period_hours: How long position was held
             current_prices: Current market prices for counterfactual analysis
+            price_path: Prices after entry, one per bar, for grid counterfactuals
         """
         timestamp = datetime.utcnow().isoformat()
         regime = market_context.get("regime", "unknown")
@@ -246,7 +248,7 @@ class CognitiveHub:
         # Perform counterfactual analysis
         if self.counterfactual_engine:
             self.counterfactual_engine.analyze_decision(
-                decision, outcome, current_prices
+                decision, outcome, current_prices, price_path=price_path
             )
 
         # Store episode in memory
@@ -275,6 +277,11 @@ class CognitiveHub:
 
             self.episodic_memory.store_episode(episode)
 
+    def shutdown(self) -> None:
+        """Flush state that is only persisted in batches."""
+        if self.counterfactual_engine:
+            self.counterfactual_engine.flush_spill()
+
     def get_system_status(self) -> dict[str, Any]:
         """Get status of all cognitive systems."""
         status = {
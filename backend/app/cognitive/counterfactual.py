@@ -2,7 +2,8 @@
 Counterfactual Reasoning Engine for ZiggyAI
 
 Enables learning from the road not taken by:
-1. Simulating alternative decisions in parallel shadow portfolios
+1. Simulating alternative decisions in parallel shadow portfolios and over a
+   grid of (action, size, holding horizon) alternatives on the realized path
 2. Comparing actual outcomes to counterfactual alternatives
 3. Learning from opportunity costs and missed chances
 4. Minimizing regret through better decision calibration
@@ -11,14 +12,28 @@ Enables learning from the road not taken by:
 from __future__ import annotations
 
 import logging
+from collections import Counter, deque
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Aggregate dimensions maintained incrementally by CounterfactualEngine
+BREAKDOWN_DIMENSIONS = ("action", "regime", "ticker")
+
+# Lesson counts are pruned back to this many distinct entries once they double
+MAX_TRACKED_LESSONS = 256
+
+# Default counterfactual grid: position size multipliers and holding horizons
+# (in bars of the forward price path)
+DEFAULT_SIZE_MULTIPLIERS = (0.25, 0.5, 1.0, 1.5, 2.0)
+DEFAULT_HOLDING_HORIZONS = (1, 2, 4, 8, 24)
+
 
 class ActionType(Enum):
     """Possible trading actions."""
@@ -127,8 +142,185 @@ class CounterfactualAnalysis:
     should_have_acted_differently: bool = False
     key_lessons: list[str] = field(default_factory=list)
 
+    # Regret over every simulated alternative (see regret_distribution())
+    regret_distribution: dict[str, float] = field(default_factory=dict)
+
     analyzed_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
 
+    def to_event(self) -> dict[str, Any]:
+        """Build an event-store payload for offline analysis.
+
+        The analysis is nested under "counterfactual" so decision-event readers
+        (which match on top-level ticker/decision/outcome) do not pick it up.
+        """
+        decision = self.actual_decision
+        analysis = {
+            "ticker": decision.ticker,
+            "decision_id": self.decision_id,
+            "decision": {
+                "timestamp": decision.timestamp,
+                "action": decision.action.value,
+                "quantity": decision.quantity,
+                "entry_price": decision.entry_price,
+                "market_regime": decision.market_regime,
+                "confidence": decision.confidence,
+                "strategy_name": decision.strategy_name,
+                "signal_name": decision.signal_name,
+            },
+            "outcome": self.actual_outcome.to_dict(),
+            "counterfactuals": [
+                {
+                    "action": cf.alternative_action.value,
+                    "quantity": cf.alternative_quantity,
+                    "pnl": cf.simulated_outcome.pnl if cf.simulated_outcome else None,
+                    "opportunity_cost": cf.opportunity_cost,
+                    "regret_score": cf.regret_score,
+                }
+                for cf in self.counterfactuals
+            ],
+            "best_alternative": (
+                self.best_alternative.value if self.best_alternative else None
+            ),
+            "worst_alternative": (
+                self.worst_alternative.value if self.worst_alternative else None
+            ),
+            "total_opportunity_cost": self.total_opportunity_cost,
+            "regret_score": self.regret_score,
+            "should_have_acted_differently": self.should_have_acted_differently,
+            "key_lessons": list(self.key_lessons),
+            "regret_distribution": dict(self.regret_distribution),
+        }
+        return {
+            "event_type": "counterfactual_analysis",
+            "kind": "counterfactual",
+            "ts": self.analyzed_at,
+            "counterfactual": analysis,
+        }
+
+
+# Grid actions and their PnL direction per unit of price move
+GRID_ACTIONS = (ActionType.BUY, ActionType.SELL, ActionType.HOLD)
+_GRID_DIRECTIONS = np.array([1.0, -1.0, 0.0])
+
+
+@dataclass
+class CounterfactualGrid:
+    """PnL of every (action, size multiplier, holding horizon) alternative."""
+
+    entry_price: float
+    base_quantity: float
+    size_multipliers: np.ndarray
+    horizons: np.ndarray
+    exit_prices: np.ndarray  # price at each horizon, shape (horizons,)
+    pnl: np.ndarray  # shape (len(GRID_ACTIONS), sizes, horizons)
+
+    def alternative_pnls(self) -> np.ndarray:
+        """Flat PnL of distinct alternatives; HOLD is a single zero-PnL point."""
+        directional = self.pnl[_GRID_DIRECTIONS != 0].ravel()
+        return np.append(directional, 0.0)
+
+    def best_variant(self, action: ActionType) -> tuple[int, int]:
+        """(size index, horizon index) of the most profitable variant of action."""
+        pnl = self.pnl[GRID_ACTIONS.index(action)]
+        size_idx, horizon_idx = np.unravel_index(np.argmax(pnl), pnl.shape)
+        return int(size_idx), int(horizon_idx)
+
+
+def simulate_counterfactual_grid(
+    entry_price: float,
+    price_path: Sequence[float] | np.ndarray,
+    base_quantity: float,
+    size_multipliers: Sequence[float] = DEFAULT_SIZE_MULTIPLIERS,
+    horizons: Sequence[int] = DEFAULT_HOLDING_HORIZONS,
+) -> CounterfactualGrid:
+    """
+    Simulate every grid alternative against a forward price path in one pass.
+
+    Args:
+        entry_price: Price the decision was made at
+        price_path: Realized prices after entry, one per bar
+        base_quantity: Position size that multipliers scale
+        size_multipliers: Position size multipliers to evaluate
+        horizons: Holding horizons in bars; horizons past the end of the path
+            exit at its last price
+
+    Returns:
+        Grid with PnL for each (action, size multiplier, horizon)
+    """
+    path = np.asarray(price_path, dtype=float)
+    if path.ndim != 1 or path.size == 0:
+        raise ValueError("price_path must be a non-empty 1-D sequence of prices")
+
+    horizon_arr = np.asarray(horizons, dtype=int)
+    multipliers = np.asarray(size_multipliers, dtype=float)
+    exit_prices = path[np.clip(horizon_arr, 1, path.size) - 1]
+    pnl = (
+        _GRID_DIRECTIONS[:, None, None]
+        * (base_quantity * multipliers)[None, :, None]
+        * (exit_prices - entry_price)[None, None, :]
+    )
+    return CounterfactualGrid(
+        entry_price=entry_price,
+        base_quantity=base_quantity,
+        size_multipliers=multipliers,
+        horizons=horizon_arr,
+        exit_prices=exit_prices,
+        pnl=pnl,
+    )
+
+
+def regret_distribution(
+    alternative_pnls: Sequence[float] | np.ndarray, actual_pnl: float
+) -> dict[str, float]:
+    """Summarize regret (alternative PnL above actual, floored at 0)."""
+    pnls = np.asarray(alternative_pnls, dtype=float)
+    if pnls.size == 0:
+        return {}
+
+    regret = np.maximum(pnls - actual_pnl, 0.0)
+    median, p90 = np.percentile(regret, [50, 90])
+    return {
+        "n_alternatives": int(pnls.size),
+        "mean": float(regret.mean()),
+        "median": float(median),
+        "p90": float(p90),
+        "max": float(regret.max()),
+        "prob_better": float(np.mean(pnls > actual_pnl)),
+    }
+
+
+@dataclass
+class RegretAggregate:
+    """Running regret and opportunity-cost totals for one breakdown key."""
+
+    count: int = 0
+    total_regret: float = 0.0
+    total_opportunity_cost: float = 0.0
+    acted_differently_count: int = 0
+
+    def add(self, analysis: CounterfactualAnalysis) -> None:
+        """Fold one analysis into the running totals."""
+        self.count += 1
+        self.total_regret += analysis.regret_score
+        self.total_opportunity_cost += analysis.total_opportunity_cost
+        if analysis.should_have_acted_differently:
+            self.acted_differently_count += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary with averages."""
+        return {
+            "decisions_analyzed": self.count,
+            "total_regret": self.total_regret,
+            "avg_regret": self.total_regret / self.count if self.count else 0.0,
+            "total_opportunity_cost": self.total_opportunity_cost,
+            "avg_opportunity_cost": (
+                self.total_opportunity_cost / self.count if self.count else 0.0
+            ),
+            "should_have_acted_differently_percent": (
+                self.acted_differently_count / self.count * 100 if self.count else 0.0
+            ),
+        }
+
 
 class ShadowPortfolio:
     """
@@ -138,7 +330,11 @@ class ShadowPortfolio:
     """
 
     def __init__(
-        self, name: str, strategy_description: str, initial_cash: float = 100000.0
+        self,
+        name: str,
+        strategy_description: str,
+        initial_cash: float = 100000.0,
+        max_trade_history: int = 1000,
     ):
         """
         Initialize shadow portfolio.
@@ -147,15 +343,16 @@ class ShadowPortfolio:
             name: Portfolio identifier
             strategy_description: What alternative strategy this represents
             initial_cash: Starting capital
+            max_trade_history: Number of recent trades kept in trade_history
         """
         self.name = name
         self.strategy_description = strategy_description
         self.cash = initial_cash
         self.initial_cash = initial_cash
 
-        # Positions and trade history
+        # Open positions and a bounded window of recent trades
         self.positions: dict[str, dict[str, float]] = {}
-        self.trade_history: list[dict[str, Any]] = []
+        self.trade_history: deque[dict[str, Any]] = deque(maxlen=max_trade_history)
 
         # Performance metrics
         self.total_pnl = 0.0
@@ -207,8 +404,11 @@ class ShadowPortfolio:
             pnl = (price - cost_basis) * quantity
             self.total_pnl += pnl
 
-            # Update position
+            # Update position; closed positions are dropped so valuation only
+            # walks what is still open
             self.positions[ticker]["quantity"] -= quantity
+            if self.positions[ticker]["quantity"] <= 0:
+                del self.positions[ticker]
             self.cash += quantity * price
 
             # Track win/loss
@@ -255,7 +455,15 @@ class CounterfactualEngine:
     """
 
     def __init__(
-        self, enable_shadow_portfolios: bool = True, track_all_alternatives: bool = True
+        self,
+        enable_shadow_portfolios: bool = True,
+        track_all_alternatives: bool = True,
+        max_history: int = 1000,
+        spill_batch_size: int = 100,
+        spill_sink: Callable[[list[dict[str, Any]]], Any] | None = None,
+        size_multipliers: Sequence[float] = DEFAULT_SIZE_MULTIPLIERS,
+        holding_horizons: Sequence[int] = DEFAULT_HOLDING_HORIZONS,
+        bar_hours: float = 1.0,
     ):
         """
         Initialize counterfactual engine.
@@ -263,9 +471,19 @@ class CounterfactualEngine:
         Args:
             enable_shadow_portfolios: Whether to maintain shadow portfolios
             track_all_alternatives: Whether to track all possible alternatives
+            max_history: Number of recent analyses kept in memory
+            spill_batch_size: Evicted analyses buffered before each spill write
+            spill_sink: Receives batches of evicted analyses as event payloads;
+                defaults to the event store's write_batch
+            size_multipliers: Position size multipliers in the counterfactual grid
+            holding_horizons: Holding horizons (in price-path bars) in the grid
+            bar_hours: Duration of one price-path bar in hours
         """
         self.enable_shadow_portfolios = enable_shadow_portfolios
         self.track_all_alternatives = track_all_alternatives
+        self.size_multipliers = tuple(size_multipliers)
+        self.holding_horizons = tuple(holding_horizons)
+        self.bar_hours = bar_hours
 
         # Shadow portfolios for different strategies
         self.shadow_portfolios: dict[str, ShadowPortfolio] = {}
@@ -274,13 +492,23 @@ class CounterfactualEngine:
         if enable_shadow_portfolios:
             self._initialize_shadow_portfolios()
 
-        # Counterfactual analysis history
-        self.analyses: list[CounterfactualAnalysis] = []
+        # Recent analyses; older ones spill to the event store on eviction
+        self.analyses: deque[CounterfactualAnalysis] = deque(maxlen=max_history)
+        self.spill_batch_size = spill_batch_size
+        self.spill_sink = spill_sink or _write_to_event_store
+        self._spill_buffer: list[dict[str, Any]] = []
+        self.spilled_count = 0
 
-        # Learning metrics
+        # Learning metrics, maintained incrementally over all analyses
         self.total_regret = 0.0
         self.total_opportunity_cost = 0.0
         self.decisions_analyzed = 0
+        self.should_have_acted_differently_count = 0
+        self.best_alternative_counts: dict[str, int] = {}
+        self.lesson_counts: Counter[str] = Counter()
+        self.breakdowns: dict[str, dict[str, RegretAggregate]] = {
+            dimension: {} for dimension in BREAKDOWN_DIMENSIONS
+        }
 
         logger.info("CounterfactualEngine initialized")
 
@@ -304,6 +532,7 @@ class CounterfactualEngine:
         decision: TradingDecision,
         actual_outcome: Outcome,
         current_prices: dict[str, float],
+        price_path: Sequence[float] | np.ndarray | None = None,
     ) -> CounterfactualAnalysis:
         """
         Perform counterfactual analysis on a completed decision.
@@ -312,16 +541,29 @@ class CounterfactualEngine:
             decision: The actual decision that was made
             actual_outcome: The actual outcome that occurred
             current_prices: Current market prices for portfolio valuation
+            price_path: Realized prices after entry, one per bar; when given,
+                alternatives are simulated over the full size/horizon grid
 
         Returns:
             Complete counterfactual analysis
         """
         decision_id = f"{decision.ticker}_{decision.timestamp}"
 
-        # Generate counterfactual scenarios
-        counterfactuals = self._generate_counterfactuals(
-            decision, actual_outcome, current_prices
-        )
+        # Generate counterfactual scenarios: the best variant of each action on
+        # the grid when the forward path is known, else three point estimates
+        if price_path is not None and len(price_path) > 0:
+            grid = self.simulate_grid(decision, price_path)
+            counterfactuals = self._grid_counterfactuals(decision, grid)
+            alternative_pnls = grid.alternative_pnls()
+        else:
+            counterfactuals = self._generate_counterfactuals(
+                decision, actual_outcome, current_prices
+            )
+            alternative_pnls = [
+                cf.simulated_outcome.pnl
+                for cf in counterfactuals
+                if cf.simulated_outcome
+            ]
 
         # Find best and worst alternatives
         best_alternative = None
@@ -374,15 +616,13 @@ class CounterfactualEngine:
             regret_score=regret_score,
             should_have_acted_differently=should_have_acted_differently,
             key_lessons=key_lessons,
+            regret_distribution=regret_distribution(
+                alternative_pnls, actual_outcome.pnl
+            ),
         )
 
-        # Update metrics
-        self.total_regret += regret_score
-        self.total_opportunity_cost += total_opportunity_cost
-        self.decisions_analyzed += 1
-
-        # Store analysis
-        self.analyses.append(analysis)
+        # Update metrics and store analysis
+        self._record_analysis(analysis)
 
         # Update shadow portfolios
         if self.enable_shadow_portfolios:
@@ -396,6 +636,60 @@ class CounterfactualEngine:
 
         return analysis
 
+    def _record_analysis(self, analysis: CounterfactualAnalysis) -> None:
+        """Fold an analysis into the aggregates and the bounded history."""
+        self.total_regret += analysis.regret_score
+        self.total_opportunity_cost += analysis.total_opportunity_cost
+        self.decisions_analyzed += 1
+        if analysis.should_have_acted_differently:
+            self.should_have_acted_differently_count += 1
+        if analysis.best_alternative:
+            key = analysis.best_alternative.value
+            self.best_alternative_counts[key] = (
+                self.best_alternative_counts.get(key, 0) + 1
+            )
+
+        self.lesson_counts.update(analysis.key_lessons)
+        if len(self.lesson_counts) > 2 * MAX_TRACKED_LESSONS:
+            self.lesson_counts = Counter(
+                dict(self.lesson_counts.most_common(MAX_TRACKED_LESSONS))
+            )
+
+        decision = analysis.actual_decision
+        keys = (decision.action.value, decision.market_regime, decision.ticker)
+        for dimension, key in zip(BREAKDOWN_DIMENSIONS, keys, strict=True):
+            bucket = self.breakdowns[dimension].get(key)
+            if bucket is None:
+                bucket = self.breakdowns[dimension][key] = RegretAggregate()
+            bucket.add(analysis)
+
+        if len(self.analyses) == self.analyses.maxlen:
+            self._spill_buffer.append(self.analyses[0].to_event())
+            if len(self._spill_buffer) >= self.spill_batch_size:
+                self.flush_spill()
+        self.analyses.append(analysis)
+
+    def flush_spill(self) -> int:
+        """
+        Write buffered evicted analyses to the spill sink.
+
+        Returns:
+            Number of analyses written; a failed write drops the batch so the
+            buffer stays bounded
+        """
+        if not self._spill_buffer:
+            return 0
+
+        batch, self._spill_buffer = self._spill_buffer, []
+        try:
+            self.spill_sink(batch)
+        except Exception as e:
+            logger.warning(f"Failed to spill {len(batch)} counterfactual analyses: {e}")
+            return 0
+
+        self.spilled_count += len(batch)
+        return len(batch)
+
     def _generate_counterfactuals(
         self,
         decision: TradingDecision,
@@ -446,6 +740,60 @@ class CounterfactualEngine:
 
         return counterfactuals
 
+    def simulate_grid(
+        self,
+        decision: TradingDecision,
+        price_path: Sequence[float] | np.ndarray,
+    ) -> CounterfactualGrid:
+        """Simulate the engine's size/horizon grid for a decision."""
+        return simulate_counterfactual_grid(
+            decision.entry_price,
+            price_path,
+            base_quantity=decision.quantity if decision.quantity > 0 else 100,
+            size_multipliers=self.size_multipliers,
+            horizons=self.holding_horizons,
+        )
+
+    def _grid_counterfactuals(
+        self, decision: TradingDecision, grid: CounterfactualGrid
+    ) -> list[CounterfactualScenario]:
+        """Turn the best grid variant of each action into a scenario."""
+        counterfactuals = []
+        exit_timestamp = datetime.utcnow().isoformat()
+
+        for action_idx, action in enumerate(GRID_ACTIONS):
+            size_idx, horizon_idx = grid.best_variant(action)
+            direction = _GRID_DIRECTIONS[action_idx]
+            if direction == 0:
+                quantity, exit_price, holding_hours = 0.0, grid.entry_price, 0.0
+            else:
+                quantity = grid.base_quantity * grid.size_multipliers[size_idx]
+                exit_price = grid.exit_prices[horizon_idx]
+                holding_hours = grid.horizons[horizon_idx] * self.bar_hours
+
+            price_change = direction * (exit_price - grid.entry_price)
+            counterfactuals.append(
+                CounterfactualScenario(
+                    alternative_action=action,
+                    alternative_quantity=float(quantity),
+                    simulated_outcome=Outcome(
+                        decision_id=f"{decision.ticker}_counterfactual",
+                        exit_timestamp=exit_timestamp,
+                        exit_price=float(exit_price),
+                        pnl=float(grid.pnl[action_idx, size_idx, horizon_idx]),
+                        pnl_percent=float(price_change / grid.entry_price * 100),
+                        holding_period_hours=float(holding_hours),
+                    ),
+                    decision_factors=[
+                        f"Confidence was {decision.confidence:.2f}",
+                        f"Market regime was {decision.market_regime}",
+                        f"Best of {grid.pnl[0].size} size/horizon variants",
+                    ],
+                )
+            )
+
+        return counterfactuals
+
     def _simulate_outcome(
         self,
         original_decision: TradingDecision,
@@ -593,11 +941,8 @@ class CounterfactualEngine:
 
         for name, portfolio in self.shadow_portfolios.items():
             total_return = portfolio.get_return_percent(current_prices)
-            win_rate = (
-                portfolio.win_count / (portfolio.win_count + portfolio.loss_count)
-                if portfolio.total_trades > 0
-                else 0.0
-            )
+            closed_trades = portfolio.win_count + portfolio.loss_count
+            win_rate = portfolio.win_count / closed_trades if closed_trades else 0.0
 
             performance[name] = {
                 "strategy": portfolio.strategy_description,
@@ -613,7 +958,7 @@ class CounterfactualEngine:
 
     def get_aggregate_insights(self) -> dict[str, Any]:
         """Get aggregate insights from all counterfactual analyses."""
-        if not self.analyses:
+        if not self.decisions_analyzed:
             return {
                 "decisions_analyzed": 0,
                 "total_regret": 0.0,
@@ -621,23 +966,6 @@ class CounterfactualEngine:
                 "total_opportunity_cost": 0.0,
             }
 
-        # Count how often we should have acted differently
-        should_have_acted_differently_count = sum(
-            1 for a in self.analyses if a.should_have_acted_differently
-        )
-
-        # Find most common lessons
-        all_lessons = []
-        for analysis in self.analyses:
-            all_lessons.extend(analysis.key_lessons)
-
-        # Most common alternative actions
-        alternative_actions = {}
-        for analysis in self.analyses:
-            if analysis.best_alternative:
-                key = analysis.best_alternative.value
-                alternative_actions[key] = alternative_actions.get(key, 0) + 1
-
         return {
             "decisions_analyzed": self.decisions_analyzed,
             "total_regret": self.total_regret,
@@ -646,8 +974,44 @@ class CounterfactualEngine:
             "avg_opportunity_cost": self.total_opportunity_cost
             / self.decisions_analyzed,
             "should_have_acted_differently_percent": (
-                should_have_acted_differently_count / self.decisions_analyzed * 100
+                self.should_have_acted_differently_count / self.decisions_analyzed * 100
             ),
-            "most_common_lessons": list(set(all_lessons))[:5],
-            "best_alternative_actions": alternative_actions,
+            "most_common_lessons": [
+                lesson for lesson, _ in self.lesson_counts.most_common(5)
+            ],
+            "best_alternative_actions": dict(self.best_alternative_counts),
+            "by_action": self.get_regret_breakdown("action"),
+            "by_regime": self.get_regret_breakdown("regime"),
         }
+
+    def get_regret_breakdown(
+        self, dimension: str, key: str | None = None
+    ) -> dict[str, Any]:
+        """
+        Get regret and opportunity-cost aggregates for one dimension.
+
+        Args:
+            dimension: One of "action", "regime" or "ticker"
+            key: Return only this action/regime/ticker's aggregate
+
+        Returns:
+            Aggregates keyed by dimension value, or a single aggregate if key
+            is given
+        """
+        if dimension not in self.breakdowns:
+            raise ValueError(
+                f"Unknown breakdown dimension {dimension!r}; "
+                f"expected one of {BREAKDOWN_DIMENSIONS}"
+            )
+
+        buckets = self.breakdowns[dimension]
+        if key is not None:
+            return buckets.get(key, RegretAggregate()).to_dict()
+        return {name: bucket.to_dict() for name, bucket in buckets.items()}
+
+
+def _write_to_event_store(events: list[dict[str, Any]]) -> None:
+    """Default spill sink: append evicted analyses to the event store."""
+    from app.memory.events import write_batch
+
+    write_batch(events)
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -23,6 +24,36 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Per-strategy scalar columns: name -> (dtype, default)
+_STRATEGY_FIELDS: dict[str, tuple[type, float]] = {
+    "total_predictions": (np.int64, 0),
+    "correct_predictions": (np.int64, 0),
+    "total_profit": (np.float64, 0.0),
+    "sharpe_ratio": (np.float64, 0.0),
+    "max_drawdown": (np.float64, 0.0),
+    "generation": (np.int64, 0),
+}
+
+# Per-(strategy, regime) matrices: name -> (dtype, default)
+_REGIME_FIELDS: dict[str, tuple[type, float]] = {
+    "predictions": (np.int64, 0),
+    "correct": (np.int64, 0),
+    "profit": (np.float64, 0.0),
+}
+
+# Numeric parameter kinds, stored as one-letter codes per parameter column
+_KIND_TYPES: dict[str, type] = {"b": bool, "i": int, "f": float}
+
+# Default strategies are never pruned
+PROTECTED_STRATEGIES = frozenset(
+    {
+        "momentum_aggressive",
+        "contrarian_conservative",
+        "balanced_default",
+        "volatility_adaptive",
+    }
+)
+
 
 class LearningStrategyType(Enum):
     """Types of learning strategies."""
@@ -103,6 +134,45 @@ class LearningStrategy:
             return 0.0
         return self.regime_performance[regime].get("accuracy", 0.0)
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "name": self.name,
+            "strategy_type": self.strategy_type.value,
+            "parameters": self.parameters,
+            "total_predictions": self.total_predictions,
+            "correct_predictions": self.correct_predictions,
+            "total_profit": self.total_profit,
+            "sharpe_ratio": self.sharpe_ratio,
+            "max_drawdown": self.max_drawdown,
+            "regime_performance": self.regime_performance,
+            "generation": self.generation,
+            "parent_strategies": self.parent_strategies,
+            "mutations": self.mutations,
+            "created_at": self.created_at,
+            "last_updated": self.last_updated,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LearningStrategy:
+        """Create from dictionary."""
+        return cls(
+            name=data["name"],
+            strategy_type=LearningStrategyType(data["strategy_type"]),
+            parameters=data["parameters"],
+            total_predictions=data.get("total_predictions", 0),
+            correct_predictions=data.get("correct_predictions", 0),
+            total_profit=data.get("total_profit", 0.0),
+            sharpe_ratio=data.get("sharpe_ratio", 0.0),
+            max_drawdown=data.get("max_drawdown", 0.0),
+            regime_performance=data.get("regime_performance", {}),
+            generation=data.get("generation", 0),
+            parent_strategies=data.get("parent_strategies", []),
+            mutations=data.get("mutations", []),
+            created_at=data.get("created_at", datetime.utcnow().isoformat()),
+            last_updated=data.get("last_updated", datetime.utcnow().isoformat()),
+        )
+
 
 @dataclass
 class MetaLearningState:
@@ -132,6 +202,12 @@ class MetaLearner:
     3. Automatic Selection: Chooses best strategy for current conditions
     4. Strategy Evolution: Creates new strategies via genetic programming
     5. Adaptive Optimization: Continuously improves strategy portfolio
+
+    Strategy statistics, per-regime performance and numeric parameters are
+    stored as NumPy arrays (one row per strategy) so selection, crossover,
+    mutation and pruning are array operations; `strategies` returns
+    LearningStrategy snapshots. Changes are persisted as generation deltas
+    appended to strategies.jsonl.
     """
 
     def __init__(
@@ -139,6 +215,9 @@ class MetaLearner:
         strategies_dir: Path | None = None,
         evolution_frequency: int = 100,  # Evolve after N trades
         min_strategy_samples: int = 20,  # Min samples before strategy evaluation
+        mutation_rate: float = 0.2,
+        journal_compact_every: int = 100,
+        seed: int | None = None,
     ):
         """
         Initialize meta-learner.
@@ -147,15 +226,50 @@ class MetaLearner:
             strategies_dir: Directory to save/load strategies
             evolution_frequency: How often to evolve new strategies
             min_strategy_samples: Minimum predictions before evaluating strategy
+            mutation_rate: Chance to mutate each numeric parameter of offspring
+            journal_compact_every: Deltas appended before the journal is
+                rewritten as a single snapshot
+            seed: Seed for crossover and mutation randomness
         """
         self.strategies_dir = strategies_dir or Path("data/meta_learning")
         self.strategies_dir.mkdir(parents=True, exist_ok=True)
 
         self.evolution_frequency = evolution_frequency
         self.min_strategy_samples = min_strategy_samples
+        self.mutation_rate = mutation_rate
+        self.journal_compact_every = journal_compact_every
+        self.rng = np.random.default_rng(seed)
+
+        # Strategy rows: identity and metadata in lists, numbers in arrays
+        self._names: list[str] = []
+        self._index: dict[str, int] = {}
+        self._types: list[LearningStrategyType] = []
+        self._info: list[dict[str, Any]] = []
+        self._stats = {
+            name: np.full(0, default, dtype=dtype)
+            for name, (dtype, default) in _STRATEGY_FIELDS.items()
+        }
+
+        # Regime columns of the per-regime performance matrices
+        self._regimes: list[str] = []
+        self._regime_index: dict[str, int] = {}
+        self._regime_stats = {
+            name: np.full((0, 0), default, dtype=dtype)
+            for name, (dtype, default) in _REGIME_FIELDS.items()
+        }
+
+        # Numeric parameter columns (NaN where a strategy lacks the parameter)
+        self._param_keys: list[str] = []
+        self._param_index: dict[str, int] = {}
+        self._param_kinds: list[str] = []
+        self._params = np.full((0, 0), np.nan)
+
+        # Persistence: strategies changed or removed since the last delta
+        self._dirty: set[str] = set()
+        self._removed: set[str] = set()
+        self._evolutions = 0
+        self._journal_entries = 0
 
-        # Strategy portfolio
-        self.strategies: dict[str, LearningStrategy] = {}
         self.state = MetaLearningState(
             current_strategy="balanced_default", regime="unknown"
         )
@@ -166,7 +280,57 @@ class MetaLearner:
         # Load any saved strategies
         self._load_strategies()
 
-        logger.info(f"MetaLearner initialized with {len(self.strategies)} strategies")
+        logger.info(f"MetaLearner initialized with {len(self._names)} strategies")
+
+    @property
+    def strategies(self) -> dict[str, LearningStrategy]:
+        """Snapshot of every strategy as LearningStrategy objects (read-only)."""
+        return {name: self._snapshot(i) for i, name in enumerate(self._names)}
+
+    def get_strategy(self, name: str) -> LearningStrategy | None:
+        """Snapshot of a single strategy, or None if unknown."""
+        i = self._index.get(name)
+        return None if i is None else self._snapshot(i)
+
+    def add_strategy(self, strategy: LearningStrategy) -> None:
+        """Add a strategy to the portfolio, replacing one with the same name."""
+        i = self._index.get(strategy.name)
+        if i is None:
+            i = len(self._names)
+            self._ensure_capacity(rows=i + 1)
+            self._names.append(strategy.name)
+            self._types.append(strategy.strategy_type)
+            self._info.append({})
+            self._index[strategy.name] = i
+
+        self._types[i] = strategy.strategy_type
+        self._info[i] = {
+            "parent_strategies": list(strategy.parent_strategies),
+            "mutations": list(strategy.mutations),
+            "created_at": strategy.created_at,
+            "last_updated": strategy.last_updated,
+            "extra_parameters": {},
+        }
+        for name in _STRATEGY_FIELDS:
+            self._stats[name][i] = getattr(strategy, name)
+
+        for name, (_, default) in _REGIME_FIELDS.items():
+            self._regime_stats[name][i] = default
+        for regime, perf in strategy.regime_performance.items():
+            r = self._regime_column(regime)
+            for name in _REGIME_FIELDS:
+                self._regime_stats[name][i, r] = perf.get(name, 0)
+
+        self._params[i] = np.nan
+        for key, value in strategy.parameters.items():
+            if isinstance(value, (bool, int, float)):
+                j = self._param_column(key, value)  # may grow self._params
+                self._params[i, j] = value
+            else:
+                self._info[i]["extra_parameters"][key] = value
+
+        self._dirty.add(strategy.name)
+        self._removed.discard(strategy.name)
 
     def _initialize_default_strategies(self) -> None:
         """Create initial set of learning strategies."""
@@ -216,7 +380,42 @@ class MetaLearner:
         ]
 
         for strategy in default_strategies:
-            self.strategies[strategy.name] = strategy
+            self.add_strategy(strategy)
+
+    def _accuracies(self) -> np.ndarray:
+        """Overall accuracy of every strategy."""
+        n = len(self._names)
+        total = self._stats["total_predictions"][:n]
+        correct = self._stats["correct_predictions"][:n]
+        return np.where(total > 0, correct / np.maximum(total, 1), 0.0)
+
+    def selection_scores(self, regime: str) -> np.ndarray:
+        """
+        Selection score of every strategy for a regime.
+
+        Regime accuracy once a strategy has min_strategy_samples predictions in
+        the regime (overall accuracy before that), plus an exploration bonus
+        that shrinks with the number of predictions in the regime.
+        """
+        n = len(self._names)
+        r = self._regime_index.get(regime)
+        if r is None:
+            predictions = np.zeros(n, dtype=np.int64)
+            correct = np.zeros(n, dtype=np.int64)
+        else:
+            predictions = self._regime_stats["predictions"][:n, r]
+            correct = self._regime_stats["correct"][:n, r]
+
+        regime_accuracy = correct / np.maximum(predictions, 1)
+        score = np.where(
+            predictions < self.min_strategy_samples,
+            self._accuracies(),
+            regime_accuracy,
+        )
+        exploration_bonus = 0.1 * np.sqrt(
+            self.min_strategy_samples / np.maximum(predictions, 1)
+        )
+        return score + exploration_bonus
 
     def select_strategy(self, regime: str) -> LearningStrategy:
         """
@@ -234,46 +433,22 @@ class MetaLearner:
             {"regime": regime, "timestamp": datetime.utcnow().isoformat()}
         )
 
-        # Find best strategy for this regime
-        best_strategy = None
-        best_score = -float("inf")
-
-        for strategy in self.strategies.values():
-            # Skip strategies with insufficient data
-            regime_data = strategy.regime_performance.get(regime, {})
-            if regime_data.get("predictions", 0) < self.min_strategy_samples:
-                # Use overall accuracy as fallback
-                score = strategy.accuracy
-            else:
-                # Use regime-specific accuracy
-                score = regime_data.get("accuracy", 0.0)
-
-            # Add exploration bonus for less-tried strategies
-            exploration_bonus = 0.1 * np.sqrt(
-                self.min_strategy_samples / max(regime_data.get("predictions", 1), 1)
-            )
-            total_score = score + exploration_bonus
-
-            if total_score > best_score:
-                best_score = total_score
-                best_strategy = strategy
-
-        # Default to balanced if no strategy selected
-        if best_strategy is None:
-            best_strategy = self.strategies.get(
-                "balanced_default", list(self.strategies.values())[0]
-            )
+        # Find best strategy for this regime (first one on ties)
+        scores = self.selection_scores(regime)
+        best = int(np.argmax(scores))
+        best_score = float(scores[best])
+        best_name = self._names[best]
 
         # Track strategy switch
-        if self.state.current_strategy != best_strategy.name:
+        if self.state.current_strategy != best_name:
             self.state.strategy_switches += 1
             logger.info(
                 f"Strategy switch: {self.state.current_strategy} -> "
-                f"{best_strategy.name} (regime: {regime}, score: {best_score:.3f})"
+                f"{best_name} (regime: {regime}, score: {best_score:.3f})"
             )
 
-        self.state.current_strategy = best_strategy.name
-        return best_strategy
+        self.state.current_strategy = best_name
+        return self._snapshot(best)
 
     def update_strategy_performance(
         self, strategy_name: str, correct: bool, profit: float, regime: str
@@ -287,12 +462,20 @@ class MetaLearner:
             profit: Profit/loss from this prediction
             regime: Market regime when prediction was made
         """
-        if strategy_name not in self.strategies:
+        i = self._index.get(strategy_name)
+        if i is None:
             logger.warning(f"Unknown strategy: {strategy_name}")
             return
 
-        strategy = self.strategies[strategy_name]
-        strategy.update_performance(correct, profit, regime)
+        r = self._regime_column(regime)
+        self._stats["total_predictions"][i] += 1
+        self._stats["correct_predictions"][i] += int(correct)
+        self._stats["total_profit"][i] += profit
+        self._regime_stats["predictions"][i, r] += 1
+        self._regime_stats["correct"][i, r] += int(correct)
+        self._regime_stats["profit"][i, r] += profit
+        self._info[i]["last_updated"] = datetime.utcnow().isoformat()
+        self._dirty.add(strategy_name)
 
         self.state.strategies_evaluated += 1
         self.state.total_profit += profit
@@ -305,7 +488,7 @@ class MetaLearner:
                 "regime": regime,
                 "correct": correct,
                 "profit": profit,
-                "accuracy": strategy.accuracy,
+                "accuracy": float(self._accuracies()[i]),
             }
         )
 
@@ -328,215 +511,367 @@ class MetaLearner:
         """
         logger.info("Evolving new strategies...")
 
-        # Get top 2 performing strategies
-        sorted_strategies = sorted(
-            self.strategies.values(), key=lambda s: s.accuracy, reverse=True
-        )
-
-        if len(sorted_strategies) < 2:
+        if len(self._names) < 2:
             logger.warning("Not enough strategies for evolution")
             return
 
-        parent1 = sorted_strategies[0]
-        parent2 = sorted_strategies[1]
-
-        # Create new strategy by combining parents
-        new_strategy = self._crossover_strategies(parent1, parent2)
-
-        # Add mutations
-        new_strategy = self._mutate_strategy(new_strategy)
+        # Get top 2 performing strategies
+        accuracies = self._accuracies()
+        parent1, parent2 = np.argsort(-accuracies, kind="stable")[:2]
 
-        # Add to portfolio
-        self.strategies[new_strategy.name] = new_strategy
+        # Create new strategy by combining parents, then mutate it
+        child = self._crossover_strategies(int(parent1), int(parent2))
+        self._mutate_strategy(child)
 
         self.state.last_evolution = datetime.utcnow().isoformat()
+        self._evolutions += 1
 
         logger.info(
-            f"Evolved new strategy: {new_strategy.name} from parents "
-            f"{parent1.name} (acc: {parent1.accuracy:.3f}) and "
-            f"{parent2.name} (acc: {parent2.accuracy:.3f})"
+            f"Evolved new strategy: {self._names[child]} from parents "
+            f"{self._names[parent1]} (acc: {accuracies[parent1]:.3f}) and "
+            f"{self._names[parent2]} (acc: {accuracies[parent2]:.3f})"
         )
 
         # Prune worst strategies if portfolio too large
-        if len(self.strategies) > 10:
+        if len(self._names) > 10:
             self._prune_strategies()
 
-    def _crossover_strategies(
-        self, parent1: LearningStrategy, parent2: LearningStrategy
-    ) -> LearningStrategy:
-        """Combine two strategies to create offspring."""
-        # Mix parameters from both parents
-        new_params = {}
-        for key in parent1.parameters:
-            if key in parent2.parameters:
-                # Average numeric parameters
-                if isinstance(parent1.parameters[key], (int, float)):
-                    new_params[key] = (
-                        parent1.parameters[key] + parent2.parameters[key]
-                    ) / 2
-                else:
-                    # Randomly choose for non-numeric
-                    new_params[key] = (
-                        parent1.parameters[key]
-                        if np.random.random() > 0.5
-                        else parent2.parameters[key]
-                    )
+        self._save_strategies()
+
+    def _crossover_strategies(self, parent1: int, parent2: int) -> int:
+        """
+        Combine two strategy rows into an offspring row.
+
+        Numeric parameters both parents share are averaged (integers rounded),
+        boolean ones are drawn from a random parent.
+
+        Returns:
+            Row index of the new strategy
+        """
+        n_params = len(self._param_keys)
+        p1 = self._params[parent1, :n_params]
+        p2 = self._params[parent2, :n_params]
+        kinds = np.array(self._param_kinds)
+        shared = ~np.isnan(p1) & ~np.isnan(p2)
+
+        mixed = (p1 + p2) / 2
+        mixed = np.where(kinds == "i", np.rint(mixed), mixed)
+        coin = self.rng.random(len(p1)) > 0.5
+        mixed = np.where(kinds == "b", np.where(coin, p1, p2), mixed)
+        child_params = np.where(shared, mixed, np.nan)
+
+        extra1 = self._info[parent1]["extra_parameters"]
+        extra2 = self._info[parent2]["extra_parameters"]
+        extra = {
+            key: value if self.rng.random() > 0.5 else extra2[key]
+            for key, value in extra1.items()
+            if key in extra2
+        }
 
         # Determine strategy type based on parents
+        accuracies = self._accuracies()
         strategy_type = (
-            parent1.strategy_type
-            if parent1.accuracy > parent2.accuracy
-            else parent2.strategy_type
+            self._types[parent1]
+            if accuracies[parent1] > accuracies[parent2]
+            else self._types[parent2]
         )
 
         # Generate name
-        generation = max(parent1.generation, parent2.generation) + 1
-        name = f"evolved_gen{generation}_{datetime.utcnow().timestamp():.0f}"
-
-        return LearningStrategy(
-            name=name,
-            strategy_type=strategy_type,
-            parameters=new_params,
-            generation=generation,
-            parent_strategies=[parent1.name, parent2.name],
+        generation = 1 + int(
+            max(self._stats["generation"][parent1], self._stats["generation"][parent2])
+        )
+        name = base_name = (
+            f"evolved_gen{generation}_{datetime.utcnow().timestamp():.0f}"
         )
+        suffix = 1
+        while name in self._index:
+            suffix += 1
+            name = f"{base_name}_{suffix}"
 
-    def _mutate_strategy(self, strategy: LearningStrategy) -> LearningStrategy:
-        """Add random mutations to strategy parameters."""
-        mutation_rate = 0.2  # 20% chance to mutate each parameter
-        mutations = []
+        self.add_strategy(
+            LearningStrategy(
+                name=name,
+                strategy_type=strategy_type,
+                parameters=extra,
+                generation=generation,
+                parent_strategies=[self._names[parent1], self._names[parent2]],
+            )
+        )
+        child = self._index[name]
+        self._params[child, :n_params] = child_params
+        return child
+
+    def _mutate_strategy(self, row: int) -> None:
+        """Add random mutations to a strategy row's numeric parameters."""
+        params = self._params[row, : len(self._param_keys)]  # view, edited in place
+        kinds = np.array(self._param_kinds)
+        mutate = (
+            (self.rng.random(len(params)) < self.mutation_rate)
+            & ~np.isnan(params)
+            & (kinds != "b")
+        )
 
-        for key, value in strategy.parameters.items():
-            if np.random.random() < mutation_rate:
-                if isinstance(value, float):
-                    # Add gaussian noise
-                    mutation_factor = np.random.normal(1.0, 0.2)
-                    strategy.parameters[key] = value * mutation_factor
-                    mutations.append(f"{key}_mutated")
-                elif isinstance(value, int):
-                    # Add/subtract small integer
-                    delta = np.random.randint(-2, 3)
-                    strategy.parameters[key] = max(1, value + delta)
-                    mutations.append(f"{key}_mutated")
-
-        strategy.mutations = mutations
-        return strategy
+        # Floats get gaussian noise, integers a small step (at least 1)
+        noise = self.rng.normal(1.0, 0.2, len(params))
+        delta = self.rng.integers(-2, 3, len(params))
+        is_float = mutate & (kinds == "f")
+        params[is_float] *= noise[is_float]
+        is_int = mutate & (kinds == "i")
+        params[is_int] = np.maximum(1, params[is_int] + delta[is_int])
+
+        self._info[row]["mutations"] = [
+            f"{key}_mutated"
+            for key, flag in zip(self._param_keys, mutate, strict=True)
+            if flag
+        ]
 
     def _prune_strategies(self, keep_top: int = 8) -> None:
         """Remove worst-performing strategies to maintain portfolio size."""
-        sorted_strategies = sorted(
-            self.strategies.values(), key=lambda s: s.accuracy, reverse=True
+        # Always keep default strategies and top performers
+        keep = np.isin(self._names, list(PROTECTED_STRATEGIES))
+        keep[np.argsort(-self._accuracies(), kind="stable")[:keep_top]] = True
+
+        to_remove = [self._names[i] for i in np.flatnonzero(~keep)]
+        self._remove(to_remove)
+        for name in to_remove:
+            self._removed.add(name)
+            self._dirty.discard(name)
+            logger.info(f"Pruned strategy: {name}")
+
+    def _ensure_capacity(
+        self, rows: int = 0, regimes: int = 0, params: int = 0
+    ) -> None:
+        """Grow the arrays (doubling) to hold rows x regimes x params."""
+        cap_rows = len(self._stats["total_predictions"])
+        cap_regimes = self._regime_stats["predictions"].shape[1]
+        cap_params = self._params.shape[1]
+        new_rows = max(cap_rows, 2 * cap_rows if rows > cap_rows else 0, rows)
+        new_regimes = max(
+            cap_regimes, 2 * cap_regimes if regimes > cap_regimes else 0, regimes
+        )
+        new_params = max(
+            cap_params, 2 * cap_params if params > cap_params else 0, params
         )
+        if (new_rows, new_regimes, new_params) == (cap_rows, cap_regimes, cap_params):
+            return
 
-        # Always keep default strategies and top performers
-        protected_names = {
-            "momentum_aggressive",
-            "contrarian_conservative",
-            "balanced_default",
-            "volatility_adaptive",
-        }
+        for name, (dtype, default) in _STRATEGY_FIELDS.items():
+            column = np.full(new_rows, default, dtype=dtype)
+            column[:cap_rows] = self._stats[name]
+            self._stats[name] = column
+        for name, (dtype, default) in _REGIME_FIELDS.items():
+            matrix = np.full((new_rows, new_regimes), default, dtype=dtype)
+            matrix[:cap_rows, :cap_regimes] = self._regime_stats[name]
+            self._regime_stats[name] = matrix
+        params_matrix = np.full((new_rows, new_params), np.nan)
+        params_matrix[:cap_rows, :cap_params] = self._params
+        self._params = params_matrix
+
+    def _regime_column(self, regime: str) -> int:
+        """Column of a regime in the performance matrices, added on first use."""
+        r = self._regime_index.get(regime)
+        if r is None:
+            r = len(self._regimes)
+            self._ensure_capacity(regimes=r + 1)
+            self._regimes.append(regime)
+            self._regime_index[regime] = r
+        return r
+
+    def _param_column(self, key: str, value: bool | int | float) -> int:
+        """Column of a numeric parameter; ints widen to float if mixed."""
+        kind = (
+            "b" if isinstance(value, bool) else "i" if isinstance(value, int) else "f"
+        )
+        j = self._param_index.get(key)
+        if j is None:
+            j = len(self._param_keys)
+            self._ensure_capacity(params=j + 1)
+            self._param_keys.append(key)
+            self._param_kinds.append(kind)
+            self._param_index[key] = j
+        elif self._param_kinds[j] == "i" and kind == "f":
+            self._param_kinds[j] = "f"
+        return j
+
+    def _snapshot(self, i: int) -> LearningStrategy:
+        """Build a LearningStrategy from row i."""
+        info = self._info[i]
+        parameters: dict[str, Any] = {}
+        for key, kind, value in zip(
+            self._param_keys,
+            self._param_kinds,
+            self._params[i, : len(self._param_keys)],
+            strict=True,
+        ):
+            if not np.isnan(value):
+                parameters[key] = _KIND_TYPES[kind](value)
+        parameters.update(info["extra_parameters"])
 
-        to_keep = set(protected_names)
-        for strategy in sorted_strategies[:keep_top]:
-            to_keep.add(strategy.name)
+        regime_performance = {}
+        for r in np.flatnonzero(
+            self._regime_stats["predictions"][i, : len(self._regimes)]
+        ):
+            perf = {
+                name: self._regime_stats[name][i, r].item() for name in _REGIME_FIELDS
+            }
+            perf["accuracy"] = perf["correct"] / perf["predictions"]
+            regime_performance[self._regimes[r]] = perf
 
-        # Remove strategies not in keep set
-        to_remove = [name for name in self.strategies.keys() if name not in to_keep]
+        return LearningStrategy(
+            name=self._names[i],
+            strategy_type=self._types[i],
+            parameters=parameters,
+            regime_performance=regime_performance,
+            parent_strategies=list(info["parent_strategies"]),
+            mutations=list(info["mutations"]),
+            created_at=info["created_at"],
+            last_updated=info["last_updated"],
+            **{name: self._stats[name][i].item() for name in _STRATEGY_FIELDS},
+        )
 
-        for name in to_remove:
-            del self.strategies[name]
-            logger.info(f"Pruned strategy: {name}")
+    @property
+    def _journal_path(self) -> Path:
+        """Append-only log of strategy generation deltas."""
+        return self.strategies_dir / "strategies.jsonl"
 
     def _save_strategies(self) -> None:
-        """Save strategies to disk."""
-        try:
-            strategies_data = {
-                name: {
-                    "name": s.name,
-                    "strategy_type": s.strategy_type.value,
-                    "parameters": s.parameters,
-                    "total_predictions": s.total_predictions,
-                    "correct_predictions": s.correct_predictions,
-                    "total_profit": s.total_profit,
-                    "sharpe_ratio": s.sharpe_ratio,
-                    "max_drawdown": s.max_drawdown,
-                    "regime_performance": s.regime_performance,
-                    "generation": s.generation,
-                    "parent_strategies": s.parent_strategies,
-                    "mutations": s.mutations,
-                    "created_at": s.created_at,
-                    "last_updated": s.last_updated,
-                }
-                for name, s in self.strategies.items()
-            }
+        """
+        Append strategies changed since the last save to the journal.
 
-            filepath = self.strategies_dir / "strategies.json"
-            with open(filepath, "w") as f:
-                json.dump(strategies_data, f, indent=2)
+        Each line is a generation delta: upserted strategy records plus names
+        of pruned strategies. After journal_compact_every deltas the journal is
+        rewritten as one full snapshot.
+        """
+        if not self._dirty and not self._removed:
+            return
 
-            logger.debug(f"Saved {len(strategies_data)} strategies to {filepath}")
+        try:
+            if self._journal_entries >= self.journal_compact_every:
+                self._compact_journal()
+                return
+
+            delta = {
+                "ts": datetime.utcnow().isoformat(),
+                "evolution": self._evolutions,
+                "upserts": [
+                    self._snapshot(self._index[name]).to_dict()
+                    for name in sorted(self._dirty)
+                ],
+                "removed": sorted(self._removed),
+            }
+            with open(self._journal_path, "a") as f:
+                f.write(json.dumps(delta) + "\n")
+
+            self._journal_entries += 1
+            self._dirty.clear()
+            self._removed.clear()
+            logger.debug(
+                f"Appended {len(delta['upserts'])} strategies to {self._journal_path}"
+            )
         except Exception as e:
             logger.error(f"Failed to save strategies: {e}")
 
+    def _compact_journal(self) -> None:
+        """Rewrite the journal as a single full snapshot."""
+        snapshot = {
+            "ts": datetime.utcnow().isoformat(),
+            "evolution": self._evolutions,
+            "full": True,
+            "upserts": [s.to_dict() for s in self.strategies.values()],
+            "removed": [],
+        }
+        tmp_path = self._journal_path.with_suffix(".jsonl.tmp")
+        with open(tmp_path, "w") as f:
+            f.write(json.dumps(snapshot) + "\n")
+        os.replace(tmp_path, self._journal_path)
+
+        self._journal_entries = 1
+        self._dirty.clear()
+        self._removed.clear()
+        logger.debug(f"Compacted strategy journal {self._journal_path}")
+
     def _load_strategies(self) -> None:
-        """Load strategies from disk."""
+        """Load strategies from disk: legacy strategies.json, then the journal."""
         filepath = self.strategies_dir / "strategies.json"
-        if not filepath.exists():
-            logger.debug("No saved strategies found")
+        if filepath.exists():
+            try:
+                with open(filepath) as f:
+                    strategies_data = json.load(f)
+
+                for data in strategies_data.values():
+                    self.add_strategy(LearningStrategy.from_dict(data))
+
+                logger.info(f"Loaded {len(strategies_data)} strategies from {filepath}")
+            except Exception as e:
+                logger.error(f"Failed to load strategies: {e}")
+
+        if not self._journal_path.exists():
+            logger.debug("No strategy journal found")
+            self._dirty.clear()
             return
 
-        try:
-            with open(filepath) as f:
-                strategies_data = json.load(f)
-
-            for name, data in strategies_data.items():
-                # Skip if already loaded (default strategies)
-                if name in self.strategies:
-                    continue
-
-                strategy = LearningStrategy(
-                    name=data["name"],
-                    strategy_type=LearningStrategyType(data["strategy_type"]),
-                    parameters=data["parameters"],
-                    total_predictions=data.get("total_predictions", 0),
-                    correct_predictions=data.get("correct_predictions", 0),
-                    total_profit=data.get("total_profit", 0.0),
-                    sharpe_ratio=data.get("sharpe_ratio", 0.0),
-                    max_drawdown=data.get("max_drawdown", 0.0),
-                    regime_performance=data.get("regime_performance", {}),
-                    generation=data.get("generation", 0),
-                    parent_strategies=data.get("parent_strategies", []),
-                    mutations=data.get("mutations", []),
-                    created_at=data.get("created_at", datetime.utcnow().isoformat()),
-                    last_updated=data.get(
-                        "last_updated", datetime.utcnow().isoformat()
-                    ),
-                )
-                self.strategies[name] = strategy
-
-            logger.info(f"Loaded {len(strategies_data)} strategies from {filepath}")
-        except Exception as e:
-            logger.error(f"Failed to load strategies: {e}")
+        with open(self._journal_path) as f:
+            for line_no, line in enumerate(f, 1):
+                try:
+                    delta = json.loads(line)
+                    if delta.get("full"):
+                        keep = {data["name"] for data in delta["upserts"]}
+                        self._remove([n for n in self._names if n not in keep])
+                    for data in delta["upserts"]:
+                        self.add_strategy(LearningStrategy.from_dict(data))
+                    self._remove(delta.get("removed", []))
+                    self._evolutions = delta.get("evolution", self._evolutions)
+                    self._journal_entries += 1
+                except Exception as e:
+                    logger.warning(
+                        f"Skipping unreadable strategy delta at line {line_no}: {e}"
+                    )
+
+        self._dirty.clear()
+        self._removed.clear()
+        logger.info(
+            f"Replayed {self._journal_entries} strategy deltas from "
+            f"{self._journal_path}"
+        )
+
+    def _remove(self, names: list[str]) -> None:
+        """Drop strategy rows by name, compacting the arrays."""
+        drop = set(names) & set(self._index)
+        if not drop:
+            return
+
+        keep = [n for n in self._names if n not in drop]
+        rows = np.array([self._index[n] for n in keep], dtype=np.int64)
+        for name in self._stats:
+            self._stats[name][: len(rows)] = self._stats[name][rows]
+        for name in self._regime_stats:
+            self._regime_stats[name][: len(rows)] = self._regime_stats[name][rows]
+        self._params[: len(rows)] = self._params[rows]
+        self._types = [self._types[i] for i in rows]
+        self._info = [self._info[i] for i in rows]
+        self._names = keep
+        self._index = {name: i for i, name in enumerate(keep)}
 
     def get_status(self) -> dict[str, Any]:
         """Get current meta-learning status."""
+        accuracies = self._accuracies()
         return {
             "current_strategy": self.state.current_strategy,
             "current_regime": self.state.regime,
-            "total_strategies": len(self.strategies),
+            "total_strategies": len(self._names),
             "strategies_evaluated": self.state.strategies_evaluated,
             "strategy_switches": self.state.strategy_switches,
             "total_profit": self.state.total_profit,
             "last_evolution": self.state.last_evolution,
             "strategies": {
                 name: {
-                    "type": s.strategy_type.value,
-                    "accuracy": s.accuracy,
-                    "total_predictions": s.total_predictions,
-                    "total_profit": s.total_profit,
-                    "generation": s.generation,
+                    "type": self._types[i].value,
+                    "accuracy": float(accuracies[i]),
+                    "total_predictions": int(self._stats["total_predictions"][i]),
+                    "total_profit": float(self._stats["total_profit"][i]),
+                    "generation": int(self._stats["generation"][i]),
                 }
-                for name, s in self.strategies.items()
+                for i, name in enumerate(self._names)
             },
         }
 
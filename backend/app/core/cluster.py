@@ -0,0 +1,366 @@
+"""Multi-worker mode: lock-file leader election and a pluggable shared backend.
+
+WORKER_MODE=single (default) keeps all state in-process and every process acts
+as the leader, which is the historical single-worker behaviour.
+
+WORKER_MODE=multi (e.g. ``uvicorn app.main:app --workers 4``):
+- one process holds an exclusive lock on CLUSTER_LOCK_PATH and runs the
+  background loops (streamers, alert monitor, scanner, paper worker); the
+  others only serve HTTP/WebSocket traffic and keep retrying the lock, so a
+  follower takes over when the leader exits
+- caches and WebSocket fan-out go through the shared backend selected by
+  SHARED_BACKEND: "memory" (default, in-process) or a ``redis://`` URL. Any
+  Redis-protocol server works, e.g. a local redis-server or fakeredis' TCP
+  server. "fakeredis" (an in-process FakeRedis) is only accepted in single mode
+  since each worker would get its own private copy.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import pickle
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore
+    import msvcrt
+
+
+logger = logging.getLogger("ziggy.cluster")
+
+DEFAULT_LOCK_PATH = "data/cluster/leader.lock"
+
+
+# ── Shared backends ──────────────────────────────────────────────────────────
+
+
+class SharedBackend(ABC):
+    """Cache + pub/sub interface shared by all worker processes."""
+
+    name = "base"
+    # True when state is visible to other processes
+    shared = False
+
+    @abstractmethod
+    def get(self, key: str) -> Any: ...
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None: ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    def publish(self, channel: str, message: dict[str, Any]) -> None: ...
+
+    @abstractmethod
+    def subscribe(
+        self, channel: str, callback: Callable[[dict[str, Any]], None]
+    ) -> Callable[[], None]:
+        """Register `callback(message)`; returns an unsubscribe function.
+
+        Callbacks may run on a background thread.
+        """
+
+    def close(self) -> None:  # noqa: B027 - optional hook, no-op by default
+        """Release connections and listener threads."""
+
+
+class InProcessBackend(SharedBackend):
+    """Default backend: a TTL dict and synchronous in-process pub/sub."""
+
+    name = "memory"
+
+    def __init__(self):
+        self._store: dict[str, tuple[float | None, Any]] = {}
+        self._subscribers: dict[str, list[Callable[[dict[str, Any]], None]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            item = self._store.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires is not None and expires < time.time():
+                self._store.pop(key, None)
+                return None
+            return value
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        expires = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._store[key] = (expires, value)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._store.pop(key, None)
+
+    def publish(self, channel: str, message: dict[str, Any]) -> None:
+        for callback in list(self._subscribers.get(channel, [])):
+            try:
+                callback(message)
+            except Exception as e:
+                logger.warning(f"Subscriber on {channel} failed: {e}")
+
+    def subscribe(
+        self, channel: str, callback: Callable[[dict[str, Any]], None]
+    ) -> Callable[[], None]:
+        self._subscribers.setdefault(channel, []).append(callback)
+
+        def _unsubscribe() -> None:
+            callbacks = self._subscribers.get(channel, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+        return _unsubscribe
+
+
+class RedisBackend(SharedBackend):
+    """Redis-protocol backend (redis-py client or a compatible stand-in).
+
+    Cached values are pickled so DataFrames and dicts round-trip; pub/sub
+    messages are JSON. Only point this at a trusted, private server.
+    """
+
+    name = "redis"
+    shared = True
+
+    def __init__(self, url: str | None = None, client: Any = None, prefix: str = ""):
+        if client is None:
+            import redis
+
+            client = redis.Redis.from_url(url or "redis://localhost:6379/0")
+        self.client = client
+        self.prefix = prefix or os.getenv("SHARED_BACKEND_PREFIX", "ziggy:")
+        self._threads: list[Any] = []
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    def get(self, key: str) -> Any:
+        raw = self.client.get(self._key(key))
+        return pickle.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        px = max(1, int(ttl * 1000)) if ttl is not None else None
+        self.client.set(self._key(key), pickle.dumps(value), px=px)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self._key(key))
+
+    def publish(self, channel: str, message: dict[str, Any]) -> None:
+        self.client.publish(self._key(channel), json.dumps(message, default=str))
+
+    def subscribe(
+        self, channel: str, callback: Callable[[dict[str, Any]], None]
+    ) -> Callable[[], None]:
+        def _handler(raw: dict[str, Any]) -> None:
+            try:
+                data = raw.get("data")
+                if isinstance(data, bytes):
+                    data = data.decode("utf-8")
+                callback(json.loads(data))
+            except Exception as e:
+                logger.warning(f"Subscriber on {channel} failed: {e}")
+
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{self._key(channel): _handler})
+        thread = pubsub.run_in_thread(sleep_time=0.05, daemon=True)
+        self._threads.append(thread)
+
+        def _unsubscribe() -> None:
+            with contextlib.suppress(Exception):
+                thread.stop()
+                pubsub.close()
+
+        return _unsubscribe
+
+    def close(self) -> None:
+        for thread in self._threads:
+            with contextlib.suppress(Exception):
+                thread.stop()
+        self._threads.clear()
+
+
+_backend: SharedBackend | None = None
+_backend_lock = threading.Lock()
+
+
+def create_shared_backend(spec: str | None = None) -> SharedBackend:
+    """Build a backend from a SHARED_BACKEND value."""
+    spec = (spec or "memory").strip()
+    if spec in ("", "memory", "inprocess"):
+        return InProcessBackend()
+    if spec == "fakeredis":
+        # FakeRedis() keeps its data in this process, so workers would not share it
+        if is_multi_worker():
+            raise ValueError(
+                "SHARED_BACKEND=fakeredis is per-process; in multi mode use a "
+                "redis:// URL (e.g. fakeredis' TCP server)"
+            )
+        import fakeredis
+
+        backend = RedisBackend(client=fakeredis.FakeRedis())
+        backend.name = "fakeredis"
+        backend.shared = False
+        return backend
+    if spec.startswith(("redis://", "rediss://", "unix://")):
+        return RedisBackend(url=spec)
+    raise ValueError(f"Unknown SHARED_BACKEND: {spec!r}")
+
+
+def get_shared_backend() -> SharedBackend:
+    """Process-wide backend; falls back to in-process if the configured one fails."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                spec = os.getenv("SHARED_BACKEND", "memory")
+                try:
+                    _backend = create_shared_backend(spec)
+                except Exception as e:
+                    logger.warning(
+                        f"Shared backend {spec!r} unavailable ({e}); using in-process"
+                    )
+                    _backend = InProcessBackend()
+    return _backend
+
+
+def set_shared_backend(backend: SharedBackend | None) -> None:
+    """Replace the process-wide backend (tests, custom deployments)."""
+    global _backend
+    _backend = backend
+
+
+# ── Leader election ──────────────────────────────────────────────────────────
+
+
+class LeaderElection:
+    """Exclusive, non-blocking lock on a file; the holder is the leader.
+
+    The OS drops the lock when the process exits, so a crashed leader never
+    blocks election.
+    """
+
+    def __init__(self, lock_path: str | Path = DEFAULT_LOCK_PATH, retry_interval=5.0):
+        self.lock_path = Path(lock_path)
+        self.retry_interval = retry_interval
+        self.is_leader = False
+        self._fh = None
+
+    def try_acquire(self) -> bool:
+        if self.is_leader:
+            return True
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with contextlib.ExitStack() as stack:
+            fh = stack.enter_context(open(self.lock_path, "a+"))
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:  # pragma: no cover - Windows
+                    fh.seek(0)
+                    msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+            except OSError:
+                return False
+            fh.seek(0)
+            fh.truncate()
+            fh.write(f"{os.getpid()}\n")
+            fh.flush()
+            # Keep the handle (and the lock) open until release()
+            stack.pop_all()
+        self._fh = fh
+        self.is_leader = True
+        logger.info(f"Elected leader (pid {os.getpid()}) via {self.lock_path}")
+        return True
+
+    def release(self) -> None:
+        if self._fh is None:
+            return
+        with contextlib.suppress(OSError):
+            if fcntl is not None:
+                fcntl.flock(self._fh.fileno(), fcntl.LOCK_UN)
+            else:  # pragma: no cover - Windows
+                self._fh.seek(0)
+                msvcrt.locking(self._fh.fileno(), msvcrt.LK_UNLCK, 1)
+        self._fh.close()
+        self._fh = None
+        self.is_leader = False
+
+    async def watch(self, on_elected: Callable[[], Awaitable[None]]) -> None:
+        """Retry the lock until acquired, then run `on_elected` once."""
+        while not self.try_acquire():
+            await asyncio.sleep(self.retry_interval)
+        await on_elected()
+
+
+_election: LeaderElection | None = None
+_watch_task: asyncio.Task | None = None
+
+
+def worker_mode() -> str:
+    return os.getenv("WORKER_MODE", "single").strip().lower()
+
+
+def is_multi_worker() -> bool:
+    return worker_mode() == "multi"
+
+
+def is_leader() -> bool:
+    """True if this process should run background loops."""
+    if not is_multi_worker():
+        return True
+    return _election is not None and _election.is_leader
+
+
+async def start_cluster(on_leader: Callable[[], Awaitable[None]]) -> bool:
+    """Run `on_leader` now if this process leads, otherwise when it takes over."""
+    global _election, _watch_task
+    if not is_multi_worker():
+        await on_leader()
+        return True
+
+    _election = LeaderElection(
+        os.getenv("CLUSTER_LOCK_PATH", DEFAULT_LOCK_PATH),
+        retry_interval=float(os.getenv("CLUSTER_RETRY_S", "5")),
+    )
+    if _election.try_acquire():
+        await on_leader()
+        return True
+    logger.info(f"Worker {os.getpid()} running as follower")
+    _watch_task = asyncio.create_task(_election.watch(on_leader))
+    return False
+
+
+async def stop_cluster() -> None:
+    global _watch_task
+    if _watch_task is not None and not _watch_task.done():
+        _watch_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _watch_task
+    _watch_task = None
+    if _election is not None:
+        _election.release()
+    if _backend is not None:
+        _backend.close()
+
+
+def cluster_info() -> dict[str, Any]:
+    return {
+        "mode": worker_mode(),
+        "pid": os.getpid(),
+        "leader": is_leader(),
+        "backend": get_shared_backend().name,
+    }
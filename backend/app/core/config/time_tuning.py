@@ -111,6 +111,14 @@ QUEUE_LIMITS = {
     "telemetry_events": _get_int_env("QUEUE_TELEMETRY_EVENTS", 1000),
     "telemetry_batch_size": _get_int_env("QUEUE_TELEMETRY_BATCH_SIZE", 50),
     "telemetry_flush_interval": _get_int_env("QUEUE_TELEMETRY_FLUSH_INTERVAL", 30),
+    "telemetry_spool_max_bytes": _get_int_env(
+        "QUEUE_TELEMETRY_SPOOL_MAX_BYTES", 10 * 1024 * 1024
+    ),
+    "telemetry_spool_max_files": _get_int_env("QUEUE_TELEMETRY_SPOOL_MAX_FILES", 5),
+    "telemetry_replay_batches": _get_int_env("QUEUE_TELEMETRY_REPLAY_BATCHES", 20),
+    # Market data streaming: symbols per batched quote call, concurrent calls
+    "market_stream_chunk_size": _get_int_env("QUEUE_MARKET_STREAM_CHUNK_SIZE", 50),
+    "market_stream_concurrency": _get_int_env("QUEUE_MARKET_STREAM_CONCURRENCY", 4),
     # Portfolio streaming queue
     "portfolio_snapshots": _get_int_env("QUEUE_PORTFOLIO_SNAPSHOTS", 100),
 }
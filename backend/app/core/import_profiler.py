@@ -0,0 +1,161 @@
+"""Import-time profiler for startup budgets.
+
+Runs ``python -X importtime -c "import <module>"`` in a fresh interpreter and
+parses the per-module self/cumulative timings, so startup cost can be reported
+per module and per top-level package and enforced in tests.
+
+Usage:
+    python -m app.core.import_profiler app.main --top 25
+    ROUTER_LOADING=lazy python -m app.core.import_profiler app.main
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+@dataclass
+class ImportEntry:
+    """One line of -X importtime output."""
+
+    module: str
+    self_ms: float
+    cumulative_ms: float
+    depth: int
+
+
+@dataclass
+class ImportReport:
+    """Parsed import timings for one top-level import."""
+
+    module: str
+    total_ms: float
+    entries: list[ImportEntry] = field(default_factory=list)
+
+    @property
+    def modules(self) -> set[str]:
+        return {e.module for e in self.entries}
+
+    def imported(self, name: str) -> bool:
+        """True if `name` or any of its submodules was imported."""
+        return any(m == name or m.startswith(name + ".") for m in self.modules)
+
+    def top(self, n: int = 20, key: str = "self_ms") -> list[ImportEntry]:
+        return sorted(self.entries, key=lambda e: getattr(e, key), reverse=True)[:n]
+
+    def by_package(self) -> dict[str, float]:
+        """Self time summed per top-level package, largest first."""
+        totals: dict[str, float] = {}
+        for e in self.entries:
+            pkg = e.module.split(".", 1)[0]
+            totals[pkg] = totals.get(pkg, 0.0) + e.self_ms
+        return dict(sorted(totals.items(), key=lambda kv: kv[1], reverse=True))
+
+    def to_dict(self, top: int = 20) -> dict:
+        return {
+            "module": self.module,
+            "total_ms": round(self.total_ms, 1),
+            "modules_imported": len(self.entries),
+            "by_package_ms": {
+                k: round(v, 1) for k, v in list(self.by_package().items())[:top]
+            },
+            "top_self_ms": [
+                {"module": e.module, "self_ms": round(e.self_ms, 1)}
+                for e in self.top(top)
+            ],
+        }
+
+    def format(self, top: int = 20) -> str:
+        lines = [
+            f"import {self.module}: {self.total_ms:.0f} ms "
+            f"({len(self.entries)} modules)",
+            "",
+            f"{'self ms':>9} {'cum ms':>9}  module",
+        ]
+        for e in self.top(top):
+            lines.append(f"{e.self_ms:9.1f} {e.cumulative_ms:9.1f}  {e.module}")
+        lines += ["", f"{'self ms':>9}  package"]
+        for pkg, ms in list(self.by_package().items())[:top]:
+            lines.append(f"{ms:9.1f}  {pkg}")
+        return "\n".join(lines)
+
+
+def parse_importtime(output: str, module: str = "") -> ImportReport:
+    """Parse stderr from ``python -X importtime``."""
+    entries: list[ImportEntry] = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3:
+            continue
+        self_us, cum_us, name = parts[0].strip(), parts[1].strip(), parts[2]
+        if not self_us.isdigit():
+            continue  # header line
+        depth = (len(name) - len(name.lstrip(" "))) // 2
+        entries.append(
+            ImportEntry(
+                module=name.strip(),
+                self_ms=int(self_us) / 1000.0,
+                cumulative_ms=int(cum_us) / 1000.0,
+                depth=depth,
+            )
+        )
+
+    total = 0.0
+    if module:
+        total = max(
+            (e.cumulative_ms for e in entries if e.module == module), default=0.0
+        )
+    if not total:
+        total = sum(e.cumulative_ms for e in entries if e.depth == 0)
+    return ImportReport(module=module, total_ms=total, entries=entries)
+
+
+def profile_import(
+    module: str,
+    env: dict[str, str] | None = None,
+    cwd: Path | str | None = None,
+    timeout: float = 120.0,
+) -> ImportReport:
+    """Import `module` in a fresh interpreter and return its import timings."""
+    run_env = {**os.environ, **(env or {})}
+    run_env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(BACKEND_DIR), run_env.get("PYTHONPATH", "")) if p
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=run_env,
+        cwd=str(cwd or BACKEND_DIR),
+        timeout=timeout,
+    )
+    if proc.returncode != 0:
+        tail = proc.stderr.strip().splitlines()[-1:] or ["unknown error"]
+        raise RuntimeError(f"import {module} failed: {tail[0]}")
+    return parse_importtime(proc.stderr, module)
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("module", nargs="?", default="app.main")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    report = profile_import(args.module)
+    if args.json:
+        print(json.dumps(report.to_dict(args.top), indent=2))
+    else:
+        print(report.format(args.top))
@@ -1,23 +1,236 @@
-"""Auto-discovery fallback for APIRouter instances.
+"""Router registration: explicit specs, lazy manifest loading, auto-discovery.
 
-This module provides a safe fallback mechanism to discover and register
-any APIRouter instances that weren't explicitly included in main.py.
-It walks the app directory tree and attempts to import modules that
-might contain routers, logging warnings for any issues but never
-crashing the application startup.
+This module provides:
+- ROUTER_SPECS, the ordered list of routers main.py registers
+- a precomputed route manifest and LazyRouterLoader, which registers routers
+  on the first request under their paths so heavy imports are deferred
+- a safe fallback mechanism to discover and register any APIRouter instances
+  that weren't explicitly included in main.py. It walks the app directory tree
+  and attempts to import modules that might contain routers, logging warnings
+  for any issues but never crashing the application startup.
 """
 
 import importlib
+import json
 import logging
 import os
+import threading
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from fastapi import FastAPI
 
 logger = logging.getLogger("ziggy.router_auto")
 
+# (module, include prefix or None) in registration order.
+# Routers with their own prefix are registered as-is (prefix None).
+ROUTER_SPECS: list[tuple[str, str | None]] = [
+    ("app.api.routes", "/api"),
+    ("app.api.routes_alerts", "/alerts"),
+    ("app.api.routes_chat", None),  # already has prefix="/chat"
+    ("app.api.routes_cognitive", None),  # already has prefix="/cognitive"
+    ("app.api.routes_crypto", "/crypto"),
+    ("app.api.routes_dev", "/dev"),
+    ("app.api.routes_explain", None),  # already has prefix="/signal"
+    ("app.api.routes_feedback", None),  # already has prefix="/feedback"
+    ("app.api.routes_integration", None),  # already has prefix="/integration"
+    ("app.api.routes_learning", "/api/learning"),
+    ("app.api.routes_market", "/market"),
+    ("app.api.routes_market_calendar", None),  # already has prefix="/market"
+    ("app.api.routes_news", "/news"),
+    ("app.api.routes_paper", "/api/paper"),
+    ("app.api.routes_performance", None),  # already has prefix="/api/performance"
+    ("app.api.routes_risk_lite", "/risk"),
+    ("app.api.routes_screener", None),  # already has prefix="/screener"
+    ("app.api.routes_signals", "/api"),  # router prefix "/signals" -> /api/signals
+    ("app.api.routes_trace", None),  # already has prefix="/signal"
+    ("app.api.routes_trading", "/trading"),
+    ("app.web.browse_router", None),  # routes already include /web prefix
+    ("app.trading.router", None),  # already has prefix="/trade"
+    ("app.api.routes_websocket", None),  # /ws/market, /ws/news, etc.
+]
+
+MANIFEST_PATH = Path(__file__).with_name("router_manifest.json")
+
+# Paths that need every router registered (schema/docs generation)
+_LOAD_ALL_PATHS = ("/docs", "/redoc", "/openapi.json")
+
+
+def include_router_spec(app: "FastAPI", module_path: str, prefix: str | None) -> list:
+    """Import a spec's module and include its router; return the routes added."""
+    module = importlib.import_module(module_path)
+    router = getattr(module, "router")
+    before = len(app.router.routes)
+    if prefix:
+        app.include_router(router, prefix=prefix)
+    else:
+        app.include_router(router)
+    return app.router.routes[before:]
+
+
+def _literal_prefixes(paths: list[str]) -> list[str]:
+    """Static part of each path (up to the first parameter), minimal cover."""
+    literals = sorted({p.split("{", 1)[0] or "/" for p in paths})
+    out: list[str] = []
+    for lit in literals:
+        if not any(lit.startswith(kept) for kept in out):
+            out.append(lit)
+    return out
+
+
+def build_router_manifest(
+    specs: list[tuple[str, str | None]] | None = None,
+) -> dict[str, Any]:
+    """Import every spec once and record the path prefixes each one serves."""
+    from fastapi import FastAPI
+
+    entries = []
+    for module_path, prefix in specs or ROUTER_SPECS:
+        scratch = FastAPI()
+        try:
+            routes = include_router_spec(scratch, module_path, prefix)
+        except Exception as e:
+            logger.warning(f"Manifest: could not load {module_path}: {e}")
+            continue
+        paths = [getattr(r, "path", "") for r in routes if getattr(r, "path", "")]
+        entries.append(
+            {
+                "module": module_path,
+                "prefix": prefix,
+                "paths": _literal_prefixes(paths),
+                "routes": len(routes),
+            }
+        )
+    return {"version": 1, "routers": entries}
+
+
+def write_router_manifest(path: Path = MANIFEST_PATH) -> dict[str, Any]:
+    manifest = build_router_manifest()
+    path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    return manifest
+
+
+def load_router_manifest(path: Path = MANIFEST_PATH) -> dict[str, Any] | None:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Router manifest unavailable ({path}): {e}")
+        return None
+
+
+class LazyRouterLoader:
+    """
+    Register routers on first use from a precomputed manifest.
+
+    Each manifest entry lists the static path prefixes its router serves. The
+    first request whose path starts with one of them imports and includes every
+    matching router, then routes are re-sorted into spec order so matching
+    precedence is the same as eager registration.
+    """
+
+    def __init__(self, app: "FastAPI", entries: list[dict[str, Any]]):
+        self.app = app
+        self.entries = entries
+        self.loaded: dict[str, float] = {}  # module -> import+include ms
+        self._order: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> list[str]:
+        return [e["module"] for e in self.entries if e["module"] not in self.loaded]
+
+    def ensure_for_path(self, path: str) -> None:
+        if not self.pending:
+            return
+        load_all = path.startswith(_LOAD_ALL_PATHS)
+        # Trailing slash so "/alerts" also matches a "/alerts/" prefix
+        path = path.rstrip("/") + "/"
+        wanted = [
+            (i, e)
+            for i, e in enumerate(self.entries)
+            if e["module"] not in self.loaded
+            and (load_all or any(path.startswith(p) for p in e["paths"]))
+        ]
+        if wanted:
+            self._load(wanted)
+
+    def load_all(self) -> None:
+        self._load(list(enumerate(self.entries)))
+
+    def _load(self, wanted: list[tuple[int, dict[str, Any]]]) -> None:
+        import time
+
+        with self._lock:
+            added = False
+            for index, entry in wanted:
+                module_path = entry["module"]
+                if module_path in self.loaded:
+                    continue
+                t0 = time.perf_counter()
+                try:
+                    routes = include_router_spec(self.app, module_path, entry["prefix"])
+                except Exception as e:
+                    logger.warning(f"Failed to include lazy router {module_path}: {e}")
+                    routes = []
+                self.loaded[module_path] = (time.perf_counter() - t0) * 1000.0
+                for route in routes:
+                    self._order[id(route)] = index
+                added = added or bool(routes)
+                logger.info(
+                    f"Lazy-loaded router {module_path} "
+                    f"({len(routes)} routes, {self.loaded[module_path]:.0f} ms)"
+                )
+            if added:
+                # Stable sort: app-level routes first, then spec order
+                self.app.router.routes.sort(key=lambda r: self._order.get(id(r), -1))
+                self.app.openapi_schema = None
+
+
+class LazyRouterMiddleware:
+    """ASGI middleware that asks the loader to register routers before routing."""
+
+    def __init__(self, app, loader: LazyRouterLoader):
+        self.app = app
+        self.loader = loader
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] in ("http", "websocket"):
+            self.loader.ensure_for_path(scope.get("path", ""))
+        await self.app(scope, receive, send)
+
+
+def install_lazy_routers(
+    app: "FastAPI",
+    specs: list[tuple[str, str | None]] | None = None,
+    manifest: dict[str, Any] | None = None,
+) -> LazyRouterLoader | None:
+    """Register specs lazily from the manifest; specs missing from it load eagerly.
+
+    Returns the loader, or None when no manifest is available (caller should
+    register eagerly).
+    """
+    manifest = manifest if manifest is not None else load_router_manifest()
+    if not manifest:
+        return None
+    by_module = {e["module"]: e for e in manifest.get("routers", [])}
+    entries = []
+    for module_path, prefix in specs or ROUTER_SPECS:
+        entry = by_module.get(module_path)
+        if entry is None or entry.get("prefix") != prefix:
+            logger.warning(f"{module_path} not in router manifest; loading eagerly")
+            try:
+                include_router_spec(app, module_path, prefix)
+            except Exception as e:
+                logger.warning(f"Failed to include router {module_path}: {e}")
+            continue
+        entries.append(entry)
+
+    loader = LazyRouterLoader(app, entries)
+    app.add_middleware(LazyRouterMiddleware, loader=loader)
+    app.state.lazy_routers = loader
+    return loader
+
 
 def discover_and_register_routers(app: "FastAPI") -> None:
     """Discover and register any APIRouter instances not already included.
@@ -65,6 +278,16 @@ def discover_and_register_routers(app: "FastAPI") -> None:
 
             # Build module path
             file_path = Path(root) / file
+
+            # Only import modules that can define a router at all
+            try:
+                if "APIRouter" not in file_path.read_text(
+                    encoding="utf-8", errors="ignore"
+                ):
+                    continue
+            except OSError:
+                continue
+
             try:
                 rel_path = file_path.relative_to(app_dir.parent)
                 module_path = str(rel_path.with_suffix("")).replace(os.sep, ".")
@@ -156,3 +379,13 @@ def discover_and_register_routers(app: "FastAPI") -> None:
                 logger.debug(f"Error processing {file_path}: {e}")
 
     logger.info(f"Auto-discovery complete, total routes: {len(app.routes)}")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if "--write-manifest" in sys.argv:
+        written = write_router_manifest()
+        print(f"Wrote {len(written['routers'])} routers to {MANIFEST_PATH}")
+    else:
+        print(json.dumps(build_router_manifest(), indent=2))
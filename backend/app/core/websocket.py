@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import os
 import time
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 from typing import Any
 
@@ -17,11 +19,39 @@ from app.core.logging import get_logger
 logger = get_logger("ziggy.websocket")
 settings = get_settings()
 
+try:  # optional fast encoder
+    import orjson  # type: ignore
+
+    _ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore
+
+# Wire encodings a client may negotiate with ?encoding=...; "binary" carries the
+# same compact UTF-8 JSON in a binary frame so clients can skip text decoding.
+WS_ENCODINGS = ("json", "binary")
+
+# Shared-backend channels used in multi-worker mode (app.core.cluster)
+WS_RELAY_CHANNEL = "ws_broadcast"
+MARKET_TICKS_CHANNEL = "market_ticks"
+MARKET_SYMBOLS_CHANNEL = "market_symbols"
+
 
 def _now() -> float:
     return time.time()
 
 
+def encode_message(payload: dict[str, Any]) -> bytes:
+    """Encode a payload once as compact UTF-8 JSON (orjson when available)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=_ORJSON_OPTS)
+        except TypeError:
+            pass
+    return json.dumps(
+        payload, separators=(",", ":"), ensure_ascii=False, default=str
+    ).encode("utf-8")
+
+
 def _is_prod_trading_enabled() -> bool:
     env = (os.getenv("APP_ENV") or os.getenv("ENV") or "development").strip().lower()
     trading = (os.getenv("TRADING_ENABLED") or "false").strip().lower() in {
@@ -42,6 +72,7 @@ class ConnectionManager:
     - Heartbeats every 25s; send ping with 2.5s timeout; prune on failures
     - Send operations wrapped with asyncio.wait_for(..., timeout=2.5)
     - Basic metrics counters (by channel): attempts, failures, pruned, queue_len, dropped, latency_ms
+    - Each broadcast is encoded once and the same frame is sent to every subscriber
     """
 
     def __init__(self):
@@ -60,6 +91,46 @@ class ConnectionManager:
         self._bg_tasks: set[asyncio.Task] = set()
         # Metrics storage
         self._metrics: dict[str, dict[str, float]] = {}
+        # Cross-worker fan-out (multi-worker mode); see attach_backend
+        self._backend = None
+        self._backend_unsubscribe: Callable[[], None] | None = None
+        self._origin = f"{os.getpid()}:{id(self)}"
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    # ------------- cross-worker relay -------------
+    def attach_backend(self, backend) -> None:
+        """Relay broadcasts through a shared backend so every worker's clients get them.
+
+        Must be called from the event loop; remote messages are re-enqueued locally.
+        """
+        self.detach_backend()
+        self._loop = asyncio.get_running_loop()
+        self._backend = backend
+        self._backend_unsubscribe = backend.subscribe(
+            WS_RELAY_CHANNEL, self._on_relay_message
+        )
+
+    def detach_backend(self) -> None:
+        if self._backend_unsubscribe is not None:
+            self._backend_unsubscribe()
+        self._backend = None
+        self._backend_unsubscribe = None
+
+    def _on_relay_message(self, envelope: dict[str, Any]) -> None:
+        if envelope.get("origin") == self._origin or self._loop is None:
+            return
+        channel, message = envelope.get("channel"), envelope.get("message")
+        if not channel or message is None:
+            return
+        self._bump_metric(channel, "relay_received", 1.0)
+        self._loop.call_soon_threadsafe(
+            self._spawn_bg, self._enqueue_broadcast(channel, message)
+        )
+
+    def _spawn_bg(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
 
     # ------------- internal helpers -------------
     def _get_lock(self, channel: str) -> asyncio.Lock:
@@ -115,6 +186,14 @@ class ConnectionManager:
         """Accept a new WebSocket connection and register under channel."""
         await websocket.accept()
 
+        encoding = "json"
+        try:
+            requested = websocket.query_params.get("encoding")  # type: ignore[attr-defined]
+            if requested in WS_ENCODINGS:
+                encoding = requested
+        except AttributeError:
+            pass
+
         # Ensure structures exist
         lock = self._get_lock(connection_type)
         self._get_queue(connection_type)  # ensure consumer started
@@ -128,6 +207,7 @@ class ConnectionManager:
                 "metadata": metadata or {},
                 "id": id(websocket),
                 "last_seen": _now(),
+                "encoding": encoding,
             }
 
         logger.info(
@@ -212,6 +292,22 @@ class ConnectionManager:
             timeout = TIMEOUTS["websocket_send"]
         await asyncio.wait_for(ws.send_json(payload), timeout=timeout)
 
+    async def _send_encoded_safe(
+        self,
+        ws: WebSocket,
+        frame: bytes,
+        text: str,
+        timeout: float | None = None,
+    ):
+        """Send a pre-encoded frame in the socket's negotiated encoding; raises on failure."""
+        if timeout is None:
+            timeout = TIMEOUTS["websocket_send"]
+        info = self.connection_metadata.get(ws)
+        if info is not None and info.get("encoding") == "binary":
+            await asyncio.wait_for(ws.send_bytes(frame), timeout=timeout)
+        else:
+            await asyncio.wait_for(ws.send_text(text), timeout=timeout)
+
     async def send_personal_message(self, message: str, websocket: WebSocket):
         """Send message to specific connection with timeout and pruning on failure."""
         try:
@@ -256,6 +352,19 @@ class ConnectionManager:
 
     async def broadcast_to_type(self, message: dict[str, Any], connection_type: str):
         """Enqueue message for broadcast to a channel; non-blocking."""
+        if self._backend is not None:
+            try:
+                self._backend.publish(
+                    WS_RELAY_CHANNEL,
+                    {
+                        "origin": self._origin,
+                        "channel": connection_type,
+                        "message": message,
+                    },
+                )
+            except Exception as e:
+                self._bump_metric(connection_type, "relay_failures", 1.0)
+                logger.debug(f"Broadcast relay failed: {e}")
         await self._enqueue_broadcast(connection_type, message)
 
     async def _consume_channel(self, channel: str):
@@ -265,15 +374,31 @@ class ConnectionManager:
             try:
                 payload = await self._queues[channel].get()
                 t0 = _now()
-                conns = list(self.connections.get(channel, set()))  # snapshot
+                conns = [
+                    ws
+                    for ws in list(self.connections.get(channel, set()))  # snapshot
+                    if not self.connection_metadata.get(ws, {}).get("direct_delivery")
+                ]
                 before = len(conns)
                 # update a metric for current subscribers
                 self._set_metric(channel, "subscribers", float(before))
                 self._bump_metric(channel, "broadcasts_attempted", 1.0)
 
+                # Encode once; every subscriber gets the same frame
+                frame = encode_message(payload)
+                text = frame.decode("utf-8")
+                t_enc = _now()
+                encode_ms = (t_enc - t0) * 1000.0
+                self._set_metric(channel, "encode_ms", encode_ms)
+                self._bump_metric(channel, "encode_ms_total", encode_ms)
+                self._bump_metric(channel, "bytes_encoded", float(len(frame)))
+
                 # Send concurrently with timeouts
-                tasks = [self._send_json_safe(ws, payload) for ws in conns]
+                tasks = [self._send_encoded_safe(ws, frame, text) for ws in conns]
                 results = await asyncio.gather(*tasks, return_exceptions=True)
+                send_ms = (_now() - t_enc) * 1000.0
+                self._set_metric(channel, "send_ms", send_ms)
+                self._bump_metric(channel, "send_ms_total", send_ms)
 
                 # Prune failed
                 failed: list[WebSocket] = []
@@ -335,9 +460,10 @@ class ConnectionManager:
                         continue
                     before = len(snapshot)
                     tasks = []
-                    ping_payload = {"type": "ping", "ts": _now()}
+                    ping_frame = encode_message({"type": "ping", "ts": _now()})
+                    ping_text = ping_frame.decode("utf-8")
                     for ws in snapshot:
-                        tasks.append(self._send_json_safe(ws, ping_payload))
+                        tasks.append(self._send_encoded_safe(ws, ping_frame, ping_text))
 
                     results = await asyncio.gather(*tasks, return_exceptions=True)
                     failed = [
@@ -425,11 +551,20 @@ class ConnectionManager:
         now = datetime.utcnow()
         for ch, conns in self.connections.items():
             q = self._queues.get(ch)
+            metrics = self._metrics.get(ch, {})
+            attempted = metrics.get("broadcasts_attempted", 0.0)
             stats["per_channel"][ch] = {
                 "connections": len(conns),
                 "queue_len": int(q.qsize()) if q else 0,
-                **self._metrics.get(ch, {}),
+                **metrics,
             }
+            if attempted:
+                stats["per_channel"][ch]["encode_ms_avg"] = (
+                    metrics.get("encode_ms_total", 0.0) / attempted
+                )
+                stats["per_channel"][ch]["send_ms_avg"] = (
+                    metrics.get("send_ms_total", 0.0) / attempted
+                )
 
         # basic uptime aggregates
         uptime: dict[str, dict[str, float]] = {}
@@ -452,89 +587,428 @@ class ConnectionManager:
 connection_manager = ConnectionManager()
 
 
+def diff_fields(previous: dict[str, Any], current: dict[str, Any]) -> dict[str, Any]:
+    """Return {"changes": {...}, "removed": [...]} between two flat states."""
+    changes = {
+        k: v for k, v in current.items() if k not in previous or previous[k] != v
+    }
+    removed = [k for k in previous if k not in current]
+    return {"changes": changes, "removed": removed}
+
+
+class _ClientStream:
+    """Per-connection subscription state for conflated delivery."""
+
+    __slots__ = ("last_sent", "pending", "seq", "symbols", "task", "wakeup")
+
+    def __init__(self):
+        self.symbols: set[str] = set()
+        # Latest unsent state per symbol (last value wins)
+        self.pending: dict[str, dict[str, Any]] = {}
+        # Last state delivered per symbol, used as the delta base
+        self.last_sent: dict[str, dict[str, Any]] = {}
+        self.seq = 0
+        self.wakeup = asyncio.Event()
+        self.task: asyncio.Task | None = None
+
+
+class ConflatingSubscriptions:
+    """
+    Per-client symbol subscriptions with last-value-wins conflation.
+
+    - publish() only overwrites each subscriber's pending slot; it never blocks
+    - one sender task per client drains its pending symbols at its own pace, so a
+      slow client only ever catches up to the newest state and never stalls others
+    - the first message per (client, symbol) is a full snapshot, later ones carry
+      only the fields that changed since the last delivered state
+    - a client whose send fails is unsubscribed from everything; symbols nobody
+      wants any more are handed to `on_release`
+    """
+
+    channel = "market_data"
+
+    def __init__(
+        self,
+        connection_manager: ConnectionManager,
+        on_release: Callable[[list[str]], Awaitable[None]] | None = None,
+    ):
+        self.connection_manager = connection_manager
+        self.on_release = on_release
+        self._clients: dict[WebSocket, _ClientStream] = {}
+
+    def symbols(self) -> set[str]:
+        """Union of all client subscriptions."""
+        out: set[str] = set()
+        for client in self._clients.values():
+            out |= client.symbols
+        return out
+
+    def subscribers(self, symbol: str) -> int:
+        return sum(1 for c in self._clients.values() if symbol in c.symbols)
+
+    def subscribe(self, ws: WebSocket, symbols: list[str]) -> None:
+        client = self._clients.get(ws)
+        if client is None:
+            client = self._clients[ws] = _ClientStream()
+            info = self.connection_manager.connection_metadata.get(ws)
+            if info is not None:
+                info["direct_delivery"] = True
+            client.task = asyncio.create_task(self._sender(ws, client))
+        client.symbols.update(symbols)
+
+    def unsubscribe(self, ws: WebSocket, symbols: list[str] | None = None) -> set[str]:
+        """Remove symbols (or the whole client); return symbols nobody wants now."""
+        client = self._clients.get(ws)
+        if client is None:
+            return set()
+        dropped = set(symbols) if symbols else set(client.symbols)
+        client.symbols -= dropped
+        for sym in dropped:
+            client.pending.pop(sym, None)
+            client.last_sent.pop(sym, None)
+        if not client.symbols:
+            self._remove(ws)
+        return {sym for sym in dropped if not self.subscribers(sym)}
+
+    def _remove(self, ws: WebSocket) -> None:
+        client = self._clients.pop(ws, None)
+        if client and client.task and not client.task.done():
+            client.task.cancel()
+        info = self.connection_manager.connection_metadata.get(ws)
+        if info is not None:
+            info.pop("direct_delivery", None)
+
+    def publish(self, symbol: str, data: dict[str, Any]) -> None:
+        """Offer the newest state for a symbol to every subscribed client."""
+        for client in self._clients.values():
+            if symbol not in client.symbols:
+                continue
+            if symbol in client.pending:
+                self.connection_manager._bump_metric(self.channel, "conflated", 1.0)
+            client.pending[symbol] = data
+            client.wakeup.set()
+
+    def _build_messages(self, client: _ClientStream) -> list[dict[str, Any]]:
+        pending, client.pending = client.pending, {}
+        messages = []
+        ts = _now()
+        for symbol, data in pending.items():
+            previous = client.last_sent.get(symbol)
+            if previous is None:
+                message = {"type": "market_data", "symbol": symbol, "data": data}
+            else:
+                delta = diff_fields(previous, data)
+                if not delta["changes"] and not delta["removed"]:
+                    continue
+                message = {"type": "market_data_delta", "symbol": symbol, **delta}
+            client.seq += 1
+            message["seq"] = client.seq
+            message["timestamp"] = ts
+            client.last_sent[symbol] = data
+            messages.append(message)
+        return messages
+
+    async def _sender(self, ws: WebSocket, client: _ClientStream) -> None:
+        cm = self.connection_manager
+        try:
+            while True:
+                await client.wakeup.wait()
+                client.wakeup.clear()
+                for message in self._build_messages(client):
+                    frame = encode_message(message)
+                    await cm._send_encoded_safe(ws, frame, frame.decode("utf-8"))
+                    cm._bump_metric(self.channel, "conflated_sent", 1.0)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.warning(
+                "Conflated send failed",
+                extra={"error": repr(e), "ws_id": id(ws)},
+            )
+            # Same path as a client disconnect; this task is ending on its own
+            client.task = None
+            unused = self.unsubscribe(ws)
+            cm.disconnect(ws)
+            if unused and self.on_release is not None:
+                await self.on_release(sorted(unused))
+
+
 class MarketDataStreamer:
     """Stream real-time market data"""
 
     def __init__(self, connection_manager: ConnectionManager):
         self.connection_manager = connection_manager
+        self.subscriptions = ConflatingSubscriptions(
+            connection_manager, on_release=self.stop_streaming
+        )
+        # Callbacks fed every enhanced tick: listener(symbol, data)
+        self._tick_listeners: list[Callable[[str, dict[str, Any]], None]] = []
         self.streaming_symbols: set[str] = set()
         self.stream_task: asyncio.Task | None = None
         # Small TTL cache to avoid hammering providers
         self._quote_cache: dict[str, tuple[float, dict[str, Any]]] = {}
         self._quote_ttl: float = 10.0  # seconds
+        # Fixed loop cadence and overrun accounting
+        self.interval: float = 1.0  # seconds
+        self.stream_stats: dict[str, float] = {
+            "passes": 0,
+            "overruns": 0,
+            "ticks_skipped": 0,
+            "symbols": 0,
+            "last_pass_ms": 0.0,
+            "max_pass_ms": 0.0,
+        }
+        # Multi-worker mode: followers forward their symbols to the leader and
+        # receive its ticks through the shared backend
+        self._backend = None
+        self._backend_unsubscribes: list[Callable[[], None]] = []
+        self._origin = f"{os.getpid()}:{id(self)}"
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._remote_symbols: dict[str, set[str]] = {}
 
     async def start_streaming(self, symbols: list[str]):
         """Start streaming market data for given symbols"""
         self.streaming_symbols.update(symbols)
+        if self._is_follower():
+            self._publish_symbols()
+            return
+        self._ensure_stream_task()
 
-        if not self.stream_task or self.stream_task.done():
+    def _ensure_stream_task(self) -> None:
+        if self._active_symbols() and (not self.stream_task or self.stream_task.done()):
             self.stream_task = asyncio.create_task(self._stream_loop())
 
+    def _active_symbols(self) -> set[str]:
+        """Local symbols plus those requested by follower workers."""
+        symbols = set(self.streaming_symbols)
+        for remote in self._remote_symbols.values():
+            symbols |= remote
+        return symbols
+
+    # ------------- multi-worker relay -------------
+    def attach_backend(self, backend) -> None:
+        """Share ticks and symbol requests with other workers (call from the loop)."""
+        self.detach_backend()
+        self._loop = asyncio.get_running_loop()
+        self._backend = backend
+        self._backend_unsubscribes = [
+            backend.subscribe(MARKET_TICKS_CHANNEL, self._on_remote_ticks),
+            backend.subscribe(MARKET_SYMBOLS_CHANNEL, self._on_remote_symbols),
+        ]
+
+    def detach_backend(self) -> None:
+        for unsubscribe in self._backend_unsubscribes:
+            unsubscribe()
+        self._backend_unsubscribes = []
+        self._backend = None
+        self._remote_symbols.clear()
+
+    def resume_as_leader(self) -> None:
+        """Start polling after promotion and ask followers to resend symbols."""
+        self._ensure_stream_task()
+        if self._backend is not None:
+            self._publish(MARKET_SYMBOLS_CHANNEL, {"resend": True})
+
+    def _is_follower(self) -> bool:
+        if self._backend is None:
+            return False
+        from app.core.cluster import is_leader
+
+        return not is_leader()
+
+    def _publish(self, channel: str, body: dict[str, Any]) -> None:
+        try:
+            self._backend.publish(channel, {"origin": self._origin, **body})
+        except Exception as e:
+            logger.debug(f"Market relay publish failed: {e}")
+
+    def _publish_symbols(self) -> None:
+        self._publish(
+            MARKET_SYMBOLS_CHANNEL, {"symbols": sorted(self.streaming_symbols)}
+        )
+
+    def _on_remote_symbols(self, envelope: dict[str, Any]) -> None:
+        origin = envelope.get("origin")
+        if origin == self._origin or self._loop is None:
+            return
+        if envelope.get("resend"):
+            if self._is_follower():
+                self._publish_symbols()
+            return
+        symbols = set(envelope.get("symbols") or [])
+        self._loop.call_soon_threadsafe(self._set_remote_symbols, origin, symbols)
+
+    def _set_remote_symbols(self, origin: str, symbols: set[str]) -> None:
+        if self._is_follower():
+            return
+        if symbols:
+            self._remote_symbols[origin] = symbols
+        else:
+            self._remote_symbols.pop(origin, None)
+        self._ensure_stream_task()
+
+    def _on_remote_ticks(self, envelope: dict[str, Any]) -> None:
+        if envelope.get("origin") == self._origin or self._loop is None:
+            return
+        ticks = envelope.get("ticks") or {}
+        if ticks:
+            self._loop.call_soon_threadsafe(self._deliver_remote_ticks, ticks)
+
+    def _deliver_remote_ticks(self, ticks: dict[str, dict[str, Any]]) -> None:
+        """Feed the leader's ticks to this worker's per-client subscribers."""
+        for symbol, data in ticks.items():
+            self.subscriptions.publish(symbol, data)
+            for listener in self._tick_listeners:
+                try:
+                    listener(symbol, data)
+                except Exception as listener_error:
+                    logger.debug(f"Tick listener failed: {listener_error}")
+
+    def add_tick_listener(self, listener: Callable[[str, dict[str, Any]], None]):
+        """Register a callback invoked with (symbol, data) for every streamed tick."""
+        if listener not in self._tick_listeners:
+            self._tick_listeners.append(listener)
+
+    def remove_tick_listener(self, listener: Callable[[str, dict[str, Any]], None]):
+        if listener in self._tick_listeners:
+            self._tick_listeners.remove(listener)
+
+    async def subscribe(self, websocket: WebSocket, symbols: list[str]):
+        """Subscribe one connection to symbols with conflated, delta-encoded delivery."""
+        self.subscriptions.subscribe(websocket, symbols)
+        await self.start_streaming(symbols)
+
+    async def unsubscribe(self, websocket: WebSocket, symbols: list[str] | None = None):
+        """Unsubscribe a connection from symbols (all when None)."""
+        unused = self.subscriptions.unsubscribe(websocket, symbols)
+        if unused:
+            await self.stop_streaming(list(unused))
+
     async def stop_streaming(self, symbols: list[str] | None = None):
         """Stop streaming for specific symbols or all"""
         if symbols:
             self.streaming_symbols.difference_update(symbols)
         else:
             self.streaming_symbols.clear()
+        if self._is_follower():
+            self._publish_symbols()
+            return
 
-        if not self.streaming_symbols and self.stream_task:
+        if not self._active_symbols() and self.stream_task:
             self.stream_task.cancel()
 
     async def _stream_loop(self):
-        """Main streaming loop (best-effort, resilient)."""
+        """Main streaming loop (best-effort, resilient) on a fixed cadence."""
         try:
-            while self.streaming_symbols:
-                for symbol in list(self.streaming_symbols):
-                    try:
-                        # Get latest market data (mock for now)
-                        market_data = await self._get_market_data(symbol)
-                        if market_data:
-                            # Simple upstream backpressure: skip broadcast when queue is high
-                            try:
-                                stats = self.connection_manager.get_connection_stats()
-                                ch_stats = stats.get("per_channel", {}).get(
-                                    "market_data", {}
-                                )
-                                qlen = int(ch_stats.get("queue_len", 0))
-                                maxsize = QUEUE_LIMITS["websocket_default"]
-                                if maxsize > 0 and qlen / maxsize >= 0.8:
-                                    # coalesce this tick; try next iteration
-                                    continue
-                            except Exception:
-                                pass
-                            # BRAIN ENHANCEMENT: Route data through Ziggy's brain
-                            enhanced_data = await self._enhance_market_data_with_brain(
-                                symbol, market_data
-                            )
-
-                            # UPDATE ALERT MONITORING: Feed market data to alert system
-                            try:
-                                from app.services.alert_monitoring import alert_monitor
-
-                                alert_monitor.update_market_data(symbol, enhanced_data)
-                            except Exception as alert_error:
-                                logger.warning(
-                                    f"Failed to update alert monitoring for {symbol}: {alert_error}"
-                                )
-
-                            # Broadcast to WebSocket clients
-                            await self.connection_manager.broadcast_market_data(
-                                symbol, enhanced_data
-                            )
-                    except Exception as e:
-                        logger.error(f"Error streaming {symbol}: {e}")
-
-                await asyncio.sleep(1)  # Stream every second
+            next_tick = time.monotonic()
+            while self._active_symbols():
+                t0 = time.monotonic()
+                symbols = sorted(self._active_symbols())
+                try:
+                    await self._stream_pass(symbols)
+                except Exception as e:
+                    logger.error(f"Market data stream pass error: {e}")
+
+                # Fixed cadence: sleep to the next tick, or record the overrun and
+                # skip the ticks we missed instead of queueing them up
+                now = time.monotonic()
+                pass_ms = (now - t0) * 1000.0
+                self.stream_stats["passes"] += 1
+                self.stream_stats["last_pass_ms"] = pass_ms
+                self.stream_stats["max_pass_ms"] = max(
+                    self.stream_stats["max_pass_ms"], pass_ms
+                )
+                self.stream_stats["symbols"] = len(symbols)
+                next_tick += self.interval
+                if now > next_tick:
+                    missed = int((now - next_tick) // self.interval) + 1
+                    self.stream_stats["overruns"] += 1
+                    self.stream_stats["ticks_skipped"] += missed
+                    next_tick += missed * self.interval
+                self._report_stream_metrics()
+                await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
 
         except asyncio.CancelledError:
             logger.info("Market data streaming stopped")
         except Exception as e:
             logger.error(f"Market data streaming error: {e}")
 
+    def _report_stream_metrics(self) -> None:
+        for key in ("last_pass_ms", "max_pass_ms", "overruns", "ticks_skipped"):
+            self.connection_manager.set_metric(
+                "market_data", f"stream_{key}", float(self.stream_stats[key])
+            )
+
+    def get_stream_stats(self) -> dict[str, Any]:
+        """Return loop cadence and overrun statistics."""
+        return {"interval_s": self.interval, **self.stream_stats}
+
+    async def _stream_pass(self, symbols: list[str]) -> None:
+        """Fetch, enhance and publish one tick for all streaming symbols."""
+        quotes = await self._get_market_data_batch(symbols)
+        if not quotes:
+            return
+
+        # BRAIN ENHANCEMENT: Route the whole tick through Ziggy's brain at once
+        enhanced_batch = self._enhance_market_data_batch(quotes)
+        if self._backend is not None:
+            self._publish(MARKET_TICKS_CHANNEL, {"ticks": enhanced_batch})
+
+        # Shared channel backpressure is evaluated once per pass
+        skip_broadcast = False
+        try:
+            stats = self.connection_manager.get_connection_stats()
+            ch_stats = stats.get("per_channel", {}).get("market_data", {})
+            qlen = int(ch_stats.get("queue_len", 0))
+            maxsize = QUEUE_LIMITS["websocket_default"]
+            skip_broadcast = maxsize > 0 and qlen / maxsize >= 0.8
+        except Exception:
+            pass
+
+        try:
+            from app.services.alert_monitoring import alert_monitor
+        except Exception:
+            alert_monitor = None
+
+        for symbol, enhanced_data in enhanced_batch.items():
+            try:
+                # Per-client subscribers: conflated, never dropped
+                self.subscriptions.publish(symbol, enhanced_data)
+
+                for listener in self._tick_listeners:
+                    try:
+                        listener(symbol, enhanced_data)
+                    except Exception as listener_error:
+                        logger.debug(f"Tick listener failed: {listener_error}")
+
+                # UPDATE ALERT MONITORING: Feed market data to alert system
+                if alert_monitor is not None:
+                    try:
+                        alert_monitor.update_market_data(symbol, enhanced_data)
+                    except Exception as alert_error:
+                        logger.warning(
+                            f"Failed to update alert monitoring for {symbol}: {alert_error}"
+                        )
+
+                # Channel-wide listeners: coalesce this tick when the queue is high
+                if skip_broadcast:
+                    continue
+                await self.connection_manager.broadcast_market_data(
+                    symbol, enhanced_data
+                )
+            except Exception as e:
+                logger.error(f"Error streaming {symbol}: {e}")
+
     async def _enhance_market_data_with_brain(
         self, symbol: str, market_data: dict[str, Any]
     ) -> dict[str, Any]:
         """Enhance real-time market data with Ziggy's brain intelligence"""
+        return self._enhance_market_data_batch({symbol: market_data})[symbol]
+
+    def _enhance_market_data_batch(
+        self, batch: dict[str, dict[str, Any]]
+    ) -> dict[str, dict[str, Any]]:
+        """Enhance a whole tick with one brain call and merge results per symbol."""
         try:
             # Import brain enhancement system
             from app.services.market_brain.simple_data_hub import (
@@ -542,57 +1016,160 @@ class MarketDataStreamer:
                 enhance_market_data,
             )
 
-            # Prepare data for brain enhancement
-            symbol_data = {symbol: market_data}
-
             # Route through Ziggy's brain for enhancement
             enhanced = enhance_market_data(
-                symbol_data, DataSource.OVERVIEW, symbols=[symbol]
+                dict(batch), DataSource.OVERVIEW, symbols=list(batch)
             )
+        except Exception as e:
+            logger.warning(f"Brain enhancement failed: {e}, using raw data")
+            enhanced = e
 
-            # Extract enhanced data for the symbol
-            if isinstance(enhanced, dict):
-                # If brain returns enhanced structure, merge with original
-                brain_enhanced_data = market_data.copy()
+        out: dict[str, dict[str, Any]] = {}
+        if isinstance(enhanced, Exception):
+            # Fallback: return original data with brain attempt marker
+            for symbol, market_data in batch.items():
+                market_data["brain_enhanced"] = False
+                market_data["brain_error"] = str(enhanced)
+                out[symbol] = market_data
+            return out
+
+        if not isinstance(enhanced, dict):
+            # Fallback: add basic brain metadata
+            for symbol, market_data in batch.items():
+                market_data["brain_enhanced"] = True
+                market_data["brain_status"] = "basic_enhancement"
+                out[symbol] = market_data
+            return out
+
+        # If brain returns enhanced structure, merge with original
+        shared = {
+            "brain_enhanced": True,
+            "brain_metadata": enhanced.get("brain_metadata", {}),
+            "market_regime": enhanced.get("market_regime", {}),
+        }
+        symbols_data = enhanced.get("symbols", {})
+        for symbol, market_data in batch.items():
+            brain_enhanced_data = market_data.copy()
+            brain_enhanced_data.update(shared)
+            brain_enhanced_data["enhanced_timestamp"] = market_data.get("timestamp")
+
+            # Add brain-computed features if available
+            symbol_enhanced = symbols_data.get(symbol)
+            if isinstance(symbol_enhanced, dict):
                 brain_enhanced_data.update(
                     {
-                        "brain_enhanced": True,
-                        "brain_metadata": enhanced.get("brain_metadata", {}),
-                        "market_regime": enhanced.get("market_regime", {}),
-                        "enhanced_timestamp": market_data["timestamp"],
+                        "brain_features": symbol_enhanced.get("features", {}),
+                        "regime_context": symbol_enhanced.get("regime_context", {}),
+                        "confidence_score": symbol_enhanced.get(
+                            "confidence_score", 0.5
+                        ),
                     }
                 )
+            out[symbol] = brain_enhanced_data
 
-                # Add brain-computed features if available
-                symbols_data = enhanced.get("symbols", {})
-                if symbol in symbols_data:
-                    symbol_enhanced = symbols_data[symbol]
-                    brain_enhanced_data.update(
-                        {
-                            "brain_features": symbol_enhanced.get("features", {}),
-                            "regime_context": symbol_enhanced.get("regime_context", {}),
-                            "confidence_score": symbol_enhanced.get(
-                                "confidence_score", 0.5
-                            ),
-                        }
-                    )
+        logger.debug(f"Enhanced {len(out)} symbols with brain intelligence")
+        return out
+
+    @staticmethod
+    def _quote_from_closes(
+        symbol: str, last: float, prev: float | None, now_ts: float
+    ) -> dict[str, Any]:
+        change = (last - prev) if prev is not None else 0.0
+        change_pct = ((change / prev) * 100.0) if prev else 0.0
+        return {
+            "symbol": symbol,
+            "price": round(float(last), 2),
+            "change": round(float(change), 2),
+            "change_percent": round(float(change_pct), 2),
+            "volume": 0,  # volume not available from daily snapshot here
+            "timestamp": now_ts,
+            "market_time": datetime.now(UTC).isoformat(),
+            "provider": "provider_chain",
+        }
 
-                logger.debug(f"Enhanced {symbol} data with brain intelligence")
-                return brain_enhanced_data
+    @staticmethod
+    def _last_two_closes(df: Any) -> tuple[float | None, float | None]:
+        if df is None or getattr(df, "empty", True):
+            return None, None
+        closes = [c for c in df["Close"].tail(2).tolist() if c is not None]
+        if not closes:
+            return None, None
+        if len(closes) == 1:
+            return float(closes[-1]), None
+        return float(closes[-1]), float(closes[0])
+
+    async def _get_market_data_batch(
+        self, symbols: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Get quotes for many symbols: TTL cache first, then one provider call per
+        chunk with bounded concurrency, then per-symbol fallbacks for the rest.
+        """
+        now_ts = time.time()
+        out: dict[str, dict[str, Any]] = {}
+        misses: list[str] = []
+        for symbol in symbols:
+            cached = self._quote_cache.get(symbol)
+            if cached and cached[0] > now_ts:
+                out[symbol] = cached[1]
             else:
-                # Fallback: add basic brain metadata
-                market_data["brain_enhanced"] = True
-                market_data["brain_status"] = "basic_enhancement"
-                return market_data
+                misses.append(symbol)
+        if not misses:
+            return out
 
+        chunk_size = max(1, QUEUE_LIMITS["market_stream_chunk_size"])
+        sem = asyncio.Semaphore(max(1, QUEUE_LIMITS["market_stream_concurrency"]))
+
+        try:
+            from app.services.provider_factory import get_price_provider
+
+            provider = get_price_provider()
         except Exception as e:
-            logger.warning(
-                f"Brain enhancement failed for {symbol}: {e}, using raw data"
-            )
-            # Fallback: return original data with brain attempt marker
-            market_data["brain_enhanced"] = False
-            market_data["brain_error"] = str(e)
-            return market_data
+            logger.debug(f"Price provider unavailable for batch quotes: {e}")
+            provider = None
+
+        async def _fetch_chunk(chunk: list[str]) -> None:
+            async with sem:
+                try:
+                    data = await asyncio.wait_for(
+                        provider.fetch_ohlc(chunk, period_days=3, adjusted=True),
+                        timeout=TIMEOUTS["websocket_queue_get"],
+                    )
+                    # Some providers may return (data_dict, source_map)
+                    if isinstance(data, tuple) and len(data) >= 1:
+                        data = data[0]
+                except Exception as e:
+                    logger.debug(f"Batched quote chunk failed ({len(chunk)}): {e}")
+                    return
+            ts = time.time()
+            for symbol in chunk:
+                try:
+                    last, prev = self._last_two_closes((data or {}).get(symbol))
+                except Exception:
+                    continue
+                if last is not None:
+                    quote = self._quote_from_closes(symbol, last, prev, ts)
+                    self._quote_cache[symbol] = (ts + self._quote_ttl, quote)
+                    out[symbol] = quote
+
+        if provider is not None and hasattr(provider, "fetch_ohlc"):
+            chunks = [
+                misses[i : i + chunk_size] for i in range(0, len(misses), chunk_size)
+            ]
+            await asyncio.gather(*(_fetch_chunk(c) for c in chunks))
+
+        # Per-symbol fallbacks (open prices, yfinance) for whatever is still missing
+        remaining = [s for s in misses if s not in out]
+
+        async def _fallback(symbol: str) -> None:
+            async with sem:
+                quote = await self._get_market_data(symbol)
+            if quote:
+                out[symbol] = quote
+
+        if remaining:
+            await asyncio.gather(*(_fallback(s) for s in remaining))
+        return out
 
     async def _get_market_data(self, symbol: str) -> dict[str, Any] | None:
         """Get latest market data for symbol using real providers"""
@@ -654,18 +1231,7 @@ class MarketDataStreamer:
                     _fetch_last_two(), timeout=TIMEOUTS["websocket_queue_get"]
                 )
                 if last is not None:
-                    change = (last - prev) if prev is not None else 0.0
-                    change_pct = ((change / prev) * 100.0) if prev else 0.0
-                    market_data = {
-                        "symbol": symbol,
-                        "price": round(float(last), 2),
-                        "change": round(float(change), 2),
-                        "change_percent": round(float(change_pct), 2),
-                        "volume": 0,  # volume not available from daily snapshot here
-                        "timestamp": now_ts,
-                        "market_time": datetime.now(UTC).isoformat(),
-                        "provider": "provider_chain",
-                    }
+                    market_data = self._quote_from_closes(symbol, last, prev, now_ts)
                     self._quote_cache[symbol] = (now_ts + ttl, market_data)
                     return market_data
             except Exception as e:
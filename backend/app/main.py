@@ -4,6 +4,7 @@
 
 import logging
 import os
+import sys
 from contextlib import asynccontextmanager
 from typing import Any
 
@@ -35,11 +36,8 @@ except Exception as e:
 
 
 # ---- Lifespan management for streaming services ----
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Initialize and cleanup streaming services."""
-    logger.info("🚀 Starting ZiggyAI streaming services...")
-
+async def _start_background_services() -> None:
+    """Start background loops; in multi-worker mode only the leader runs these."""
     # Start news streaming
     try:
         from app.services.news_streaming import start_news_streaming
@@ -67,6 +65,49 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning("⚠️ Portfolio streaming not started: %s", e)
 
+    # Followers forwarded their market symbols to the previous leader
+    try:
+        from app.core.websocket import market_streamer
+
+        market_streamer.resume_as_leader()
+    except Exception as e:
+        logger.debug("Market streamer resume: %s", e)
+
+
+async def _attach_shared_backend() -> None:
+    """Fan WebSocket broadcasts and market ticks out across worker processes."""
+    from app.core.cluster import get_shared_backend
+    from app.core.websocket import connection_manager, market_streamer
+
+    backend = get_shared_backend()
+    if not backend.shared:
+        logger.warning(
+            "WORKER_MODE=multi with an in-process SHARED_BACKEND; "
+            "followers will not receive leader broadcasts"
+        )
+        return
+    connection_manager.attach_backend(backend)
+    market_streamer.attach_backend(backend)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize and cleanup streaming services."""
+    logger.info("🚀 Starting ZiggyAI streaming services...")
+
+    # WORKER_MODE=multi: run with `uvicorn app.main:app --workers N`; one worker
+    # wins the lock-file election and runs background loops, all serve requests
+    from app.core.cluster import is_multi_worker, start_cluster, stop_cluster
+
+    if is_multi_worker():
+        try:
+            await _attach_shared_backend()
+        except Exception as e:
+            logger.warning("⚠️ Shared backend not attached: %s", e)
+    leader = await start_cluster(_start_background_services)
+    if not leader:
+        logger.info("Worker %s serving as follower", os.getpid())
+
     logger.info("✅ ZiggyAI backend ready!")
 
     # Application runs while we're in this context
@@ -89,6 +130,19 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.debug("WebSocket cleanup: %s", e)
 
+    # Only if the cognitive routes were loaded (they may be lazily imported)
+    cognitive_routes = sys.modules.get("app.api.routes_cognitive")
+    if cognitive_routes is not None:
+        try:
+            cognitive_routes.shutdown_cognitive_hub()
+        except Exception as e:
+            logger.debug("Cognitive hub cleanup: %s", e)
+
+    try:
+        await stop_cluster()
+    except Exception as e:
+        logger.debug("Cluster cleanup: %s", e)
+
     logger.info("✅ ZiggyAI backend shutdown complete")
 
 
@@ -296,172 +350,27 @@ async def detailed_health() -> HealthResponse:
 
 
 # ---- Explicit router includes ----
-# Import and register all discovered routers
+# Routers are listed in app.core.router_auto.ROUTER_SPECS (module, prefix).
 # Note: Routers with their own prefix are registered as-is
-# Routers without prefix get a sensible default based on their module name
-
-try:
-    from app.api.routes import router as core_router
-
-    app.include_router(core_router, prefix="/api")
-except Exception as e:
-    logger.warning("Failed to include core router: %s", e)
-
-try:
-    from app.api.routes_alerts import router as alerts_router
-
-    app.include_router(alerts_router, prefix="/alerts")
-except Exception as e:
-    logger.warning("Failed to include alerts router: %s", e)
-
-try:
-    from app.api.routes_chat import router as chat_router
-
-    app.include_router(chat_router)  # already has prefix="/chat"
-except Exception as e:
-    logger.warning("Failed to include chat router: %s", e)
-
-try:
-    from app.api.routes_cognitive import router as cognitive_router
-
-    app.include_router(cognitive_router)  # already has prefix="/cognitive"
-except Exception as e:
-    logger.warning("Failed to include cognitive router: %s", e)
-
-try:
-    from app.api.routes_crypto import router as crypto_router
-
-    app.include_router(crypto_router, prefix="/crypto")
-except Exception as e:
-    logger.warning("Failed to include crypto router: %s", e)
-
-try:
-    from app.api.routes_dev import router as dev_router
-
-    app.include_router(dev_router, prefix="/dev")
-except Exception as e:
-    logger.warning("Failed to include dev router: %s", e)
-
-try:
-    from app.api.routes_explain import router as explain_router
-
-    app.include_router(explain_router)  # already has prefix="/signal"
-except Exception as e:
-    logger.warning("Failed to include explain router: %s", e)
-
-try:
-    from app.api.routes_feedback import router as feedback_router
-
-    app.include_router(feedback_router)  # already has prefix="/feedback"
-except Exception as e:
-    logger.warning("Failed to include feedback router: %s", e)
-
-try:
-    from app.api.routes_integration import router as integration_router
-
-    app.include_router(integration_router)  # already has prefix="/integration"
-except Exception as e:
-    logger.warning("Failed to include integration router: %s", e)
-
-try:
-    from app.api.routes_learning import router as learning_router
-
-    app.include_router(learning_router, prefix="/api/learning")
-except Exception as e:
-    logger.warning("Failed to include learning router: %s", e)
-
-try:
-    from app.api.routes_market import router as market_router
-
-    app.include_router(market_router, prefix="/market")
-except Exception as e:
-    logger.warning("Failed to include market router: %s", e)
-
-try:
-    from app.api.routes_market_calendar import router as market_calendar_router
-
-    app.include_router(market_calendar_router)  # already has prefix="/market"
-except Exception as e:
-    logger.warning("Failed to include market_calendar router: %s", e)
-
-try:
-    from app.api.routes_news import router as news_router
-
-    app.include_router(news_router, prefix="/news")
-except Exception as e:
-    logger.warning("Failed to include news router: %s", e)
-
-try:
-    from app.api.routes_paper import router as paper_router
-
-    app.include_router(paper_router, prefix="/api/paper")
-except Exception as e:
-    logger.warning("Failed to include paper router: %s", e)
-
-try:
-    from app.api.routes_performance import router as performance_router
-
-    app.include_router(performance_router)  # already has prefix="/api/performance"
-except Exception as e:
-    logger.warning("Failed to include performance router: %s", e)
-
-try:
-    from app.api.routes_risk_lite import router as risk_router
-
-    app.include_router(risk_router, prefix="/risk")
-except Exception as e:
-    logger.warning("Failed to include risk router: %s", e)
-
-try:
-    from app.api.routes_screener import router as screener_router
-
-    app.include_router(screener_router)  # already has prefix="/screener"
-except Exception as e:
-    logger.warning("Failed to include screener router: %s", e)
-
-try:
-    from app.api.routes_signals import router as signals_router
-
-    # router has prefix="/signals", combined = "/api/signals"
-    app.include_router(signals_router, prefix="/api")
-except Exception as e:
-    logger.warning("Failed to include signals router: %s", e)
-
-try:
-    from app.api.routes_trace import router as trace_router
-
-    app.include_router(trace_router)  # already has prefix="/signal"
-except Exception as e:
-    logger.warning("Failed to include trace router: %s", e)
-
-try:
-    from app.api.routes_trading import router as trading_router
-
-    app.include_router(trading_router, prefix="/trading")
-except Exception as e:
-    logger.warning("Failed to include trading router: %s", e)
-
-try:
-    from app.web.browse_router import router as browse_router
-
-    app.include_router(browse_router)  # routes already include /web prefix
-except Exception as e:
-    logger.warning("Failed to include browse router: %s", e)
-
-try:
-    from app.trading.router import router as trade_router
-
-    app.include_router(trade_router)  # already has prefix="/trade"
-except Exception as e:
-    logger.warning("Failed to include trade router: %s", e)
-
-try:
-    from app.api.routes_websocket import router as websocket_router
-
-    # WebSocket routes: /ws/market, /ws/news, etc.
-    app.include_router(websocket_router)
-except Exception as e:
-    logger.warning("Failed to include websocket router: %s", e)
+#
+# ROUTER_LOADING=lazy registers them from the precomputed manifest
+# (app/core/router_manifest.json) and imports each router module on the first
+# request under its paths; regenerate the manifest with
+# `python -m app.core.router_auto --write-manifest` after changing routes.
+from app.core.router_auto import ROUTER_SPECS, include_router_spec, install_lazy_routers
+
+ROUTER_LOADING = os.getenv("ROUTER_LOADING", "eager").strip().lower()
+
+lazy_routers = None
+if ROUTER_LOADING == "lazy":
+    lazy_routers = install_lazy_routers(app, ROUTER_SPECS)
+
+if lazy_routers is None:
+    for _module_path, _prefix in ROUTER_SPECS:
+        try:
+            include_router_spec(app, _module_path, _prefix)
+        except Exception as e:
+            logger.warning("Failed to include router %s: %s", _module_path, e)
 
 
 # ---- Auto-discovery fallback (currently disabled) ----
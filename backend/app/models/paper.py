@@ -100,7 +100,9 @@ class PaperRun(Base):
 
     # Relationships
     trades = relationship(
-        "Trade", back_populates="paper_run", cascade="all, delete-orphan"
+        "app.models.paper.Trade",
+        back_populates="paper_run",
+        cascade="all, delete-orphan",
     )
     theory_perfs = relationship(
         "TheoryPerf", back_populates="paper_run", cascade="all, delete-orphan"
@@ -168,7 +170,7 @@ class Trade(Base):
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
     # Relationships
-    paper_run = relationship("PaperRun", back_populates="trades")
+    paper_run = relationship("app.models.paper.PaperRun", back_populates="trades")
 
     # Indexes for performance
     __table_args__ = (
@@ -237,7 +239,7 @@ class TheoryPerf(Base):
     )
 
     # Relationships
-    paper_run = relationship("PaperRun", back_populates="theory_perfs")
+    paper_run = relationship("app.models.paper.PaperRun", back_populates="theory_perfs")
 
     # Constraints and indexes
     __table_args__ = (
@@ -299,7 +301,9 @@ class ModelSnapshot(Base):
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
     # Relationships
-    paper_run = relationship("PaperRun", back_populates="model_snapshots")
+    paper_run = relationship(
+        "app.models.paper.PaperRun", back_populates="model_snapshots"
+    )
 
     # Indexes
     __table_args__ = (
@@ -346,7 +350,7 @@ class TradingSession(Base):
     ended_at = Column(DateTime, nullable=True)
 
     # Relationships
-    paper_run = relationship("PaperRun")
+    paper_run = relationship("app.models.paper.PaperRun")
 
     # Indexes
     __table_args__ = (
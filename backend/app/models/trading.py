@@ -60,7 +60,7 @@ class TradingSignal(Base):
 
     # Relationships
     backtest_results = relationship("BacktestResult", back_populates="signal")
-    positions = relationship("Position", back_populates="signal")
+    positions = relationship("app.models.trading.Position", back_populates="signal")
 
 
 class BacktestResult(Base):
@@ -116,7 +116,7 @@ class Portfolio(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
-    positions = relationship("Position", back_populates="portfolio")
+    positions = relationship("app.models.trading.Position", back_populates="portfolio")
 
 
 class Position(Base):
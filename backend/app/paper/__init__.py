@@ -20,13 +20,14 @@ from .features import (
 )
 from .labels import LabelGenerator, TradeLabel, label_generator
 from .learner import OnlineLearner, PredictionResult, TrainingBatch
-from .theories import MarketFeatures, Theory, theory_registry
+from .theories import FeatureTable, MarketFeatures, Theory, theory_registry
 
 
 __all__ = [
     "BanditAlgorithm",
     "BanditAllocator",
     "FeatureComputer",
+    "FeatureTable",
     "LabelGenerator",
     "MarketFeatures",
     "OnlineLearner",
@@ -7,13 +7,13 @@ trading flow across theories based on performance metrics.
 
 from __future__ import annotations
 
-import math
-import random
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
+import numpy as np
+
 from app.core.logging import get_logger
 
 
@@ -30,7 +30,7 @@ class BanditAlgorithm(Enum):
 
 @dataclass
 class TheoryArm:
-    """Bandit arm representing a trading theory."""
+    """Bandit arm representing a trading theory (snapshot of allocator state)."""
 
     theory_id: str
 
@@ -59,6 +59,24 @@ class TheoryArm:
     last_allocation: float = 0.0
 
 
+# Per-arm statistics stored as columns: name -> (dtype, initial value)
+_ARM_FIELDS: dict[str, tuple[type, float]] = {
+    "alpha": (np.float64, 1.0),
+    "beta": (np.float64, 1.0),
+    "total_reward": (np.float64, 0.0),
+    "num_selections": (np.int64, 0),
+    "total_trades": (np.int64, 0),
+    "winning_trades": (np.int64, 0),
+    "total_pnl_bps": (np.float64, 0.0),
+    "total_fees_bps": (np.float64, 0.0),
+    "recent_alpha": (np.float64, 1.0),
+    "recent_beta": (np.float64, 1.0),
+    "recent_reward": (np.float64, 0.0),
+    "recent_selections": (np.int64, 0),
+    "last_allocation": (np.float64, 0.0),
+}
+
+
 @dataclass
 class AllocationResult:
     """Result of bandit allocation."""
@@ -79,6 +97,11 @@ class BanditAllocator:
     - Exponential decay for concept drift
     - Performance-based reward calculation
     - Cold-start handling
+
+    Arm statistics live in NumPy columns indexed by arm, so allocation over
+    hundreds of arms is a handful of array operations. Decay is lazy: each
+    allocation advances a global decay epoch and an arm's recent_* values are
+    brought up to date only when it is next read or updated.
     """
 
     def __init__(
@@ -90,6 +113,7 @@ class BanditAllocator:
         epsilon: float = 0.1,
         performance_window_mins: int = 60,
         random_seed: int | None = None,
+        initial_capacity: int = 16,
     ):
         self.algorithm = algorithm
         self.decay_factor = decay_factor
@@ -98,10 +122,21 @@ class BanditAllocator:
         self.epsilon = epsilon
         self.performance_window_mins = performance_window_mins
 
-        self.rng = random.Random(random_seed)
-        self.arms: dict[str, TheoryArm] = {}
+        self.rng = np.random.default_rng(random_seed)
         self.total_selections = 0
 
+        # Arm storage
+        self._index: dict[str, int] = {}
+        self._ids: list[str] = []
+        self._last_update: list[datetime | None] = []
+        self._stats: dict[str, np.ndarray] = {
+            name: np.full(max(1, initial_capacity), default, dtype=dtype)
+            for name, (dtype, default) in _ARM_FIELDS.items()
+        }
+        # Decays applied globally vs. per arm
+        self._decay_epoch = 0
+        self._arm_epoch = np.zeros(max(1, initial_capacity), dtype=np.int64)
+
         logger.info(
             "BanditAllocator initialized",
             extra={
@@ -111,11 +146,27 @@ class BanditAllocator:
             },
         )
 
+    @property
+    def arms(self) -> dict[str, TheoryArm]:
+        """Snapshot of every arm as TheoryArm objects (read-only view)."""
+        self._materialize(np.arange(len(self._ids)))
+        return {tid: self._snapshot(i) for tid, i in self._index.items()}
+
     def add_theory(self, theory_id: str) -> None:
         """Add a new theory arm."""
-        if theory_id not in self.arms:
-            self.arms[theory_id] = TheoryArm(theory_id=theory_id)
-            logger.info("Added theory arm", extra={"theory_id": theory_id})
+        if theory_id in self._index:
+            return
+
+        idx = len(self._ids)
+        if idx == len(self._arm_epoch):
+            self._grow(2 * idx)
+        for name, (_, default) in _ARM_FIELDS.items():
+            self._stats[name][idx] = default
+        self._arm_epoch[idx] = self._decay_epoch
+        self._index[theory_id] = idx
+        self._ids.append(theory_id)
+        self._last_update.append(None)
+        logger.info("Added theory arm", extra={"theory_id": theory_id})
 
     def allocate(self, available_theories: list[str]) -> AllocationResult:
         """
@@ -128,24 +179,25 @@ class BanditAllocator:
             AllocationResult with allocations and selected theory
         """
         # Ensure all theories are registered
-        for theory_id in available_theories:
+        theories = list(dict.fromkeys(available_theories))
+        for theory_id in theories:
             self.add_theory(theory_id)
 
-        # Apply decay to all arms
+        # Apply decay to all arms (lazily: materialized on access)
         self._apply_decay()
+        idx = np.array([self._index[t] for t in theories], dtype=np.int64)
+        self._materialize(idx)
 
         # Calculate allocations based on algorithm
         if self.algorithm == BanditAlgorithm.THOMPSON_SAMPLING:
-            result = self._thompson_sampling_allocation(available_theories)
+            result = self._thompson_sampling_allocation(theories, idx)
         elif self.algorithm == BanditAlgorithm.UCB1:
-            result = self._ucb1_allocation(available_theories)
+            result = self._ucb1_allocation(theories, idx)
         else:  # EPSILON_GREEDY
-            result = self._epsilon_greedy_allocation(available_theories)
+            result = self._epsilon_greedy_allocation(theories, idx)
 
         # Update allocation tracking
-        for theory_id, allocation in result.allocations.items():
-            if theory_id in self.arms:
-                self.arms[theory_id].last_allocation = allocation
+        self._stats["last_allocation"][idx] = [result.allocations[t] for t in theories]
 
         self.total_selections += 1
 
@@ -169,42 +221,44 @@ class BanditAllocator:
             was_winner: True if trade was profitable
             timestamp: Trade timestamp (defaults to now)
         """
-        if theory_id not in self.arms:
+        if theory_id not in self._index:
             self.add_theory(theory_id)
 
-        arm = self.arms[theory_id]
+        i = self._index[theory_id]
+        self._materialize(np.array([i]))
+        stats = self._stats
         timestamp = timestamp or datetime.utcnow()
 
         # Calculate net PnL
         net_pnl_bps = pnl_bps - fees_bps
 
         # Update basic stats
-        arm.total_trades += 1
-        arm.total_pnl_bps += net_pnl_bps
-        arm.total_fees_bps += fees_bps
-        arm.last_update = timestamp
+        stats["total_trades"][i] += 1
+        stats["total_pnl_bps"][i] += net_pnl_bps
+        stats["total_fees_bps"][i] += fees_bps
+        self._last_update[i] = timestamp
 
         if was_winner:
-            arm.winning_trades += 1
+            stats["winning_trades"][i] += 1
 
         # Update bandit-specific metrics
         if self.algorithm == BanditAlgorithm.THOMPSON_SAMPLING:
             # Convert PnL to success/failure for Beta distribution
             if net_pnl_bps > 0:
-                arm.alpha += 1
-                arm.recent_alpha += 1
+                stats["alpha"][i] += 1
+                stats["recent_alpha"][i] += 1
             else:
-                arm.beta += 1
-                arm.recent_beta += 1
+                stats["beta"][i] += 1
+                stats["recent_beta"][i] += 1
 
         elif self.algorithm == BanditAlgorithm.UCB1:
             # Normalize reward to [0, 1] range
             # Map PnL bps to reward (e.g., +100 bps = 1.0, -100 bps = 0.0)
             reward = max(0.0, min(1.0, (net_pnl_bps + 100) / 200))
-            arm.total_reward += reward
-            arm.recent_reward += reward
-            arm.num_selections += 1
-            arm.recent_selections += 1
+            stats["total_reward"][i] += reward
+            stats["recent_reward"][i] += reward
+            stats["num_selections"][i] += 1
+            stats["recent_selections"][i] += 1
 
         logger.debug(
             "Updated theory performance",
@@ -212,7 +266,7 @@ class BanditAllocator:
                 "theory_id": theory_id,
                 "net_pnl_bps": net_pnl_bps,
                 "was_winner": was_winner,
-                "total_trades": arm.total_trades,
+                "total_trades": int(stats["total_trades"][i]),
             },
         )
 
@@ -259,20 +313,12 @@ class BanditAllocator:
 
     def reset_theory(self, theory_id: str) -> bool:
         """Reset a theory's performance metrics."""
-        if theory_id in self.arms:
-            arm = self.arms[theory_id]
-            arm.alpha = 1.0
-            arm.beta = 1.0
-            arm.total_reward = 0.0
-            arm.num_selections = 0
-            arm.total_trades = 0
-            arm.winning_trades = 0
-            arm.total_pnl_bps = 0.0
-            arm.total_fees_bps = 0.0
-            arm.recent_alpha = 1.0
-            arm.recent_beta = 1.0
-            arm.recent_reward = 0.0
-            arm.recent_selections = 0
+        if theory_id in self._index:
+            i = self._index[theory_id]
+            for name, (_, default) in _ARM_FIELDS.items():
+                if name != "last_allocation":
+                    self._stats[name][i] = default
+            self._arm_epoch[i] = self._decay_epoch
             logger.info("Reset theory metrics", extra={"theory_id": theory_id})
             return True
         return False
@@ -282,21 +328,7 @@ class BanditAllocator:
         """Return serializable state of bandit arms and allocator parameters."""
         arms_payload = {}
         for tid, arm in self.arms.items():
-            arms_payload[tid] = {
-                "alpha": arm.alpha,
-                "beta": arm.beta,
-                "total_reward": arm.total_reward,
-                "num_selections": arm.num_selections,
-                "total_trades": arm.total_trades,
-                "winning_trades": arm.winning_trades,
-                "total_pnl_bps": arm.total_pnl_bps,
-                "total_fees_bps": arm.total_fees_bps,
-                "recent_alpha": arm.recent_alpha,
-                "recent_beta": arm.recent_beta,
-                "recent_reward": arm.recent_reward,
-                "recent_selections": arm.recent_selections,
-                "last_allocation": arm.last_allocation,
-            }
+            arms_payload[tid] = {name: getattr(arm, name) for name in _ARM_FIELDS}
         return {
             "algorithm": self.algorithm.value,
             "params": {
@@ -315,179 +347,183 @@ class BanditAllocator:
             return
         for tid, data in payload.items():
             self.add_theory(tid)
-            arm = self.arms[tid]
-            arm.alpha = float(data.get("alpha", arm.alpha))
-            arm.beta = float(data.get("beta", arm.beta))
-            arm.total_reward = float(data.get("total_reward", arm.total_reward))
-            arm.num_selections = int(data.get("num_selections", arm.num_selections))
-            arm.total_trades = int(data.get("total_trades", arm.total_trades))
-            arm.winning_trades = int(data.get("winning_trades", arm.winning_trades))
-            arm.total_pnl_bps = float(data.get("total_pnl_bps", arm.total_pnl_bps))
-            arm.total_fees_bps = float(data.get("total_fees_bps", arm.total_fees_bps))
-            arm.recent_alpha = float(data.get("recent_alpha", arm.recent_alpha))
-            arm.recent_beta = float(data.get("recent_beta", arm.recent_beta))
-            arm.recent_reward = float(data.get("recent_reward", arm.recent_reward))
-            arm.recent_selections = int(
-                data.get("recent_selections", arm.recent_selections)
-            )
-            arm.last_allocation = float(
-                data.get("last_allocation", arm.last_allocation)
-            )
+            i = self._index[tid]
+            self._materialize(np.array([i]))
+            for name, (dtype, _) in _ARM_FIELDS.items():
+                if name in data:
+                    cast = int if dtype is np.int64 else float
+                    self._stats[name][i] = cast(data[name])
+
+    def _grow(self, capacity: int) -> None:
+        """Reallocate arm columns with room for `capacity` arms."""
+        for name, (dtype, default) in _ARM_FIELDS.items():
+            column = np.full(capacity, default, dtype=dtype)
+            column[: len(self._ids)] = self._stats[name][: len(self._ids)]
+            self._stats[name] = column
+        epochs = np.zeros(capacity, dtype=np.int64)
+        epochs[: len(self._ids)] = self._arm_epoch[: len(self._ids)]
+        self._arm_epoch = epochs
+
+    def _snapshot(self, i: int) -> TheoryArm:
+        values = {name: self._stats[name][i].item() for name in _ARM_FIELDS}
+        return TheoryArm(
+            theory_id=self._ids[i], last_update=self._last_update[i], **values
+        )
 
     def _apply_decay(self) -> None:
-        """Apply exponential decay to recent performance metrics."""
-        for arm in self.arms.values():
-            arm.recent_alpha = max(1.0, arm.recent_alpha * self.decay_factor)
-            arm.recent_beta = max(1.0, arm.recent_beta * self.decay_factor)
-            arm.recent_reward *= self.decay_factor
-            arm.recent_selections = int(arm.recent_selections * self.decay_factor)
-
-    def _thompson_sampling_allocation(self, theories: list[str]) -> AllocationResult:
-        """Thompson Sampling allocation using Beta distributions."""
-        samples = {}
+        """Apply exponential decay to recent performance metrics.
 
-        # Sample from each theory's Beta distribution
-        for theory_id in theories:
-            arm = self.arms[theory_id]
-            # Use recent metrics for concept drift adaptation
-            sample = self.rng.betavariate(arm.recent_alpha, arm.recent_beta)
-            samples[theory_id] = sample
+        O(1): advances the global decay epoch; `_materialize` catches arms up.
+        """
+        self._decay_epoch += 1
 
-        # Select theory with highest sample
-        selected_theory = max(samples.keys(), key=lambda k: samples[k])
+    def _materialize(self, idx: np.ndarray) -> None:
+        """Apply the decay steps arms `idx` have missed since they were last read."""
+        if len(idx) == 0:
+            return
+        steps = self._decay_epoch - self._arm_epoch[idx]
+        stale = steps > 0
+        if not stale.any():
+            return
+        idx, steps = idx[stale], steps[stale]
+        stats, d = self._stats, self.decay_factor
+        factor = d ** steps.astype(np.float64)
 
-        # Calculate allocation weights based on samples
-        total_sample = sum(samples.values())
-        allocations = {}
+        # max(1, x * d) applied k times is max(1, x * d**k) for x >= 1
+        stats["recent_alpha"][idx] = np.maximum(
+            1.0, stats["recent_alpha"][idx] * factor
+        )
+        stats["recent_beta"][idx] = np.maximum(1.0, stats["recent_beta"][idx] * factor)
+        stats["recent_reward"][idx] *= factor
+
+        # Selections are truncated to int at every step; replay the steps
+        # (all arms at once) until each count has caught up or hit zero
+        selections = stats["recent_selections"][idx]
+        remaining = steps.copy()
+        active = (remaining > 0) & (selections > 0)
+        while active.any():
+            selections[active] = (selections[active] * d).astype(np.int64)
+            remaining[active] -= 1
+            active = (remaining > 0) & (selections > 0)
+        stats["recent_selections"][idx] = selections
+
+        self._arm_epoch[idx] = self._decay_epoch
+
+    def _renormalize(self, base: np.ndarray) -> np.ndarray:
+        """Apply the minimum allocation floor and renormalize to sum to 1."""
+        floored = np.maximum(self.min_allocation, base)
+        return floored / floored.sum()
+
+    def _thompson_sampling_allocation(
+        self, theories: list[str], idx: np.ndarray
+    ) -> AllocationResult:
+        """Thompson Sampling allocation using Beta distributions."""
+        # Sample every theory's Beta posterior at once, using recent metrics
+        # for concept drift adaptation
+        alphas = self._stats["recent_alpha"][idx]
+        betas = self._stats["recent_beta"][idx]
+        samples = self.rng.beta(alphas, betas)
 
-        for theory_id in theories:
-            base_allocation = (
-                samples[theory_id] / total_sample
-                if total_sample > 0
-                else 1.0 / len(theories)
-            )
-            # Ensure minimum allocation
-            allocations[theory_id] = max(self.min_allocation, base_allocation)
+        # Select theory with highest sample
+        best = int(np.argmax(samples))
 
-        # Renormalize
-        total_allocation = sum(allocations.values())
-        allocations = {k: v / total_allocation for k, v in allocations.items()}
+        # Calculate allocation weights based on samples
+        total_sample = samples.sum()
+        if total_sample > 0:
+            base = samples / total_sample
+        else:
+            base = np.full(len(theories), 1.0 / len(theories))
+        allocations = self._renormalize(base)
 
         return AllocationResult(
-            allocations=allocations,
-            selected_theory=selected_theory,
-            confidence=samples[selected_theory],
+            allocations=dict(zip(theories, allocations.tolist())),
+            selected_theory=theories[best],
+            confidence=float(samples[best]),
             algorithm_state={
-                "samples": samples,
+                "samples": dict(zip(theories, samples.tolist())),
                 "beta_parameters": {
-                    theory_id: {
-                        "alpha": self.arms[theory_id].recent_alpha,
-                        "beta": self.arms[theory_id].recent_beta,
-                    }
-                    for theory_id in theories
+                    theory_id: {"alpha": a, "beta": b}
+                    for theory_id, a, b in zip(
+                        theories, alphas.tolist(), betas.tolist()
+                    )
                 },
             },
         )
 
-    def _ucb1_allocation(self, theories: list[str]) -> AllocationResult:
-        """UCB1 allocation with confidence bounds."""
-        ucb_values = {}
-
-        for theory_id in theories:
-            arm = self.arms[theory_id]
+    def _avg_rewards(self, idx: np.ndarray) -> np.ndarray:
+        selections = self._stats["recent_selections"][idx]
+        rewards = self._stats["recent_reward"][idx]
+        return np.divide(
+            rewards,
+            selections,
+            out=np.zeros(len(idx)),
+            where=selections > 0,
+        )
 
-            if arm.recent_selections == 0:
-                # Infinite confidence for unselected arms
-                ucb_values[theory_id] = float("inf")
-            else:
-                avg_reward = arm.recent_reward / arm.recent_selections
-                confidence_bound = math.sqrt(
-                    (2 * math.log(self.total_selections)) / arm.recent_selections
-                )
-                ucb_values[theory_id] = avg_reward + self.ucb_c * confidence_bound
+    def _ucb1_allocation(
+        self, theories: list[str], idx: np.ndarray
+    ) -> AllocationResult:
+        """UCB1 allocation with confidence bounds."""
+        selections = self._stats["recent_selections"][idx]
+        avg_rewards = self._avg_rewards(idx)
+
+        # Infinite confidence for unselected arms
+        selected = selections > 0
+        log_total = np.log(max(self.total_selections, 1))
+        bounds = np.sqrt(
+            np.divide(2 * log_total, selections, out=np.zeros(len(idx)), where=selected)
+        )
+        ucb_values = np.where(selected, avg_rewards + self.ucb_c * bounds, np.inf)
 
         # Select theory with highest UCB value
-        selected_theory = max(ucb_values.keys(), key=lambda k: ucb_values[k])
+        best = int(np.argmax(ucb_values))
 
         # Convert UCB values to allocation weights
         # Use softmax transformation for smooth allocation
-        max_ucb = max(ucb_values.values())
-        if max_ucb == float("inf"):
+        max_ucb = ucb_values[best]
+        if np.isinf(max_ucb):
             # Handle infinite values
-            exp_values = {
-                theory_id: 1.0 if ucb == float("inf") else 0.1
-                for theory_id, ucb in ucb_values.items()
-            }
+            exp_values = np.where(np.isinf(ucb_values), 1.0, 0.1)
         else:
-            exp_values = {
-                theory_id: math.exp((ucb - max_ucb) / 2.0)  # Temperature = 2.0
-                for theory_id, ucb in ucb_values.items()
-            }
-
-        total_exp = sum(exp_values.values())
-        allocations = {
-            theory_id: max(self.min_allocation, exp_val / total_exp)
-            for theory_id, exp_val in exp_values.items()
-        }
-
-        # Renormalize
-        total_allocation = sum(allocations.values())
-        allocations = {k: v / total_allocation for k, v in allocations.items()}
+            exp_values = np.exp((ucb_values - max_ucb) / 2.0)  # Temperature = 2.0
+        allocations = self._renormalize(exp_values / exp_values.sum())
 
         return AllocationResult(
-            allocations=allocations,
-            selected_theory=selected_theory,
-            confidence=ucb_values[selected_theory],
+            allocations=dict(zip(theories, allocations.tolist())),
+            selected_theory=theories[best],
+            confidence=float(max_ucb),
             algorithm_state={
-                "ucb_values": ucb_values,
-                "avg_rewards": {
-                    theory_id: (
-                        self.arms[theory_id].recent_reward
-                        / self.arms[theory_id].recent_selections
-                        if self.arms[theory_id].recent_selections > 0
-                        else 0.0
-                    )
-                    for theory_id in theories
-                },
+                "ucb_values": dict(zip(theories, ucb_values.tolist())),
+                "avg_rewards": dict(zip(theories, avg_rewards.tolist())),
             },
         )
 
-    def _epsilon_greedy_allocation(self, theories: list[str]) -> AllocationResult:
+    def _epsilon_greedy_allocation(
+        self, theories: list[str], idx: np.ndarray
+    ) -> AllocationResult:
         """Epsilon-greedy allocation."""
-        # Calculate average rewards
-        avg_rewards = {}
-        for theory_id in theories:
-            arm = self.arms[theory_id]
-            if arm.recent_selections > 0:
-                avg_rewards[theory_id] = arm.recent_reward / arm.recent_selections
-            else:
-                avg_rewards[theory_id] = 0.0
+        avg_rewards = self._avg_rewards(idx)
 
         # Epsilon-greedy selection
-        if self.rng.random() < self.epsilon:
+        explore = bool(self.rng.random() < self.epsilon)
+        if explore:
             # Explore: random selection
-            selected_theory = self.rng.choice(theories)
+            best = int(self.rng.integers(len(theories)))
         else:
             # Exploit: select best theory
-            selected_theory = max(avg_rewards.keys(), key=lambda k: avg_rewards[k])
+            best = int(np.argmax(avg_rewards))
 
         # Allocation: heavy weight to selected theory, remainder distributed
-        allocations = {}
-        main_allocation = 1.0 - (len(theories) - 1) * self.min_allocation
-
-        for theory_id in theories:
-            if theory_id == selected_theory:
-                allocations[theory_id] = main_allocation
-            else:
-                allocations[theory_id] = self.min_allocation
+        allocations = np.full(len(theories), self.min_allocation)
+        allocations[best] = 1.0 - (len(theories) - 1) * self.min_allocation
 
         return AllocationResult(
-            allocations=allocations,
-            selected_theory=selected_theory,
-            confidence=avg_rewards[selected_theory],
+            allocations=dict(zip(theories, allocations.tolist())),
+            selected_theory=theories[best],
+            confidence=float(avg_rewards[best]),
             algorithm_state={
-                "avg_rewards": avg_rewards,
+                "avg_rewards": dict(zip(theories, avg_rewards.tolist())),
                 "epsilon": self.epsilon,
-                "was_exploration": self.rng.random() < self.epsilon,
+                "was_exploration": explore,
             },
         )
@@ -8,7 +8,12 @@ providing rate limiting, replay buffer, walk-forward windows, and multi-order ty
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
+import time
 import uuid
+from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -21,6 +26,9 @@ from app.trading.models import Order, Side
 
 logger = get_logger("ziggy.paper_engine")
 
+# Longest a throttled trade may wait for its rate-limit slot before it is shed
+MAX_THROTTLE_WAIT_S = 60.0
+
 
 class RunStatus(Enum):
     """Paper trading run status."""
@@ -90,6 +98,142 @@ class RunStats:
     queue_depth: int = 0
 
 
+class TokenBucket:
+    """
+    Token-bucket rate limiter with reservations.
+
+    Refills continuously at `rate` tokens/second up to `capacity`. `reserve()`
+    takes a token and returns how long the caller must wait for it, so callers
+    sleep exactly once instead of polling. Passing `max_wait` bounds the debt:
+    reservations that would wait longer are refused.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated = clock()
+
+    @classmethod
+    def per_minute(cls, limit: int, **kwargs: Any) -> TokenBucket:
+        """Bucket allowing `limit` operations per minute with a burst of `limit`."""
+        return cls(rate=limit / 60.0, capacity=float(limit), **kwargs)
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        self._refill(self._clock())
+        return self._tokens
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available now."""
+        self._refill(self._clock())
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+    def reserve(self, max_wait: float | None = None) -> float | None:
+        """
+        Take a token (possibly borrowed) and return seconds until it is valid.
+
+        Returns None, without taking a token, if the wait would exceed `max_wait`.
+        """
+        self._refill(self._clock())
+        wait = max(0.0, 1.0 - self._tokens) / self.rate
+        if max_wait is not None and wait > max_wait:
+            return None
+        self._tokens -= 1.0
+        return wait
+
+    def refund(self) -> None:
+        """Return a reserved token that will not be used."""
+        self._refill(self._clock())
+        self._tokens = min(self.capacity, self._tokens + 1.0)
+
+
+class DelayQueue:
+    """
+    Priority queue of items released at a scheduled time.
+
+    Items come out ordered by (ready_at, arrival) and never before `ready_at`.
+    Within a key (symbol) ready times are forced non-decreasing, so each
+    key's items are released in FIFO order. With `maxsize` > 0, `put()`
+    raises asyncio.QueueFull once that many items are waiting.
+    """
+
+    def __init__(self, maxsize: int = 0, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self._clock = clock
+        self._heap: list[tuple[float, int, str | None, Any]] = []
+        self._seq = itertools.count()
+        self._last_ready: dict[str, float] = {}
+        self._queued: dict[str, int] = {}
+        self._changed = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self._heap)
+
+    def put(self, item: Any, delay: float = 0.0, key: str | None = None) -> float:
+        """Schedule `item` after `delay` seconds; returns its ready time."""
+        if self.full():
+            raise asyncio.QueueFull
+        ready_at = self._clock() + max(0.0, delay)
+        if key is not None:
+            ready_at = max(ready_at, self._last_ready.get(key, ready_at))
+            self._last_ready[key] = ready_at
+            self._queued[key] = self._queued.get(key, 0) + 1
+        heapq.heappush(self._heap, (ready_at, next(self._seq), key, item))
+        self._changed.set()
+        return ready_at
+
+    async def get(self) -> Any:
+        """Wait for the earliest item to become ready and return it."""
+        while True:
+            if self._heap:
+                wait = self._heap[0][0] - self._clock()
+                if wait <= 0:
+                    _, _, key, item = heapq.heappop(self._heap)
+                    if key is not None:
+                        self._queued[key] -= 1
+                        if not self._queued[key]:
+                            del self._queued[key]
+                            del self._last_ready[key]
+                    return item
+            else:
+                wait = None
+            self._changed.clear()
+            try:
+                # Woken early when an item is added (it may be due sooner)
+                await asyncio.wait_for(self._changed.wait(), timeout=wait)
+            except TimeoutError:
+                pass
+
+    def pending(self, key: str) -> bool:
+        """True while an item for `key` is still waiting in the queue."""
+        return key in self._queued
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._last_ready.clear()
+        self._queued.clear()
+
+
 class PaperEngine:
     """
     Micro-trade engine for autonomous paper trading.
@@ -119,9 +263,25 @@ class PaperEngine:
         self.active_tasks: set[asyncio.Task] = set()
         self.semaphore: asyncio.Semaphore | None = None
 
-        # Rate limiting
-        self.trade_timestamps: list[datetime] = []
-        self.last_minute_trades = 0
+        # Rate limiting: token bucket + delay queue (FIFO per symbol)
+        self.rate_limiter: TokenBucket | None = None
+        self.delayed_trades = DelayQueue(maxsize=max_queue_size)
+        self.throttle_stats: dict[str, float] = self._init_throttle_stats()
+
+        # Brain ingest backpressure: trades the brain queue refused are held
+        # here and retried in order instead of being lost
+        self._brain_backlog: deque[Any] = deque()
+        self.brain_backlog_max = 1000
+        # Leading backlog entries already counted as rejected (waiting to retry)
+        self._brain_waiting = 0
+        self.brain_ingest: dict[str, int] = {
+            "accepted": 0,
+            "backpressure": 0,
+            "rejected": 0,
+            "retries": 0,
+            "failed": 0,
+            "dropped": 0,
+        }
 
         # Statistics
         self.stats = RunStats()
@@ -161,7 +321,9 @@ class PaperEngine:
 
         # Initialize rate limiting
         self.semaphore = asyncio.Semaphore(params.max_concurrency)
-        self.trade_timestamps.clear()
+        self.rate_limiter = TokenBucket.per_minute(params.max_trades_per_minute)
+        self.delayed_trades = DelayQueue(maxsize=self.max_queue_size)
+        self.throttle_stats = self._init_throttle_stats()
 
         # Reset statistics
         self.stats = RunStats()
@@ -302,6 +464,12 @@ class PaperEngine:
                 "total_pnl": self.stats.total_pnl,
                 "win_rate": self.stats.win_rate,
                 "last_error": self.stats.last_error,
+                "delayed_trades": len(self.delayed_trades),
+                "throttle": dict(self.throttle_stats),
+                "brain_ingest": {
+                    **self.brain_ingest,
+                    "backlog": len(self._brain_backlog),
+                },
             },
             "theory_stats": self.theory_stats,
         }
@@ -329,9 +497,11 @@ class PaperEngine:
         task = asyncio.create_task(self._process_signals())
         self.active_tasks.add(task)
 
-        # Trade executor
+        # Trade executor: rate-limit intake and scheduled dispatch
         task = asyncio.create_task(self._execute_trades())
         self.active_tasks.add(task)
+        task = asyncio.create_task(self._dispatch_delayed_trades())
+        self.active_tasks.add(task)
 
         # Stats updater
         task = asyncio.create_task(self._update_stats_loop())
@@ -417,28 +587,76 @@ class PaperEngine:
                     request = await asyncio.wait_for(
                         self.trade_requests.get(), timeout=1.0
                     )
-
-                    # Check rate limit
-                    if not await self._check_rate_limit():
-                        # Re-queue the request for later
-                        await asyncio.sleep(0.1)
-                        import contextlib
-
-                        with contextlib.suppress(asyncio.QueueFull):
-                            self.trade_requests.put_nowait(request)
-                        continue
-
-                    # Execute trade
-                    task = asyncio.create_task(self._execute_trade(request))
-                    self.active_tasks.add(task)
-
                 except TimeoutError:
                     continue
 
+                # Reserve a token; throttled requests wait in the delay queue
+                # for exactly their slot instead of being re-queued at the tail;
+                # past the wait or queue bound the request is shed
+                wait = self._reserve_trade_slot()
+                symbol = request.signal.symbol
+                if wait is None:
+                    self._shed_trade(request, "rate limit backlog full")
+                    continue
+                if wait <= 0 and not self.delayed_trades.pending(symbol):
+                    self._launch_trade(request)
+                    continue
+                try:
+                    self.delayed_trades.put(request, delay=wait, key=symbol)
+                except asyncio.QueueFull:
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.refund()
+                    self._shed_trade(request, "delay queue full")
+                    continue
+                self.throttle_stats["throttled"] += 1
+                self.throttle_stats["throttled_seconds"] += wait
+                self.throttle_stats["max_wait_s"] = max(
+                    self.throttle_stats["max_wait_s"], wait
+                )
+
         except asyncio.CancelledError:
             logger.info("Trade executor cancelled")
             raise
 
+    async def _dispatch_delayed_trades(self) -> None:
+        """Launch throttled trades when their reserved slot comes up."""
+        try:
+            while self.status == RunStatus.RUNNING:
+                request = await self.delayed_trades.get()
+                self._launch_trade(request)
+        except asyncio.CancelledError:
+            self.delayed_trades.clear()
+            raise
+
+    def _launch_trade(self, request: TradeRequest) -> None:
+        task = asyncio.create_task(self._execute_trade(request))
+        self.active_tasks.add(task)
+
+    def _reserve_trade_slot(self) -> float | None:
+        """
+        Reserve one trade against the per-minute budget; returns seconds to wait.
+
+        None means the slot is more than MAX_THROTTLE_WAIT_S away.
+        """
+        if self.rate_limiter is None:
+            return 0.0
+        return self.rate_limiter.reserve(max_wait=MAX_THROTTLE_WAIT_S)
+
+    def _shed_trade(self, request: TradeRequest, reason: str) -> None:
+        self.throttle_stats["shed"] += 1
+        logger.warning(
+            "Trade throttle saturated, dropping trade request",
+            extra={
+                "signal_id": request.signal.signal_id,
+                "symbol": request.signal.symbol,
+                "reason": reason,
+            },
+        )
+
+    @staticmethod
+    def _init_throttle_stats() -> dict[str, float]:
+        return {"throttled": 0, "throttled_seconds": 0.0, "max_wait_s": 0.0, "shed": 0}
+
     async def _execute_trade(self, request: TradeRequest) -> None:
         """Execute a single trade."""
         if self.semaphore is None:
@@ -494,22 +712,9 @@ class PaperEngine:
 
     async def _check_rate_limit(self) -> bool:
         """Check if we can execute another trade without exceeding rate limit."""
-        if self.params is None:
-            return False
-
-        now = datetime.utcnow()
-
-        # Clean old timestamps
-        cutoff = now - timedelta(minutes=1)
-        self.trade_timestamps = [ts for ts in self.trade_timestamps if ts > cutoff]
-
-        # Check limit
-        if len(self.trade_timestamps) >= self.params.max_trades_per_minute:
+        if self.params is None or self.rate_limiter is None:
             return False
-
-        # Record timestamp
-        self.trade_timestamps.append(now)
-        return True
+        return self.rate_limiter.try_acquire()
 
     def _get_market_price(self, symbol: str) -> float:
         """Get market price for a symbol (simplified for now)."""
@@ -547,7 +752,6 @@ class PaperEngine:
         try:
             # Import here to avoid circular dependencies
             from app.models.paper import Trade, TradeStatus
-            from app.paper.ingest import enqueue_for_brain
 
             # Create a minimal Trade object for brain ingestion
             # Note: In a full implementation, this would be the actual persisted trade
@@ -563,24 +767,9 @@ class PaperEngine:
                 realized_pnl=0.0,  # Would be calculated later
             )
 
-            # Enqueue asynchronously (fire and forget)
-            import asyncio
-
-            t = asyncio.create_task(enqueue_for_brain(trade))
-            try:
-                self.active_tasks.add(t)
-                t.add_done_callback(self.active_tasks.discard)
-            except Exception:
-                pass
-
-            logger.debug(
-                "Trade enqueued for brain learning",
-                extra={
-                    "trade_id": signal.signal_id,
-                    "symbol": signal.symbol,
-                    "theory": signal.theory_id,
-                },
-            )
+            # Trades wait in a local backlog while the brain queue is full
+            self._brain_backlog.append(trade)
+            self._flush_brain_backlog()
 
         except ImportError:
             # Brain ingest not available
@@ -591,6 +780,40 @@ class PaperEngine:
                 extra={"signal_id": signal.signal_id, "error": str(e)},
             )
 
+    def _flush_brain_backlog(self) -> None:
+        """Offer backlogged trades to the brain queue in order, honouring backpressure."""
+        try:
+            from app.paper.ingest import IngestStatus, submit_for_brain
+        except ImportError:
+            # Brain ingest not available
+            self._brain_backlog.clear()
+            self._brain_waiting = 0
+            return
+
+        while self._brain_backlog:
+            if self._brain_waiting:
+                self.brain_ingest["retries"] += 1
+            status = submit_for_brain(self._brain_backlog[0])
+            if status == IngestStatus.REJECTED:
+                # Count each trade once, when it starts waiting, not per retry
+                waiting = len(self._brain_backlog)
+                self.brain_ingest["rejected"] += waiting - self._brain_waiting
+                self._brain_waiting = waiting
+                break
+            self._brain_backlog.popleft()
+            self._brain_waiting = max(0, self._brain_waiting - 1)
+            self.brain_ingest[status.value] += 1
+
+        # Bounded backlog: shed the oldest trades, and say so
+        while len(self._brain_backlog) > self.brain_backlog_max:
+            dropped = self._brain_backlog.popleft()
+            self._brain_waiting = max(0, self._brain_waiting - 1)
+            self.brain_ingest["dropped"] += 1
+            logger.warning(
+                "Brain backlog full, dropping oldest trade",
+                extra={"trade_id": getattr(dropped, "trade_id", None)},
+            )
+
     def _init_theory_stats(self) -> dict[str, Any]:
         """Initialize statistics for a theory."""
         return {
@@ -624,6 +847,7 @@ class PaperEngine:
         try:
             while self.status == RunStatus.RUNNING:
                 await self._update_stats()
+                self._flush_brain_backlog()
                 await asyncio.sleep(10)  # Update every 10 seconds
         except asyncio.CancelledError:
             pass
@@ -7,14 +7,17 @@ into Ziggy's brain learning system for future prediction enhancement.
 
 from __future__ import annotations
 
+import asyncio
+import bisect
+import time
 from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
+from enum import Enum
 from typing import Any
 
 from app.core.logging import get_logger
 from app.models.paper import Trade
-from app.paper.features import FeatureComputer
 
 
 logger = get_logger("ziggy.paper.ingest")
@@ -31,22 +34,55 @@ class BrainTradeEvent:
     timestamp: datetime
     theory_name: str
     metadata: dict[str, Any]
+    # Monotonic enqueue time, used for lag metrics
+    enqueued_at: float = 0.0
+
+
+class IngestStatus(str, Enum):
+    """Outcome of offering an event to the brain queue."""
+
+    ACCEPTED = "accepted"
+    # Accepted, but the queue is above its high watermark: producers should slow down
+    BACKPRESSURE = "backpressure"
+    # Queue full; the event was NOT stored and the producer still owns it
+    REJECTED = "rejected"
+    # The trade could not be converted into an event
+    FAILED = "failed"
 
 
 class BrainIngestQueue:
-    """In-memory queue for trade events awaiting brain processing."""
+    """
+    Bounded in-memory queue for trade events awaiting brain processing.
 
-    def __init__(self, max_size: int = 10000):
-        self.queue: deque[BrainTradeEvent] = deque(maxlen=max_size)
+    A full queue rejects new events instead of evicting old ones, and
+    `enqueue` reports backpressure above `high_watermark` so producers can
+    hold or shed load explicitly.
+    """
+
+    def __init__(self, max_size: int = 10000, high_watermark: float = 0.8):
+        self.queue: deque[BrainTradeEvent] = deque()
+        self.max_size = max_size
+        self.high_watermark = high_watermark
         self.events_total = 0
         self.events_5m = 0
+        self.events_rejected = 0
+        self.events_backpressure = 0
         self.last_5m_timestamp = datetime.utcnow()
+        self._wakeup: asyncio.Event | None = None
+        self._wake_at = 1
+
+    def enqueue(self, event: BrainTradeEvent) -> IngestStatus:
+        """Add trade event to brain queue; never drops silently."""
+        if len(self.queue) >= self.max_size:
+            self.events_rejected += 1
+            return IngestStatus.REJECTED
 
-    def enqueue(self, event: BrainTradeEvent) -> None:
-        """Add trade event to brain queue."""
+        event.enqueued_at = time.monotonic()
         self.queue.append(event)
         self.events_total += 1
         self._update_5m_counter()
+        if self._wakeup is not None and len(self.queue) >= self._wake_at:
+            self._wakeup.set()
 
         logger.debug(
             "Trade event enqueued for brain",
@@ -60,6 +96,35 @@ class BrainIngestQueue:
             },
         )
 
+        if self.pressure() >= self.high_watermark:
+            self.events_backpressure += 1
+            return IngestStatus.BACKPRESSURE
+        return IngestStatus.ACCEPTED
+
+    def pressure(self) -> float:
+        """Queue fill ratio (0.0 empty, 1.0 full)."""
+        return len(self.queue) / self.max_size if self.max_size else 0.0
+
+    def oldest_age(self) -> float:
+        """Seconds the oldest queued event has been waiting (0.0 if empty)."""
+        if not self.queue:
+            return 0.0
+        return max(0.0, time.monotonic() - self.queue[0].enqueued_at)
+
+    async def wait_for(self, min_items: int, timeout: float) -> bool:
+        """Wait until at least `min_items` are queued or `timeout` passes."""
+        if len(self.queue) >= min_items:
+            return True
+        self._wake_at = max(1, min_items)
+        self._wakeup = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=max(0.0, timeout))
+            return True
+        except TimeoutError:
+            return len(self.queue) >= min_items
+        finally:
+            self._wakeup = None
+
     def drain_batch(self, batch_size: int = 256) -> list[BrainTradeEvent]:
         """Drain a batch of events from the queue."""
         batch = []
@@ -90,6 +155,51 @@ class BrainIngestQueue:
 _brain_queue = BrainIngestQueue()
 
 
+# Histogram bucket upper bounds
+LAG_MS_BUCKETS = (10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+THROUGHPUT_BUCKETS = (10, 50, 100, 500, 1000, 5000, 10000, 50000, 100000)
+
+
+class Histogram:
+    """Fixed-bucket histogram; `buckets[i]` counts values <= `bounds[i]`."""
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.buckets[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float | None:
+        """Upper bound of the bucket holding the q-quantile (max for overflow)."""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target:
+                return float(self.bounds[i]) if i < len(self.bounds) else self.max
+        return self.max
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.sum / self.count if self.count else None,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "bounds": list(self.bounds),
+            "buckets": list(self.buckets),
+        }
+
+
 class LearnerMetrics:
     """Metrics for learner processing."""
 
@@ -100,12 +210,24 @@ class LearnerMetrics:
         self.last_batch_timestamp: datetime | None = None
         self.learner_available = False
         self.last_error: str | None = None
-
-    def record_batch(self, batch_size: int) -> None:
+        # Enqueue-to-processed lag per event, and events/second per batch
+        self.lag_ms = Histogram(LAG_MS_BUCKETS)
+        self.throughput_eps = Histogram(THROUGHPUT_BUCKETS)
+
+    def record_batch(
+        self,
+        batch_size: int,
+        lags_ms: list[float] | None = None,
+        duration_s: float | None = None,
+    ) -> None:
         """Record a processed batch."""
         self.batches_total += 1
         self._update_5m_counter()
         self.last_batch_timestamp = datetime.utcnow()
+        for lag in lags_ms or ():
+            self.lag_ms.observe(lag)
+        if batch_size and duration_s is not None:
+            self.throughput_eps.observe(batch_size / max(duration_s, 1e-6))
 
         logger.info(
             "Learner batch processed",
@@ -138,16 +260,14 @@ class LearnerMetrics:
 _learner_metrics = LearnerMetrics()
 
 
-async def enqueue_for_brain(trade: Trade) -> None:
+def submit_for_brain(trade: Trade) -> IngestStatus:
     """
-    Enqueue trade for brain learning ingestion.
+    Offer a trade to the brain learning queue.
 
-    This is called after each trade is persisted to the database.
+    Returns the queue's answer so the caller can react to backpressure; on
+    REJECTED the trade was not stored and should be held or retried.
     """
     try:
-        # Extract features using existing feature computer
-        feature_computer = FeatureComputer()
-
         # Simplified feature extraction for now
         features = [
             float(trade.quantity) if trade.quantity else 0.0,
@@ -175,25 +295,37 @@ async def enqueue_for_brain(trade: Trade) -> None:
             },
         )
 
-        # Enqueue for brain processing
-        _brain_queue.enqueue(event)
-
-        logger.info(
-            "Trade enqueued for brain learning",
-            extra={
-                "evt": "brain_enqueue",
-                "trade_id": trade.trade_id,
-                "symbol": trade.ticker,
-                "features": len(features),
-                "label": label,
-            },
-        )
-
     except Exception as e:
         logger.error(
             "Failed to enqueue trade for brain",
             extra={"trade_id": getattr(trade, "trade_id", "unknown"), "error": str(e)},
         )
+        return IngestStatus.FAILED
+
+    # Enqueue for brain processing
+    status = _brain_queue.enqueue(event)
+
+    logger.debug(
+        "Trade offered for brain learning",
+        extra={
+            "evt": "brain_enqueue",
+            "trade_id": trade.trade_id,
+            "symbol": trade.ticker,
+            "features": len(features),
+            "label": label,
+            "status": status.value,
+        },
+    )
+    return status
+
+
+async def enqueue_for_brain(trade: Trade) -> IngestStatus:
+    """
+    Enqueue trade for brain learning ingestion.
+
+    This is called after each trade is persisted to the database.
+    """
+    return submit_for_brain(trade)
 
 
 def get_brain_queue_metrics() -> dict[str, Any]:
@@ -202,6 +334,10 @@ def get_brain_queue_metrics() -> dict[str, Any]:
         "queue_depth": _brain_queue.get_depth(),
         "events_total": _brain_queue.events_total,
         "events_5m": _brain_queue.get_5m_count(),
+        "events_rejected": _brain_queue.events_rejected,
+        "events_backpressure": _brain_queue.events_backpressure,
+        "pressure": round(_brain_queue.pressure(), 4),
+        "oldest_age_s": round(_brain_queue.oldest_age(), 3),
     }
 
 
@@ -217,4 +353,6 @@ def get_learner_metrics() -> dict[str, Any]:
         ),
         "learner_available": _learner_metrics.learner_available,
         "last_error": _learner_metrics.last_error,
+        "lag_ms": _learner_metrics.lag_ms.to_dict(),
+        "throughput_eps": _learner_metrics.throughput_eps.to_dict(),
     }
@@ -7,10 +7,14 @@ future returns at various horizons and trade outcome classification.
 
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Sequence
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
+import numpy as np
+
 from app.core.logging import get_logger
 from app.paper.features import PriceData
 
@@ -48,6 +52,17 @@ class TradeLabel:
     hold_duration_mins: int | None = None
 
 
+@dataclass
+class PendingLabel:
+    """Trade waiting for its longest horizon to elapse before labeling."""
+
+    symbol: str
+    entry_time: datetime
+    entry_price: float
+    side: str
+    due_time: datetime
+
+
 @dataclass
 class CalibrationMetrics:
     """Calibration metrics for model predictions."""
@@ -58,15 +73,95 @@ class CalibrationMetrics:
     horizon_mins: int
 
 
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_EPOCH_AWARE = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_seconds(ts: datetime) -> float:
+    """Seconds since the epoch; naive timestamps stay naive (no local tz shift)."""
+    epoch = _EPOCH_NAIVE if ts.tzinfo is None else _EPOCH_AWARE
+    return (ts - epoch).total_seconds()
+
+
+class _PriceSeries:
+    """Per-symbol timestamps (epoch seconds) and closes in sorted arrays.
+
+    Backed by buffers of twice the window so appends are amortized O(1); the
+    last `max_points` observations are compacted to the front when full.
+    """
+
+    def __init__(self, max_points: int):
+        self.max_points = max_points
+        self._ts = np.empty(2 * max_points, dtype=np.float64)
+        self._close = np.empty(2 * max_points, dtype=np.float64)
+        self._n = 0
+
+    def __len__(self) -> int:
+        return min(self._n, self.max_points)
+
+    def append(self, ts: float, close: float) -> None:
+        if self._n == len(self._ts):
+            keep = self.max_points
+            self._ts[:keep] = self._ts[self._n - keep : self._n]
+            self._close[:keep] = self._close[self._n - keep : self._n]
+            self._n = keep
+
+        n = self._n
+        if n and ts < self._ts[n - 1]:
+            # Late observation: insert at its sorted position
+            pos = int(np.searchsorted(self._ts[:n], ts, side="right"))
+            self._ts[pos + 1 : n + 1] = self._ts[pos:n]
+            self._close[pos + 1 : n + 1] = self._close[pos:n]
+        else:
+            pos = n
+        self._ts[pos] = ts
+        self._close[pos] = close
+        self._n = n + 1
+
+    @property
+    def ts(self) -> np.ndarray:
+        return self._ts[self._n - len(self) : self._n]
+
+    @property
+    def close(self) -> np.ndarray:
+        return self._close[self._n - len(self) : self._n]
+
+    @property
+    def last_ts(self) -> float | None:
+        return float(self._ts[self._n - 1]) if self._n else None
+
+
+def _closest_indices(ts: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Index of the observation closest to each target (earliest on ties)."""
+    last = len(ts) - 1
+    right = np.searchsorted(ts, targets, side="left")
+    hi = np.minimum(right, last)
+    lo = np.maximum(right - 1, 0)
+    use_lo = np.abs(targets - ts[lo]) <= np.abs(ts[hi] - targets)
+    closest = np.where(use_lo, lo, hi)
+    # Duplicate timestamps resolve to their first occurrence
+    return np.searchsorted(ts, ts[closest], side="left")
+
+
 class LabelGenerator:
     """Generates labels for trades and predictions."""
 
     def __init__(
-        self, horizons_mins: list[int] | None = None, direction_threshold: float = 0.001
-    ):  # 0.1% threshold for direction
+        self,
+        horizons_mins: list[int] | None = None,
+        direction_threshold: float = 0.001,  # 0.1% threshold for direction
+        max_history: int = 500,
+        label_grace_mins: float = 5.0,
+    ):
         self.horizons_mins = horizons_mins or [5, 15, 60]
         self.direction_threshold = direction_threshold
-        self.price_history: dict[str, list[PriceData]] = {}
+        self.max_history = max_history
+        # Labels are resolved once the feed passes the longest horizon, or
+        # this long after it when the symbol's feed has stalled
+        self.label_grace_mins = label_grace_mins
+        self.price_history: dict[str, deque[PriceData]] = {}
+        self._series: dict[str, _PriceSeries] = {}
+        self._pending: list[PendingLabel] = []
 
         logger.info(
             "LabelGenerator initialized",
@@ -78,16 +173,16 @@ class LabelGenerator:
 
     def add_price_data(self, price_data: PriceData) -> None:
         """Add price data for label generation."""
-        if price_data.symbol not in self.price_history:
-            self.price_history[price_data.symbol] = []
-
-        self.price_history[price_data.symbol].append(price_data)
+        symbol = price_data.symbol
+        if symbol not in self.price_history:
+            # Keep only recent data (e.g., last 500 points)
+            self.price_history[symbol] = deque(maxlen=self.max_history)
+            self._series[symbol] = _PriceSeries(self.max_history)
 
-        # Keep only recent data (e.g., last 500 points)
-        if len(self.price_history[price_data.symbol]) > 500:
-            self.price_history[price_data.symbol] = self.price_history[
-                price_data.symbol
-            ][-500:]
+        self.price_history[symbol].append(price_data)
+        self._series[symbol].append(
+            _to_seconds(price_data.timestamp), float(price_data.close)
+        )
 
     def generate_trade_label(
         self, symbol: str, entry_time: datetime, entry_price: float, side: str
@@ -104,51 +199,150 @@ class LabelGenerator:
         Returns:
             TradeLabel with forward returns and metrics
         """
-        label = TradeLabel(
-            symbol=symbol, entry_time=entry_time, entry_price=entry_price, side=side
+        return self.generate_trade_labels([(symbol, entry_time, entry_price, side)])[0]
+
+    def generate_trade_labels(
+        self, trades: Sequence[tuple[str, datetime, float, str]]
+    ) -> list[TradeLabel]:
+        """
+        Generate labels for many trades at once.
+
+        Args:
+            trades: (symbol, entry_time, entry_price, side) tuples
+
+        Returns:
+            TradeLabels in the same order as `trades`
+        """
+        labels = [
+            TradeLabel(
+                symbol=symbol, entry_time=entry_time, entry_price=entry_price, side=side
+            )
+            for symbol, entry_time, entry_price, side in trades
+        ]
+
+        by_symbol: dict[str, list[int]] = {}
+        for i, label in enumerate(labels):
+            by_symbol.setdefault(label.symbol, []).append(i)
+
+        for symbol, rows in by_symbol.items():
+            series = self._series.get(symbol)
+            if series is None or not len(series):
+                continue
+            self._label_symbol(series, [labels[i] for i in rows])
+
+        return labels
+
+    def _label_symbol(self, series: _PriceSeries, labels: list[TradeLabel]) -> None:
+        """Fill forward returns and excursions for one symbol's trades."""
+        ts, close = series.ts, series.close
+        entry_prices = np.array([label.entry_price for label in labels], dtype=float)
+        is_buy = np.array([label.side == "BUY" for label in labels])
+        entry_secs = np.array([_to_seconds(label.entry_time) for label in labels])
+
+        # Entry and every horizon in one binary search each
+        entry_idx = _closest_indices(ts, entry_secs)
+        horizon_secs = np.array(self.horizons_mins, dtype=float) * 60.0
+        future_idx = _closest_indices(
+            ts, (entry_secs[:, None] + horizon_secs[None, :]).ravel()
+        ).reshape(len(labels), len(horizon_secs))
+
+        future_prices = close[future_idx]
+        ep = entry_prices[:, None]
+        returns = np.where(is_buy[:, None], future_prices - ep, ep - future_prices) / ep
+        has_future = future_idx > entry_idx[:, None]
+
+        # Best/worst close after each entry via suffix cumulative max/min
+        suffix_max = np.maximum.accumulate(close[::-1])[::-1]
+        suffix_min = np.minimum.accumulate(close[::-1])[::-1]
+        after = np.minimum(entry_idx + 1, len(close) - 1)
+        best, worst = suffix_max[after], suffix_min[after]
+        favorable = (
+            np.where(is_buy, best - entry_prices, entry_prices - worst) / entry_prices
         )
+        adverse = (
+            np.where(is_buy, worst - entry_prices, entry_prices - best) / entry_prices
+        )
+        has_after = entry_idx < len(close) - 1
+
+        for row, label in enumerate(labels):
+            for col, horizon_mins in enumerate(self.horizons_mins):
+                if not has_future[row, col] or not hasattr(
+                    label, f"return_{horizon_mins}m"
+                ):
+                    continue
+                forward_return = float(returns[row, col])
+                setattr(label, f"return_{horizon_mins}m", forward_return)
+                setattr(
+                    label,
+                    f"direction_{horizon_mins}m",
+                    self._classify_direction(forward_return),
+                )
 
-        if symbol not in self.price_history:
-            return label
-
-        price_data = self.price_history[symbol]
-
-        # Find the price data point closest to entry time
-        entry_idx = self._find_closest_price_index(price_data, entry_time)
-        if entry_idx is None:
-            return label
-
-        # Calculate forward returns at each horizon
-        for horizon_mins in self.horizons_mins:
-            future_time = entry_time + timedelta(minutes=horizon_mins)
-            future_idx = self._find_closest_price_index(price_data, future_time)
-
-            if future_idx is not None and future_idx > entry_idx:
-                future_price = price_data[future_idx].close
-
-                # Calculate return based on trade side
-                if side == "BUY":
-                    forward_return = (future_price - entry_price) / entry_price
-                else:  # SELL
-                    forward_return = (entry_price - future_price) / entry_price
-
-                # Store return
-                if horizon_mins == 5:
-                    label.return_5m = forward_return
-                    label.direction_5m = self._classify_direction(forward_return)
-                elif horizon_mins == 15:
-                    label.return_15m = forward_return
-                    label.direction_15m = self._classify_direction(forward_return)
-                elif horizon_mins == 60:
-                    label.return_60m = forward_return
-                    label.direction_60m = self._classify_direction(forward_return)
-
-        # Calculate max favorable/adverse excursions
-        label.max_favorable_excursion, label.max_adverse_excursion = (
-            self._calculate_excursions(price_data, entry_idx, entry_price, side)
+            if has_after[row]:
+                label.max_favorable_excursion = max(0.0, float(favorable[row]))
+                label.max_adverse_excursion = abs(min(0.0, float(adverse[row])))
+
+    def enqueue_trade(
+        self, symbol: str, entry_time: datetime, entry_price: float, side: str
+    ) -> PendingLabel:
+        """
+        Queue a trade for labeling once its longest horizon has elapsed.
+
+        Labeling at entry time would see no forward prices, so trades wait
+        here and are labeled together by `resolve_pending`.
+        """
+        pending = PendingLabel(
+            symbol=symbol,
+            entry_time=entry_time,
+            entry_price=entry_price,
+            side=side,
+            due_time=entry_time + timedelta(minutes=max(self.horizons_mins)),
         )
+        self._pending.append(pending)
+        return pending
 
-        return label
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def resolve_pending(self, now: datetime | None = None) -> list[TradeLabel]:
+        """
+        Label every queued trade whose horizons have elapsed.
+
+        A trade is ready once its symbol's feed reaches the due time, or once
+        `now` is `label_grace_mins` past it (stalled feed, partial labels).
+
+        Args:
+            now: Current time; None resolves on observed data only
+
+        Returns:
+            TradeLabels for the resolved trades, in queue order
+        """
+        grace = timedelta(minutes=self.label_grace_mins)
+        ready: list[PendingLabel] = []
+        waiting: list[PendingLabel] = []
+        for pending in self._pending:
+            series = self._series.get(pending.symbol)
+            last_ts = series.last_ts if series is not None else None
+            if (last_ts is not None and last_ts >= _to_seconds(pending.due_time)) or (
+                now is not None and now >= pending.due_time + grace
+            ):
+                ready.append(pending)
+            else:
+                waiting.append(pending)
+
+        self._pending = waiting
+        if not ready:
+            return []
+
+        labels = self.generate_trade_labels(
+            [(p.symbol, p.entry_time, p.entry_price, p.side) for p in ready]
+        )
+        logger.debug(
+            "Resolved pending labels",
+            extra={"resolved": len(labels), "pending": len(waiting)},
+        )
+        return labels
 
     def update_trade_outcome(
         self, label: TradeLabel, exit_time: datetime, exit_price: float
@@ -292,24 +486,6 @@ class LabelGenerator:
 
         return weighted_error
 
-    def _find_closest_price_index(
-        self, price_data: list[PriceData], target_time: datetime
-    ) -> int | None:
-        """Find index of price data closest to target time."""
-        if not price_data:
-            return None
-
-        min_diff = float("inf")
-        closest_idx = None
-
-        for i, data in enumerate(price_data):
-            diff = abs((data.timestamp - target_time).total_seconds())
-            if diff < min_diff:
-                min_diff = diff
-                closest_idx = i
-
-        return closest_idx
-
     def _classify_direction(self, return_value: float) -> str:
         """Classify return direction based on threshold."""
         if return_value > self.direction_threshold:
@@ -319,32 +495,6 @@ class LabelGenerator:
         else:
             return "flat"
 
-    def _calculate_excursions(
-        self, price_data: list[PriceData], entry_idx: int, entry_price: float, side: str
-    ) -> tuple[float | None, float | None]:
-        """Calculate max favorable and adverse excursions."""
-        if entry_idx >= len(price_data) - 1:
-            return None, None
-
-        max_favorable = 0.0
-        max_adverse = 0.0
-
-        # Look at prices after entry
-        for i in range(entry_idx + 1, len(price_data)):
-            price = price_data[i].close
-
-            if side == "BUY":
-                # For long trades: favorable = higher prices, adverse = lower prices
-                excursion = (price - entry_price) / entry_price
-            else:  # SELL
-                # For short trades: favorable = lower prices, adverse = higher prices
-                excursion = (entry_price - price) / entry_price
-
-            max_favorable = max(max_favorable, excursion)
-            max_adverse = min(max_adverse, excursion)
-
-        return max_favorable, abs(max_adverse)
-
     def _get_confidence_bucket(self, confidence: float) -> str:
         """Get confidence bucket for calibration analysis."""
         if confidence < 0.1:
@@ -12,7 +12,9 @@ from __future__ import annotations
 import importlib.util as importlib_util
 import io
 import json
+import os
 import pickle
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -55,6 +57,51 @@ class TrainingBatch:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+class ReplayBuffer:
+    """
+    Fixed-capacity ring of training rows (X, y, w) for experience replay.
+
+    Arrays are allocated once on the first add, so memory stays constant
+    however long the learner runs; the oldest rows are overwritten.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+        self.X: np.ndarray | None = None
+        self.y = np.zeros(self.capacity)
+        self.w = np.ones(self.capacity)
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(
+        self, X: np.ndarray, y: np.ndarray, sample_weight: np.ndarray | None = None
+    ) -> None:
+        if self.X is None or self.X.shape[1] != X.shape[1]:
+            self.X = np.zeros((self.capacity, X.shape[1]))
+            self._next = self._size = 0
+
+        # Only the newest `capacity` rows can survive
+        X, y = X[-self.capacity :], y[-self.capacity :]
+        w = sample_weight[-self.capacity :] if sample_weight is not None else 1.0
+        idx = (self._next + np.arange(len(X))) % self.capacity
+        self.X[idx] = X
+        self.y[idx] = y
+        self.w[idx] = w
+        self._next = int(idx[-1] + 1) % self.capacity
+        self._size = min(self._size + len(X), self.capacity)
+
+    def sample(
+        self, n: int, rng: np.random.Generator
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Uniform sample of up to `n` stored rows, without replacement."""
+        assert self.X is not None
+        idx = rng.choice(self._size, size=min(n, self._size), replace=False)
+        return self.X[idx], self.y[idx], self.w[idx]
+
+
 @dataclass
 class PredictionResult:
     """Result of model prediction."""
@@ -79,10 +126,14 @@ class SimpleFallbackLearner:
 
     def partial_fit(
         self, X: np.ndarray, y: np.ndarray, sample_weight: np.ndarray | None = None
-    ) -> None:
-        """Partial fit with simple gradient descent."""
+    ) -> np.ndarray | None:
+        """Partial fit with simple gradient descent.
+
+        Returns the per-sample outputs (probabilities or values) from the
+        forward pass made before each update.
+        """
         if X.size == 0 or y.size == 0:
-            return
+            return None
 
         # Initialize on first fit
         if self.weights is None:
@@ -119,6 +170,7 @@ class SimpleFallbackLearner:
         X_norm = (X - fm) / (fs + 1e-8)
 
         # Simple gradient descent update
+        outputs = np.empty(batch_size)
         for i in range(batch_size):
             x_i = X_norm[i]
             y_i = y[i]
@@ -132,14 +184,18 @@ class SimpleFallbackLearner:
                 # Logistic regression
                 sigmoid_pred = 1 / (1 + np.exp(-prediction))
                 error = sigmoid_pred - y_i
+                outputs[i] = sigmoid_pred
             else:
                 # Linear regression
                 error = prediction - y_i
+                outputs[i] = prediction
 
             # Update weights
             self.weights -= self.learning_rate * weight * error * x_i
             self.bias -= self.learning_rate * weight * error
 
+        return outputs
+
     def predict(self, X: np.ndarray) -> np.ndarray:
         """Make predictions."""
         if self.weights is None:
@@ -201,6 +257,8 @@ class OnlineLearner:
         feature_dim: int | None = None,
         buffer_size: int = 1000,
         torch_hidden_dims: list[int] | None = None,
+        replay_batch_size: int = 0,
+        inference_threads: int | None = None,
     ):
         self.task_type = task_type
         self.backend = self._select_backend(backend)
@@ -208,6 +266,16 @@ class OnlineLearner:
         self.feature_dim = feature_dim
         self.buffer_size = buffer_size
         self.torch_hidden_dims = torch_hidden_dims or [64, 32]
+        # Rows replayed from the buffer alongside each new batch (0 = off)
+        self.replay_batch_size = replay_batch_size
+        # Torch intra-op threads for predict_batch (None = torch's own setting);
+        # applied only for the duration of the call
+        env_threads = os.getenv("LEARNER_INFERENCE_THREADS")
+        self.inference_threads = inference_threads or (
+            int(env_threads) if env_threads else None
+        )
+        # Reused predict_batch input buffer, grown as the universe grows
+        self._batch_buffer: Any = None
 
         # Initialize model
         self.model = self._create_model()
@@ -218,8 +286,9 @@ class OnlineLearner:
         )
         self.is_fitted = False
 
-        # Training buffer for experience replay
-        self.training_buffer: list[TrainingBatch] = []
+        # Ring buffer of recent rows (buffer_size rows) for experience replay
+        self.replay_buffer = ReplayBuffer(buffer_size)
+        self._replay_rng = np.random.default_rng(42)
 
         # Metrics tracking
         self.training_metrics: dict[str, list[float]] = {"loss": []}
@@ -262,7 +331,7 @@ class OnlineLearner:
                 raise ImportError("scikit-learn not available")
             if self.task_type == "classification":
                 return SGDClassifier(
-                    loss="log",  # Logistic regression
+                    loss="log_loss",  # Logistic regression
                     learning_rate="adaptive",
                     eta0=0.01,
                     random_state=42,
@@ -270,7 +339,7 @@ class OnlineLearner:
                 )
             else:
                 return SGDRegressor(
-                    loss="squared_loss",
+                    loss="squared_error",
                     learning_rate="adaptive",
                     eta0=0.01,
                     random_state=42,
@@ -334,6 +403,9 @@ class OnlineLearner:
         """
         Partial fit on new data.
 
+        With replay_batch_size > 0 the update also includes rows sampled from
+        the replay buffer; metrics always describe the new rows only.
+
         Args:
             X: Feature matrix
             y: Target values
@@ -345,28 +417,57 @@ class OnlineLearner:
         if X.size == 0 or y.size == 0:
             return {}
 
-        # Add to training buffer
-        batch = TrainingBatch(
-            features=X.copy(),
-            labels=y.copy(),
-            sample_weights=sample_weight.copy() if sample_weight is not None else None,
-        )
-        self.training_buffer.append(batch)
+        n_new = X.shape[0]
+        if self.replay_batch_size > 0 and len(self.replay_buffer):
+            X_replay, y_replay, w_replay = self.replay_buffer.sample(
+                self.replay_batch_size, self._replay_rng
+            )
+            w_new = sample_weight if sample_weight is not None else np.ones(n_new)
+            X_fit = np.concatenate([X, X_replay])
+            y_fit = np.concatenate([y, y_replay])
+            w_fit = np.concatenate([w_new, w_replay])
+        else:
+            X_fit, y_fit, w_fit = X, y, sample_weight
 
-        # Keep buffer size manageable
-        if len(self.training_buffer) > self.buffer_size:
-            self.training_buffer.pop(0)
+        self.replay_buffer.add(X, y, sample_weight)
 
         # Train model
         if self.backend == "sklearn":
-            return self._sklearn_partial_fit(X, y, sample_weight)
+            return self._sklearn_partial_fit(X_fit, y_fit, w_fit, n_new)
         elif self.backend == "torch":
-            return self._torch_partial_fit(X, y, sample_weight)
+            return self._torch_partial_fit(X_fit, y_fit, w_fit, n_new)
         else:  # simple
-            return self._simple_partial_fit(X, y, sample_weight)
+            return self._simple_partial_fit(X_fit, y_fit, w_fit, n_new)
+
+    def _record_metrics(
+        self,
+        outputs: np.ndarray,
+        y: np.ndarray,
+        sample_weight: np.ndarray | None,
+        loss: float | None = None,
+        threshold: float = 0.5,
+    ) -> dict[str, float]:
+        """Training metrics from model outputs (probabilities, logits or values)."""
+        if self.task_type == "classification":
+            correct = ((outputs > threshold).astype(int) == y).astype(float)
+            accuracy = float(np.average(correct, weights=sample_weight))
+            self.training_metrics["accuracy"].append(accuracy)
+            metrics = {"accuracy": accuracy}
+        else:
+            mse = float(np.average((outputs - y) ** 2, weights=sample_weight))
+            self.training_metrics["mse"].append(mse)
+            metrics = {"mse": mse}
+
+        if loss is not None:
+            metrics["loss"] = loss
+        return metrics
 
     def _sklearn_partial_fit(
-        self, X: np.ndarray, y: np.ndarray, sample_weight: np.ndarray | None = None
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        sample_weight: np.ndarray | None = None,
+        n_metric: int | None = None,
     ) -> dict[str, float]:
         """Sklearn partial fit."""
         # Scale features
@@ -379,35 +480,28 @@ class OnlineLearner:
             X_scaled = self.scaler.transform(X)
 
         # Partial fit
+        model_any: Any = self.model
         if self.task_type == "classification":
             classes = np.array([0, 1])  # Binary classification
-            model_any: Any = self.model
             model_any.partial_fit(
                 X_scaled, y, classes=classes, sample_weight=sample_weight
             )
         else:
-            model_any: Any = self.model
             model_any.partial_fit(X_scaled, y, sample_weight=sample_weight)
 
-        # Calculate metrics
-        model_any: Any = self.model
-        predictions = model_any.predict(X_scaled)
-
-        if self.task_type == "classification":
-            assert accuracy_score is not None
-            accuracy = float(
-                accuracy_score(y, predictions, sample_weight=sample_weight)
-            )
-            self.training_metrics["accuracy"].append(accuracy)
-            return {"accuracy": accuracy}
-        else:
-            assert mean_squared_error is not None
-            mse = float(mean_squared_error(y, predictions, sample_weight=sample_weight))
-            self.training_metrics["mse"].append(mse)
-            return {"mse": mse}
+        # Metrics from the linear decision directly rather than a second
+        # predict() call with its input validation
+        n = X.shape[0] if n_metric is None else n_metric
+        w = sample_weight[:n] if sample_weight is not None else None
+        decision = X_scaled[:n] @ model_any.coef_.ravel() + model_any.intercept_[0]
+        return self._record_metrics(decision, y[:n], w, threshold=0.0)
 
     def _torch_partial_fit(
-        self, X: np.ndarray, y: np.ndarray, sample_weight: np.ndarray | None = None
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        sample_weight: np.ndarray | None = None,
+        n_metric: int | None = None,
     ) -> dict[str, float]:
         """PyTorch partial fit."""
         if not TORCH_AVAILABLE:
@@ -442,45 +536,40 @@ class OnlineLearner:
 
         if self.task_type == "classification":
             loss_fn = _nn.BCELoss(reduction="none")
-            loss = loss_fn(predictions, y_tensor)
-            weighted_loss = (loss * weight_tensor.unsqueeze(1)).mean()
         else:
             loss_fn = _nn.MSELoss(reduction="none")
-            loss = loss_fn(predictions, y_tensor)
-            weighted_loss = (loss * weight_tensor.unsqueeze(1)).mean()
+        loss = loss_fn(predictions, y_tensor)
+        weighted_loss = (loss * weight_tensor.unsqueeze(1)).mean()
 
         weighted_loss.backward()
         self.optimizer.step()
-
-        # Calculate metrics
         tmodel.eval()  # type: ignore[attr-defined]
-        with _torch.no_grad():
-            if self.task_type == "classification":
-                pred_classes = (predictions > 0.5).float()
-                accuracy = float((pred_classes == y_tensor).float().mean().item())
-                self.training_metrics["accuracy"].append(accuracy)
-                return {"accuracy": accuracy, "loss": float(weighted_loss.item())}
-            else:
-                mse = float(loss.mean().item())
-                self.training_metrics["mse"].append(mse)
-                return {"mse": mse, "loss": float(weighted_loss.item())}
+        self.is_fitted = True
+
+        # Metrics from the forward pass above (pre-step outputs)
+        n = X.shape[0] if n_metric is None else n_metric
+        outputs = predictions.detach().numpy().ravel()[:n]
+        return self._record_metrics(
+            outputs, y[:n], None, loss=float(weighted_loss.item())
+        )
 
     def _simple_partial_fit(
-        self, X: np.ndarray, y: np.ndarray, sample_weight: np.ndarray | None = None
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        sample_weight: np.ndarray | None = None,
+        n_metric: int | None = None,
     ) -> dict[str, float]:
         """Simple fallback partial fit."""
-        self.model.partial_fit(X, y, sample_weight)
+        outputs = self.model.partial_fit(X, y, sample_weight)
         self.is_fitted = True
+        if outputs is None:
+            return {}
 
-        # Calculate basic metrics
-        predictions = self.model.predict(X)
-
-        if self.task_type == "classification":
-            accuracy = np.mean(predictions == y)
-            return {"accuracy": accuracy}
-        else:
-            mse = np.mean((predictions - y) ** 2)
-            return {"mse": mse}
+        # Metrics from the forward pass made during the update
+        n = X.shape[0] if n_metric is None else n_metric
+        w = sample_weight[:n] if sample_weight is not None else None
+        return self._record_metrics(outputs[:n], y[:n], w)
 
     def predict(self, X: np.ndarray) -> PredictionResult:
         """
@@ -571,6 +660,144 @@ class OnlineLearner:
             predictions=predictions, probabilities=probabilities, confidence=confidence
         )
 
+    def predict_batch(self, X: np.ndarray, explain: bool = True) -> PredictionResult:
+        """
+        Predict and explain every row of `X` (e.g. the whole universe) at once.
+
+        Inputs are scaled into a reused buffer rather than fresh arrays per
+        call; the torch backend runs under inference_mode, with
+        `inference_threads` intra-op threads when set (the process-wide torch
+        setting is restored afterwards).
+
+        Args:
+            X: Feature matrix, one row per symbol
+            explain: Include per-row feature contributions
+
+        Returns:
+            PredictionResult; explanations hold `feature_importance` (n_features)
+            and `feature_contributions` (n_rows x n_features) arrays
+        """
+        X = np.asarray(X, dtype=float)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if not self.is_fitted:
+            return PredictionResult(predictions=np.zeros(X.shape[0]))
+
+        if self.backend == "torch":
+            return self._torch_predict_batch(X)
+
+        if self.backend == "sklearn":
+            assert self.scaler is not None
+            model_any: Any = self.model
+            offset, scale = self.scaler.mean_, self.scaler.scale_
+            weights, bias = model_any.coef_.ravel(), model_any.intercept_[0]
+        else:  # simple
+            if self.model.weights is None:
+                return PredictionResult(predictions=np.zeros(X.shape[0]))
+            offset = (
+                self.model.feature_means
+                if self.model.feature_means is not None
+                else np.zeros(X.shape[1])
+            )
+            scale = (
+                self.model.feature_stds + 1e-8
+                if self.model.feature_stds is not None
+                else np.ones(X.shape[1])
+            )
+            weights, bias = self.model.weights, self.model.bias
+
+        X_scaled = self._input_buffer(X.shape)
+        np.subtract(X, offset, out=X_scaled)
+        np.divide(X_scaled, scale, out=X_scaled)
+        outputs = X_scaled @ weights + bias
+
+        probabilities = confidence = None
+        if self.task_type == "classification":
+            predictions = (outputs > 0).astype(int)
+            p_up = 1.0 / (1.0 + np.exp(-outputs))
+            probabilities = np.column_stack([1 - p_up, p_up])
+            confidence = np.maximum(p_up, 1 - p_up)
+        else:
+            predictions = outputs
+
+        explanations = None
+        if explain:
+            explanations = {
+                "method": "feature_importance",
+                "feature_importance": np.array(weights),
+                "feature_contributions": X_scaled * weights,
+            }
+
+        return PredictionResult(
+            predictions=predictions,
+            probabilities=probabilities,
+            confidence=confidence,
+            explanations=explanations,
+        )
+
+    def _input_buffer(self, shape: tuple[int, int]) -> np.ndarray:
+        """View of the reused float64 input buffer with the requested shape."""
+        rows, cols = shape
+        buf = self._batch_buffer
+        if (
+            not isinstance(buf, np.ndarray)
+            or buf.shape[0] < rows
+            or buf.shape[1] != cols
+        ):
+            capacity = 1 << max(rows - 1, 0).bit_length()
+            buf = self._batch_buffer = np.empty((capacity, cols))
+        return buf[:rows]
+
+    def _torch_predict_batch(self, X: np.ndarray) -> PredictionResult:
+        """Batched PyTorch inference into a reused float32 input tensor."""
+        if not TORCH_AVAILABLE:
+            return PredictionResult(predictions=np.zeros(X.shape[0]))
+        try:
+            import torch as _torch  # type: ignore
+        except Exception:
+            return PredictionResult(predictions=np.zeros(X.shape[0]))
+
+        rows, cols = X.shape
+        buf = self._batch_buffer
+        if (
+            not isinstance(buf, _torch.Tensor)
+            or buf.shape[0] < rows
+            or buf.shape[1] != cols
+        ):
+            capacity = 1 << max(rows - 1, 0).bit_length()
+            buf = self._batch_buffer = _torch.empty((capacity, cols))
+        X_tensor = buf[:rows]
+        X_tensor.copy_(_torch.from_numpy(X))
+
+        tmodel: Any = self.model
+        tmodel.eval()  # type: ignore[attr-defined]
+        previous_threads = _torch.get_num_threads()
+        override = bool(self.inference_threads) and (
+            self.inference_threads != previous_threads
+        )
+        if override:
+            _torch.set_num_threads(self.inference_threads)
+        try:
+            with _torch.inference_mode():
+                outputs = tmodel(X_tensor).numpy().ravel()
+        finally:
+            if override:
+                _torch.set_num_threads(previous_threads)
+
+        if self.task_type == "classification":
+            return PredictionResult(
+                predictions=(outputs > 0.5).astype(int),
+                probabilities=np.column_stack([1 - outputs, outputs]),
+                confidence=np.maximum(outputs, 1 - outputs),
+                explanations={
+                    "error": "Explanations not implemented for torch backend"
+                },
+            )
+        return PredictionResult(
+            predictions=outputs,
+            explanations={"error": "Explanations not implemented for torch backend"},
+        )
+
     def explain(self, x: np.ndarray) -> dict[str, Any]:
         """
         Generate explanations for a single prediction.
@@ -810,3 +1037,37 @@ class OnlineLearner:
                 self.is_fitted = bool(meta.get("is_fitted", True))
         except Exception as e:
             logger.warning("Learner set_state failed", extra={"error": str(e)})
+
+
+def benchmark_inference(
+    learner: OnlineLearner, X: np.ndarray, repeats: int = 5
+) -> dict[str, float]:
+    """
+    Micro-benchmark per-row predict()+explain() against predict_batch().
+
+    Returns the best-of-`repeats` wall time in milliseconds for each path.
+    """
+
+    def _best(fn) -> float:
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            fn()
+            timings.append((time.perf_counter() - start) * 1000)
+        return min(timings)
+
+    def _per_row() -> None:
+        for row in X:
+            learner.predict(row.reshape(1, -1))
+            learner.explain(row)
+
+    per_row_ms = _best(_per_row)
+    batch_ms = _best(lambda: learner.predict_batch(X))
+    return {
+        "rows": float(len(X)),
+        "per_row_ms": per_row_ms,
+        "batch_ms": batch_ms,
+        "per_row_us_per_row": per_row_ms * 1000 / max(len(X), 1),
+        "batch_us_per_row": batch_ms * 1000 / max(len(X), 1),
+        "speedup": per_row_ms / batch_ms if batch_ms > 0 else float("inf"),
+    }
@@ -27,7 +27,14 @@ logger = get_logger("ziggy.paper.learner_gateway")
 
 
 class LearnerGateway:
-    """Gateway between paper trading and brain learning system."""
+    """
+    Gateway between paper trading and brain learning system.
+
+    Drains adaptively: a micro-batch is processed as soon as `batch_size`
+    events are queued, or once the oldest queued event has waited
+    `drain_interval` seconds, whichever comes first. Features are copied
+    into preallocated buffers that are reused across batches.
+    """
 
     def __init__(self, batch_size: int = 256, drain_interval: float = 5.0):
         self.batch_size = batch_size
@@ -37,6 +44,11 @@ class LearnerGateway:
         self._learner: Any | None = None
         self._last_checkpoint_ts: float = 0.0
         self._checkpoint_interval_s: float = 600.0  # 10 minutes
+        # Reused X/y buffers (grown on demand)
+        self._X: Any | None = None
+        self._y: Any | None = None
+        # Why each drain fired: full batch vs deadline
+        self.drain_triggers: dict[str, int] = {"size": 0, "deadline": 0}
 
     async def start(self) -> None:
         """Start the learner gateway background task."""
@@ -70,21 +82,34 @@ class LearnerGateway:
         logger.info("Learner gateway stopped")
 
     async def _drain_loop(self) -> None:
-        """Main drain loop that processes brain queue."""
+        """Main drain loop: waits for a full batch or the oldest event's deadline."""
         logger.info("Starting learner gateway drain loop")
 
         try:
             while self.is_running:
                 try:
+                    depth = _brain_queue.get_depth()
+                    if depth >= self.batch_size:
+                        self.drain_triggers["size"] += 1
+                    elif depth and _brain_queue.oldest_age() >= self.drain_interval:
+                        self.drain_triggers["deadline"] += 1
+                    else:
+                        # Sleep until the batch fills or the oldest event is due
+                        timeout = (
+                            self.drain_interval - _brain_queue.oldest_age()
+                            if depth
+                            else self.drain_interval
+                        )
+                        await _brain_queue.wait_for(
+                            self.batch_size if depth else 1, timeout
+                        )
+                        continue
+
                     # Drain a batch from the queue
                     batch = _brain_queue.drain_batch(self.batch_size)
-
                     if batch:
                         await self._process_batch(batch)
 
-                    # Wait before next drain cycle
-                    await asyncio.sleep(self.drain_interval)
-
                 except Exception as e:
                     error_msg = f"Error in learner drain loop: {e!s}"
                     logger.error(
@@ -100,6 +125,25 @@ class LearnerGateway:
             logger.info("Learner gateway drain loop cancelled")
             raise
 
+    def _fill_buffers(self, events: list[BrainTradeEvent]) -> tuple[Any, Any]:
+        """Copy features/labels into the reusable buffers; returns (X, y) views."""
+        import numpy as np
+
+        n = len(events)
+        dim = max(len(evt.features) for evt in events)
+        if self._X is None or self._X.shape[0] < n or self._X.shape[1] != dim:
+            rows = max(n, self.batch_size)
+            self._X = np.zeros((rows, dim), dtype=float)
+            self._y = np.zeros(rows, dtype=float)
+
+        X, y = self._X[:n], self._y[:n]
+        for i, evt in enumerate(events):
+            width = len(evt.features)
+            X[i, :width] = evt.features
+            X[i, width:] = 0.0
+            y[i] = float(cast(float, evt.label))
+        return X, y
+
     async def _process_batch(self, batch: list[BrainTradeEvent]) -> None:
         """Process a batch of trade events."""
         if not batch:
@@ -125,13 +169,9 @@ class LearnerGateway:
                 _learner_metrics.record_batch(0)
                 return
 
-            # Prepare numpy arrays
-            import numpy as np
-
-            X = np.array([evt.features for evt in labeled], dtype=float)
-            y = np.array(
-                [float(cast(float, evt.label)) for evt in labeled], dtype=float
-            )
+            # Fill preallocated arrays in place (learners copy what they keep)
+            X, y = self._fill_buffers(labeled)
+            t0 = time.monotonic()
 
             features_dim = int(X.shape[1]) if X.ndim == 2 and X.size else 0
 
@@ -159,8 +199,13 @@ class LearnerGateway:
                     extra={"batch_size": len(batch)},
                 )
 
-            # Record the batch processing
-            _learner_metrics.record_batch(len(labeled))
+            # Record the batch processing with per-event lag
+            done = time.monotonic()
+            _learner_metrics.record_batch(
+                len(labeled),
+                lags_ms=[(done - evt.enqueued_at) * 1000.0 for evt in batch],
+                duration_s=done - t0,
+            )
 
         except Exception as e:
             error_msg = f"Failed to process learner batch: {e!s}"
@@ -200,6 +245,7 @@ class LearnerGateway:
             "is_running": self.is_running,
             "batch_size": self.batch_size,
             "drain_interval": self.drain_interval,
+            "drain_triggers": dict(self.drain_triggers),
             "queue_metrics": get_brain_queue_metrics(),
             "learner_metrics": get_learner_metrics(),
         }
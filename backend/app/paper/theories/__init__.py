@@ -7,11 +7,15 @@ and includes starter implementations for common patterns.
 
 from __future__ import annotations
 
+import math
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 from app.paper.engine import Signal
 
 
@@ -55,6 +59,63 @@ class MarketFeatures:
     sector_momentum: float = 0.0
 
 
+CATEGORICAL_FEATURES = ("vol_regime", "trend_regime")
+NUMERIC_FEATURES = tuple(
+    f.name
+    for f in fields(MarketFeatures)
+    if f.name not in ("symbol", "timestamp", *CATEGORICAL_FEATURES)
+)
+
+
+@dataclass
+class FeatureTable:
+    """
+    Columnar view of MarketFeatures for a whole universe, one row per symbol.
+
+    Numeric features are float64 arrays and regimes are string arrays, so
+    theories can evaluate every symbol at once with array operations.
+    """
+
+    symbols: list[str]
+    timestamps: list[datetime]
+    columns: dict[str, np.ndarray]
+    rows: list[MarketFeatures] = field(default_factory=list)
+
+    @classmethod
+    def from_features(cls, rows: list[MarketFeatures]) -> FeatureTable:
+        columns: dict[str, np.ndarray] = {
+            name: np.fromiter(
+                (getattr(r, name) for r in rows), dtype=np.float64, count=len(rows)
+            )
+            for name in NUMERIC_FEATURES
+        }
+        for name in CATEGORICAL_FEATURES:
+            columns[name] = np.array([getattr(r, name) for r in rows], dtype=object)
+        return cls(
+            symbols=[r.symbol for r in rows],
+            timestamps=[r.timestamp for r in rows],
+            columns=columns,
+            rows=list(rows),
+        )
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def row(self, i: int) -> MarketFeatures:
+        return self.rows[i]
+
+
+def _positive_finite(*columns: np.ndarray) -> np.ndarray:
+    """Rows where every column holds a positive, finite value."""
+    mask = np.ones(len(columns[0]), dtype=bool)
+    for column in columns:
+        mask &= np.isfinite(column) & (column > 0)
+    return mask
+
+
 class Theory(ABC):
     """
     Abstract base class for trading theories.
@@ -63,6 +124,9 @@ class Theory(ABC):
     1. Signal generation based on market features
     2. Risk model for position sizing
     3. Theory-specific metadata and description
+
+    `generate_signals_batch` / `risk_model_batch` evaluate a whole FeatureTable;
+    the defaults loop over the per-row methods, which remain the reference.
     """
 
     def __init__(self, theory_id: str):
@@ -102,6 +166,53 @@ class Theory(ABC):
         """
         pass
 
+    def generate_signals_batch(self, table: FeatureTable) -> list[Signal]:
+        """Signals for every row of `table` (same result as per-row calls)."""
+        signals: list[Signal] = []
+        for i in range(len(table)):
+            signals.extend(self.generate_signals(table.row(i)))
+        return signals
+
+    def risk_model_batch(self, table: FeatureTable) -> np.ndarray:
+        """Position size multiplier for every row of `table`."""
+        return np.array(
+            [self.risk_model(table.row(i)) for i in range(len(table))],
+            dtype=np.float64,
+        )
+
+    def evaluate_batch(self, table: FeatureTable) -> list[Signal]:
+        """Batch signals with confidence scaled by each row's risk multiplier."""
+        signals = self.generate_signals_batch(table)
+        if not signals:
+            return signals
+        risk = self.risk_model_batch(table)
+        row_of = {symbol: i for i, symbol in enumerate(table.symbols)}
+        for signal in signals:
+            signal.confidence *= float(risk[row_of[signal.symbol]])
+        return signals
+
+    def _emit_batch(
+        self,
+        table: FeatureTable,
+        mask: np.ndarray,
+        side: str,
+        confidence: np.ndarray,
+        horizon_mins: int,
+        features: Callable[[int], dict[str, Any]],
+    ) -> list[Signal]:
+        """Build Signals for the rows selected by `mask`."""
+        return [
+            Signal(
+                theory_id=self.theory_id,
+                symbol=table.symbols[i],
+                side=side,
+                confidence=float(confidence[i]),
+                horizon_mins=horizon_mins,
+                features=features(i),
+            )
+            for i in np.flatnonzero(mask)
+        ]
+
     def update_state(
         self, signal: Signal, outcome: dict[str, Any] | None = None
     ) -> None:
@@ -153,6 +264,14 @@ class MeanReversionTheory(Theory):
     def generate_signals(self, features: MarketFeatures) -> list[Signal]:
         signals = []
 
+        # Zero or missing quotes/bands would give NaN/inf price_vs_bb features
+        if not (
+            0 < features.price < math.inf
+            and 0 < features.bollinger_lower < math.inf
+            and 0 < features.bollinger_upper < math.inf
+        ):
+            return signals
+
         # Check for oversold condition (BUY signal)
         if (
             features.rsi <= self.rsi_oversold
@@ -215,6 +334,61 @@ class MeanReversionTheory(Theory):
 
         return min(1.0, base_size)
 
+    def generate_signals_batch(self, table: FeatureTable) -> list[Signal]:
+        rsi, price = table["rsi"], table["price"]
+        bb_lower, bb_upper = table["bollinger_lower"], table["bollinger_upper"]
+        valid = _positive_finite(price, bb_lower, bb_upper)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            buy = (
+                valid
+                & (rsi <= self.rsi_oversold)
+                & (price <= bb_lower * (1 + self.bb_threshold))
+            )
+            sell = (
+                valid
+                & ~buy
+                & (rsi >= self.rsi_overbought)
+                & (price >= bb_upper * (1 - self.bb_threshold))
+            )
+            vs_lower = price / bb_lower
+            vs_upper = price / bb_upper
+
+        signals = self._emit_batch(
+            table,
+            buy,
+            "BUY",
+            np.minimum(1.0, (self.rsi_oversold - rsi) / 10.0),
+            15,
+            lambda i: {
+                "rsi": float(rsi[i]),
+                "price_vs_bb_lower": float(vs_lower[i]),
+                "volume_ratio": 1.0,
+                "signal_type": "oversold",
+            },
+        )
+        signals += self._emit_batch(
+            table,
+            sell,
+            "SELL",
+            np.minimum(1.0, (rsi - self.rsi_overbought) / 10.0),
+            15,
+            lambda i: {
+                "rsi": float(rsi[i]),
+                "price_vs_bb_upper": float(vs_upper[i]),
+                "volume_ratio": 1.0,
+                "signal_type": "overbought",
+            },
+        )
+        return signals
+
+    def risk_model_batch(self, table: FeatureTable) -> np.ndarray:
+        vol, trend = table["vol_regime"], table["trend_regime"]
+        size = np.ones(len(table))
+        size = np.where(vol == "high", size * 0.5, size)
+        size = np.where(vol == "low", size * 1.2, size)
+        size = np.where((trend == "up") | (trend == "down"), size * 0.7, size)
+        return np.minimum(1.0, size)
+
 
 class BreakoutTheory(Theory):
     """
@@ -252,7 +426,7 @@ class BreakoutTheory(Theory):
 
         # Simple breakout detection (would be more sophisticated in practice)
         sma_20 = features.sma_20
-        if sma_20 <= 0:
+        if sma_20 <= 0 or not 0 < features.price < math.inf:
             return signals
 
         # Upside breakout
@@ -321,6 +495,50 @@ class BreakoutTheory(Theory):
 
         return min(1.0, base_size)
 
+    def generate_signals_batch(self, table: FeatureTable) -> list[Signal]:
+        price, sma_20, volume = table["price"], table["sma_20"], table["volume"]
+        valid = (sma_20 > 0) & (volume > 0) & _positive_finite(price)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            up = valid & (price > sma_20 * (1 + self.breakout_threshold))
+            down = valid & ~up & (price < sma_20 * (1 - self.breakout_threshold))
+            up_mag = (price - sma_20) / sma_20
+            down_mag = (sma_20 - price) / sma_20
+
+        def _features(magnitude: np.ndarray, signal_type: str):
+            return lambda i: {
+                "breakout_level": float(sma_20[i]),
+                "breakout_magnitude": float(magnitude[i]),
+                "volume": int(volume[i]),
+                "signal_type": signal_type,
+            }
+
+        signals = self._emit_batch(
+            table,
+            up,
+            "BUY",
+            np.minimum(1.0, up_mag / self.breakout_threshold),
+            30,
+            _features(up_mag, "upside_breakout"),
+        )
+        signals += self._emit_batch(
+            table,
+            down,
+            "SELL",
+            np.minimum(1.0, down_mag / self.breakout_threshold),
+            30,
+            _features(down_mag, "downside_breakout"),
+        )
+        return signals
+
+    def risk_model_batch(self, table: FeatureTable) -> np.ndarray:
+        trend, atr, price = table["trend_regime"], table["atr"], table["price"]
+        size = np.ones(len(table))
+        size = np.where((trend == "up") | (trend == "down"), size * 1.3, size)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            atr_factor = np.minimum(2.0, atr / (price * 0.02))
+            size = np.where(atr > 0, size / atr_factor, size)
+        return np.minimum(1.0, size)
+
 
 class NewsShockGuardTheory(Theory):
     """
@@ -394,6 +612,33 @@ class NewsShockGuardTheory(Theory):
 
         return min(1.0, base_size)
 
+    def generate_signals_batch(self, table: FeatureTable) -> list[Signal]:
+        sentiment, urgency = table["news_sentiment"], table["news_urgency"]
+        vol = table["vol_regime"]
+        shock = (sentiment <= self.sentiment_threshold) & (
+            urgency >= self.urgency_threshold
+        )
+        return self._emit_batch(
+            table,
+            shock,
+            "SELL",
+            np.minimum(1.0, np.abs(sentiment) * urgency),
+            5,
+            lambda i: {
+                "news_sentiment": float(sentiment[i]),
+                "news_urgency": float(urgency[i]),
+                "vol_regime": vol[i],
+                "signal_type": "defensive_sell",
+            },
+        )
+
+    def risk_model_batch(self, table: FeatureTable) -> np.ndarray:
+        urgency, vol = table["news_urgency"], table["vol_regime"]
+        size = np.ones(len(table))
+        size = np.where(urgency > self.urgency_threshold, size * (1 + urgency), size)
+        size = np.where(vol == "high", size * self.volatility_amplifier, size)
+        return np.minimum(1.0, size)
+
 
 class VolatilityRegimeTheory(Theory):
     """
@@ -473,6 +718,42 @@ class VolatilityRegimeTheory(Theory):
 
         return min(1.0, base_size)
 
+    def generate_signals_batch(self, table: FeatureTable) -> list[Signal]:
+        vol, atr = table["vol_regime"], table["atr"]
+        high = (vol == "high") & (atr > 0)
+        low = (vol == "low") & ~high
+
+        def _features(signal_type: str):
+            return lambda i: {
+                "vol_regime": vol[i],
+                "atr": float(atr[i]),
+                "signal_type": signal_type,
+            }
+
+        signals = self._emit_batch(
+            table,
+            high,
+            "BUY",
+            np.full(len(table), 0.7),
+            60,
+            _features("long_volatility"),
+        )
+        signals += self._emit_batch(
+            table,
+            low,
+            "SELL",
+            np.full(len(table), 0.6),
+            60,
+            _features("short_volatility"),
+        )
+        return signals
+
+    def risk_model_batch(self, table: FeatureTable) -> np.ndarray:
+        vol = table["vol_regime"]
+        size = np.full(len(table), 0.8)
+        size = np.where((vol == "high") | (vol == "low"), size * 1.2, size)
+        return np.minimum(1.0, size)
+
 
 class IntradayMomentumTheory(Theory):
     """
@@ -577,6 +858,53 @@ class IntradayMomentumTheory(Theory):
 
         return min(1.0, base_size)
 
+    def _momentum_batch(self, table: FeatureTable) -> np.ndarray:
+        price, sma_5 = table["price"], table["sma_5"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(sma_5 > 0, (price - sma_5) / sma_5, 0.0)
+
+    def generate_signals_batch(self, table: FeatureTable) -> list[Signal]:
+        price, sma_5 = table["price"], table["sma_5"]
+        momentum = self._momentum_batch(table)
+        strength = np.minimum(1.0, np.abs(momentum) / self.momentum_threshold)
+
+        def _features(signal_type: str):
+            return lambda i: {
+                "momentum": float(momentum[i]),
+                "price": float(price[i]),
+                "sma_5": float(sma_5[i]),
+                "signal_type": signal_type,
+            }
+
+        signals = self._emit_batch(
+            table,
+            momentum > self.momentum_threshold,
+            "BUY",
+            strength,
+            5,
+            _features("momentum_up"),
+        )
+        signals += self._emit_batch(
+            table,
+            momentum < -self.momentum_threshold,
+            "SELL",
+            strength,
+            5,
+            _features("momentum_down"),
+        )
+        return signals
+
+    def risk_model_batch(self, table: FeatureTable) -> np.ndarray:
+        trend = table["trend_regime"]
+        momentum = self._momentum_batch(table)
+        size = np.ones(len(table))
+        aligned = ((momentum > 0) & (trend == "up")) | (
+            (momentum < 0) & (trend == "down")
+        )
+        size = np.where(aligned, size * 1.3, size)
+        size = np.where(trend == "sideways", size * 0.7, size)
+        return np.minimum(1.0, size)
+
 
 class TheoryRegistry:
     """Registry for managing trading theories."""
@@ -18,6 +18,10 @@ from sqlalchemy import (
 from app.models.base import Base
 
 
+# SQLite (the fallback DB) only autoincrements INTEGER PRIMARY KEY columns
+_BigIntPK = BigInteger().with_variant(Integer, "sqlite")
+
+
 class PaperRun(Base):
     __tablename__ = "durable_paper_runs"
 
@@ -62,7 +66,7 @@ class Position(Base):
 class PnLPoint(Base):
     __tablename__ = "durable_paper_pnl_points"
 
-    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    id = Column(_BigIntPK, primary_key=True, autoincrement=True)
     run_id = Column(String(64), ForeignKey("durable_paper_runs.id"), nullable=False)
     idx = Column(Integer, nullable=True)
     ts = Column(DateTime(timezone=False), nullable=False, default=datetime.utcnow)
@@ -72,7 +76,7 @@ class PnLPoint(Base):
 class BanditSnapshot(Base):
     __tablename__ = "durable_bandit_snapshots"
 
-    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    id = Column(_BigIntPK, primary_key=True, autoincrement=True)
     run_id = Column(String(64), ForeignKey("durable_paper_runs.id"), nullable=False)
     ts = Column(DateTime(timezone=False), nullable=False, default=datetime.utcnow)
     payload = Column(JSON, nullable=False)
@@ -81,7 +85,7 @@ class BanditSnapshot(Base):
 class LearnerCheckpoint(Base):
     __tablename__ = "durable_learner_checkpoints"
 
-    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    id = Column(_BigIntPK, primary_key=True, autoincrement=True)
     run_id = Column(String(64), ForeignKey("durable_paper_runs.id"), nullable=False)
     ts = Column(DateTime(timezone=False), nullable=False, default=datetime.utcnow)
     algo = Column(String(64), nullable=True)
@@ -92,7 +96,7 @@ class LearnerCheckpoint(Base):
 class QueueSnapshot(Base):
     __tablename__ = "durable_queue_snapshots"
 
-    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    id = Column(_BigIntPK, primary_key=True, autoincrement=True)
     run_id = Column(String(64), ForeignKey("durable_paper_runs.id"), nullable=False)
     ts = Column(DateTime(timezone=False), nullable=False, default=datetime.utcnow)
     payload = Column(JSON, nullable=False)
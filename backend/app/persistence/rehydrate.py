@@ -48,13 +48,87 @@ async def ensure_db_with_fallback() -> None:
             logger.warning("SQLite fallback failed", extra={"error": str(e)})
 
 
+def merge_bandit_payloads(payloads: list[Any]) -> dict[str, Any]:
+    """Fold a full bandit snapshot and its later deltas into one allocator state."""
+    state: dict[str, Any] = {"arms": {}}
+    for payload in payloads:
+        if not isinstance(payload, dict):
+            continue
+        if payload.get("kind") == "delta":
+            state["arms"].update(payload.get("arms") or {})
+        elif isinstance(payload.get("arms"), dict):
+            state = {k: v for k, v in payload.items() if k != "kind"}
+            state["arms"] = dict(payload["arms"])
+        else:
+            # Legacy payloads stored the arms mapping directly
+            state = {"arms": dict(payload)}
+    return state
+
+
+def replay_audit_events(events: list[dict[str, Any]]) -> dict[str, Any]:
+    """Rebuild state from the last full checkpoint in the audit log plus later deltas.
+
+    Logs written before delta checkpoints have no "checkpoint" events and are
+    replayed from the start, as before.
+    """
+    start = 0
+    for i, ev in enumerate(events):
+        if ev.get("type") == "checkpoint" and (ev.get("payload") or {}).get("full"):
+            start = i
+
+    positions: dict[str, dict[str, Any]] = {}
+    equity_curve: list[dict[str, Any]] = []
+    bandit_payloads: list[Any] = []
+    learner_meta: dict[str, Any] | None = None
+
+    def _apply_positions(rows: list[dict[str, Any]]) -> None:
+        for p in rows or []:
+            if int(p.get("qty") or 0) == 0:
+                positions.pop(p["symbol"], None)
+            else:
+                positions[p["symbol"]] = p
+
+    for ev in events[start:]:
+        et = ev.get("type")
+        payload = ev.get("payload")
+        if et == "checkpoint":
+            payload = payload or {}
+            positions.clear()
+            _apply_positions(payload.get("positions", []))
+            equity_curve = list(payload.get("equity_curve") or [])
+            bandit_payloads = [payload["bandit"]] if payload.get("bandit") else []
+            learner_meta = (payload.get("learner") or {}).get("meta")
+        elif et == "position":
+            _apply_positions(payload)
+        elif et == "pnl":
+            payload = payload or {}
+            if "points" in payload:
+                equity_curve.extend(payload["points"])
+            elif payload.get("equity_curve"):
+                # Legacy events carried the whole curve
+                equity_curve = list(payload["equity_curve"])
+        elif et == "bandit":
+            bandit_payloads.append(payload)
+        elif et == "learner":
+            # JSONL carries meta only; model bytes cannot be recovered here
+            learner_meta = (payload or {}).get("meta")
+
+    return {
+        "positions": list(positions.values()),
+        "equity_curve": equity_curve,
+        "bandit": merge_bandit_payloads(bandit_payloads) if bandit_payloads else None,
+        "learner_meta": learner_meta,
+    }
+
+
 async def resume_from_persistence() -> dict[str, Any]:
     """Rehydrate runtime state from DB (or JSONL) when available.
 
     Strategy:
     - Ensure DB is connected (with fallback)
     - If RUN_RESUME=true and a worker is available, load latest run and apply states
-    - If DB empty but audit log exists, replay to reconstruct and apply best-effort state
+    - If DB empty but audit log exists, replay from the last full checkpoint plus
+      later deltas to reconstruct and apply best-effort state
     """
     if (os.getenv("RUN_RESUME") or "true").strip().lower() not in {"1", "true", "yes"}:
         return {"ok": False, "reason": "resume_disabled"}
@@ -101,15 +175,17 @@ async def _apply_resume_to_worker(worker) -> dict[str, Any]:
             if run:
                 rid = getattr(run, "id", None)
                 run_id = rid if isinstance(rid, str) else str(rid)
+                # Closed positions are kept as qty 0 rows by delta checkpoints
                 positions = [
                     {"symbol": p.symbol, "qty": p.qty, "avg_price": p.avg_price}
                     for p in repo.load_positions(db, run_id)
+                    if p.qty
                 ]
                 pnl_points = [
                     {"ts": r.ts.isoformat(), "equity": r.equity, "idx": r.idx or 0}
                     for r in repo.load_pnl_points(db, run_id)
                 ]
-                bandit = repo.load_bandit_latest(db, run_id)
+                bandit_chain = repo.load_bandit_since_full(db, run_id)
                 learner = repo.load_learner_latest(db, run_id)
                 queue = repo.load_queue_latest(db, run_id)
 
@@ -125,13 +201,15 @@ async def _apply_resume_to_worker(worker) -> dict[str, Any]:
                         }
                     )
                     positions_n = len(positions)
-                if bandit and hasattr(worker.allocator, "set_state"):
-                    payload = getattr(bandit, "payload", None) or {}
+                if bandit_chain and hasattr(worker.allocator, "set_state"):
+                    bandit_state = merge_bandit_payloads(
+                        [getattr(b, "payload", None) for b in bandit_chain]
+                    )
                     if asyncio.iscoroutinefunction(worker.allocator.set_state):
-                        await worker.allocator.set_state({"arms": payload})
+                        await worker.allocator.set_state(bandit_state)
                     else:
-                        worker.allocator.set_state({"arms": payload})
-                    arms_k = len(payload) if isinstance(payload, dict) else 0
+                        worker.allocator.set_state(bandit_state)
+                    arms_k = len(bandit_state["arms"])
                 if learner and hasattr(worker.learner, "set_state"):
                     worker.learner.set_state(learner.bytes, (learner.meta or {}))
                     learner_loaded = True
@@ -158,43 +236,30 @@ async def _apply_resume_to_worker(worker) -> dict[str, Any]:
             "AUDIT_LOG_PATH", str(Path("./data/paper_events.jsonl").resolve())
         )
         audit = AuditLog(audit_path)
-        latest_positions: dict[str, dict[str, Any]] = {}
-        equity_curve: list[dict[str, Any]] = []
-        bandit_payload: dict[str, Any] | None = None
-        learner_meta: dict[str, Any] | None = None
+        replayed = replay_audit_events(list(audit.replay_events()))
+        latest_positions = replayed["positions"]
+        equity_curve = replayed["equity_curve"]
+        bandit_state = replayed["bandit"]
+        learner_meta = replayed["learner_meta"]
         model_bytes: bytes | None = None
-        for ev in audit.replay_events():
-            et = ev.get("type")
-            if et == "position":
-                for p in ev.get("payload", []):
-                    latest_positions[p["symbol"]] = p
-            elif et == "pnl":
-                eq = ev.get("payload", {}).get("equity_curve", [])
-                if eq:
-                    equity_curve = eq
-            elif et == "bandit":
-                bandit_payload = ev.get("payload")
-            elif et == "learner":
-                # JSONL carries meta only; model bytes cannot be recovered here
-                learner_meta = (ev.get("payload") or {}).get("meta")
         # Apply best-effort to worker
         if hasattr(worker.engine, "set_state"):
             await worker.engine.set_state(
                 {
                     "run_id": worker.engine.run_id or "recovered",
-                    "positions": list(latest_positions.values()),
+                    "positions": latest_positions,
                     "equity_curve": equity_curve[-500:],
                     "params": {},
                 }
             )
             positions_n = len(latest_positions)
-        if bandit_payload and hasattr(worker.allocator, "set_state"):
+        if bandit_state and hasattr(worker.allocator, "set_state"):
             (
-                await worker.allocator.set_state({"arms": bandit_payload})
+                await worker.allocator.set_state(bandit_state)
                 if asyncio.iscoroutinefunction(worker.allocator.set_state)
-                else worker.allocator.set_state({"arms": bandit_payload})
+                else worker.allocator.set_state(bandit_state)
             )
-            arms_k = len(bandit_payload or {})
+            arms_k = len(bandit_state["arms"])
         if model_bytes and hasattr(worker.learner, "set_state"):
             worker.learner.set_state(model_bytes, learner_meta or {})
             learner_loaded = True
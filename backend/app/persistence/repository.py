@@ -126,9 +126,12 @@ def append_pnl_points(
     db: Session, run_id: str, points: Iterable[dict[str, Any]]
 ) -> None:
     for pt in points:
+        ts = pt.get("ts") or datetime.utcnow()
+        if isinstance(ts, str):
+            ts = datetime.fromisoformat(ts)
         p = PnLPoint(
             run_id=run_id,
-            ts=pt.get("ts") or datetime.utcnow(),
+            ts=ts,
             equity=float(pt["equity"]),
             idx=int(pt.get("idx", 0)),
         )
@@ -200,6 +203,45 @@ def load_pnl_points(db: Session, run_id: str) -> list[PnLPoint]:
     )
 
 
+def load_pnl_high_water_mark(db: Session, run_id: str) -> tuple[str, int] | None:
+    """(ts ISO, idx) of the newest stored PnL point, or None if there are none."""
+    row = (
+        db.execute(
+            select(PnLPoint)
+            .where(PnLPoint.run_id == run_id)
+            .order_by(PnLPoint.ts.desc(), PnLPoint.idx.desc())
+        )
+        .scalars()
+        .first()
+    )
+    if row is None:
+        return None
+    return row.ts.isoformat(), int(row.idx or 0)
+
+
+def load_bandit_since_full(db: Session, run_id: str) -> list[BanditSnapshot]:
+    """Latest full bandit snapshot followed by the deltas written after it.
+
+    Rows without a "kind" (written before delta checkpoints) count as full.
+    """
+    rows = (
+        db.execute(
+            select(BanditSnapshot)
+            .where(BanditSnapshot.run_id == run_id)
+            .order_by(BanditSnapshot.ts.desc(), BanditSnapshot.id.desc())
+        )
+        .scalars()
+        .all()
+    )
+    chain: list[BanditSnapshot] = []
+    for row in rows:
+        chain.append(row)
+        if (row.payload or {}).get("kind") != "delta":
+            break
+    chain.reverse()
+    return chain
+
+
 def load_bandit_latest(db: Session, run_id: str) -> BanditSnapshot | None:
     return (
         db.execute(
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import hashlib
+import json
 import os
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -40,6 +43,12 @@ class Snapshotter:
         self.audit = AuditLog(self.audit_log_path, fsync_every=25)
         self._task: asyncio.Task | None = None
         self._last_checkpoint_ts: datetime | None = None
+        # Every Nth checkpoint is a full snapshot; the rest are deltas
+        self.full_every = max(1, int(os.getenv("CHECKPOINT_FULL_EVERY") or "10"))
+        # The DB and the audit JSONL advance separately: a failed DB write must
+        # be retried next time without re-appending deltas to the JSONL
+        self._marks = _HighWaterMarks(None)
+        self._db_marks = _HighWaterMarks(None)
 
     async def start_periodic(self) -> None:
         if self._task and not self._task.done():
@@ -65,7 +74,15 @@ class Snapshotter:
         except asyncio.CancelledError:
             logger.info("Snapshotter loop cancelled")
 
-    async def checkpoint_once(self) -> dict[str, Any]:
+    async def checkpoint_once(self, full: bool | None = None) -> dict[str, Any]:
+        """Persist one checkpoint.
+
+        Delta checkpoints write only what changed since the per-component
+        high-water marks: new PnL points, changed positions and bandit arms,
+        and learner/queue state when it differs. Every `full_every`-th
+        checkpoint (and the first one) is a full snapshot that rehydrate can
+        restore from before applying later deltas.
+        """
         worker = get_paper_worker()
         if worker is None:
             return {"ok": False, "reason": "worker_not_running"}
@@ -81,10 +98,19 @@ class Snapshotter:
         learner_state = _safe_get_state_sync(learner, component="learner")
         queues_state = _safe_get_state_sync(worker, component="queues")
 
+        run_id = (engine_state or {}).get("run_id") or "unknown"
+        if run_id != self._marks.run_id:
+            self._marks = _HighWaterMarks(run_id)
+            self._db_marks = _HighWaterMarks(run_id)
+        if full is None:
+            full = self._marks.checkpoints % self.full_every == 0
+        states = (engine_state or {}, bandit_state, learner_state, queues_state, full)
+        delta = self._marks.delta(*states)
+
         # Persist to DB if connected
         persisted = False
-        run_id = (engine_state or {}).get("run_id") or "unknown"
         if getattr(models_base, "SessionLocal", None):
+            db_delta = self._db_marks.delta(*states)
             try:
                 db = models_base.SessionLocal()
                 try:
@@ -96,102 +122,74 @@ class Snapshotter:
                             "meta": engine_state.get("params") if engine_state else {},
                         },
                     )
-                    # positions
-                    for pos in (engine_state or {}).get("positions", []):
+                    if self._db_marks.pnl is None:
+                        # Fresh process (or failed write): don't re-append stored points
+                        self._db_marks.pnl = repo.load_pnl_high_water_mark(db, run_id)
+                        db_delta.pnl_points = self._db_marks.new_pnl_points(
+                            (engine_state or {}).get("equity_curve", [])
+                        )
+                    # positions (closed positions are written with qty 0)
+                    now = datetime.utcnow()
+                    for pos in db_delta.positions:
                         repo.upsert_position(
-                            db,
-                            run_id,
-                            pos["symbol"],
-                            pos["qty"],
-                            pos["avg_price"],
-                            datetime.utcnow(),
+                            db, run_id, pos["symbol"], pos["qty"], pos["avg_price"], now
                         )
                     # pnl
-                    pnl_points = (engine_state or {}).get("equity_curve", [])
-                    if pnl_points:
-                        repo.append_pnl_points(db, run_id, pnl_points)
+                    if db_delta.pnl_points:
+                        repo.append_pnl_points(db, run_id, db_delta.pnl_points)
                     # bandit
-                    if bandit_state:
-                        repo.save_bandit_snapshot(db, run_id, bandit_state)
+                    if db_delta.bandit is not None:
+                        repo.save_bandit_snapshot(db, run_id, db_delta.bandit)
                     # learner
-                    if learner_state:
-                        lb = learner_state.get("bytes")
+                    if db_delta.learner is not None:
+                        lb = db_delta.learner.get("bytes")
                         if isinstance(lb, (bytes, bytearray)):
                             repo.save_learner_checkpoint(
                                 db,
                                 run_id,
-                                learner_state.get("algo"),
+                                db_delta.learner.get("algo"),
                                 bytes(lb),
-                                learner_state.get("meta"),
+                                db_delta.learner.get("meta"),
                             )
                     # queues
-                    if queues_state:
-                        repo.save_queue_snapshot(db, run_id, queues_state)
+                    if db_delta.queues is not None:
+                        repo.save_queue_snapshot(db, run_id, db_delta.queues)
                     persisted = True
                 finally:
                     db.close()
             except Exception as e:
                 logger.warning("DB snapshot failed", extra={"error": str(e)})
+            if persisted:
+                self._db_marks.commit(db_delta)
+            else:
+                # Points may have been committed before the failure; re-read the
+                # stored mark on the next attempt instead of trusting ours
+                self._db_marks.pnl = None
 
         # Always append audit JSONL events (dual write)
         now_iso = datetime.utcnow().isoformat()
-        if engine_state:
-            self.audit.append_event(
-                {
-                    "ts": now_iso,
-                    "type": "pnl",
-                    "run_id": run_id,
-                    "payload": {"equity_curve": engine_state.get("equity_curve", [])},
-                }
-            )
-            self.audit.append_event(
-                {
-                    "ts": now_iso,
-                    "type": "position",
-                    "run_id": run_id,
-                    "payload": engine_state.get("positions", []),
-                }
-            )
-        if bandit_state:
-            self.audit.append_event(
-                {
-                    "ts": now_iso,
-                    "type": "bandit",
-                    "run_id": run_id,
-                    "payload": bandit_state,
-                }
-            )
-        if learner_state:
-            # Don't dump raw bytes to JSONL; include only meta
-            self.audit.append_event(
-                {
-                    "ts": now_iso,
-                    "type": "learner",
-                    "run_id": run_id,
-                    "payload": {
-                        "algo": learner_state.get("algo"),
-                        "meta": learner_state.get("meta"),
-                    },
-                }
-            )
-        if queues_state:
+        for event_type, payload in delta.audit_events(engine_state):
             self.audit.append_event(
                 {
                     "ts": now_iso,
-                    "type": "queue",
+                    "type": event_type,
                     "run_id": run_id,
-                    "payload": queues_state,
+                    "payload": payload,
                 }
             )
+        self._marks.commit(delta)
 
         self._last_checkpoint_ts = datetime.utcnow()
         logger.info(
-            "Checkpoint complete", extra={"persisted": persisted, "run_id": run_id}
+            "Checkpoint complete",
+            extra={"persisted": persisted, "run_id": run_id, "full": full},
         )
         return {
             "ok": True,
             "persisted": persisted,
             "run_id": run_id,
+            "full": full,
+            "delta": delta.counts(),
             "ts": self._last_checkpoint_ts.isoformat(),
         }
 
@@ -223,3 +221,162 @@ def _safe_get_state_sync(obj: Any, component: str) -> dict[str, Any] | None:
             "State collection failed", extra={"component": component, "error": str(e)}
         )
     return None
+
+
+def _pnl_key(point: dict[str, Any]) -> tuple[str, int]:
+    ts = point.get("ts")
+    ts = ts.isoformat() if isinstance(ts, datetime) else str(ts or "")
+    return ts, int(point.get("idx") or 0)
+
+
+def _fingerprint(payload: Any) -> str:
+    if isinstance(payload, (bytes, bytearray)):
+        return hashlib.sha1(bytes(payload)).hexdigest()
+    return json.dumps(payload, sort_keys=True, default=str)
+
+
+@dataclass
+class CheckpointDelta:
+    """What one checkpoint writes; `None` means unchanged."""
+
+    full: bool
+    pnl_points: list[dict[str, Any]] = field(default_factory=list)
+    positions: list[dict[str, Any]] = field(default_factory=list)
+    bandit: dict[str, Any] | None = None
+    learner: dict[str, Any] | None = None
+    queues: dict[str, Any] | None = None
+    # Snapshot of everything the marks saw, committed after a successful write
+    seen_positions: dict[str, tuple[int, float]] = field(default_factory=dict)
+    seen_arms: dict[str, str] = field(default_factory=dict)
+    learner_fp: str | None = None
+    queues_fp: str | None = None
+
+    def counts(self) -> dict[str, int]:
+        return {
+            "pnl_points": len(self.pnl_points),
+            "positions": len(self.positions),
+            "bandit_arms": len((self.bandit or {}).get("arms") or {}),
+            "learner": int(self.learner is not None),
+            "queues": int(self.queues is not None),
+        }
+
+    def audit_events(
+        self, engine_state: dict[str, Any] | None
+    ) -> list[tuple[str, Any]]:
+        """Audit JSONL events: one "checkpoint" event when full, else per-component deltas."""
+        events: list[tuple[str, Any]] = []
+        learner_meta = (
+            {"algo": self.learner.get("algo"), "meta": self.learner.get("meta")}
+            if self.learner is not None
+            else None
+        )
+        if self.full:
+            events.append(
+                (
+                    "checkpoint",
+                    {
+                        "full": True,
+                        "positions": self.positions,
+                        "equity_curve": (engine_state or {}).get("equity_curve", []),
+                        "bandit": self.bandit,
+                        # Don't dump raw bytes to JSONL; include only meta
+                        "learner": learner_meta,
+                        "queues": self.queues,
+                    },
+                )
+            )
+            return events
+        if self.pnl_points:
+            events.append(("pnl", {"points": self.pnl_points}))
+        if self.positions:
+            events.append(("position", self.positions))
+        if self.bandit is not None:
+            events.append(("bandit", self.bandit))
+        if learner_meta is not None:
+            events.append(("learner", learner_meta))
+        if self.queues is not None:
+            events.append(("queue", self.queues))
+        return events
+
+
+class _HighWaterMarks:
+    """Per-component marks of what has already been persisted for a run."""
+
+    def __init__(self, run_id: str | None):
+        self.run_id = run_id
+        self.checkpoints = 0
+        # (ts, idx) of the newest persisted PnL point; None = not loaded yet
+        self.pnl: tuple[str, int] | None = None
+        self.positions: dict[str, tuple[int, float]] = {}
+        self.arms: dict[str, str] = {}
+        self.learner_fp: str | None = None
+        self.queues_fp: str | None = None
+
+    def new_pnl_points(self, curve: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if self.pnl is None:
+            return list(curve)
+        return [pt for pt in curve if _pnl_key(pt) > self.pnl]
+
+    def delta(
+        self,
+        engine_state: dict[str, Any],
+        bandit_state: dict[str, Any] | None,
+        learner_state: dict[str, Any] | None,
+        queues_state: dict[str, Any] | None,
+        full: bool,
+    ) -> CheckpointDelta:
+        d = CheckpointDelta(full=full)
+        d.pnl_points = self.new_pnl_points(engine_state.get("equity_curve", []))
+
+        current = {
+            p["symbol"]: (int(p["qty"]), float(p["avg_price"]))
+            for p in engine_state.get("positions", [])
+        }
+        d.seen_positions = current
+        for symbol, (qty, avg) in current.items():
+            if full or self.positions.get(symbol) != (qty, avg):
+                d.positions.append({"symbol": symbol, "qty": qty, "avg_price": avg})
+        for symbol in self.positions.keys() - current.keys():
+            d.positions.append({"symbol": symbol, "qty": 0, "avg_price": 0.0})
+
+        if bandit_state:
+            arms = bandit_state.get("arms") or {}
+            d.seen_arms = {tid: _fingerprint(arm) for tid, arm in arms.items()}
+            if full:
+                d.bandit = {**bandit_state, "kind": "full"}
+            else:
+                changed = {
+                    tid: arms[tid]
+                    for tid, fp in d.seen_arms.items()
+                    if self.arms.get(tid) != fp
+                }
+                if changed:
+                    d.bandit = {"kind": "delta", "arms": changed}
+        else:
+            d.seen_arms = dict(self.arms)
+
+        if learner_state:
+            d.learner_fp = _fingerprint(
+                learner_state.get("bytes") or learner_state.get("meta")
+            )
+            if full or d.learner_fp != self.learner_fp:
+                d.learner = learner_state
+        if queues_state:
+            d.queues_fp = _fingerprint(queues_state)
+            if full or d.queues_fp != self.queues_fp:
+                d.queues = queues_state
+        return d
+
+    def commit(self, d: CheckpointDelta) -> None:
+        self.checkpoints += 1
+        if d.pnl_points:
+            newest = max(_pnl_key(pt) for pt in d.pnl_points)
+            self.pnl = max(self.pnl, newest) if self.pnl is not None else newest
+        elif self.pnl is None:
+            self.pnl = ("", 0)
+        self.positions = d.seen_positions
+        self.arms = d.seen_arms
+        if d.learner_fp is not None:
+            self.learner_fp = d.learner_fp
+        if d.queues_fp is not None:
+            self.queues_fp = d.queues_fp
@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 import asyncio
+import math
 import time
+from collections import deque
 from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
 from typing import Any
 
 import yfinance as yf
@@ -41,6 +44,318 @@ class TechnicalIndicator:
     timeframe: str
 
 
+class _Ema:
+    """Exponential moving average seeded with the SMA of the first `period` values."""
+
+    __slots__ = ("count", "multiplier", "period", "seed_sum", "value")
+
+    def __init__(self, period: int):
+        self.period = period
+        self.multiplier = 2 / (period + 1)
+        self.count = 0
+        self.seed_sum = 0.0
+        self.value: float | None = None
+
+    def push(self, price: float) -> None:
+        if self.value is None:
+            self.count += 1
+            self.seed_sum += price
+            if self.count == self.period:
+                self.value = self.seed_sum / self.period
+        else:
+            self.value = price * self.multiplier + self.value * (1 - self.multiplier)
+
+    def peek(self, price: float | None = None) -> float:
+        """Current EMA, optionally as if `price` were the next value."""
+        if price is None:
+            if self.value is not None:
+                return self.value
+            return self.seed_sum / self.count if self.count else 0.0
+        if self.value is None:
+            return (self.seed_sum + price) / (self.count + 1)
+        return price * self.multiplier + self.value * (1 - self.multiplier)
+
+
+class IncrementalIndicators:
+    """
+    SMA/RSI/EMA/MACD state updated in O(1) per closed bar.
+
+    Values match ChartStreamer._calculate_indicators over the same closes; the
+    forming bar is applied on read without mutating the committed state.
+    """
+
+    RESYNC_EVERY = 1000
+
+    def __init__(self, rsi_period: int = 14, fast: int = 12, slow: int = 26):
+        self.count = 0
+        self.window: deque[float] = deque(maxlen=50)
+        self.sum20 = 0.0
+        self.sum50 = 0.0
+        self.rsi_period = rsi_period
+        self.last_close: float | None = None
+        self.gains: deque[float] = deque(maxlen=rsi_period)
+        self.losses: deque[float] = deque(maxlen=rsi_period)
+        self.gain_sum = 0.0
+        self.loss_sum = 0.0
+        self.ema_fast = _Ema(fast)
+        self.ema_slow = _Ema(slow)
+
+    def push(self, close: float) -> None:
+        """Commit a closed bar."""
+        window = self.window
+        if len(window) >= 20:
+            self.sum20 -= window[-20]
+        if len(window) == window.maxlen:
+            self.sum50 -= window[0]
+        window.append(close)
+        self.sum20 += close
+        self.sum50 += close
+
+        if self.last_close is not None:
+            delta = close - self.last_close
+            if len(self.gains) == self.rsi_period:
+                self.gain_sum -= self.gains[0]
+                self.loss_sum -= self.losses[0]
+            self.gains.append(max(delta, 0.0))
+            self.losses.append(max(-delta, 0.0))
+            self.gain_sum += self.gains[-1]
+            self.loss_sum += self.losses[-1]
+        self.last_close = close
+
+        self.ema_fast.push(close)
+        self.ema_slow.push(close)
+
+        self.count += 1
+        if self.count % self.RESYNC_EVERY == 0:
+            # Bound floating-point drift of the running sums
+            self.sum20 = math.fsum(list(window)[-20:])
+            self.sum50 = math.fsum(window)
+            self.gain_sum = math.fsum(self.gains)
+            self.loss_sum = math.fsum(self.losses)
+
+    def _sma(self, period: int, running: float, forming: float | None) -> float:
+        if forming is None:
+            return running / period
+        window = self.window
+        evicted = window[-period] if len(window) >= period else 0.0
+        return (running - evicted + forming) / period
+
+    def _rsi(self, forming: float | None, total: int) -> float:
+        period = self.rsi_period
+        if total < period + 1:
+            return 50.0
+        gain_sum, loss_sum = self.gain_sum, self.loss_sum
+        if forming is not None:
+            delta = forming - (self.last_close or forming)
+            if len(self.gains) == period:
+                gain_sum -= self.gains[0]
+                loss_sum -= self.losses[0]
+            gain_sum += max(delta, 0.0)
+            loss_sum += max(-delta, 0.0)
+        avg_loss = loss_sum / period
+        if avg_loss <= 0:
+            return 100.0
+        rs = (gain_sum / period) / avg_loss
+        return 100 - (100 / (1 + rs))
+
+    def values(self, forming: float | None = None) -> dict[str, float]:
+        """Indicator values over the closed bars plus the optional forming close."""
+        total = self.count + (1 if forming is not None else 0)
+        if total < 20:
+            return {}
+        out = {"SMA_20": self._sma(20, self.sum20, forming)}
+        if total >= 50:
+            out["SMA_50"] = self._sma(50, self.sum50, forming)
+        out["RSI_14"] = self._rsi(forming, total)
+        if total >= 26:
+            macd_line = self.ema_fast.peek(forming) - self.ema_slow.peek(forming)
+            out["MACD"] = macd_line
+            out["MACD_Signal"] = macd_line * 0.9  # Simplified signal line
+        return out
+
+
+class CandleSeries:
+    """Closed bars plus the forming bar for one (symbol, timeframe)."""
+
+    def __init__(self, symbol: str, timeframe: str, seconds: int, max_bars: int = 500):
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.seconds = seconds
+        self.closed: deque[dict[str, Any]] = deque(maxlen=max_bars)
+        self.forming: dict[str, Any] | None = None
+        self.indicators = IncrementalIndicators()
+        # Offset of bucket boundaries from the epoch (e.g. exchange-local midnight)
+        self.anchor = 0.0
+
+    def bucket(self, ts: float) -> float:
+        return ((ts - self.anchor) // self.seconds) * self.seconds + self.anchor
+
+    def upsert(self, bar: dict[str, Any]) -> bool:
+        """Replace the forming bar or close it and start a new one; True if changed."""
+        forming = self.forming
+        if forming is not None:
+            if bar["timestamp"] < forming["timestamp"]:
+                return False
+            if bar["timestamp"] == forming["timestamp"]:
+                if bar == forming:
+                    return False
+                self.forming = bar
+                return True
+            self.closed.append(forming)
+            self.indicators.push(forming["close"])
+        self.forming = bar
+        return True
+
+    def load(self, bars: list[dict[str, Any]]) -> None:
+        for bar in bars:
+            self.upsert(bar)
+        if bars:
+            self.anchor = bars[-1]["timestamp"] % self.seconds
+
+    def __len__(self) -> int:
+        return len(self.closed) + (1 if self.forming is not None else 0)
+
+    def chart_data(self, limit: int = 100) -> dict[str, Any]:
+        now = time.time()
+        candles = list(self.closed)[-(limit - 1) :] if limit > 1 else []
+        forming_close = None
+        if self.forming is not None:
+            candles.append(self.forming)
+            forming_close = self.forming["close"]
+        indicators = [
+            {
+                "name": name,
+                "value": value,
+                "timestamp": now,
+                "symbol": self.symbol,
+                "timeframe": self.timeframe,
+            }
+            for name, value in self.indicators.values(forming_close).items()
+        ]
+        return {
+            "symbol": self.symbol,
+            "timeframe": self.timeframe,
+            "candlesticks": candles,
+            "indicators": indicators,
+            "last_updated": now,
+        }
+
+
+def _merge_bar(
+    partial: dict[str, Any] | None, bar: dict[str, Any], start: float, timeframe: str
+) -> dict[str, Any]:
+    if partial is None:
+        return {**bar, "timestamp": start, "timeframe": timeframe}
+    return {
+        "timestamp": start,
+        "open": partial["open"],
+        "high": max(partial["high"], bar["high"]),
+        "low": min(partial["low"], bar["low"]),
+        "close": bar["close"],
+        "volume": partial["volume"] + bar["volume"],
+        "symbol": bar["symbol"],
+        "timeframe": timeframe,
+    }
+
+
+class CandleStore:
+    """
+    Shared candle store: 1m bars drive every higher timeframe.
+
+    Higher timeframes are seeded once from history, then only their forming bar
+    is rebuilt from the closed 1m bars of the current bucket plus the live 1m bar.
+    """
+
+    # 1m bars kept per symbol; a full day so any bucket up to 1d can be rebuilt
+    MINUTE_BARS = 1440
+
+    def __init__(self, timeframes: dict[str, int], max_bars: int = 500):
+        self.timeframes = timeframes
+        self.max_bars = max_bars
+        self.series: dict[tuple[str, str], CandleSeries] = {}
+        # Aggregate of closed 1m bars in the current bucket per (symbol, timeframe)
+        self._partials: dict[tuple[str, str], dict[str, Any]] = {}
+
+    def get(self, symbol: str, timeframe: str) -> CandleSeries | None:
+        return self.series.get((symbol, timeframe))
+
+    def seed(self, symbol: str, timeframe: str, bars: list[dict[str, Any]]) -> None:
+        series = CandleSeries(
+            symbol, timeframe, self.timeframes[timeframe], self.max_bars
+        )
+        series.load(bars)
+        self.series[(symbol, timeframe)] = series
+        self._partials.pop((symbol, timeframe), None)
+
+        # Rebuild the current bucket's partial from 1m bars already held
+        base = self.series.get((symbol, "1m"))
+        if base is not None and base.forming is not None:
+            start = series.bucket(base.forming["timestamp"])
+            partial = None
+            for bar in base.closed:
+                if series.bucket(bar["timestamp"]) == start:
+                    partial = _merge_bar(partial, bar, start, timeframe)
+            if partial is not None:
+                self._partials[(symbol, timeframe)] = partial
+            series.upsert(_merge_bar(partial, base.forming, start, timeframe))
+
+    def drop(self, symbol: str, timeframe: str | None = None) -> None:
+        for key in list(self.series):
+            if key[0] == symbol and (timeframe is None or key[1] == timeframe):
+                self.series.pop(key, None)
+                self._partials.pop(key, None)
+
+    def _higher(self, symbol: str) -> list[CandleSeries]:
+        return [
+            series
+            for (sym, tf), series in self.series.items()
+            if sym == symbol and tf != "1m"
+        ]
+
+    def ingest_minute_bars(self, symbol: str, bars: list[dict[str, Any]]) -> set[str]:
+        """Apply 1m bars (oldest first); return timeframes whose bars changed."""
+        base = self.series.get((symbol, "1m"))
+        if base is None:
+            base = self.series[(symbol, "1m")] = CandleSeries(
+                symbol, "1m", self.timeframes["1m"], self.MINUTE_BARS
+            )
+        higher = self._higher(symbol)
+        changed: set[str] = set()
+
+        for bar in bars:
+            previous = base.forming
+            if previous is not None and bar["timestamp"] < previous["timestamp"]:
+                continue
+            if previous is not None and bar["timestamp"] > previous["timestamp"]:
+                # The previous minute closed: fold it into each bucket's partial
+                for series in higher:
+                    key = (symbol, series.timeframe)
+                    start = series.bucket(previous["timestamp"])
+                    partial = self._partials.get(key)
+                    if partial is not None and partial["timestamp"] != start:
+                        partial = None
+                    self._partials[key] = _merge_bar(
+                        partial, previous, start, series.timeframe
+                    )
+            if base.upsert(bar):
+                changed.add("1m")
+
+            for series in higher:
+                start = series.bucket(bar["timestamp"])
+                partial = self._partials.get((symbol, series.timeframe))
+                if partial is not None and partial["timestamp"] != start:
+                    partial = None
+                if series.upsert(_merge_bar(partial, bar, start, series.timeframe)):
+                    changed.add(series.timeframe)
+        return changed
+
+    def chart_data(self, symbol: str, timeframe: str) -> dict[str, Any] | None:
+        series = self.series.get((symbol, timeframe))
+        if series is None or not len(series):
+            return None
+        return series.chart_data()
+
+
 class ChartStreamer:
     """Real-time chart data and candlestick streaming service"""
 
@@ -59,11 +374,11 @@ class ChartStreamer:
         # Active subscriptions: symbol -> set of timeframes
         self.active_subscriptions: dict[str, set[str]] = {}
 
-        # Cache for chart data to avoid redundant API calls
-        self.chart_cache: dict[str, dict[str, Any]] = {}
-        self.cache_ttl = 30  # 30 seconds cache TTL for most timeframes
+        # Shared candle store; one 1m poll per symbol feeds every timeframe
+        self.store = CandleStore(self.timeframes)
+        self.poll_interval = 30  # seconds between 1m polls
 
-        # Streaming control
+        # Streaming control: one task per symbol
         self.is_running = False
         self.streaming_tasks: dict[str, asyncio.Task] = {}
 
@@ -88,12 +403,11 @@ class ChartStreamer:
                 if timeframe in self.timeframes:
                     self.active_subscriptions[symbol].add(timeframe)
 
-                    # Start individual streaming task for this symbol-timeframe combo
-                    task_key = f"{symbol}_{timeframe}"
-                    if task_key not in self.streaming_tasks:
-                        self.streaming_tasks[task_key] = asyncio.create_task(
-                            self._stream_chart_data(symbol, timeframe)
-                        )
+            # One polling task per symbol serves all of its timeframes
+            if self.active_subscriptions[symbol] and symbol not in self.streaming_tasks:
+                self.streaming_tasks[symbol] = asyncio.create_task(
+                    self._stream_symbol(symbol)
+                )
 
         self.is_running = True
         logger.info(
@@ -131,16 +445,16 @@ class ChartStreamer:
                 for timeframe in timeframes_to_remove:
                     if timeframe in self.active_subscriptions[symbol]:
                         self.active_subscriptions[symbol].discard(timeframe)
+                        if timeframe != "1m":
+                            self.store.drop(symbol, timeframe)
 
-                        # Cancel the streaming task
-                        task_key = f"{symbol}_{timeframe}"
-                        if task_key in self.streaming_tasks:
-                            self.streaming_tasks[task_key].cancel()
-                            del self.streaming_tasks[task_key]
-
-                # Remove symbol if no timeframes left
+                # Remove symbol and cancel its task if no timeframes left
                 if not self.active_subscriptions[symbol]:
                     del self.active_subscriptions[symbol]
+                    task = self.streaming_tasks.pop(symbol, None)
+                    if task is not None:
+                        task.cancel()
+                    self.store.drop(symbol)
 
         # Check if all streaming stopped
         if not self.active_subscriptions:
@@ -151,29 +465,16 @@ class ChartStreamer:
             extra={"symbols": symbols, "timeframes": timeframes},
         )
 
-    async def _stream_chart_data(self, symbol: str, timeframe: str):
-        """Stream chart data for a specific symbol and timeframe"""
-        update_interval = self.timeframes[timeframe]
-
-        # For minute charts, update more frequently
-        if timeframe == "1m":
-            update_interval = 30  # Update every 30 seconds for 1-minute charts
-        elif timeframe == "5m":
-            update_interval = 60  # Update every minute for 5-minute charts
+    async def _stream_symbol(self, symbol: str):
+        """Poll 1m bars for a symbol and push one update per changed (symbol, timeframe)"""
+        update_interval = self.poll_interval
 
         logger.info(
-            f"Starting chart streaming for {symbol} {timeframe}",
-            extra={
-                "symbol": symbol,
-                "timeframe": timeframe,
-                "update_interval": update_interval,
-            },
+            f"Starting chart streaming for {symbol}",
+            extra={"symbol": symbol, "update_interval": update_interval},
         )
 
         while self.is_running and symbol in self.active_subscriptions:
-            if timeframe not in self.active_subscriptions.get(symbol, set()):
-                break
-
             start_time = time.time()
 
             try:
@@ -187,7 +488,6 @@ class ChartStreamer:
                             "Skipping chart update due to high queue utilization",
                             extra={
                                 "symbol": symbol,
-                                "timeframe": timeframe,
                                 "queue_size": size,
                                 "queue_capacity": cap,
                                 "utilization": round(ratio, 3),
@@ -200,13 +500,17 @@ class ChartStreamer:
                     # Do not let metrics/backpressure checks break streaming
                     pass
 
-                # Fetch chart data
-                chart_data = await self._fetch_chart_data(symbol, timeframe)
+                timeframes = set(self.active_subscriptions.get(symbol, set()))
+                changed = await self._poll_symbol(symbol, timeframes)
 
-                if chart_data:
-                    # Broadcast chart update
-                    await self._broadcast_chart_update(symbol, timeframe, chart_data)
-                    self.update_count += 1
+                for timeframe in sorted(changed & timeframes):
+                    chart_data = self.store.chart_data(symbol, timeframe)
+                    if chart_data:
+                        self.update_count += 1
+                        await self._broadcast_chart_update(
+                            symbol, timeframe, chart_data
+                        )
+                if changed:
                     self.last_update_time = time.time()
 
                 # Calculate processing time and adjust sleep
@@ -218,7 +522,6 @@ class ChartStreamer:
                         "Chart data processing slow",
                         extra={
                             "symbol": symbol,
-                            "timeframe": timeframe,
                             "processing_time": processing_time,
                             "target_interval": update_interval,
                         },
@@ -232,123 +535,132 @@ class ChartStreamer:
                     "Chart streaming error",
                     extra={
                         "symbol": symbol,
-                        "timeframe": timeframe,
                         "error": str(e),
                         "error_count": self.error_count,
                     },
                 )
                 await asyncio.sleep(60)  # Longer pause on error
 
-    async def _fetch_chart_data(
-        self, symbol: str, timeframe: str
-    ) -> dict[str, Any] | None:
-        """Fetch chart data from yfinance"""
-        cache_key = f"{symbol}_{timeframe}"
-        current_time = time.time()
-
-        # Check cache first
-        if cache_key in self.chart_cache:
-            cached_data = self.chart_cache[cache_key]
-            if current_time - cached_data["timestamp"] < self.cache_ttl:
-                return cached_data["data"]
-
-        try:
-            # Map our timeframes to yfinance intervals
-            interval_map = {
-                "1m": "1m",
-                "5m": "5m",
-                "15m": "15m",
-                "1h": "1h",
-                "1d": "1d",
-            }
+    async def _poll_symbol(self, symbol: str, timeframes: set[str]) -> set[str]:
+        """Seed missing higher timeframes once, then apply new 1m bars to all."""
+        for timeframe in timeframes - {"1m"}:
+            if self.store.get(symbol, timeframe) is None:
+                bars = await self._fetch_bars(symbol, timeframe)
+                if bars:
+                    self.store.seed(symbol, timeframe, bars)
+
+        # After the first load only request bars from the forming minute onwards
+        base = self.store.get(symbol, "1m")
+        since = base.forming["timestamp"] if base and base.forming else None
+        bars = await self._fetch_bars(symbol, "1m", since=since)
+        return self.store.ingest_minute_bars(symbol, bars or [])
+
+    async def _fetch_bars(
+        self, symbol: str, timeframe: str, since: float | None = None
+    ) -> list[dict[str, Any]] | None:
+        """Fetch OHLCV bars from yfinance (full period, or from `since` onwards)"""
+        # Map our timeframes to yfinance intervals
+        interval_map = {
+            "1m": "1m",
+            "5m": "5m",
+            "15m": "15m",
+            "1h": "1h",
+            "1d": "1d",
+        }
 
-            # Determine period based on timeframe
-            period_map = {
-                "1m": "1d",  # 1 day of 1-minute data
-                "5m": "5d",  # 5 days of 5-minute data
-                "15m": "1mo",  # 1 month of 15-minute data
-                "1h": "3mo",  # 3 months of hourly data
-                "1d": "1y",  # 1 year of daily data
-            }
+        # Determine period based on timeframe
+        period_map = {
+            "1m": "1d",  # 1 day of 1-minute data
+            "5m": "5d",  # 5 days of 5-minute data
+            "15m": "1mo",  # 1 month of 15-minute data
+            "1h": "3mo",  # 3 months of hourly data
+            "1d": "1y",  # 1 year of daily data
+        }
 
-            interval = interval_map.get(timeframe, "1h")
-            period = period_map.get(timeframe, "1mo")
+        interval = interval_map.get(timeframe, "1h")
+        if since is not None:
+            window = {"start": datetime.fromtimestamp(since, UTC)}
+        else:
+            window = {"period": period_map.get(timeframe, "1mo")}
 
-            # Fetch data from yfinance with timeout
-            try:
-                ticker = yf.Ticker(symbol)
-                # Use asyncio timeout to prevent hanging
-                hist = await asyncio.wait_for(
-                    asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda: ticker.history(
-                            period=period,
-                            interval=interval,
-                            auto_adjust=True,
-                            prepost=True,
-                        ),
+        # Fetch data from yfinance with timeout
+        try:
+            ticker = yf.Ticker(symbol)
+            # Use asyncio timeout to prevent hanging
+            hist = await asyncio.wait_for(
+                asyncio.get_event_loop().run_in_executor(
+                    None,
+                    lambda: ticker.history(
+                        interval=interval,
+                        auto_adjust=True,
+                        prepost=True,
+                        **window,
                     ),
-                    timeout=TIMEOUTS["provider_market_data"],
-                )
-
-                if hist.empty:
-                    logger.warning(f"No chart data available for {symbol} {timeframe}")
-                    return None
+                ),
+                timeout=TIMEOUTS["provider_market_data"],
+            )
 
-            except TimeoutError:
-                logger.error(f"Timeout fetching chart data for {symbol} {timeframe}")
-                return None
-            except Exception as fetch_error:
-                logger.error(
-                    f"Failed to fetch data from yfinance for {symbol}: {fetch_error}"
-                )
+            if hist.empty:
+                logger.warning(f"No chart data available for {symbol} {timeframe}")
                 return None
 
-            # Convert to our candlestick format
-            candlesticks = []
-            for timestamp, row in hist.iterrows():
-                # Handle different timestamp types safely
-                try:
-                    if hasattr(timestamp, "timestamp"):
-                        ts_value = timestamp.timestamp()  # type: ignore
-                    else:
-                        ts_value = float(str(timestamp))
-                except (ValueError, TypeError, AttributeError):
-                    ts_value = time.time()
-
-                candlestick = Candlestick(
-                    timestamp=ts_value,
-                    open=float(row["Open"]),
-                    high=float(row["High"]),
-                    low=float(row["Low"]),
-                    close=float(row["Close"]),
-                    volume=int(row["Volume"]),
+        except TimeoutError:
+            logger.error(f"Timeout fetching chart data for {symbol} {timeframe}")
+            return None
+        except Exception as fetch_error:
+            logger.error(
+                f"Failed to fetch data from yfinance for {symbol}: {fetch_error}"
+            )
+            return None
+
+        return self._bars_from_history(hist, symbol, timeframe)
+
+    @staticmethod
+    def _bars_from_history(hist: Any, symbol: str, timeframe: str) -> list[dict]:
+        """Convert an OHLCV frame to candlestick dicts (column-wise, no iterrows)"""
+        timestamps = []
+        for timestamp in hist.index:
+            # Handle different timestamp types safely
+            try:
+                if hasattr(timestamp, "timestamp"):
+                    timestamps.append(timestamp.timestamp())  # type: ignore
+                else:
+                    timestamps.append(float(str(timestamp)))
+            except (ValueError, TypeError, AttributeError):
+                timestamps.append(time.time())
+
+        return [
+            asdict(
+                Candlestick(
+                    timestamp=ts,
+                    open=float(o),
+                    high=float(h),
+                    low=float(lo),
+                    close=float(c),
+                    volume=int(v),
                     symbol=symbol,
                     timeframe=timeframe,
                 )
-                candlesticks.append(asdict(candlestick))
-
-            # Calculate basic technical indicators
-            indicators = await self._calculate_indicators(
-                candlesticks, symbol, timeframe
             )
+            for ts, o, h, lo, c, v in zip(
+                timestamps,
+                hist["Open"].tolist(),
+                hist["High"].tolist(),
+                hist["Low"].tolist(),
+                hist["Close"].tolist(),
+                hist["Volume"].tolist(),
+                strict=True,
+            )
+        ]
 
-            chart_data = {
-                "symbol": symbol,
-                "timeframe": timeframe,
-                "candlesticks": candlesticks[-100:],  # Last 100 bars
-                "indicators": indicators,
-                "last_updated": current_time,
-            }
-
-            # Update cache
-            self.chart_cache[cache_key] = {
-                "data": chart_data,
-                "timestamp": current_time,
-            }
-
-            return chart_data
-
+    async def _fetch_chart_data(
+        self, symbol: str, timeframe: str
+    ) -> dict[str, Any] | None:
+        """Return chart data for a symbol/timeframe from the shared candle store"""
+        try:
+            if self.store.get(symbol, timeframe) is None:
+                await self._poll_symbol(symbol, {timeframe})
+            return self.store.chart_data(symbol, timeframe)
         except Exception as e:
             logger.error(f"Error fetching chart data for {symbol} {timeframe}: {e}")
             return None
@@ -356,7 +668,7 @@ class ChartStreamer:
     async def _calculate_indicators(
         self, candlesticks: list[dict[str, Any]], symbol: str, timeframe: str
     ) -> list[dict[str, Any]]:
-        """Calculate basic technical indicators"""
+        """Calculate basic technical indicators from scratch (see IncrementalIndicators)"""
         if len(candlesticks) < 20:
             return []
 
@@ -49,6 +49,10 @@ class PerformanceMetrics:
     # Feature stability
     psi_scores: dict[str, float]  # Population Stability Index per feature
 
+    # Bootstrap intervals for the risk-adjusted ratios
+    sharpe_confidence_interval: tuple[float, float] = (0.0, 0.0)
+    sortino_confidence_interval: tuple[float, float] = (0.0, 0.0)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -71,6 +75,8 @@ class PerformanceMetrics:
             "hit_rate_confidence_interval": self.hit_rate_confidence_interval,
             "expectancy_confidence_interval": self.expectancy_confidence_interval,
             "psi_scores": self.psi_scores,
+            "sharpe_confidence_interval": self.sharpe_confidence_interval,
+            "sortino_confidence_interval": self.sortino_confidence_interval,
         }
 
 
@@ -185,6 +191,15 @@ def calculate_max_drawdown(df: pd.DataFrame) -> tuple[float, int]:
     return max_drawdown, max_dd_duration
 
 
+def calculate_daily_turnover(df: pd.DataFrame) -> float:
+    """Average number of trades per calendar day (timestamps in epoch seconds)."""
+    if "timestamp" not in df.columns or len(df) == 0:
+        return 0.0
+
+    dates = pd.to_datetime(df["timestamp"], unit="s").dt.date
+    return dates.groupby(dates).size().mean()
+
+
 def calculate_brier_score(df: pd.DataFrame) -> float:
     """Calculate Brier score for probability calibration."""
     if "predicted_prob" not in df.columns or "realized_pnl" not in df.columns:
@@ -344,17 +359,19 @@ def calculate_psi(
 
 
 def bootstrap_confidence_interval(
-    data: np.ndarray, statistic_func, n_bootstrap: int = 1000, confidence: float = 0.95
+    data: np.ndarray,
+    statistic_func,
+    n_bootstrap: int = 1000,
+    confidence: float = 0.95,
+    seed: int | None = None,
 ) -> tuple[float, float]:
     """Calculate bootstrap confidence interval for a statistic."""
     if len(data) == 0:
         return 0.0, 0.0
 
-    bootstrap_stats = []
-
-    for _ in range(n_bootstrap):
-        sample = np.random.choice(data, size=len(data), replace=True)
-        bootstrap_stats.append(statistic_func(sample))
+    data = np.asarray(data)
+    indices = BootstrapEngine(n_bootstrap, confidence, seed).resample_indices(len(data))
+    bootstrap_stats = [statistic_func(sample) for sample in data[indices]]
 
     alpha = 1 - confidence
     lower = np.percentile(bootstrap_stats, alpha / 2 * 100)
@@ -363,8 +380,97 @@ def bootstrap_confidence_interval(
     return lower, upper
 
 
+class BootstrapEngine:
+    """
+    Vectorized bootstrap over trade PnL.
+
+    Draws one (n_bootstrap, n) resample index matrix per sample size and
+    computes every metric for all resamples with array reductions, so hit
+    rate, expectancy, Sharpe and Sortino share the same resamples. Pass a
+    seed for reproducible intervals.
+    """
+
+    METRICS = ("hit_rate", "expectancy", "sharpe", "sortino")
+
+    def __init__(
+        self,
+        n_bootstrap: int = 1000,
+        confidence: float = 0.95,
+        seed: int | None = None,
+        risk_free_rate: float = 0.02,
+    ):
+        self.n_bootstrap = n_bootstrap
+        self.confidence = confidence
+        self.seed = seed
+        self.risk_free_rate = risk_free_rate
+
+    def resample_indices(self, n: int) -> np.ndarray:
+        """Index matrix of shape (n_bootstrap, n); same seed gives same draws."""
+        rng = np.random.default_rng(self.seed)
+        return rng.integers(0, n, size=(self.n_bootstrap, n))
+
+    def metric_distributions(self, pnl: np.ndarray) -> dict[str, np.ndarray]:
+        """Bootstrap distribution of each metric, one value per resample."""
+        pnl = np.asarray(pnl, dtype=float)
+        samples = pnl[self.resample_indices(len(pnl))]
+        n = samples.shape[1]
+
+        mean = samples.mean(axis=1)
+        annual_excess = mean * 252 - self.risk_free_rate
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Sharpe: sample std (ddof=1) as in calculate_sharpe_ratio
+            std = samples.std(axis=1, ddof=1) if n > 1 else np.zeros(len(samples))
+            sharpe = np.where(std == 0, 0.0, annual_excess / (std * np.sqrt(252)))
+
+            # Sortino: std over each resample's losing trades only
+            losing = samples < 0
+            n_losing = losing.sum(axis=1)
+            losing_mean = np.where(losing, samples, 0.0).sum(axis=1) / n_losing
+            sq_dev = np.where(losing, samples - losing_mean[:, None], 0.0) ** 2
+            downside_std = np.sqrt(sq_dev.sum(axis=1) / (n_losing - 1))
+            sortino = np.where(
+                n_losing == 0,
+                np.inf,
+                np.where(
+                    downside_std == 0,
+                    0.0,
+                    annual_excess / (downside_std * np.sqrt(252)),
+                ),
+            )
+            sortino = np.where(n_losing == 1, np.nan, sortino)
+
+        return {
+            "hit_rate": (samples > 0).mean(axis=1),
+            "expectancy": mean,
+            "sharpe": sharpe,
+            "sortino": sortino,
+        }
+
+    def confidence_intervals(self, pnl: np.ndarray) -> dict[str, tuple[float, float]]:
+        """Percentile interval per metric; (0.0, 0.0) for empty input."""
+        if len(pnl) == 0:
+            return {name: (0.0, 0.0) for name in self.METRICS}
+
+        alpha = 1 - self.confidence
+        bounds = [alpha / 2 * 100, (1 - alpha / 2) * 100]
+        intervals = {}
+        for name, values in self.metric_distributions(pnl).items():
+            values = values[~np.isnan(values)]
+            if len(values) == 0:
+                intervals[name] = (0.0, 0.0)
+                continue
+            # Loss-free resamples give an infinite Sortino; don't interpolate it
+            method = "linear" if np.isfinite(values).all() else "nearest"
+            lower, upper = np.percentile(values, bounds, method=method)
+            intervals[name] = (float(lower), float(upper))
+        return intervals
+
+
 def evaluate_trading_performance(
-    df: pd.DataFrame, baseline_df: pd.DataFrame | None = None
+    df: pd.DataFrame,
+    baseline_df: pd.DataFrame | None = None,
+    bootstrap: BootstrapEngine | None = None,
 ) -> PerformanceMetrics:
     """
     Calculate comprehensive trading performance metrics.
@@ -372,6 +478,7 @@ def evaluate_trading_performance(
     Args:
         df: DataFrame with trading data
         baseline_df: Optional baseline for feature drift comparison
+        bootstrap: Engine for confidence intervals (unseeded default if None)
 
     Returns:
         PerformanceMetrics object with all calculated metrics
@@ -437,24 +544,16 @@ def evaluate_trading_performance(
     avg_holding_period = 0.0
 
     if "timestamp" in completed_df.columns:
-        # Calculate daily turnover
-        completed_df["date"] = pd.to_datetime(
-            completed_df["timestamp"], unit="s"
-        ).dt.date
-        daily_trades = completed_df.groupby("date").size()
-        avg_daily_turnover = daily_trades.mean()
+        avg_daily_turnover = calculate_daily_turnover(completed_df)
 
         # Estimate holding period (if we have entry/exit times)
         if "exit_timestamp" in completed_df.columns:
             holding_periods = completed_df["exit_timestamp"] - completed_df["timestamp"]
             avg_holding_period = holding_periods.mean() / 3600  # Convert to hours
 
-    # Statistical confidence intervals
-    outcomes = (completed_df["realized_pnl"] > 0).astype(int).values
+    # Statistical confidence intervals, all from one set of resamples
     pnl_values = completed_df["realized_pnl"].values
-
-    hit_rate_ci = bootstrap_confidence_interval(outcomes, lambda x: x.mean())
-    expectancy_ci = bootstrap_confidence_interval(pnl_values, lambda x: x.mean())
+    intervals = (bootstrap or BootstrapEngine()).confidence_intervals(pnl_values)
 
     # Feature stability (PSI)
     psi_scores = {}
@@ -484,9 +583,11 @@ def evaluate_trading_performance(
         reliability_diagram=reliability_diagram,
         avg_daily_turnover=avg_daily_turnover,
         avg_holding_period=avg_holding_period,
-        hit_rate_confidence_interval=hit_rate_ci,
-        expectancy_confidence_interval=expectancy_ci,
+        hit_rate_confidence_interval=intervals["hit_rate"],
+        expectancy_confidence_interval=intervals["expectancy"],
         psi_scores=psi_scores,
+        sharpe_confidence_interval=intervals["sharpe"],
+        sortino_confidence_interval=intervals["sortino"],
     )
 
 
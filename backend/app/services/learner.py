@@ -7,10 +7,14 @@ Focuses on interpretable parameter optimization with rigorous validation gates.
 from __future__ import annotations
 
 import json
+import os
+import pickle
 import time
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 from dataclasses import asdict, dataclass
 from datetime import datetime
+from multiprocessing import shared_memory
 from pathlib import Path
 from typing import Any
 
@@ -19,7 +23,13 @@ import pandas as pd
 
 from .calibration import ProbabilityCalibrator
 from .data_log import get_logger
-from .evaluation import PerformanceMetrics, compare_runs, evaluate_trading_performance
+from .evaluation import (
+    BootstrapEngine,
+    PerformanceMetrics,
+    calculate_daily_turnover,
+    compare_runs,
+    evaluate_trading_performance,
+)
 
 
 @dataclass
@@ -199,11 +209,82 @@ class RuleParameterGenerator:
         return variations
 
 
+class SharedSplits:
+    """
+    Train/valid/test frames serialized once into shared memory.
+
+    Pool workers attach by segment name and deserialize once per process
+    instead of receiving the DataFrames with every candidate.
+    """
+
+    def __init__(self, frames: dict[str, pd.DataFrame]):
+        self._segments: dict[str, tuple[shared_memory.SharedMemory, int]] = {}
+        try:
+            for name, frame in frames.items():
+                payload = pickle.dumps(frame, protocol=pickle.HIGHEST_PROTOCOL)
+                segment = shared_memory.SharedMemory(create=True, size=len(payload))
+                segment.buf[: len(payload)] = payload
+                self._segments[name] = (segment, len(payload))
+        except Exception:
+            self.close()
+            raise
+
+    @property
+    def handles(self) -> dict[str, tuple[str, int]]:
+        """Picklable (segment name, size) per frame for worker initializers."""
+        return {name: (seg.name, size) for name, (seg, size) in self._segments.items()}
+
+    @staticmethod
+    def attach(handles: dict[str, tuple[str, int]]) -> dict[str, pd.DataFrame]:
+        frames = {}
+        for name, (segment_name, size) in handles.items():
+            segment = shared_memory.SharedMemory(name=segment_name)
+            try:
+                with segment.buf[:size] as view:
+                    frames[name] = pickle.loads(view)
+            finally:
+                segment.close()
+        return frames
+
+    def close(self) -> None:
+        for segment, _ in self._segments.values():
+            segment.close()
+            segment.unlink()
+        self._segments.clear()
+
+
+# Per-process state for candidate scoring workers
+_worker_state: dict[str, Any] = {}
+
+
+def _init_candidate_worker(
+    handles: dict[str, tuple[str, int]],
+    gates: StrictGates,
+    bootstrap_seed: int | None,
+) -> None:
+    _worker_state["frames"] = SharedSplits.attach(handles)
+    _worker_state["learner"] = StrictLearner(
+        gates=gates, bootstrap_seed=bootstrap_seed, parallel_workers=0
+    )
+
+
+def _score_candidate_in_worker(
+    candidate: RuleSet,
+) -> tuple[float, PerformanceMetrics] | None:
+    frames = _worker_state["frames"]
+    return _worker_state["learner"].score_candidate(
+        candidate, frames["train"], frames["valid"]
+    )
+
+
 class StrictLearner:
     """
     Strict learning system that optimizes rule parameters with rigorous validation.
     """
 
+    # Hard constraint on the validation split, alongside the turnover gate
+    min_validation_trades = 50
+
     def __init__(
         self,
         data_window_days: int = 180,
@@ -211,6 +292,8 @@ class StrictLearner:
         valid_split: float = 0.2,
         test_split: float = 0.2,
         gates: StrictGates | None = None,
+        bootstrap_seed: int | None = None,
+        parallel_workers: int | None = None,
     ):
         """
         Initialize strict learner.
@@ -221,6 +304,10 @@ class StrictLearner:
             valid_split: Fraction for validation (hyperparameter selection)
             test_split: Fraction for testing (final evaluation)
             gates: Validation gates (uses defaults if None)
+            bootstrap_seed: Seed for bootstrap confidence intervals (reproducible
+                gate decisions); None draws fresh resamples each run
+            parallel_workers: Processes for candidate scoring; 0 scores serially
+                (default from LEARNER_WORKERS)
         """
         self.data_window_days = data_window_days
         self.train_split = train_split
@@ -234,6 +321,11 @@ class StrictLearner:
 
         self.gates = gates or StrictGates()
         self.generator = RuleParameterGenerator()
+        self.bootstrap_seed = bootstrap_seed
+        self.bootstrap = BootstrapEngine(seed=bootstrap_seed)
+        if parallel_workers is None:
+            parallel_workers = int(os.getenv("LEARNER_WORKERS", "0"))
+        self.parallel_workers = parallel_workers
 
         # Storage paths
         self.rules_dir = Path("./data/rules")
@@ -310,9 +402,93 @@ class StrictLearner:
             eval_df["predicted_prob"] = calibrated_probs
 
         # Calculate metrics
-        metrics = evaluate_trading_performance(eval_df, baseline_df=train_df)
+        metrics = evaluate_trading_performance(
+            eval_df, baseline_df=train_df, bootstrap=self.bootstrap
+        )
         return metrics
 
+    def violates_hard_constraints(self, valid_df: pd.DataFrame) -> bool:
+        """
+        Cheap pre-check of the validation constraints on trade count and turnover.
+
+        Both depend only on the validation split, so a failure here means no
+        candidate can be selected and the costly evaluation is skipped.
+        """
+        completed = valid_df[valid_df["realized_pnl"].notna()]
+        if len(completed) < self.min_validation_trades:
+            return True
+        turnover = calculate_daily_turnover(completed)
+        return turnover > self.gates.max_daily_turnover_cap
+
+    def score_candidate(
+        self, candidate_rules: RuleSet, train_df: pd.DataFrame, valid_df: pd.DataFrame
+    ) -> tuple[float, PerformanceMetrics] | None:
+        """
+        Score a candidate on the validation split.
+
+        Returns:
+            (objective, metrics), or None if the candidate failed a constraint
+        """
+        if len(valid_df) == 0 or self.violates_hard_constraints(valid_df):
+            return None
+
+        metrics = self.evaluate_candidate_on_split(candidate_rules, train_df, valid_df)
+        if metrics is None:
+            return None
+
+        # Objective: expectancy with drawdown penalty
+        objective = metrics.expectancy_after_costs - 0.1 * metrics.max_drawdown
+        return objective, metrics
+
+    def score_candidates(
+        self,
+        candidates: list[RuleSet],
+        train_df: pd.DataFrame,
+        valid_df: pd.DataFrame,
+    ) -> list[tuple[float, PerformanceMetrics] | None]:
+        """
+        Score candidates in order, on a process pool when parallel_workers > 0.
+
+        The splits are written to shared memory once and read by every worker.
+        Falls back to serial scoring if the pool cannot be used.
+        """
+        if not candidates:
+            return []
+        if len(valid_df) == 0 or self.violates_hard_constraints(valid_df):
+            return [None] * len(candidates)
+
+        workers = min(self.parallel_workers, len(candidates))
+        if workers > 1:
+            try:
+                return self._score_candidates_parallel(
+                    candidates, train_df, valid_df, workers
+                )
+            except Exception as e:
+                print(f"Parallel candidate scoring failed, running serially: {e}")
+
+        return [
+            self.score_candidate(candidate, train_df, valid_df)
+            for candidate in candidates
+        ]
+
+    def _score_candidates_parallel(
+        self,
+        candidates: list[RuleSet],
+        train_df: pd.DataFrame,
+        valid_df: pd.DataFrame,
+        workers: int,
+    ) -> list[tuple[float, PerformanceMetrics] | None]:
+        splits = SharedSplits({"train": train_df, "valid": valid_df})
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_candidate_worker,
+                initargs=(splits.handles, self.gates, self.bootstrap_seed),
+            ) as pool:
+                return list(pool.map(_score_candidate_in_worker, candidates))
+        finally:
+            splits.close()
+
     def check_strict_gates(
         self,
         baseline_metrics: PerformanceMetrics,
@@ -455,7 +631,9 @@ class StrictLearner:
         train_df, valid_df, test_df = self.split_data_chronologically(df)
 
         # Evaluate baseline on test set
-        baseline_metrics = evaluate_trading_performance(test_df, baseline_df=train_df)
+        baseline_metrics = evaluate_trading_performance(
+            test_df, baseline_df=train_df, bootstrap=self.bootstrap
+        )
 
         # Generate candidates
         candidates = self.generator.generate_candidates(current_rules)
@@ -465,23 +643,16 @@ class StrictLearner:
         best_metrics = None
         best_objective = float("-inf")
 
-        for candidate in candidates:
-            metrics = self.evaluate_candidate_on_split(candidate, train_df, valid_df)
-            if metrics is None:
+        scores = self.score_candidates(candidates, train_df, valid_df)
+        for candidate, score in zip(candidates, scores):
+            if score is None:
                 continue
 
-            # Objective: expectancy with drawdown penalty
-            objective = metrics.expectancy_after_costs - 0.1 * metrics.max_drawdown
-
-            # Apply hard constraints
-            if (
-                metrics.total_trades >= 50  # Minimum trades in validation
-                and metrics.avg_daily_turnover <= self.gates.max_daily_turnover_cap
-            ):
-                if objective > best_objective:
-                    best_objective = objective
-                    best_candidate = candidate
-                    best_metrics = metrics
+            objective, metrics = score
+            if objective > best_objective:
+                best_objective = objective
+                best_candidate = candidate
+                best_metrics = metrics
 
         # If no valid candidate found
         if best_candidate is None:
@@ -499,7 +670,7 @@ class StrictLearner:
 
         # Evaluate best candidate on test set
         candidate_test_metrics = evaluate_trading_performance(
-            test_df, baseline_df=train_df
+            test_df, baseline_df=train_df, bootstrap=self.bootstrap
         )
 
         # Compare results
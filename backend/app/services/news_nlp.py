@@ -26,6 +26,7 @@ Primary entry point (preferred by routes):
 
 Enhanced entry points:
     extract_entities_and_sentiment(text: str, date: str = None) -> dict
+    analyze_news_batch_parallel(articles: list[dict], ...) -> dict
     classify_event_type(text: str) -> str
     aggregate_sentiment_with_decay(ticker: str, days: int = 14) -> dict
     calculate_novelty_score(ticker: str, event_type: str, days: int = 21) -> float
@@ -50,12 +51,16 @@ Output shape (for *analyze_news_sentiment*):
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import re
-from collections import defaultdict
+import threading
+import time
+from collections import OrderedDict, defaultdict
 from collections.abc import Iterable
-from datetime import UTC, datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime
 from typing import Any
 
 
@@ -67,6 +72,12 @@ NLP_DECAY_HALF_LIFE_DAYS = float(os.getenv("NLP_DECAY_HALF_LIFE_DAYS", "14"))
 NLP_NOVELTY_WINDOW_DAYS = int(os.getenv("NLP_NOVELTY_WINDOW_DAYS", "21"))
 NLP_DEVSET_PATH = os.getenv("NLP_DEVSET_PATH", "/data/nlp/devset.jsonl")
 
+# Batch pipeline configuration
+NLP_BATCH_WORKERS = int(os.getenv("NLP_BATCH_WORKERS", "0"))  # 0 = os.cpu_count()
+NLP_BATCH_CHUNK_SIZE = int(os.getenv("NLP_BATCH_CHUNK_SIZE", "64"))
+NLP_BATCH_MIN_PARALLEL = int(os.getenv("NLP_BATCH_MIN_PARALLEL", "256"))
+NLP_SCORE_CACHE_SIZE = int(os.getenv("NLP_SCORE_CACHE_SIZE", "50000"))
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Optional VADER (NLTK) support
 # ──────────────────────────────────────────────────────────────────────────────
@@ -621,6 +632,10 @@ def aggregate_sentiment_with_decay(ticker: str, days: int = None) -> dict[str, A
     """
     Aggregate sentiment for a ticker with exponential decay.
 
+    Served from the streaming per-(ticker, event_type) state in
+    app.services.sentiment_state; a custom ``days`` half-life that differs
+    from the configured one falls back to a scan of the event store.
+
     Args:
         ticker: Ticker symbol
         days: Number of days to look back (uses NLP_DECAY_HALF_LIFE_DAYS if None)
@@ -631,76 +646,110 @@ def aggregate_sentiment_with_decay(ticker: str, days: int = None) -> dict[str, A
     decay_days = days or NLP_DECAY_HALF_LIFE_DAYS
 
     try:
-        # Get recent sentiment events from memory layer
-        from app.memory.events import iter_events
-
-        sentiment_events = []
-        cutoff_date = datetime.now(UTC) - timedelta(days=decay_days * 2)
-
-        for event in iter_events():
-            if (
-                event.get("ticker") == ticker
-                and event.get("event_type") == "news_sentiment"
-                and "ts" in event
-            ):
-                event_date = datetime.fromisoformat(event["ts"].replace("Z", "+00:00"))
-                if event_date >= cutoff_date:
-                    sentiment_events.append(event)
-
-        if not sentiment_events:
-            return {
-                "ticker": ticker,
-                "aggregated_score": 0.0,
-                "confidence": 0.0,
-                "event_count": 0,
-                "decay_applied": True,
-                "half_life_days": decay_days,
-            }
-
-        # Apply exponential decay
-        now = datetime.now(UTC)
-        total_weight = 0.0
-        weighted_score = 0.0
-
-        for event in sentiment_events:
-            event_date = datetime.fromisoformat(event["ts"].replace("Z", "+00:00"))
-            days_ago = (now - event_date).days
+        from app.services.sentiment_state import get_sentiment_state
 
-            # Exponential decay: weight = 0.5^(days_ago / half_life)
-            weight = 0.5 ** (days_ago / decay_days)
-
-            sentiment_score = event.get("sentiment_score", 0.0)
-            weighted_score += sentiment_score * weight
-            total_weight += weight
-
-        # Calculate final aggregated score
-        if total_weight > 0:
-            aggregated_score = weighted_score / total_weight
-            confidence = min(1.0, total_weight / len(sentiment_events))
+        state = get_sentiment_state()
+        if decay_days == state.half_life_days:
+            totals = state.aggregate(ticker)
         else:
-            aggregated_score = 0.0
-            confidence = 0.0
-
+            totals = _scan_sentiment_totals(ticker, decay_days)
+    except ImportError:
+        # Memory layer not available
         return {
             "ticker": ticker,
-            "aggregated_score": float(aggregated_score),
-            "confidence": float(confidence),
-            "event_count": len(sentiment_events),
-            "decay_applied": True,
-            "half_life_days": decay_days,
-            "total_weight": float(total_weight),
+            "aggregated_score": 0.0,
+            "confidence": 0.0,
+            "event_count": 0,
+            "error": "Memory layer not available",
         }
 
-    except ImportError:
-        # Memory layer not available
+    return _sentiment_result(ticker, decay_days, totals)
+
+
+def _sentiment_result(
+    ticker: str, decay_days: float, totals: dict[str, Any]
+) -> dict[str, Any]:
+    """Shape decayed totals into the aggregate_sentiment_with_decay payload."""
+    event_count = totals["event_count"]
+    if not event_count:
         return {
             "ticker": ticker,
             "aggregated_score": 0.0,
             "confidence": 0.0,
             "event_count": 0,
-            "error": "Memory layer not available",
+            "decay_applied": True,
+            "half_life_days": decay_days,
         }
 
+    total_weight = totals["total_weight"]
+    if total_weight > 0:
+        aggregated_score = totals["weighted_score"] / total_weight
+        confidence = min(1.0, total_weight / event_count)
+    else:
+        aggregated_score = 0.0
+        confidence = 0.0
+
+    return {
+        "ticker": ticker,
+        "aggregated_score": float(aggregated_score),
+        "confidence": float(confidence),
+        "event_count": event_count,
+        "decay_applied": True,
+        "half_life_days": decay_days,
+        "total_weight": float(total_weight),
+    }
+
+
+def _scan_sentiment_totals(ticker: str, decay_days: float) -> dict[str, Any]:
+    """
+    Reference scan: decayed totals over every sentiment event in the store.
+
+    Weight per event is 0.5 ** (age_days / decay_days) over a look-back of
+    two half-lives. Each timestamp is parsed once.
+    """
+    from app.memory.events import iter_events
+    from app.services.sentiment_state import sentiment_from_event
+
+    now = datetime.now(UTC).timestamp()
+    cutoff = now - decay_days * 2 * 86400.0
+    weighted_score = 0.0
+    total_weight = 0.0
+    event_count = 0
+
+    for event in iter_events():
+        if event.get("ticker") != ticker:
+            continue
+        parsed = sentiment_from_event(event)
+        if parsed is None or parsed[2] < cutoff:
+            continue
+        weight = 0.5 ** (((now - parsed[2]) / 86400.0) / decay_days)
+        weighted_score += parsed[3] * weight
+        total_weight += weight
+        event_count += 1
+
+    return {
+        "weighted_score": weighted_score,
+        "total_weight": total_weight,
+        "event_count": event_count,
+    }
+
+
+def _novelty_from_count(similar_events: int) -> float:
+    """Map a count of similar recent events to a novelty score."""
+    # Use logarithmic scaling to handle event frequency
+    if similar_events == 0:
+        return 1.0  # Completely novel
+    elif similar_events == 1:
+        return 0.8  # Very novel
+    elif similar_events <= 3:
+        return 0.6  # Somewhat novel
+    elif similar_events <= 7:
+        return 0.4  # Common
+    elif similar_events <= 15:
+        return 0.2  # Very common
+    else:
+        return 0.1  # Extremely common
+
 
 def calculate_novelty_score(ticker: str, event_type: str, days: int = None) -> float:
     """
@@ -714,45 +763,44 @@ def calculate_novelty_score(ticker: str, event_type: str, days: int = None) -> f
     Returns:
         Novelty score between 0.0 (common) and 1.0 (novel)
     """
-    window_days = days or NLP_NOVELTY_WINDOW_DAYS
-
     try:
-        from app.memory.events import iter_events
-
-        # Count similar events in window
-        cutoff_date = datetime.now(UTC) - timedelta(days=window_days)
-        similar_events = 0
-
-        for event in iter_events():
-            if (
-                event.get("ticker") == ticker
-                and event.get("event_type") == event_type
-                and "ts" in event
-            ):
-                event_date = datetime.fromisoformat(event["ts"].replace("Z", "+00:00"))
-                if event_date >= cutoff_date:
-                    similar_events += 1
-
-        # Calculate novelty: fewer similar events = higher novelty
-        # Use logarithmic scaling to handle event frequency
-        if similar_events == 0:
-            return 1.0  # Completely novel
-        elif similar_events == 1:
-            return 0.8  # Very novel
-        elif similar_events <= 3:
-            return 0.6  # Somewhat novel
-        elif similar_events <= 7:
-            return 0.4  # Common
-        elif similar_events <= 15:
-            return 0.2  # Very common
-        else:
-            return 0.1  # Extremely common
+        # Fewer similar events = higher novelty
+        return _novelty_from_count(_count_similar_events(ticker, event_type, days))
 
     except ImportError:
         # Default to moderate novelty if memory not available
         return 0.5
 
 
+def _count_similar_events(ticker: str, event_type: str, days: int = None) -> int:
+    """Count recent (ticker, event_type) events, from streaming state when possible."""
+    from app.services.sentiment_state import get_sentiment_state
+
+    window_days = days or NLP_NOVELTY_WINDOW_DAYS
+    state = get_sentiment_state()
+    if window_days == state.novelty_window_days:
+        return state.count_recent(ticker, event_type)
+    return _scan_similar_events(ticker, event_type, window_days)
+
+
+def _scan_similar_events(ticker: str, event_type: str, window_days: float) -> int:
+    """Reference scan: count (ticker, event_type) events inside the window."""
+    from app.memory.events import iter_events
+    from app.services.sentiment_state import sentiment_from_event
+
+    cutoff = datetime.now(UTC).timestamp() - window_days * 86400.0
+    similar_events = 0
+
+    for event in iter_events():
+        if event.get("ticker") != ticker:
+            continue
+        parsed = sentiment_from_event(event)
+        if parsed is not None and parsed[1] == event_type and parsed[2] >= cutoff:
+            similar_events += 1
+
+    return similar_events
+
+
 def persist_sentiment_triple(
     ticker: str,
     event_type: str,
@@ -798,9 +846,27 @@ def persist_sentiment_triple(
             ingest_ts_utc=datetime.now(UTC).isoformat(),
         )
 
+        # Load the streaming decay state before appending: a cold rebuild or
+        # tail replay after the append would already include this event
+        state = None
+        try:
+            from app.services.sentiment_state import get_sentiment_state
+
+            state = get_sentiment_state()
+            state.ensure_loaded()
+        except Exception as e:
+            logger.warning(f"Failed to load sentiment state: {e}")
+
         # Store in memory
         event_id = append_event(sentiment_event)
 
+        # Fold into the streaming decay state (O(1), no store rescan)
+        if state is not None:
+            try:
+                state.record_event({"id": event_id, **sentiment_event})
+            except Exception as e:
+                logger.warning(f"Failed to update sentiment state: {e}")
+
         logger.info(
             f"Persisted sentiment triple: {ticker} {event_type} {polarity} ({strength:.2f})"
         )
@@ -895,6 +961,280 @@ def analyze_news_batch(
     return results
 
 
+# ──────────────────────────────────────────────────────────────────────────────
+# Batch pipeline - dedupe, memoize, process-pool scoring
+# ──────────────────────────────────────────────────────────────────────────────
+
+_SCORE_CACHE: OrderedDict[str, dict[str, Any]] = OrderedDict()
+_SCORE_CACHE_LOCK = threading.Lock()
+_POOL: ProcessPoolExecutor | None = None
+_POOL_WORKERS = 0
+_POOL_LOCK = threading.Lock()
+
+
+def _text_key(text: str, date: str | None) -> str:
+    """Stable hash for a cleaned text plus its date context."""
+    raw = f"{date or ''}\x00{text}"
+    return hashlib.sha1(raw.encode("utf-8", errors="ignore")).hexdigest()
+
+
+def _analyze_chunk(
+    items: list[tuple[str, str | None]],
+) -> list[dict[str, Any] | None]:
+    """
+    CPU-bound analysis for a chunk of (text, date) pairs.
+
+    Runs inside pool workers, so it must stay a top-level, picklable function.
+    A text that fails to analyze yields None instead of failing its chunk.
+    """
+    out: list[dict[str, Any] | None] = []
+    for text, date in items:
+        try:
+            analysis = extract_entities_and_sentiment(text, date)
+            out.append(
+                {
+                    "tickers": analysis["tickers"],
+                    "entities": analysis["entities"],
+                    "sentiment": analysis["sentiment"],
+                    "negation_detected": analysis["negation_detected"],
+                    "event_type": classify_event_type(text),
+                }
+            )
+        except Exception as e:
+            logger.warning(f"Failed to process article: {e}")
+            out.append(None)
+    return out
+
+
+def _get_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Lazily create the shared scoring pool, resizing it if max_workers changed."""
+    global _POOL, _POOL_WORKERS
+    with _POOL_LOCK:
+        if _POOL is not None and _POOL_WORKERS != max_workers:
+            # In-flight tasks still finish; new work goes to the resized pool
+            _POOL.shutdown(wait=False)
+            _POOL = None
+        if _POOL is None:
+            _POOL = ProcessPoolExecutor(max_workers=max_workers)
+            _POOL_WORKERS = max_workers
+        return _POOL
+
+
+def shutdown_nlp_pool() -> None:
+    """Shut down the shared scoring pool (safe to call when not started)."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.shutdown(wait=True)
+            _POOL = None
+
+
+def clear_score_cache() -> None:
+    """Drop all memoized text analyses."""
+    with _SCORE_CACHE_LOCK:
+        _SCORE_CACHE.clear()
+
+
+def _cache_get(key: str) -> dict[str, Any] | None:
+    with _SCORE_CACHE_LOCK:
+        hit = _SCORE_CACHE.get(key)
+        if hit is not None:
+            _SCORE_CACHE.move_to_end(key)
+        return hit
+
+
+def _cache_put(key: str, value: dict[str, Any]) -> None:
+    with _SCORE_CACHE_LOCK:
+        _SCORE_CACHE[key] = value
+        _SCORE_CACHE.move_to_end(key)
+        while len(_SCORE_CACHE) > NLP_SCORE_CACHE_SIZE:
+            _SCORE_CACHE.popitem(last=False)
+
+
+def _score_unique(
+    pending: list[tuple[str, str | None]], max_workers: int, chunk_size: int
+) -> tuple[list[dict[str, Any] | None], bool]:
+    """
+    Score unique texts, in chunks on the process pool when worthwhile.
+
+    Returns (results in input order with None for failed texts, whether the
+    pool was used).
+    """
+    if not pending:
+        return [], False
+
+    chunks = [pending[i : i + chunk_size] for i in range(0, len(pending), chunk_size)]
+    if max_workers > 1 and len(pending) >= NLP_BATCH_MIN_PARALLEL and len(chunks) > 1:
+        try:
+            pool = _get_pool(max_workers)
+            results: list[dict[str, Any] | None] = []
+            # map() yields chunk results in submission order
+            for chunk_result in pool.map(_analyze_chunk, chunks):
+                results.extend(chunk_result)
+            return results, True
+        except Exception as e:
+            logger.warning(f"NLP process pool failed, scoring inline: {e}")
+            shutdown_nlp_pool()
+
+    return _analyze_chunk(pending), False
+
+
+def analyze_news_batch_parallel(
+    articles: list[dict[str, Any]],
+    persist_triples: bool = True,
+    max_workers: int | None = None,
+    chunk_size: int | None = None,
+) -> dict[str, Any]:
+    """
+    High-throughput variant of analyze_news_batch.
+
+    Identical headlines are analyzed once, analyses are memoized by text hash
+    across calls, and CPU-bound scoring is spread over a process pool in
+    chunks. Articles are returned in input order with per-stage timings.
+
+    Args:
+        articles: List of article dictionaries
+        persist_triples: Whether to persist sentiment triples
+        max_workers: Pool size (defaults to NLP_BATCH_WORKERS or CPU count)
+        chunk_size: Texts per pool task (defaults to NLP_BATCH_CHUNK_SIZE)
+
+    Returns:
+        Same shape as analyze_news_batch plus "timings_ms" and "cache" sections
+    """
+    workers = max_workers or NLP_BATCH_WORKERS or (os.cpu_count() or 1)
+    chunk = max(1, chunk_size or NLP_BATCH_CHUNK_SIZE)
+    timings: dict[str, float] = {}
+    t_start = time.perf_counter()
+
+    # Stage 1: clean and dedupe
+    t0 = time.perf_counter()
+    keyed: list[tuple[dict[str, Any], str, str]] = []
+    unique: dict[str, tuple[str, str | None]] = {}
+    for article in articles:
+        try:
+            headline = article.get("title", "")
+            if not headline:
+                continue
+            text = _clean_text(headline)
+            key = _text_key(text, article.get("date"))
+        except Exception as e:
+            logger.warning(f"Failed to process article: {e}")
+            continue
+        keyed.append((article, headline, key))
+        unique.setdefault(key, (text, article.get("date")))
+    timings["dedupe"] = (time.perf_counter() - t0) * 1000
+
+    # Stage 2: memo lookup
+    t0 = time.perf_counter()
+    analyses: dict[str, dict[str, Any] | None] = {}
+    pending_keys: list[str] = []
+    for key in unique:
+        hit = _cache_get(key)
+        if hit is not None:
+            analyses[key] = hit
+        else:
+            pending_keys.append(key)
+    timings["cache_lookup"] = (time.perf_counter() - t0) * 1000
+
+    # Stage 3: score the misses
+    t0 = time.perf_counter()
+    scored, used_pool = _score_unique([unique[k] for k in pending_keys], workers, chunk)
+    for key, analysis in zip(pending_keys, scored, strict=True):
+        analyses[key] = analysis
+        if analysis is not None:
+            _cache_put(key, analysis)
+    # Articles whose text failed to analyze are skipped, as in the serial path
+    keyed = [item for item in keyed if analyses[item[2]] is not None]
+    timings["score"] = (time.perf_counter() - t0) * 1000
+
+    # Stage 4: similar-event counts per ticker/event type as of batch start;
+    # triples persisted earlier in this batch are added during assembly so
+    # novelty matches the serial path
+    t0 = time.perf_counter()
+    base_counts: dict[tuple[str, str], int | None] = {}
+    for _, _, key in keyed:
+        analysis = analyses[key]
+        for ticker in analysis["tickers"]:
+            memo_key = (ticker, analysis["event_type"])
+            if memo_key not in base_counts:
+                try:
+                    base_counts[memo_key] = _count_similar_events(*memo_key)
+                except ImportError:
+                    base_counts[memo_key] = None
+    persisted_in_batch: dict[tuple[str, str], int] = defaultdict(int)
+    timings["novelty"] = (time.perf_counter() - t0) * 1000
+
+    # Stage 5: assemble in input order and persist
+    t0 = time.perf_counter()
+    results: dict[str, Any] = {
+        "processed_count": 0,
+        "tickers_found": set(),
+        "event_types": defaultdict(int),
+        "sentiment_distribution": {"positive": 0, "negative": 0, "neutral": 0},
+        "novelty_scores": [],
+        "articles": [],
+    }
+    for article, headline, key in keyed:
+        analysis = analyses[key]
+        event_type = analysis["event_type"]
+        sentiment = analysis["sentiment"]
+        article_result = {
+            "headline": headline,
+            "tickers": list(analysis["tickers"]),
+            "entities": list(analysis["entities"]),
+            "sentiment": dict(sentiment),
+            "event_type": event_type,
+            "negation_detected": analysis["negation_detected"],
+            "novelty_scores": {},
+        }
+        for ticker in analysis["tickers"]:
+            memo_key = (ticker, event_type)
+            base = base_counts[memo_key]
+            novelty = (
+                0.5
+                if base is None
+                else _novelty_from_count(base + persisted_in_batch[memo_key])
+            )
+            article_result["novelty_scores"][ticker] = novelty
+            results["tickers_found"].add(ticker)
+            results["novelty_scores"].append(novelty)
+
+            if persist_triples:
+                try:
+                    persist_sentiment_triple(
+                        ticker=ticker,
+                        event_type=event_type,
+                        polarity=sentiment["label"],
+                        strength=abs(sentiment["score"]),
+                        novelty=novelty,
+                        source_id=article.get("url", ""),
+                        headline=headline,
+                        source_tz=article.get("source_tz", "UTC"),
+                    )
+                    persisted_in_batch[memo_key] += 1
+                except Exception as e:
+                    logger.warning(f"Failed to persist sentiment triple: {e}")
+
+        results["event_types"][event_type] += 1
+        results["sentiment_distribution"][sentiment["label"]] += 1
+        results["articles"].append(article_result)
+        results["processed_count"] += 1
+    timings["assemble"] = (time.perf_counter() - t0) * 1000
+    timings["total"] = (time.perf_counter() - t_start) * 1000
+
+    results["tickers_found"] = sorted(results["tickers_found"])
+    results["event_types"] = dict(results["event_types"])
+    results["timings_ms"] = {k: round(v, 3) for k, v in timings.items()}
+    results["cache"] = {
+        "unique_texts": len(unique),
+        "duplicates": len(keyed) - len(unique),
+        "cache_hits": len(unique) - len(pending_keys),
+        "scored": len(pending_keys),
+        "process_pool": used_pool,
+    }
+    return results
+
+
 __all__ = [
     "analyze_news_sentiment",
     "news_sentiment",
@@ -910,4 +1250,7 @@ __all__ = [
     "calculate_novelty_score",
     "persist_sentiment_triple",
     "analyze_news_batch",
+    "analyze_news_batch_parallel",
+    "clear_score_cache",
+    "shutdown_nlp_pool",
 ]
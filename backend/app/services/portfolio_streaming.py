@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import os
 import time
 from datetime import UTC, datetime
 from typing import Any
@@ -15,6 +16,207 @@ from app.trading.signals import get_portfolio_summary, get_positions
 
 logger = get_logger("ziggy.portfolio_streaming")
 
+# Position fields derived from quantity, average price and the last price
+_POSITION_TOTALS = ("market_value", "cost_basis", "unrealized_pnl")
+
+
+class PortfolioState:
+    """
+    Incrementally maintained portfolio document with JSON-patch change tracking.
+
+    The document is {"portfolio": {...}, "positions": {symbol: {...}}}. Fills and
+    price ticks update only the affected position and adjust portfolio totals by
+    delta; every changed leaf is recorded as a patch op until drain_ops().
+    """
+
+    def __init__(self):
+        self.portfolio: dict[str, Any] = {}
+        self.positions: dict[str, dict[str, Any]] = {}
+        self.seq = 0
+        # Pending ops keyed by path so repeated updates collapse to the latest
+        self._ops: dict[str, dict[str, Any]] = {}
+
+    # ------------- snapshot / reconcile -------------
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "portfolio": dict(self.portfolio),
+            "positions": {sym: dict(p) for sym, p in self.positions.items()},
+        }
+
+    def load(self, portfolio: dict[str, Any], positions: list[dict[str, Any]]) -> None:
+        """Reconcile against a full fetch, recording ops for whatever differs."""
+        fresh = {
+            (p.get("symbol") or "").upper(): p for p in positions if p.get("symbol")
+        }
+        for sym in list(self.positions):
+            if sym not in fresh:
+                self._remove_position(sym)
+        for sym, position in fresh.items():
+            fields = {k: v for k, v in position.items() if k != "timestamp"}
+            if sym not in self.positions:
+                self._add_position(sym, fields)
+            else:
+                for key, value in fields.items():
+                    self._set_position(sym, key, value)
+        # Fetched totals are authoritative over the position-by-position deltas
+        for key, value in portfolio.items():
+            if key not in ("timestamp", "last_updated"):
+                self._set_portfolio(key, value)
+
+    # ------------- events -------------
+    def apply_fill(self, symbol: str, side: str, qty: float, price: float) -> None:
+        """Apply an executed fill (BUY/SELL) to the position, cash and realized P&L."""
+        symbol = symbol.upper()
+        signed = qty if side.upper() == "BUY" else -qty
+        position = self.positions.get(symbol)
+        old_qty = float(position["quantity"]) if position else 0.0
+        old_avg = float(position["avg_price"]) if position else 0.0
+        new_qty = old_qty + signed
+
+        if old_qty == 0 or (old_qty > 0) == (signed > 0):
+            new_avg = (abs(old_qty) * old_avg + abs(signed) * price) / abs(new_qty)
+        else:
+            closed = min(abs(signed), abs(old_qty))
+            realized = closed * (price - old_avg) * (1 if old_qty > 0 else -1)
+            self._set_portfolio(
+                "realized_pnl", self.portfolio.get("realized_pnl", 0.0) + realized
+            )
+            new_avg = price if abs(signed) > abs(old_qty) else old_avg
+
+        self._set_portfolio(
+            "cash_balance", self.portfolio.get("cash_balance", 0.0) - signed * price
+        )
+
+        if new_qty == 0:
+            if position:
+                self._remove_position(symbol)
+            self._refresh_total_value()
+            return
+
+        current = float(position["current_price"]) if position else price
+        fields = self._derive(new_qty, new_avg, current or price)
+        if position is None:
+            self._add_position(symbol, {"symbol": symbol, **fields})
+        else:
+            for key, value in fields.items():
+                self._set_position(symbol, key, value)
+        self._refresh_total_value()
+
+    def apply_price(self, symbol: str, price: float) -> bool:
+        """Mark a held position to a new price; False if the symbol is not held."""
+        position = self.positions.get(symbol.upper())
+        if position is None or position.get("current_price") == price:
+            return False
+        old_price = float(position.get("current_price") or 0.0)
+        qty = float(position["quantity"])
+        if old_price:
+            self._set_portfolio(
+                "daily_pnl",
+                self.portfolio.get("daily_pnl", 0.0) + qty * (price - old_price),
+            )
+        fields = self._derive(qty, float(position["avg_price"]), price)
+        for key, value in fields.items():
+            self._set_position(symbol.upper(), key, value)
+        self._refresh_total_value()
+        return True
+
+    @staticmethod
+    def _derive(qty: float, avg_price: float, price: float) -> dict[str, Any]:
+        market_value = qty * price
+        cost_basis = qty * avg_price
+        unrealized = market_value - cost_basis
+        return {
+            "quantity": qty,
+            "avg_price": avg_price,
+            "current_price": price,
+            "market_value": market_value,
+            "cost_basis": cost_basis,
+            "unrealized_pnl": unrealized,
+            "unrealized_pnl_percent": (
+                unrealized / abs(cost_basis) * 100.0 if cost_basis else 0.0
+            ),
+            "side": "long" if qty > 0 else "short",
+        }
+
+    def _refresh_total_value(self) -> None:
+        total = self.portfolio.get("cash_balance", 0.0) + self.portfolio.get(
+            "market_value", 0.0
+        )
+        self._set_portfolio("total_value", total)
+        base = total - self.portfolio.get("daily_pnl", 0.0)
+        self._set_portfolio(
+            "daily_pnl_percent",
+            self.portfolio.get("daily_pnl", 0.0) / base * 100.0 if base else 0.0,
+        )
+
+    # ------------- low-level mutations with op tracking -------------
+    def _record(self, op: str, path: str, value: Any = None) -> None:
+        entry: dict[str, Any] = {"op": op, "path": path}
+        if op != "remove":
+            entry["value"] = value
+        self._ops[path] = entry
+
+    def _set_portfolio(self, key: str, value: Any) -> None:
+        if key in self.portfolio and self.portfolio[key] == value:
+            return
+        op = "replace" if key in self.portfolio else "add"
+        self.portfolio[key] = value
+        self._record(op, f"/portfolio/{key}", value)
+
+    def _adjust_totals(self, fields: dict[str, Any], sign: float) -> None:
+        for key in _POSITION_TOTALS:
+            if key in fields:
+                self._set_portfolio(
+                    key,
+                    self.portfolio.get(key, 0.0) + sign * float(fields[key] or 0.0),
+                )
+
+    def _add_position(self, symbol: str, fields: dict[str, Any]) -> None:
+        self.positions[symbol] = dict(fields)
+        self._adjust_totals(fields, 1.0)
+        # A whole-position op supersedes any pending field ops for it
+        prefix = f"/positions/{symbol}/"
+        for path in [p for p in self._ops if p.startswith(prefix)]:
+            del self._ops[path]
+        self._record("add", f"/positions/{symbol}", dict(fields))
+
+    def _remove_position(self, symbol: str) -> None:
+        fields = self.positions.pop(symbol)
+        self._adjust_totals(fields, -1.0)
+        prefix = f"/positions/{symbol}/"
+        for path in [p for p in self._ops if p.startswith(prefix)]:
+            del self._ops[path]
+        self._record("remove", f"/positions/{symbol}")
+
+    def _set_position(self, symbol: str, key: str, value: Any) -> None:
+        position = self.positions[symbol]
+        old = position.get(key)
+        if old == value and key in position:
+            return
+        if key in _POSITION_TOTALS:
+            self._set_portfolio(
+                key,
+                self.portfolio.get(key, 0.0) + float(value or 0.0) - float(old or 0.0),
+            )
+        position[key] = value
+        whole = self._ops.get(f"/positions/{symbol}")
+        if whole is not None and whole["op"] == "add":
+            # Not yet sent: fold into the pending add
+            whole["value"] = dict(position)
+            return
+        self._record("replace", f"/positions/{symbol}/{key}", value)
+
+    def mark_synced(self) -> None:
+        """Drop pending ops without a new seq (state delivered via snapshot)."""
+        self._ops.clear()
+
+    def drain_ops(self) -> list[dict[str, Any]]:
+        """Return pending ops (advancing seq when non-empty) and reset."""
+        ops, self._ops = list(self._ops.values()), {}
+        if ops:
+            self.seq += 1
+        return ops
+
 
 class PortfolioStreamer:
     """Real-time portfolio value, P&L, and position streaming service"""
@@ -47,6 +249,19 @@ class PortfolioStreamer:
         self.broadcasts_attempted: int = 0
         self.broadcasts_failed: int = 0
 
+        # Event-driven mode: incremental state, patch coalescing, periodic resync
+        self.state = PortfolioState()
+        self.event_mode = False
+        self.patch_debounce = 0.1  # seconds to coalesce bursts of events
+        self.resync_interval = 60.0  # seconds between full reconcile fetches
+        self._dirty = asyncio.Event()
+        self._patch_task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._detach: list[Any] = []
+        # Market data source and the held symbols we asked it to poll
+        self._market_streamer: Any = None
+        self._streamed_symbols: set[str] = set()
+
     async def start_streaming(self):
         """Start portfolio data streaming"""
         if self.is_running:
@@ -62,6 +277,170 @@ class PortfolioStreamer:
             extra={"update_interval_s": self.update_interval},
         )
 
+    async def start_event_streaming(self, oms: Any = None, market_streamer: Any = None):
+        """Start event-driven streaming: react to fills and ticks, broadcast patches.
+
+        Fills come from `oms.add_fill_listener` (the OMS or the trading manager) and
+        prices from `market_streamer.add_tick_listener`, which is kept streaming the
+        held symbols; either may be omitted and fed manually through
+        on_fill()/on_price_tick().
+        """
+        if self.is_running:
+            logger.warning("Portfolio streaming already running")
+            return
+
+        self.is_running = True
+        self.event_mode = True
+        self._loop = asyncio.get_running_loop()
+        await self._reconcile()
+        self.state.mark_synced()  # initial state is delivered via snapshots
+
+        if oms is not None:
+            oms.add_fill_listener(self.on_fill)
+            self._detach.append(lambda: oms.remove_fill_listener(self.on_fill))
+        if market_streamer is not None:
+            self._market_streamer = market_streamer
+            market_streamer.add_tick_listener(self.on_price_tick)
+            self._detach.append(
+                lambda: market_streamer.remove_tick_listener(self.on_price_tick)
+            )
+            await self._sync_symbols(force=True)
+
+        self._consumer_task = asyncio.create_task(self._consume_loop())
+        self._patch_task = asyncio.create_task(self._patch_loop())
+        logger.info(
+            "Portfolio event streaming started",
+            extra={"resync_interval_s": self.resync_interval},
+        )
+
+    def on_fill(self, fill: Any) -> None:
+        """Fill callback (OMS Fill or any object with symbol/side/qty/avg_price)."""
+        self._dispatch(
+            self.state.apply_fill,
+            fill.symbol,
+            fill.side,
+            float(fill.qty),
+            float(fill.avg_price),
+        )
+
+    def on_price_tick(self, symbol: str, data: dict[str, Any]) -> None:
+        """Price tick callback (MarketDataStreamer tick listener signature)."""
+        price = data.get("price") if isinstance(data, dict) else data
+        if price is not None and symbol.upper() in self.state.positions:
+            self._dispatch(self.state.apply_price, symbol, float(price))
+
+    def _dispatch(self, fn: Any, *args: Any) -> None:
+        """Apply a state mutation on the event loop thread and wake the patcher."""
+
+        def _apply():
+            fn(*args)
+            self._dirty.set()
+
+        loop = self._loop
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if loop is not None and running is not loop:
+            loop.call_soon_threadsafe(_apply)
+        else:
+            _apply()
+
+    async def _reconcile(self) -> None:
+        portfolio_data = await self._get_portfolio_data()
+        positions_data = await self._get_positions_data()
+        if "error" not in portfolio_data:
+            self.state.load(portfolio_data, positions_data)
+
+    async def _sync_symbols(self, force: bool = False) -> None:
+        """Keep the market streamer polling the held symbols.
+
+        Newly held symbols are subscribed and closed ones released unless a client
+        still watches them; `force` re-subscribes everything held (after a resync,
+        in case a client unsubscribe dropped a symbol we still need).
+        """
+        streamer = self._market_streamer
+        if streamer is None:
+            return
+        held = set(self.state.positions)
+        added = held if force else held - self._streamed_symbols
+        released = self._streamed_symbols - held
+        self._streamed_symbols = held
+        if added:
+            await streamer.start_streaming(sorted(added))
+        await self._release_symbols(released)
+
+    async def _release_symbols(self, symbols: set[str]) -> None:
+        streamer = self._market_streamer
+        subscriptions = getattr(streamer, "subscriptions", None)
+        if subscriptions is not None:
+            symbols = {s for s in symbols if not subscriptions.subscribers(s)}
+        if symbols:
+            await streamer.stop_streaming(sorted(symbols))
+
+    async def _patch_loop(self):
+        """Coalesce state changes into sequenced patch messages; resync periodically."""
+        next_resync = time.time() + self.resync_interval
+        while self.is_running:
+            try:
+                timeout = max(0.0, next_resync - time.time())
+                try:
+                    await asyncio.wait_for(self._dirty.wait(), timeout=timeout)
+                    await asyncio.sleep(self.patch_debounce)
+                    await self._sync_symbols()
+                except TimeoutError:
+                    await self._reconcile()
+                    await self._sync_symbols(force=True)
+                    next_resync = time.time() + self.resync_interval
+                self._dirty.clear()
+
+                ops = self.state.drain_ops()
+                if not ops:
+                    continue
+                patch = {
+                    "type": "portfolio_patch",
+                    "seq": self.state.seq,
+                    "base_seq": self.state.seq - 1,
+                    "ops": ops,
+                    "timestamp": time.time(),
+                }
+                self._enqueue(patch)
+                self.update_count += 1
+                self.last_update_time = time.time()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.error_count += 1
+                logger.error("Portfolio patch loop error", extra={"error": repr(e)})
+                await asyncio.sleep(1.0)
+
+    def _enqueue(self, message: dict[str, Any]) -> None:
+        # Patches must not be dropped (clients would need a resync), so when full
+        # collapse the backlog into a resync hint instead of dropping silently
+        try:
+            self.portfolio_queue.put_nowait(message)
+        except asyncio.QueueFull:
+            while not self.portfolio_queue.empty():
+                with contextlib.suppress(Exception):
+                    self.portfolio_queue.get_nowait()
+                    self.portfolio_queue.task_done()
+            self.portfolio_queue.put_nowait(
+                {"type": "portfolio_resync_required", "seq": self.state.seq}
+            )
+        with contextlib.suppress(Exception):
+            self.connection_manager.set_metric(
+                "portfolio", "portfolio_queue_len", float(self.portfolio_queue.qsize())
+            )
+
+    def get_snapshot(self) -> dict[str, Any]:
+        """Full state document with the sequence number patches continue from."""
+        return {
+            "type": "portfolio_snapshot",
+            "seq": self.state.seq,
+            **self.state.snapshot(),
+            "timestamp": time.time(),
+        }
+
     async def stop_streaming(self):
         """Stop portfolio data streaming"""
         if not self.is_running:
@@ -70,6 +449,20 @@ class PortfolioStreamer:
         self.is_running = False
         from contextlib import suppress
 
+        for detach in self._detach:
+            with suppress(Exception):
+                detach()
+        self._detach.clear()
+        if self._market_streamer is not None:
+            with suppress(Exception):
+                await self._release_symbols(self._streamed_symbols)
+            self._streamed_symbols = set()
+            self._market_streamer = None
+        if self._patch_task:
+            self._patch_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._patch_task
+
         # Cancel producer
         if self._producer_task:
             self._producer_task.cancel()
@@ -418,7 +811,13 @@ class PortfolioStreamer:
         """Handle incoming client messages for portfolio streaming"""
         action = message.get("action")
 
-        if action == "force_update":
+        if action in ("resync", "get_snapshot") and self.event_mode:
+            # Client detected a seq gap (or just connected): send full state
+            await self.connection_manager.send_json_personal(
+                self.get_snapshot(), websocket
+            )
+
+        elif action == "force_update":
             # Force immediate portfolio update
             try:
                 portfolio_data = await self._get_portfolio_data()
@@ -454,6 +853,8 @@ class PortfolioStreamer:
                     "last_update_time": self.last_update_time,
                     "is_running": self.is_running,
                     "update_interval": self.update_interval,
+                    "event_mode": self.event_mode,
+                    "seq": self.state.seq,
                 },
                 "timestamp": time.time(),
             }
@@ -477,11 +878,22 @@ def get_portfolio_streamer(connection_manager: ConnectionManager) -> PortfolioSt
 
 
 async def start_portfolio_streaming():
-    """Start portfolio streaming (call during app startup)"""
-    from app.core.websocket import connection_manager
+    """Start portfolio streaming (call during app startup)
+
+    PORTFOLIO_STREAM_MODE=events switches from interval polling to event-driven
+    patches fed by trading manager fills and market data ticks for held symbols.
+    """
+    from app.core.websocket import connection_manager, market_streamer
 
     streamer = get_portfolio_streamer(connection_manager)
-    await streamer.start_streaming()
+    if os.getenv("PORTFOLIO_STREAM_MODE", "poll").strip().lower() == "events":
+        from app.trading.signals import get_trading_manager
+
+        await streamer.start_event_streaming(
+            oms=get_trading_manager(), market_streamer=market_streamer
+        )
+    else:
+        await streamer.start_streaming()
 
 
 async def stop_portfolio_streaming():
@@ -150,6 +150,12 @@ def _record_provider_failure(
 
 
 class _TTLCache:
+    """Per-process TTL cache, backed by the shared cluster cache when one is set.
+
+    In multi-worker mode (app.core.cluster) a local miss falls through to the
+    shared backend so workers reuse each other's provider responses.
+    """
+
     def __init__(self, ttl_seconds: int | None = None, max_entries: int = 256):
         self.ttl: float = float(
             ttl_seconds
@@ -162,18 +168,48 @@ class _TTLCache:
     def _now(self) -> float:
         return time.time()
 
+    def _shared(self):
+        try:
+            from app.core.cluster import get_shared_backend
+
+            backend = get_shared_backend()
+        except Exception:
+            return None
+        return backend if backend.shared else None
+
     def get(self, key: Any) -> Any:
         item = self._store.get(key)
-        if not item:
-            return None
-        exp, val = item
-        if exp < self._now():
+        if item:
+            exp, val = item
+            if exp >= self._now():
+                return val
             # expired
             self._store.pop(key, None)
+        shared = self._shared()
+        if shared is None:
+            return None
+        try:
+            val = shared.get(f"provider_cache:{key!r}")
+        except Exception:
             return None
+        if val is not None:
+            self._set_local(key, val, None)
         return val
 
     def set(self, key: Any, value: Any, ttl: float | None = None) -> None:
+        self._set_local(key, value, ttl)
+        shared = self._shared()
+        if shared is not None:
+            try:
+                shared.set(
+                    f"provider_cache:{key!r}",
+                    value,
+                    ttl=ttl if ttl is not None else self.ttl,
+                )
+            except Exception as e:
+                logger.debug(f"Shared cache write failed: {e}")
+
+    def _set_local(self, key: Any, value: Any, ttl: float | None) -> None:
         # tiny LRU-ish trim
         if len(self._store) >= self.max:
             try:
@@ -3,13 +3,25 @@ Data Quarantine System - Perception Layer
 
 Isolates failed data for analysis and prevents corrupt data from entering
 the processing pipeline. Provides audit trail for data quality issues.
+
+Storage layout under QUARANTINE_PATH:
+- segments/<YYYYMMDD>_<pid>.jsonl  append-only payload records (one per line)
+- index.db                         SQLite index: id, dataset, ts, size, preview
+                                   and the (segment, offset, length) of the record
+
+Listing, stats and cleanup are index queries; payloads are only read by
+get_by_id. Legacy one-file-per-entry ``*.json`` records are imported into the
+index the first time it is opened.
 """
 
 from __future__ import annotations
 
+import itertools
 import json
 import logging
 import os
+import sqlite3
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
@@ -24,6 +36,216 @@ logger = logging.getLogger(__name__)
 QUARANTINE_PATH = os.getenv("QUARANTINE_PATH", "/data/quarantine/")
 QUARANTINE_MAX_PAYLOAD_SIZE = int(os.getenv("QUARANTINE_MAX_PAYLOAD_SIZE", "100000"))
 QUARANTINE_RETENTION_DAYS = int(os.getenv("QUARANTINE_RETENTION_DAYS", "30"))
+QUARANTINE_PREVIEW_CHARS = 200
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id TEXT PRIMARY KEY,
+    dataset TEXT NOT NULL,
+    ts REAL NOT NULL,
+    timestamp TEXT NOT NULL,
+    reason TEXT,
+    metadata TEXT,
+    payload_type TEXT,
+    payload_size INTEGER,
+    payload_truncated INTEGER DEFAULT 0,
+    preview TEXT,
+    size INTEGER NOT NULL,
+    segment TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_ts ON entries(ts);
+CREATE INDEX IF NOT EXISTS idx_entries_dataset_ts ON entries(dataset, ts);
+CREATE INDEX IF NOT EXISTS idx_entries_segment ON entries(segment);
+"""
+
+# Offset used for legacy entries whose record is a whole standalone file
+_WHOLE_FILE = -1
+
+_seq = itertools.count()
+
+
+class _QuarantineIndex:
+    """Append-only segment log plus SQLite index for one quarantine directory."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.segments_dir = root / "segments"
+        self.segments_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(root / "index.db"), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        try:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.DatabaseError:
+            pass
+        self.conn.executescript(_SCHEMA)
+        self.conn.commit()
+        self._import_legacy_files()
+
+    def append(self, record: dict[str, Any], entry_id: str, ts: float) -> None:
+        """Append the record to today's segment and index it."""
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        segment = f"{datetime.fromtimestamp(ts).strftime('%Y%m%d')}_{os.getpid()}.jsonl"
+        payload = record.get("payload")
+        preview = _preview(payload) if isinstance(payload, str) else None
+
+        with self._lock:
+            with open(self.segments_dir / segment, "ab") as f:
+                offset = f.tell()
+                f.write(line)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO entries (id, dataset, ts, timestamp, reason, "
+                "metadata, payload_type, payload_size, payload_truncated, preview, "
+                "size, segment, offset, length) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)",
+                (
+                    entry_id,
+                    record["dataset"],
+                    ts,
+                    record["timestamp"],
+                    record.get("reason"),
+                    json.dumps(record.get("metadata") or {}, default=str),
+                    record.get("payload_type"),
+                    record.get("payload_size"),
+                    1 if record.get("payload_truncated") else 0,
+                    preview,
+                    len(line),
+                    segment,
+                    offset,
+                    len(line),
+                ),
+            )
+            self.conn.commit()
+
+    def query(self, sql: str, params: tuple = ()) -> list[sqlite3.Row]:
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def read_record(self, row: sqlite3.Row) -> dict[str, Any]:
+        """Load the full stored record for an index row."""
+        if row["offset"] == _WHOLE_FILE:
+            with open(self.root / row["segment"], encoding="utf-8") as f:
+                return json.load(f)
+        with open(self.segments_dir / row["segment"], "rb") as f:
+            f.seek(row["offset"])
+            return json.loads(f.read(row["length"]).decode("utf-8"))
+
+    def delete_before(self, cutoff: float) -> int:
+        """Drop index rows older than cutoff and any segment left without rows."""
+        with self._lock:
+            candidates = self.conn.execute(
+                "SELECT DISTINCT segment, offset = ? FROM entries WHERE ts < ?",
+                (_WHOLE_FILE, cutoff),
+            ).fetchall()
+            removed = self.conn.execute(
+                "DELETE FROM entries WHERE ts < ?", (cutoff,)
+            ).rowcount
+            self.conn.commit()
+
+            for segment, whole_file in candidates:
+                still_used = self.conn.execute(
+                    "SELECT 1 FROM entries WHERE segment = ? LIMIT 1", (segment,)
+                ).fetchone()
+                if still_used:
+                    continue
+                path = (self.root if whole_file else self.segments_dir) / segment
+                try:
+                    path.unlink(missing_ok=True)
+                except Exception as e:
+                    logger.warning(f"Failed to remove quarantine segment {path}: {e}")
+        return removed
+
+    def _import_legacy_files(self) -> None:
+        """Index pre-existing one-file-per-entry records (read once)."""
+        legacy = list(self.root.glob("*.json"))
+        if not legacy:
+            return
+        known = {r[0] for r in self.conn.execute("SELECT segment FROM entries")}
+        imported = 0
+        for file_path in legacy:
+            if file_path.name in known:
+                continue
+            try:
+                with open(file_path, encoding="utf-8") as f:
+                    record = json.load(f)
+                stat = file_path.stat()
+                payload = record.get("payload")
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO entries (id, dataset, ts, timestamp, reason, "
+                    "metadata, payload_type, payload_size, payload_truncated, preview, "
+                    "size, segment, offset, length) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)",
+                    (
+                        file_path.stem,
+                        record.get("dataset") or file_path.name.split("_")[0],
+                        stat.st_mtime,
+                        record.get("timestamp")
+                        or datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                        record.get("reason"),
+                        json.dumps(record.get("metadata") or {}, default=str),
+                        record.get("payload_type"),
+                        record.get("payload_size"),
+                        1 if record.get("payload_truncated") else 0,
+                        _preview(payload) if isinstance(payload, str) else None,
+                        stat.st_size,
+                        file_path.name,
+                        _WHOLE_FILE,
+                        stat.st_size,
+                    ),
+                )
+                imported += 1
+            except Exception as e:
+                logger.warning(f"Failed to index quarantine file {file_path}: {e}")
+        self.conn.commit()
+        if imported:
+            logger.info(f"Indexed {imported} legacy quarantine files")
+
+
+_indexes: dict[str, _QuarantineIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def _get_index(create: bool = True) -> _QuarantineIndex | None:
+    """Return the index for the current QUARANTINE_PATH (opened once per path)."""
+    root = Path(QUARANTINE_PATH)
+    key = str(root.resolve())
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            if not create and not root.exists():
+                return None
+            root.mkdir(parents=True, exist_ok=True)
+            index = _indexes[key] = _QuarantineIndex(root)
+        return index
+
+
+def _preview(payload: str) -> str:
+    if len(payload) > QUARANTINE_PREVIEW_CHARS:
+        return payload[:QUARANTINE_PREVIEW_CHARS] + "..."
+    return payload
+
+
+def _entry_from_row(index: _QuarantineIndex, row: sqlite3.Row) -> dict[str, Any]:
+    """Build a listing entry from an index row without touching the payload."""
+    whole_file = row["offset"] == _WHOLE_FILE
+    location = (index.root if whole_file else index.segments_dir) / row["segment"]
+    entry: dict[str, Any] = {
+        "quarantine_id": row["id"],
+        "timestamp": row["timestamp"],
+        "dataset": row["dataset"],
+        "reason": row["reason"],
+        "metadata": json.loads(row["metadata"] or "{}"),
+        "payload_type": row["payload_type"],
+        "payload_size": row["payload_size"],
+        "file_path": str(location),
+        "file_size": row["size"],
+        "file_modified": datetime.fromtimestamp(row["ts"]).isoformat(),
+    }
+    if row["payload_truncated"]:
+        entry["payload_truncated"] = True
+    if row["preview"] is not None:
+        entry["payload_preview"] = row["preview"]
+    return entry
 
 
 def write(
@@ -42,21 +264,19 @@ def write(
         metadata: Additional context (vendor, ticker, etc.)
 
     Returns:
-        Quarantine file path/ID
+        Quarantine entry ID
     """
     try:
-        # Ensure quarantine directory exists
-        quarantine_dir = Path(QUARANTINE_PATH)
-        quarantine_dir.mkdir(parents=True, exist_ok=True)
+        index = _get_index()
 
-        # Generate unique filename with timestamp
-        timestamp_ms = int(time.time() * 1000)
-        filename = f"{dataset}_{timestamp_ms}_{os.getpid()}.json"
-        file_path = quarantine_dir / filename
+        # Generate unique ID with timestamp
+        now = time.time()
+        entry_id = f"{dataset}_{int(now * 1000)}_{os.getpid()}_{next(_seq)}"
 
         # Prepare quarantine record
         quarantine_record = {
-            "timestamp": datetime.now().isoformat(),
+            "id": entry_id,
+            "timestamp": datetime.fromtimestamp(now).isoformat(),
             "dataset": dataset,
             "reason": reason,
             "metadata": metadata or {},
@@ -96,13 +316,12 @@ def write(
             quarantine_record["payload"] = f"Serialization failed: {e}"
             quarantine_record["payload_error"] = str(e)
 
-        # Write to file
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(quarantine_record, f, ensure_ascii=False, indent=2)
+        # Append to the segment log and index it
+        index.append(quarantine_record, entry_id, now)
 
-        logger.warning(f"Data quarantined: {dataset} -> {file_path} (reason: {reason})")
+        logger.warning(f"Data quarantined: {dataset} -> {entry_id} (reason: {reason})")
 
-        return str(file_path)
+        return entry_id
 
     except Exception as e:
         logger.error(f"Failed to quarantine data: {e}")
@@ -135,52 +354,19 @@ def list_recent(n: int = 50, dataset: str = None) -> list[dict[str, Any]]:
         List of quarantine entries with metadata
     """
     try:
-        quarantine_dir = Path(QUARANTINE_PATH)
-        if not quarantine_dir.exists():
+        index = _get_index(create=False)
+        if index is None:
             return []
 
-        # Get all quarantine files
-        quarantine_files = list(quarantine_dir.glob("*.json"))
-
-        # Sort by modification time (newest first)
-        quarantine_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-
-        # Filter by dataset if specified
         if dataset:
-            quarantine_files = [
-                f for f in quarantine_files if f.name.startswith(f"{dataset}_")
-            ]
-
-        # Load metadata from files
-        entries = []
-        for file_path in quarantine_files[:n]:
-            try:
-                with open(file_path, encoding="utf-8") as f:
-                    record = json.load(f)
-
-                # Add file info
-                record["file_path"] = str(file_path)
-                record["file_size"] = file_path.stat().st_size
-                record["file_modified"] = datetime.fromtimestamp(
-                    file_path.stat().st_mtime
-                ).isoformat()
-
-                # Remove large payload for listing
-                if "payload" in record:
-                    record["payload_preview"] = (
-                        record["payload"][:200] + "..."
-                        if len(record["payload"]) > 200
-                        else record["payload"]
-                    )
-                    del record["payload"]
-
-                entries.append(record)
-
-            except Exception as e:
-                logger.warning(f"Failed to read quarantine file {file_path}: {e}")
-                continue
+            rows = index.query(
+                "SELECT * FROM entries WHERE dataset = ? ORDER BY ts DESC LIMIT ?",
+                (dataset, n),
+            )
+        else:
+            rows = index.query("SELECT * FROM entries ORDER BY ts DESC LIMIT ?", (n,))
 
-        return entries
+        return [_entry_from_row(index, row) for row in rows]
 
     except Exception as e:
         logger.error(f"Failed to list quarantine entries: {e}")
@@ -189,29 +375,33 @@ def list_recent(n: int = 50, dataset: str = None) -> list[dict[str, Any]]:
 
 def get_by_id(quarantine_id: str) -> dict[str, Any]:
     """
-    Get quarantine entry by ID (file path).
+    Get quarantine entry by ID.
 
     Args:
-        quarantine_id: Quarantine file path or ID
+        quarantine_id: Quarantine entry ID (legacy file paths are accepted)
 
     Returns:
         Quarantine record with full payload
     """
     try:
-        file_path = Path(quarantine_id)
-        if not file_path.exists():
-            # Try relative to quarantine directory
-            file_path = Path(QUARANTINE_PATH) / quarantine_id
-
-        if not file_path.exists():
+        index = _get_index(create=False)
+        if index is None:
             return {}
 
-        with open(file_path, encoding="utf-8") as f:
-            record = json.load(f)
+        entry_id = (
+            Path(quarantine_id).stem
+            if quarantine_id.endswith(".json")
+            else quarantine_id
+        )
+        rows = index.query("SELECT * FROM entries WHERE id = ?", (entry_id,))
+        if not rows:
+            return {}
 
-        # Add file info
-        record["file_path"] = str(file_path)
-        record["file_size"] = file_path.stat().st_size
+        row = rows[0]
+        record = index.read_record(row)
+        record["quarantine_id"] = row["id"]
+        record["file_path"] = _entry_from_row(index, row)["file_path"]
+        record["file_size"] = row["size"]
 
         return record
 
@@ -228,30 +418,17 @@ def cleanup_old_entries(days: int = None) -> int:
         days: Age threshold in days (uses QUARANTINE_RETENTION_DAYS if None)
 
     Returns:
-        Number of files cleaned up
+        Number of entries cleaned up
     """
     try:
         days = days or QUARANTINE_RETENTION_DAYS
         cutoff_time = time.time() - (days * 24 * 3600)
 
-        quarantine_dir = Path(QUARANTINE_PATH)
-        if not quarantine_dir.exists():
+        index = _get_index(create=False)
+        if index is None:
             return 0
 
-        # Find old files
-        old_files = []
-        for file_path in quarantine_dir.glob("*.json"):
-            if file_path.stat().st_mtime < cutoff_time:
-                old_files.append(file_path)
-
-        # Remove old files
-        removed_count = 0
-        for file_path in old_files:
-            try:
-                file_path.unlink()
-                removed_count += 1
-            except Exception as e:
-                logger.warning(f"Failed to remove old quarantine file {file_path}: {e}")
+        removed_count = index.delete_before(cutoff_time)
 
         if removed_count > 0:
             logger.info(
@@ -273,8 +450,8 @@ def get_stats() -> dict[str, Any]:
         Dictionary with quarantine metrics
     """
     try:
-        quarantine_dir = Path(QUARANTINE_PATH)
-        if not quarantine_dir.exists():
+        index = _get_index(create=False)
+        if index is None:
             return {
                 "total_entries": 0,
                 "total_size_bytes": 0,
@@ -282,29 +459,24 @@ def get_stats() -> dict[str, Any]:
                 "recent_24h": 0,
             }
 
-        # Count files and sizes
-        files = list(quarantine_dir.glob("*.json"))
-        total_size = sum(f.stat().st_size for f in files)
-
-        # Group by dataset
-        datasets = {}
         recent_cutoff = time.time() - (24 * 3600)  # 24 hours ago
-        recent_count = 0
-
-        for file_path in files:
-            # Extract dataset from filename
-            dataset = file_path.name.split("_")[0]
-            datasets[dataset] = datasets.get(dataset, 0) + 1
-
-            # Count recent entries
-            if file_path.stat().st_mtime > recent_cutoff:
-                recent_count += 1
+        totals = index.query(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), "
+            "COALESCE(SUM(CASE WHEN ts > ? THEN 1 ELSE 0 END), 0) FROM entries",
+            (recent_cutoff,),
+        )[0]
+        datasets = {
+            row[0]: row[1]
+            for row in index.query(
+                "SELECT dataset, COUNT(*) FROM entries GROUP BY dataset"
+            )
+        }
 
         return {
-            "total_entries": len(files),
-            "total_size_bytes": total_size,
+            "total_entries": totals[0],
+            "total_size_bytes": totals[1],
             "datasets": datasets,
-            "recent_24h": recent_count,
+            "recent_24h": totals[2],
             "quarantine_path": QUARANTINE_PATH,
         }
 
@@ -326,7 +498,7 @@ def write_provider_failure(
         metadata: Additional context
 
     Returns:
-        Quarantine file path
+        Quarantine entry ID
     """
     failure_metadata = {
         "provider": provider,
@@ -363,7 +535,7 @@ def write_contract_violation(
         metadata: Additional context
 
     Returns:
-        Quarantine file path
+        Quarantine entry ID
     """
     violation_metadata = {
         "contract": contract_name,
@@ -0,0 +1,498 @@
+"""
+Streaming Sentiment State - Perception Layer
+
+Keeps an exponentially decayed sentiment accumulator per (ticker, event_type)
+so that news_nlp can answer aggregate and novelty queries without walking the
+event store. Each accumulator holds a decayed weighted sum, decayed weight,
+event count and last-update time; writes are O(1) amortized and reads only
+touch the handful of event types seen for a ticker.
+
+Window semantics match the reference scans in news_nlp exactly: events older
+than the look-back window are subtracted from the sums when they expire, so
+the streaming values equal a full scan over the same events.
+
+State is snapshotted to a JSON file next to the event store and rebuilt from
+the store only on cold start (no usable snapshot). The snapshot records a
+high-water mark of the store (byte offset for JSONL, max rowid for SQLite) and
+on warm start events written after it are replayed; stores that cannot be
+tailed are always rebuilt.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+SECONDS_PER_DAY = 86400.0
+
+NLP_DECAY_HALF_LIFE_DAYS = float(os.getenv("NLP_DECAY_HALF_LIFE_DAYS", "14"))
+NLP_NOVELTY_WINDOW_DAYS = int(os.getenv("NLP_NOVELTY_WINDOW_DAYS", "21"))
+NLP_SENTIMENT_STATE_PATH = os.getenv("NLP_SENTIMENT_STATE_PATH", "")
+NLP_SENTIMENT_SNAPSHOT_EVERY = int(os.getenv("NLP_SENTIMENT_SNAPSHOT_EVERY", "100"))
+
+_POLARITY_SIGN = {"positive": 1.0, "negative": -1.0}
+
+
+def parse_event_ts(ts: str) -> float | None:
+    """Parse an event-store timestamp into epoch seconds (naive means UTC)."""
+    try:
+        dt = datetime.fromisoformat(str(ts).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt.timestamp()
+
+
+def sentiment_from_event(event: dict[str, Any]) -> tuple[str, str, float, float] | None:
+    """
+    Extract (ticker, event_type, epoch_ts, signed_score) from a stored event.
+
+    Recognizes raw ``news_sentiment`` events and the ``sentiment_triple``
+    events written by news_nlp.persist_sentiment_triple.
+    """
+    ticker = event.get("ticker")
+    ts = event.get("ts")
+    if not ticker or not ts:
+        return None
+
+    kind = event.get("event_type")
+    if kind == "sentiment_triple":
+        event_type = event.get("extracted_event_type") or "other"
+        sign = _POLARITY_SIGN.get(str(event.get("polarity")), 0.0)
+        score = sign * abs(float(event.get("strength") or 0.0))
+    elif kind == "news_sentiment":
+        event_type = kind
+        score = float(event.get("sentiment_score") or 0.0)
+    else:
+        return None
+
+    epoch = parse_event_ts(ts)
+    if epoch is None:
+        return None
+    return str(ticker), str(event_type), epoch, score
+
+
+@dataclass
+class DecayedSentiment:
+    """
+    Decayed accumulator for one (ticker, event_type).
+
+    ``weighted_sum`` and ``weight`` are decayed to ``last_update``. ``times`` and
+    ``scores`` keep the events still inside the retention window (sorted by
+    time) so expired contributions can be subtracted exactly.
+    """
+
+    weighted_sum: float = 0.0
+    weight: float = 0.0
+    last_update: float = 0.0
+    times: list[float] = field(default_factory=list)
+    scores: list[float] = field(default_factory=list)
+    decay_start: int = 0  # first index still contributing to the sums
+
+    @property
+    def count(self) -> int:
+        return len(self.times) - self.decay_start
+
+    def _decay(self, dt_seconds: float, half_life_days: float) -> float:
+        return 0.5 ** (dt_seconds / (half_life_days * SECONDS_PER_DAY))
+
+    def add(self, ts: float, score: float, half_life_days: float) -> None:
+        """Fold one event into the accumulator."""
+        was_empty = self.count == 0
+        pos = bisect_right(self.times, ts)
+        self.times.insert(pos, ts)
+        self.scores.insert(pos, score)
+        if pos < self.decay_start:
+            # Already older than the decay window at the last expiry
+            self.decay_start += 1
+            return
+
+        if was_empty:
+            self.weighted_sum = 0.0
+            self.weight = 0.0
+            self.last_update = ts
+        if ts >= self.last_update:
+            factor = self._decay(ts - self.last_update, half_life_days)
+            self.weighted_sum = self.weighted_sum * factor + score
+            self.weight = self.weight * factor + 1.0
+            self.last_update = ts
+        else:
+            factor = self._decay(self.last_update - ts, half_life_days)
+            self.weighted_sum += score * factor
+            self.weight += factor
+
+    def expire(
+        self, decay_cutoff: float, retain_cutoff: float, half_life_days: float
+    ) -> None:
+        """Drop contributions older than ``decay_cutoff`` and events before ``retain_cutoff``."""
+        while (
+            self.decay_start < len(self.times)
+            and self.times[self.decay_start] < decay_cutoff
+        ):
+            factor = self._decay(
+                self.last_update - self.times[self.decay_start], half_life_days
+            )
+            self.weighted_sum -= self.scores[self.decay_start] * factor
+            self.weight -= factor
+            self.decay_start += 1
+        if self.decay_start == len(self.times):
+            self.weighted_sum = 0.0
+            self.weight = 0.0
+
+        drop = bisect_left(self.times, retain_cutoff)
+        if drop:
+            drop = min(drop, self.decay_start)
+            del self.times[:drop]
+            del self.scores[:drop]
+            self.decay_start -= drop
+
+    def decayed_at(self, now: float, half_life_days: float) -> tuple[float, float]:
+        """Return (weighted_sum, weight) decayed to ``now``."""
+        if not self.count:
+            return 0.0, 0.0
+        factor = self._decay(now - self.last_update, half_life_days)
+        return self.weighted_sum * factor, max(0.0, self.weight * factor)
+
+    def count_since(self, cutoff: float) -> int:
+        return len(self.times) - bisect_left(self.times, cutoff)
+
+
+class SentimentStateStore:
+    """In-memory decayed sentiment state keyed by (ticker, event_type)."""
+
+    def __init__(
+        self,
+        events_path: str | None = None,
+        snapshot_path: str | None = None,
+        store_kind: str | None = "jsonl",
+        half_life_days: float = NLP_DECAY_HALF_LIFE_DAYS,
+        novelty_window_days: float = NLP_NOVELTY_WINDOW_DAYS,
+        snapshot_every: int = NLP_SENTIMENT_SNAPSHOT_EVERY,
+    ):
+        self.events_path = events_path
+        self.snapshot_path = snapshot_path
+        # "jsonl" or "sqlite" select how the tail is replayed; None = cannot tail
+        self.store_kind = store_kind
+        self.half_life_days = half_life_days
+        self.novelty_window_days = novelty_window_days
+        self.snapshot_every = max(1, snapshot_every)
+
+        self._states: dict[tuple[str, str], DecayedSentiment] = {}
+        self._types_by_ticker: dict[str, set[str]] = {}
+        self._lock = threading.RLock()
+        self._dirty = 0
+        self._loaded = False
+        self.cold_start = False
+
+    # ── Windows ───────────────────────────────────────────────────────────────
+
+    @property
+    def decay_window_seconds(self) -> float:
+        # Reference scan looks back two half-lives
+        return 2 * self.half_life_days * SECONDS_PER_DAY
+
+    @property
+    def retain_window_seconds(self) -> float:
+        return max(
+            self.decay_window_seconds, self.novelty_window_days * SECONDS_PER_DAY
+        )
+
+    def _expire(self, state: DecayedSentiment, now: float) -> None:
+        state.expire(
+            now - self.decay_window_seconds,
+            now - self.retain_window_seconds,
+            self.half_life_days,
+        )
+
+    # ── Writes ────────────────────────────────────────────────────────────────
+
+    def record_event(self, event: dict[str, Any]) -> bool:
+        """Fold a stored event into the state; returns False if not sentiment."""
+        parsed = sentiment_from_event(event)
+        if parsed is None:
+            return False
+        self.ensure_loaded()
+        with self._lock:
+            self._apply(*parsed)
+            self._dirty += 1
+            if self._dirty >= self.snapshot_every:
+                self.save_snapshot()
+        return True
+
+    def _apply(self, ticker: str, event_type: str, ts: float, score: float) -> None:
+        key = (ticker, event_type)
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = DecayedSentiment()
+            self._types_by_ticker.setdefault(ticker, set()).add(event_type)
+        state.add(ts, score, self.half_life_days)
+        self._expire(state, max(time.time(), state.last_update))
+
+    # ── Reads ─────────────────────────────────────────────────────────────────
+
+    def aggregate(self, ticker: str, now: float | None = None) -> dict[str, Any]:
+        """Decayed sentiment for a ticker across its event types."""
+        self.ensure_loaded()
+        now = time.time() if now is None else now
+        weighted_score = 0.0
+        total_weight = 0.0
+        event_count = 0
+        with self._lock:
+            for event_type in self._types_by_ticker.get(ticker, ()):
+                state = self._states[(ticker, event_type)]
+                self._expire(state, now)
+                ws, w = state.decayed_at(now, self.half_life_days)
+                weighted_score += ws
+                total_weight += w
+                event_count += state.count
+        return {
+            "weighted_score": weighted_score,
+            "total_weight": total_weight,
+            "event_count": event_count,
+        }
+
+    def count_recent(
+        self, ticker: str, event_type: str, now: float | None = None
+    ) -> int:
+        """Number of (ticker, event_type) events inside the novelty window."""
+        self.ensure_loaded()
+        now = time.time() if now is None else now
+        with self._lock:
+            state = self._states.get((ticker, event_type))
+            if state is None:
+                return 0
+            self._expire(state, now)
+            return state.count_since(now - self.novelty_window_days * SECONDS_PER_DAY)
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "keys": len(self._states),
+                "tickers": len(self._types_by_ticker),
+                "retained_events": sum(len(s.times) for s in self._states.values()),
+                "cold_start": self.cold_start,
+                "snapshot_path": self.snapshot_path,
+            }
+
+    # ── Persistence ───────────────────────────────────────────────────────────
+
+    def ensure_loaded(self) -> None:
+        """Load the snapshot, or rebuild from the event store on cold start."""
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            offset = self._load_snapshot()
+            if offset is None:
+                self.cold_start = True
+                self._rebuild_from_store()
+                self.save_snapshot()
+            else:
+                self._replay_tail(offset)
+
+    def _store_mark(self) -> int | None:
+        """High-water mark of the store: JSONL byte size or SQLite max rowid."""
+        if not self.events_path or not os.path.exists(self.events_path):
+            return None
+        if self.store_kind == "jsonl":
+            return os.path.getsize(self.events_path)
+        if self.store_kind == "sqlite":
+            try:
+                from app.memory.events import _get_sqlite_conn
+
+                row = (
+                    _get_sqlite_conn()
+                    .execute("SELECT MAX(rowid) FROM events")
+                    .fetchone()
+                )
+            except Exception as e:
+                logger.warning(f"Failed to read sentiment store mark: {e}")
+                return None
+            return int(row[0] or 0)
+        return None
+
+    def save_snapshot(self) -> None:
+        """Write the current state atomically to the snapshot file."""
+        if not self.snapshot_path:
+            return
+        with self._lock:
+            payload = {
+                "version": 2,
+                "half_life_days": self.half_life_days,
+                "novelty_window_days": self.novelty_window_days,
+                "events_path": self.events_path,
+                "store_kind": self.store_kind,
+                "events_offset": self._store_mark(),
+                "saved_at": time.time(),
+                "states": [
+                    {
+                        "ticker": ticker,
+                        "event_type": event_type,
+                        "weighted_sum": s.weighted_sum,
+                        "weight": s.weight,
+                        "last_update": s.last_update,
+                        "decay_start": s.decay_start,
+                        "times": s.times,
+                        "scores": s.scores,
+                    }
+                    for (ticker, event_type), s in self._states.items()
+                ],
+            }
+            self._dirty = 0
+        try:
+            path = Path(self.snapshot_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(path.suffix + ".tmp")
+            tmp.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(tmp, path)
+        except Exception as e:
+            logger.warning(f"Failed to save sentiment state snapshot: {e}")
+
+    def _load_snapshot(self) -> int | None:
+        """Load snapshot state; returns the store mark it covers, or None."""
+        if not self.snapshot_path or not os.path.exists(self.snapshot_path):
+            return None
+        try:
+            with open(self.snapshot_path, encoding="utf-8") as f:
+                payload = json.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable sentiment snapshot: {e}")
+            return None
+
+        if (
+            payload.get("half_life_days") != self.half_life_days
+            or payload.get("novelty_window_days") != self.novelty_window_days
+            or payload.get("events_path") != self.events_path
+            or payload.get("store_kind") != self.store_kind
+        ):
+            return None
+        offset = payload.get("events_offset")
+        if self.store_kind is None or offset is None:
+            # Writes after the snapshot cannot be found; rebuild instead
+            return None
+        if (self._store_mark() or 0) < offset:
+            # Store was truncated or rotated; the snapshot no longer applies
+            return None
+
+        for row in payload.get("states", []):
+            state = DecayedSentiment(
+                weighted_sum=float(row["weighted_sum"]),
+                weight=float(row["weight"]),
+                last_update=float(row["last_update"]),
+                times=[float(t) for t in row["times"]],
+                scores=[float(s) for s in row["scores"]],
+                decay_start=int(row["decay_start"]),
+            )
+            self._states[(row["ticker"], row["event_type"])] = state
+            self._types_by_ticker.setdefault(row["ticker"], set()).add(
+                row["event_type"]
+            )
+        return int(offset)
+
+    def _replay_tail(self, offset: int) -> None:
+        """Apply events written after the snapshot's store mark."""
+        if not self.events_path or not os.path.exists(self.events_path):
+            return
+        replayed = 0
+        for raw in self._tail_rows(offset):
+            try:
+                parsed = sentiment_from_event(json.loads(raw))
+            except (json.JSONDecodeError, TypeError, ValueError):
+                continue
+            if parsed is not None:
+                self._apply(*parsed)
+                replayed += 1
+        if replayed:
+            logger.info(f"Replayed {replayed} sentiment events after snapshot")
+            self.save_snapshot()
+
+    def _tail_rows(self, offset: int) -> Iterator[str]:
+        """Raw JSON of the events stored after ``offset``."""
+        if self.store_kind == "sqlite":
+            from app.memory.events import _get_sqlite_conn
+
+            cursor = _get_sqlite_conn().execute(
+                "SELECT event_data FROM events WHERE rowid > ? ORDER BY rowid",
+                (offset,),
+            )
+            for row in cursor:
+                yield row[0]
+            return
+        with open(self.events_path, encoding="utf-8") as f:
+            f.seek(offset)
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield line
+
+    def _rebuild_from_store(self) -> None:
+        """Cold start: fold every sentiment event in the store into the state."""
+        try:
+            from app.memory.events import iter_events
+        except ImportError:
+            return
+
+        rebuilt = 0
+        for event in iter_events():
+            parsed = sentiment_from_event(event)
+            if parsed is not None:
+                self._apply(*parsed)
+                rebuilt += 1
+        logger.info(f"Rebuilt sentiment state from event store: {rebuilt} events")
+
+
+_STORE: SentimentStateStore | None = None
+_STORE_LOCK = threading.Lock()
+
+
+def _current_events_path() -> tuple[str | None, str | None]:
+    """Return (event store path, store kind: "jsonl", "sqlite" or None)."""
+    try:
+        from app.memory import events
+
+        if events.MODE == "JSONL":
+            return events._get_jsonl_path(), "jsonl"
+        if events.MODE == "SQLITE":
+            return events.SQLITE_PATH, "sqlite"
+        return None, None
+    except ImportError:
+        return None, None
+
+
+def get_sentiment_state() -> SentimentStateStore:
+    """Return the process-wide state, re-created if the event store moved."""
+    global _STORE
+    events_path, store_kind = _current_events_path()
+    with _STORE_LOCK:
+        if _STORE is None or _STORE.events_path != events_path:
+            snapshot_path = NLP_SENTIMENT_STATE_PATH or (
+                f"{events_path}.sentiment_state.json" if events_path else None
+            )
+            _STORE = SentimentStateStore(
+                events_path=events_path,
+                snapshot_path=snapshot_path,
+                store_kind=store_kind,
+            )
+        return _STORE
+
+
+def reset_sentiment_state() -> None:
+    """Drop the in-memory state (next access reloads the snapshot)."""
+    global _STORE
+    with _STORE_LOCK:
+        _STORE = None
@@ -3,16 +3,29 @@ Telemetry System - Perception Layer
 
 Emits metrics and violations for monitoring data quality and provider health.
 Integrates with observability systems for real-time alerting.
+
+Pipeline:
+- emit() enqueues a compact tuple; no per-event dict or timestamp formatting
+- the worker blocks on the queue until the batch fills or the flush deadline
+  passes, then packs events into one columnar batch per event type
+- batches that cannot be delivered are spooled to a rotating local JSONL file
+  and replayed once the sink accepts data again
+- high-rate metrics are pre-aggregated in-process as counters and histograms
+  and shipped once per flush instead of one event per call
 """
 
 from __future__ import annotations
 
+import bisect
+import json
 import logging
 import os
 import queue
 import threading
 import time
+from collections.abc import Callable
 from datetime import datetime
+from pathlib import Path
 from threading import Lock
 from typing import Any
 
@@ -29,27 +42,260 @@ TELEMETRY_SAMPLE = float(os.getenv("TELEMETRY_SAMPLE", "1.0"))
 TELEMETRY_TIMEOUT = TIMEOUTS["telemetry_http"]
 TELEMETRY_BATCH_SIZE = QUEUE_LIMITS["telemetry_batch_size"]
 TELEMETRY_FLUSH_INTERVAL = QUEUE_LIMITS["telemetry_flush_interval"]
+TELEMETRY_SPOOL_PATH = os.getenv("TELEMETRY_SPOOL_PATH", "data/telemetry/spool.jsonl")
+TELEMETRY_SPOOL_MAX_BYTES = QUEUE_LIMITS["telemetry_spool_max_bytes"]
+TELEMETRY_SPOOL_MAX_FILES = QUEUE_LIMITS["telemetry_spool_max_files"]
+TELEMETRY_REPLAY_BATCHES = QUEUE_LIMITS["telemetry_replay_batches"]
 
+SOURCE = "ziggy-perception"
 
-class TelemetryEmitter:
+# Histogram bucket upper bounds (last bucket is +inf)
+HISTOGRAM_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+def pack_columnar(
+    events: list[tuple[float, str, dict[str, Any], dict[str, Any]]],
+) -> list[dict[str, Any]]:
+    """
+    Pack (ts, event_type, data, metadata) tuples into per-type columnar batches.
+
+    Each batch carries one list per field; rows missing a field get None.
+    """
+    grouped: dict[str, list[tuple[float, dict[str, Any], dict[str, Any]]]] = {}
+    for ts, event_type, data, metadata in events:
+        grouped.setdefault(event_type, []).append((ts, data, metadata))
+
+    batches = []
+    for event_type, rows in grouped.items():
+        data_keys: dict[str, None] = {}
+        meta_keys: dict[str, None] = {}
+        for _, data, metadata in rows:
+            data_keys.update(dict.fromkeys(data))
+            meta_keys.update(dict.fromkeys(metadata))
+        batches.append(
+            {
+                "event_type": event_type,
+                "count": len(rows),
+                "ts": [round(ts, 3) for ts, _, _ in rows],
+                "data": {k: [data.get(k) for _, data, _ in rows] for k in data_keys},
+                "metadata": {
+                    k: [meta.get(k) for _, _, meta in rows] for k in meta_keys
+                },
+            }
+        )
+    return batches
+
+
+class _Histogram:
+    """Fixed-bucket histogram with count, sum, min and max."""
+
+    __slots__ = ("buckets", "count", "max", "min", "sum")
+
+    def __init__(self):
+        self.buckets = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def observe(self, value: float) -> None:
+        self.buckets[bisect.bisect_left(HISTOGRAM_BUCKETS, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "bounds": list(HISTOGRAM_BUCKETS),
+            "buckets": list(self.buckets),
+        }
+
+
+class MetricAggregator:
     """
-    Batched telemetry emitter with async processing.
+    In-process counters and histograms, drained once per flush.
+
+    Free-form metadata that is too high-cardinality for tags is kept as an
+    exemplar: the most recent metadata seen for each series is shipped with
+    its aggregate.
     """
 
     def __init__(self):
+        self._lock = Lock()
+        self._counters: dict[tuple[str, tuple], float] = {}
+        self._histograms: dict[tuple[str, tuple], _Histogram] = {}
+        self._exemplars: dict[tuple[str, tuple], dict[str, Any]] = {}
+
+    @staticmethod
+    def _key(name: str, tags: dict[str, str] | None) -> tuple[str, tuple]:
+        return name, tuple(sorted((tags or {}).items()))
+
+    def increment(
+        self,
+        name: str,
+        value: float = 1.0,
+        tags: dict[str, str] = None,
+        exemplar: dict[str, Any] = None,
+    ) -> None:
+        key = self._key(name, tags)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+            if exemplar:
+                self._exemplars[key] = exemplar
+
+    def observe(
+        self,
+        name: str,
+        value: float,
+        tags: dict[str, str] = None,
+        exemplar: dict[str, Any] = None,
+    ) -> None:
+        key = self._key(name, tags)
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = _Histogram()
+            hist.observe(float(value))
+            if exemplar:
+                self._exemplars[key] = exemplar
+
+    def drain(self) -> list[dict[str, Any]]:
+        """Return aggregated series since the last drain and reset."""
+        with self._lock:
+            counters, self._counters = self._counters, {}
+            histograms, self._histograms = self._histograms, {}
+            exemplars, self._exemplars = self._exemplars, {}
+
+        series: list[dict[str, Any]] = [
+            {"kind": "counter", "name": name, "tags": dict(tags), "value": value}
+            for (name, tags), value in counters.items()
+        ]
+        series.extend(
+            {"kind": "histogram", "name": name, "tags": dict(tags), **h.to_dict()}
+            for (name, tags), h in histograms.items()
+        )
+        for entry in series:
+            exemplar = exemplars.get(self._key(entry["name"], entry["tags"]))
+            if exemplar:
+                entry["exemplar"] = exemplar
+        return series
+
+
+class TelemetrySpool:
+    """Rotating local JSONL spool for batches the sink could not accept."""
+
+    def __init__(
+        self,
+        path: str = TELEMETRY_SPOOL_PATH,
+        max_bytes: int = TELEMETRY_SPOOL_MAX_BYTES,
+        max_files: int = TELEMETRY_SPOOL_MAX_FILES,
+    ):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.max_files = max(1, max_files)
+        self._lock = Lock()
+
+    def _rotated(self, i: int) -> Path:
+        return self.path.with_name(f"{self.path.name}.{i}")
+
+    def files_oldest_first(self) -> list[Path]:
+        rotated = [self._rotated(i) for i in range(self.max_files - 1, 0, -1)]
+        return [p for p in [*rotated, self.path] if p.exists()]
+
+    def append(self, payload: dict[str, Any]) -> None:
+        line = json.dumps(payload, default=str, separators=(",", ":")) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if (
+                self.path.exists()
+                and self.path.stat().st_size + len(line) > self.max_bytes
+            ):
+                self._rotate()
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+    def _rotate(self) -> None:
+        oldest = self._rotated(self.max_files - 1)
+        if self.max_files == 1:
+            self.path.unlink(missing_ok=True)
+            return
+        oldest.unlink(missing_ok=True)
+        for i in range(self.max_files - 2, 0, -1):
+            if self._rotated(i).exists():
+                os.replace(self._rotated(i), self._rotated(i + 1))
+        os.replace(self.path, self._rotated(1))
+
+    def replay(self, send: Callable[[dict[str, Any]], bool], limit: int) -> int:
+        """Send spooled payloads oldest first; stop at the first failure."""
+        sent = 0
+        with self._lock:
+            for spool_file in self.files_oldest_first():
+                lines = spool_file.read_text(encoding="utf-8").splitlines()
+                remaining = []
+                for i, line in enumerate(lines):
+                    if sent >= limit:
+                        remaining = lines[i:]
+                        break
+                    try:
+                        payload = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if not send(payload):
+                        remaining = lines[i:]
+                        break
+                    sent += 1
+                if remaining:
+                    spool_file.write_text("\n".join(remaining) + "\n", encoding="utf-8")
+                    return sent
+                spool_file.unlink(missing_ok=True)
+        return sent
+
+    def pending_bytes(self) -> int:
+        return sum(p.stat().st_size for p in self.files_oldest_first())
+
+
+class TelemetryEmitter:
+    """
+    Batched telemetry emitter with a columnar wire format and local spool.
+    """
+
+    def __init__(
+        self,
+        sink: Callable[[dict[str, Any]], bool] | None = None,
+        spool: TelemetrySpool | None = None,
+        batch_size: int = TELEMETRY_BATCH_SIZE,
+        flush_interval: float = TELEMETRY_FLUSH_INTERVAL,
+        start: bool = True,
+    ):
         self.queue = queue.Queue(maxsize=QUEUE_LIMITS["telemetry_events"])
-        self.batch = []
-        self.batch_lock = Lock()
+        self.sink = sink or self._post
+        self.spool = spool or TelemetrySpool()
+        self.metrics = MetricAggregator()
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
         self.stats = {
             "events_emitted": 0,
             "events_dropped": 0,
             "events_failed": 0,
+            "batches_sent": 0,
+            "batches_spooled": 0,
+            "batches_replayed": 0,
             "last_flush": None,
         }
+        self._stop = threading.Event()
+        self._flush_lock = Lock()
 
         # Start background worker
         self.worker_thread = threading.Thread(target=self._worker, daemon=True)
-        self.worker_thread.start()
+        if start:
+            self.worker_thread.start()
 
     def emit(
         self, event_type: str, data: dict[str, Any], metadata: dict[str, Any] = None
@@ -69,83 +315,115 @@ class TelemetryEmitter:
             if random.random() > TELEMETRY_SAMPLE:
                 return
 
-        event = {
-            "timestamp": datetime.now().isoformat(),
-            "event_type": event_type,
-            "data": data,
-            "metadata": metadata or {},
-            "source": "ziggy-perception",
-        }
-
         try:
-            self.queue.put_nowait(event)
+            self.queue.put_nowait((time.time(), event_type, data, metadata or {}))
             self.stats["events_emitted"] += 1
         except queue.Full:
             self.stats["events_dropped"] += 1
             logger.warning("Telemetry queue full, dropping event")
 
+    def _collect(self) -> list[tuple[float, str, dict[str, Any], dict[str, Any]]]:
+        """Block until the batch is full or the flush deadline passes."""
+        events = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(events) < self.batch_size and not self._stop.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                events.append(self.queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return events
+
     def _worker(self) -> None:
         """Background worker to process telemetry events."""
-        while True:
+        while not self._stop.is_set():
             try:
-                # Collect events into batch
-                events_to_send = []
-                timeout_start = time.time()
-
-                # Wait for events or timeout
-                while (
-                    len(events_to_send) < TELEMETRY_BATCH_SIZE
-                    and (time.time() - timeout_start) < TELEMETRY_FLUSH_INTERVAL
-                ):
+                self.flush(self._collect())
+            except Exception as e:
+                logger.error(f"Telemetry worker error: {e}")
+                self._stop.wait(5)  # Brief pause before retrying
+
+    def flush(self, events: list | None = None) -> None:
+        """Pack and deliver queued events plus aggregated metrics."""
+        with self._flush_lock:
+            if events is None:
+                events = []
+                while True:
                     try:
-                        event = self.queue.get(timeout=TIMEOUTS["telemetry_queue_get"])
-                        events_to_send.append(event)
-                        self.queue.task_done()
+                        events.append(self.queue.get_nowait())
                     except queue.Empty:
-                        continue
+                        break
+            aggregates = self.metrics.drain()
+            try:
+                if events or aggregates:
+                    self._deliver(events, aggregates)
+            finally:
+                for _ in events:
+                    self.queue.task_done()
+
+    def _deliver(self, events: list, aggregates: list[dict[str, Any]]) -> None:
+        payload = {
+            "source": SOURCE,
+            "timestamp": datetime.now().isoformat(),
+            "format": "columnar",
+            "batches": pack_columnar(events),
+            "metrics": aggregates,
+            "count": len(events),
+        }
 
-                # Send batch if we have events
-                if events_to_send:
-                    self._send_batch(events_to_send)
+        if self.sink(payload):
+            self.stats["batches_sent"] += 1
+            self.stats["last_flush"] = payload["timestamp"]
+            replayed = self.spool.replay(self.sink, TELEMETRY_REPLAY_BATCHES)
+            self.stats["batches_replayed"] += replayed
+            return
 
-            except Exception as e:
-                logger.error(f"Telemetry worker error: {e}")
-                time.sleep(5)  # Brief pause before retrying
-
-    def _send_batch(self, events: list) -> None:
-        """Send batch of events to telemetry endpoint."""
+        # Sink unavailable: keep the batch locally for replay
+        self.stats["events_failed"] += len(events)
         try:
-            payload = {
-                "source": "ziggy-perception",
-                "timestamp": datetime.now().isoformat(),
-                "events": events,
-                "count": len(events),
-            }
+            self.spool.append(payload)
+            self.stats["batches_spooled"] += 1
+        except Exception as e:
+            logger.error(f"Failed to spool telemetry batch: {e}")
 
+    def _post(self, payload: dict[str, Any]) -> bool:
+        """Send one payload to the telemetry endpoint."""
+        try:
             response = requests.post(
                 TELEMETRY_ENDPOINT,
-                json=payload,
+                data=json.dumps(payload, default=str, separators=(",", ":")),
                 timeout=TELEMETRY_TIMEOUT,
                 headers={"Content-Type": "application/json"},
             )
-
             if response.status_code == 200:
-                logger.debug(f"Sent {len(events)} telemetry events")
-                self.stats["last_flush"] = datetime.now().isoformat()
-            else:
-                logger.warning(f"Telemetry endpoint returned {response.status_code}")
-                self.stats["events_failed"] += len(events)
-
+                logger.debug(f"Sent {payload.get('count', 0)} telemetry events")
+                return True
+            logger.warning(f"Telemetry endpoint returned {response.status_code}")
         except requests.exceptions.RequestException as e:
             logger.warning(f"Failed to send telemetry: {e}")
-            self.stats["events_failed"] += len(events)
         except Exception as e:
             logger.error(f"Unexpected telemetry error: {e}")
-            self.stats["events_failed"] += len(events)
+        return False
+
+    def stop(self, flush: bool = True) -> None:
+        """Stop the worker, optionally flushing what is queued."""
+        self._stop.set()
+        if self.worker_thread.is_alive():
+            self.worker_thread.join(timeout=TELEMETRY_TIMEOUT + 1)
+        if flush:
+            self.flush()
 
     def get_stats(self) -> dict[str, Any]:
         """Get telemetry statistics."""
-        return self.stats.copy()
+        stats = self.stats.copy()
+        stats["queue_depth"] = self.queue.qsize()
+        try:
+            stats["spool_bytes"] = self.spool.pending_bytes()
+        except OSError:
+            stats["spool_bytes"] = None
+        return stats
 
 
 # Global emitter instance
@@ -179,22 +457,16 @@ def emit_provider_metric(
         vendor: Provider name
         latency_ms: Request latency in milliseconds
         ok: Whether request succeeded
-        metadata: Additional context
+        metadata: Additional context, shipped as the series exemplar
     """
-    data = {
-        "vendor": vendor,
-        "latency_ms": latency_ms,
-        "success": ok,
-        "timestamp_ms": int(time.time() * 1000),
-    }
-
-    meta = {
-        "component": "provider_health",
-        "metric_type": "performance",
-        **(metadata or {}),
-    }
-
-    _emitter.emit("provider_metric", data, meta)
+    # Pre-aggregated: one histogram/counter series per vendor per flush
+    tags = {"vendor": vendor}
+    _emitter.metrics.observe("provider_latency_ms", latency_ms, tags, metadata)
+    _emitter.metrics.increment(
+        "provider_requests_total",
+        tags={**tags, "success": str(bool(ok))},
+        exemplar=metadata,
+    )
 
 
 def emit_contract_validation(
@@ -359,13 +631,24 @@ def emit_custom_metric(
         metric_name: Name of the metric
         value: Metric value
         tags: Metric tags/labels
-        metadata: Additional context
+        metadata: Additional context, shipped as the series exemplar
     """
-    data = {"metric_name": metric_name, "value": value, "tags": tags or {}}
+    # Pre-aggregated into a histogram per (metric_name, tags) per flush
+    _emitter.metrics.observe(metric_name, value, tags, metadata)
 
-    meta = {"component": "custom_metrics", "metric_type": "gauge", **(metadata or {})}
 
-    _emitter.emit("custom_metric", data, meta)
+def increment_counter(
+    metric_name: str, value: float = 1.0, tags: dict[str, str] = None
+) -> None:
+    """
+    Increment an in-process counter shipped once per flush.
+
+    Args:
+        metric_name: Name of the counter
+        value: Amount to add
+        tags: Metric tags/labels
+    """
+    _emitter.metrics.increment(metric_name, value, tags)
 
 
 def get_telemetry_stats() -> dict[str, Any]:
@@ -374,9 +657,8 @@ def get_telemetry_stats() -> dict[str, Any]:
 
 
 def flush_telemetry() -> None:
-    """Force flush telemetry queue (useful for testing)."""
-    # Wait for queue to be processed
-    _emitter.queue.join()
+    """Force flush queued events and aggregated metrics (useful for testing)."""
+    _emitter.flush()
 
 
 class TelemetryContext:
@@ -11,6 +11,7 @@ import json
 import logging
 import os
 import re
+from collections import defaultdict
 
 
 logger = logging.getLogger(__name__)
@@ -19,6 +20,101 @@ logger = logging.getLogger(__name__)
 TICKER_DB_PATH = os.getenv("TICKER_DB_PATH", "/data/ticker_mapping.json")
 FUZZY_MATCH_THRESHOLD = float(os.getenv("FUZZY_MATCH_THRESHOLD", "0.8"))
 
+# Precompiled candidate patterns (previously compiled on every call)
+_CANDIDATE_PATTERNS = [
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        # Capitalized sequences (2+ words)
+        r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+(?:\s+(?:Inc|Corp|Ltd|LLC|PLC|Co)\.?)?",
+        # Known company suffixes
+        r"\b[A-Z][a-zA-Z\s&]+(?:Inc\.|Corp\.|Ltd\.|LLC|PLC|Company|Group|Holdings|International|Technologies|Systems|Solutions|Services)\b",
+        # All caps sequences (likely acronyms)
+        r"\b[A-Z]{2,8}\b",
+        # Mixed case with common business words
+        r"\b[A-Z][a-zA-Z]*(?:\s+[A-Z][a-zA-Z]*)*\s+(?:Bank|Financial|Insurance|Energy|Oil|Gas|Electric|Motors|Airlines|Airways)\b",
+    )
+]
+
+_PUNCT_RE = re.compile(r'[.,\'"!?]')
+_WHITESPACE_RE = re.compile(r"\s+")
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_JOINERS_RE = re.compile(r"[.'\u2019]")
+
+
+def _tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens using the name normalization rules."""
+    lowered = text.lower().replace("&", " and ").replace("+", " plus ")
+    return _TOKEN_RE.findall(_JOINERS_RE.sub("", lowered))
+
+
+class NameAutomaton:
+    """
+    Aho-Corasick automaton over word tokens.
+
+    Every known name is inserted as a token sequence, so one left-to-right
+    pass over a tokenized text reports all mentions at word boundaries,
+    independent of how many names are registered.
+    """
+
+    def __init__(self) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[str]] = [[]]
+
+    def add(self, tokens: list[str], key: str) -> None:
+        """Insert a token sequence that resolves to ``key``."""
+        if not tokens:
+            return
+        node = 0
+        for token in tokens:
+            nxt = self._goto[node].get(token)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][token] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        if key not in self._out[node]:
+            self._out[node].append(key)
+
+    def build(self) -> None:
+        """Compute failure links breadth-first and merge outputs along them."""
+        queue = list(self._goto[0].values())
+        for child in queue:
+            self._fail[child] = 0
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for token, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child].extend(
+                    k for k in self._out[self._fail[child]] if k not in self._out[child]
+                )
+
+    def find(self, tokens: list[str]) -> set[str]:
+        """Return the keys of all names occurring in ``tokens``."""
+        found: set[str] = set()
+        node = 0
+        goto, fail, out = self._goto, self._fail, self._out
+        for token in tokens:
+            while node and token not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(token, 0)
+            if out[node]:
+                found.update(out[node])
+        return found
+
+    @property
+    def size(self) -> int:
+        return len(self._goto)
+
 
 class TickerLinker:
     """
@@ -32,6 +128,11 @@ class TickerLinker:
         self.subsidiaries: dict[str, str] = {}
         self.exchange_context: dict[str, str] = {}
 
+        # Compiled matchers, rebuilt lazily after mappings change
+        self._automaton: NameAutomaton | None = None
+        self._fuzzy_index: dict[str, set[str]] = {}
+        self._fuzzy_words: dict[str, frozenset[str]] = {}
+
         self._load_mappings()
         self._build_common_aliases()
 
@@ -148,6 +249,16 @@ class TickerLinker:
 
         # Build suffix variations
         self.common_suffixes = set(common_suffixes)
+        self._compile_suffix_pattern()
+        self._invalidate_compiled()
+
+    def _compile_suffix_pattern(self) -> None:
+        """Compile one anchored pattern that strips any trailing run of suffixes."""
+        alternatives = "|".join(
+            re.escape(suffix)
+            for suffix in sorted(self.common_suffixes, key=len, reverse=True)
+        )
+        self._suffix_re = re.compile(rf"(?:\s*\b(?:{alternatives})\b)+$")
 
     def map_org_to_tickers(
         self, text: str, date: str = None, venue: str = None
@@ -166,35 +277,109 @@ class TickerLinker:
         if not text or not text.strip():
             return []
 
-        found_tickers = set()
+        return self._map_text(text, date, venue, {})
+
+    def map_orgs_to_tickers_batch(
+        self, texts: list[str], date: str = None, venue: str = None
+    ) -> list[list[str]]:
+        """
+        Map organization names for many texts at once.
 
-        # Extract potential company names from text
-        company_names = self._extract_company_names(text)
+        The automaton is built once for the batch and fuzzy resolutions are
+        memoized across texts, so repeated company mentions are resolved once.
+
+        Args:
+            texts: Texts containing organization names
+            date: Date context for temporal mappings
+            venue: News venue for context
 
-        for name in company_names:
-            tickers = self._resolve_name_to_tickers(name, date, venue)
+        Returns:
+            List of ticker lists, in the same order as ``texts``
+        """
+        self._ensure_compiled()
+        memo: dict[str, list[str]] = {}
+        return [
+            self._map_text(text, date, venue, memo) if text and text.strip() else []
+            for text in texts
+        ]
+
+    def _map_text(
+        self, text: str, date: str | None, venue: str | None, memo: dict[str, list[str]]
+    ) -> list[str]:
+        """Resolve one text: automaton pass first, indexed fuzzy fallback second."""
+        automaton = self._ensure_compiled()
+        found_tickers: set[str] = set()
+
+        # 1. Single linear pass over the text for exact names, aliases and subsidiaries
+        for key in automaton.find(_tokenize(text)):
+            found_tickers.update(self._lookup_key(key))
+
+        # 2. Fuzzy fallback for extracted candidates that have no direct mapping
+        for name in self._extract_company_names(text):
+            normalized_name = self._normalize_name(name)
+            if normalized_name in memo:
+                found_tickers.update(memo[normalized_name])
+                continue
+            tickers = self._lookup_key(normalized_name) or self._fuzzy_match(
+                normalized_name
+            )
+            memo[normalized_name] = tickers
             found_tickers.update(tickers)
 
-        return sorted(list(found_tickers))
+        return sorted(found_tickers)
+
+    def _lookup_key(self, key: str) -> list[str]:
+        """Resolve a normalized name through exact, alias and subsidiary tables."""
+        if key in self.exact_matches:
+            return self.exact_matches[key]
+        canonical_name = self.aliases.get(key)
+        if canonical_name and canonical_name in self.exact_matches:
+            return self.exact_matches[canonical_name]
+        parent_name = self.subsidiaries.get(key)
+        if parent_name and parent_name in self.exact_matches:
+            return self.exact_matches[parent_name]
+        return []
+
+    def _ensure_compiled(self) -> NameAutomaton:
+        """Build the name automaton and fuzzy index if mappings changed."""
+        if self._automaton is not None:
+            return self._automaton
+
+        automaton = NameAutomaton()
+        for table in (self.exact_matches, self.aliases, self.subsidiaries):
+            for key in table:
+                automaton.add(_tokenize(self._normalize_name(key)), key)
+        automaton.build()
+
+        fuzzy_index: dict[str, set[str]] = defaultdict(set)
+        fuzzy_words: dict[str, frozenset[str]] = {}
+        for known_name in self.exact_matches:
+            words = frozenset(known_name.split())
+            fuzzy_words[known_name] = words
+            for word in words:
+                fuzzy_index[word].add(known_name)
+
+        self._fuzzy_index = dict(fuzzy_index)
+        self._fuzzy_words = fuzzy_words
+        self._automaton = automaton
+        logger.debug(
+            f"Compiled ticker automaton: {automaton.size} states, "
+            f"{len(fuzzy_index)} indexed words"
+        )
+        return automaton
+
+    def _invalidate_compiled(self) -> None:
+        """Drop compiled matchers so the next lookup rebuilds them."""
+        self._automaton = None
+        self._fuzzy_index = {}
+        self._fuzzy_words = {}
 
     def _extract_company_names(self, text: str) -> list[str]:
         """Extract potential company names from text."""
-        # Common patterns for company names
-        patterns = [
-            # Capitalized sequences (2+ words)
-            r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+(?:\s+(?:Inc|Corp|Ltd|LLC|PLC|Co)\.?)?",
-            # Known company suffixes
-            r"\b[A-Z][a-zA-Z\s&]+(?:Inc\.|Corp\.|Ltd\.|LLC|PLC|Company|Group|Holdings|International|Technologies|Systems|Solutions|Services)\b",
-            # All caps sequences (likely acronyms)
-            r"\b[A-Z]{2,8}\b",
-            # Mixed case with common business words
-            r"\b[A-Z][a-zA-Z]*(?:\s+[A-Z][a-zA-Z]*)*\s+(?:Bank|Financial|Insurance|Energy|Oil|Gas|Electric|Motors|Airlines|Airways)\b",
-        ]
-
         candidates = set()
 
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _CANDIDATE_PATTERNS:
+            matches = pattern.findall(text)
             candidates.update(match.strip() for match in matches)
 
         # Filter out common false positives
@@ -243,58 +428,19 @@ class TickerLinker:
 
         return filtered_candidates
 
-    def _resolve_name_to_tickers(
-        self, name: str, date: str = None, venue: str = None
-    ) -> list[str]:
-        """Resolve a single company name to ticker symbols."""
-        if not name:
-            return []
-
-        normalized_name = self._normalize_name(name)
-
-        # 1. Try exact match
-        if normalized_name in self.exact_matches:
-            return self.exact_matches[normalized_name]
-
-        # 2. Try aliases
-        if normalized_name in self.aliases:
-            canonical_name = self.aliases[normalized_name]
-            if canonical_name in self.exact_matches:
-                return self.exact_matches[canonical_name]
-
-        # 3. Try subsidiaries
-        if normalized_name in self.subsidiaries:
-            parent_name = self.subsidiaries[normalized_name]
-            if parent_name in self.exact_matches:
-                return self.exact_matches[parent_name]
-
-        # 4. Try fuzzy matching
-        fuzzy_tickers = self._fuzzy_match(normalized_name)
-        if fuzzy_tickers:
-            return fuzzy_tickers
-
-        # 5. Try partial matching for known patterns
-        partial_tickers = self._partial_match(normalized_name)
-        if partial_tickers:
-            return partial_tickers
-
-        return []
-
     def _normalize_name(self, name: str) -> str:
         """Normalize company name for matching."""
         # Convert to lowercase
         normalized = name.lower().strip()
 
         # Remove common punctuation
-        normalized = re.sub(r'[.,\'"!?]', "", normalized)
+        normalized = _PUNCT_RE.sub("", normalized)
 
         # Normalize whitespace
-        normalized = re.sub(r"\s+", " ", normalized)
+        normalized = _WHITESPACE_RE.sub(" ", normalized)
 
         # Remove common suffixes for broader matching
-        for suffix in self.common_suffixes:
-            pattern = rf"\b{re.escape(suffix)}\b$"
-            normalized = re.sub(pattern, "", normalized).strip()
+        normalized = self._suffix_re.sub("", normalized).strip()
 
         # Handle special characters
         normalized = normalized.replace("&", "and")
@@ -303,13 +449,32 @@ class TickerLinker:
         return normalized
 
     def _fuzzy_match(self, name: str) -> list[str]:
-        """Perform fuzzy matching against known company names."""
-        best_matches = []
+        """
+        Perform fuzzy matching against known company names.
 
-        for known_name, tickers in self.exact_matches.items():
+        Uses the word index to score only names that share at least one word
+        with ``name`` and whose size allows the Jaccard threshold to be met.
+        """
+        self._ensure_compiled()
+        words = set(name.split())
+        if not words:
+            return []
+
+        min_len = FUZZY_MATCH_THRESHOLD * len(words)
+        max_len = len(words) / FUZZY_MATCH_THRESHOLD if FUZZY_MATCH_THRESHOLD else float("inf")
+
+        candidates: set[str] = set()
+        for word in words:
+            candidates.update(self._fuzzy_index.get(word, ()))
+
+        best_matches = []
+        for known_name in candidates:
+            known_words = self._fuzzy_words[known_name]
+            if not min_len <= len(known_words) <= max_len:
+                continue
             similarity = self._calculate_similarity(name, known_name)
             if similarity >= FUZZY_MATCH_THRESHOLD:
-                best_matches.extend(tickers)
+                best_matches.extend(self.exact_matches[known_name])
 
         return list(set(best_matches))
 
@@ -327,24 +492,6 @@ class TickerLinker:
 
         return intersection / union
 
-    def _partial_match(self, name: str) -> list[str]:
-        """Try partial matching for multi-word company names."""
-        name_words = name.split()
-
-        if len(name_words) >= 2:
-            # Try first word only (e.g., "Apple" from "Apple Inc")
-            first_word = name_words[0]
-            if first_word in self.exact_matches:
-                return self.exact_matches[first_word]
-
-            # Try first two words (e.g., "JP Morgan" from "JP Morgan Chase")
-            if len(name_words) >= 2:
-                first_two = " ".join(name_words[:2])
-                if first_two in self.exact_matches:
-                    return self.exact_matches[first_two]
-
-        return []
-
     def add_mapping(
         self, company_name: str, tickers: list[str], mapping_type: str = "exact"
     ) -> None:
@@ -383,6 +530,7 @@ class TickerLinker:
                 if parent_name:
                     self.subsidiaries[normalized_name] = parent_name
 
+        self._invalidate_compiled()
         logger.info(f"Added {mapping_type} mapping: {company_name} -> {tickers}")
 
     def get_stats(self) -> dict[str, int]:
@@ -421,6 +569,23 @@ def map_org_to_tickers(text: str, date: str = None, venue: str = None) -> list[s
     return _ticker_linker.map_org_to_tickers(text, date, venue)
 
 
+def map_orgs_to_tickers_batch(
+    texts: list[str], date: str = None, venue: str = None
+) -> list[list[str]]:
+    """
+    Map organization names to ticker symbols for a batch of texts.
+
+    Args:
+        texts: Texts containing organization names
+        date: Date context for temporal mappings
+        venue: News venue for context
+
+    Returns:
+        List of ticker lists, one per input text
+    """
+    return _ticker_linker.map_orgs_to_tickers_batch(texts, date, venue)
+
+
 def add_ticker_mapping(
     company_name: str, tickers: list[str], mapping_type: str = "exact"
 ) -> None:
@@ -16,6 +16,7 @@ from app.core.logging import get_logger
 from app.paper import (
     BanditAllocator,
     FeatureComputer,
+    FeatureTable,
     LabelGenerator,
     OnlineLearner,
     PaperEngine,
@@ -365,37 +366,60 @@ class PaperWorker:
         return market_data
 
     async def _generate_signals(self, market_data: list[PriceData]) -> list[Signal]:
-        """Generate trading signals from theories."""
-        signals = []
+        """Generate trading signals from theories.
 
+        Features for the whole universe are packed into one FeatureTable and
+        each theory evaluates every symbol at once.
+        """
+        rows = []
         for price_data in market_data:
             # Compute features for this symbol
             features = self.feature_computer.compute_features(price_data.symbol)
-            if features is None:
-                continue
+            if features is not None:
+                rows.append(features)
+        if not rows:
+            return []
 
-            # Generate signals from enabled theories
-            for theory in theory_registry.get_enabled():
-                try:
-                    theory_signals = theory.generate_signals(features)
+        table = FeatureTable.from_features(rows)
+        signals = []
 
-                    # Apply risk model to adjust signal strength
-                    risk_multiplier = theory.risk_model(features)
+        # Generate risk-adjusted signals from enabled theories
+        for theory in theory_registry.get_enabled():
+            try:
+                signals.extend(theory.evaluate_batch(table))
 
-                    for signal in theory_signals:
-                        signal.confidence *= risk_multiplier
-                        signals.append(signal)
+            except Exception as e:
+                logger.warning(
+                    "Batch theory evaluation failed, falling back to per-symbol",
+                    extra={"theory_id": theory.theory_id, "error": str(e)},
+                )
+                signals.extend(self._generate_signals_per_row(theory, rows))
 
-                except Exception as e:
-                    logger.warning(
-                        "Theory signal generation failed",
-                        extra={
-                            "theory_id": theory.theory_id,
-                            "symbol": price_data.symbol,
-                            "error": str(e),
-                        },
-                    )
+        return signals
+
+    def _generate_signals_per_row(self, theory, rows: list) -> list[Signal]:
+        """Reference path: evaluate one theory symbol by symbol."""
+        signals = []
+        for features in rows:
+            try:
+                theory_signals = theory.generate_signals(features)
+
+                # Apply risk model to adjust signal strength
+                risk_multiplier = theory.risk_model(features)
+
+                for signal in theory_signals:
+                    signal.confidence *= risk_multiplier
+                    signals.append(signal)
 
+            except Exception as e:
+                logger.warning(
+                    "Theory signal generation failed",
+                    extra={
+                        "theory_id": theory.theory_id,
+                        "symbol": features.symbol,
+                        "error": str(e),
+                    },
+                )
         return signals
 
     async def _allocate_signals(self, signals: list[Signal]) -> list[Signal]:
@@ -561,6 +585,12 @@ async def start_paper_worker() -> None:
         logger.info("Paper worker already running")
         return
 
+    from app.core.cluster import is_leader
+
+    if not is_leader():
+        logger.info("Paper worker runs on the leader worker only")
+        return
+
     try:
         from app.core.config import get_settings
 
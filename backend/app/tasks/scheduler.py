@@ -379,8 +379,12 @@ def set_scan_enabled(enabled: bool) -> None:
 
 
 def start_scanner() -> None:
-    """Idempotent start of background scanner."""
+    """Idempotent start of background scanner (leader worker only)."""
     global _THREAD, _STOP
+    from app.core.cluster import is_leader
+
+    if not is_leader():
+        return
     with _LOCK:
         if _THREAD and _THREAD.is_alive():
             return
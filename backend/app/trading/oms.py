@@ -1,16 +1,30 @@
 from __future__ import annotations
 
+import logging
 import sqlite3
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 
 from .models import Fill, Order, Position
 
 
+logger = logging.getLogger(__name__)
+
+
 class OMS:
     def __init__(self, db_path: str):
         self.db_path = db_path
+        self._fill_listeners: list[Callable[[Fill], None]] = []
         self._init()
 
+    def add_fill_listener(self, listener: Callable[[Fill], None]) -> None:
+        """Call `listener(fill)` after each recorded fill."""
+        if listener not in self._fill_listeners:
+            self._fill_listeners.append(listener)
+
+    def remove_fill_listener(self, listener: Callable[[Fill], None]) -> None:
+        if listener in self._fill_listeners:
+            self._fill_listeners.remove(listener)
+
     def _conn(self):
         return sqlite3.connect(self.db_path)
 
@@ -67,7 +81,13 @@ class OMS:
                 (f.order_id, f.symbol, f.side, f.qty, f.avg_price, f.ts),
             )
             self._apply_fill_to_positions(c, f)
-            return cur.lastrowid
+            fill_id = cur.lastrowid
+        for listener in list(self._fill_listeners):
+            try:
+                listener(f)
+            except Exception as e:
+                logger.warning(f"Fill listener failed: {e}")
+        return fill_id
 
     def _apply_fill_to_positions(self, c: sqlite3.Connection, f: Fill) -> None:
         row = c.execute(
@@ -5,10 +5,13 @@ Replaces basic stubs with actual broker connectivity and order management.
 
 import logging
 import uuid
+from collections.abc import Callable
 from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 
+from app.trading.models import Fill
+
 
 logger = logging.getLogger("ziggy")
 
@@ -171,6 +174,31 @@ class TradingSignalsManager:
         self.positions: dict[str, Position] = {}
         self.broker_connector = None
         self.paper_trading = True  # Start in paper trading mode
+        self._fill_listeners: list[Callable[[Fill], None]] = []
+
+    def add_fill_listener(self, listener: Callable[[Fill], None]) -> None:
+        """Call `listener(fill)` after each fill is applied to positions."""
+        if listener not in self._fill_listeners:
+            self._fill_listeners.append(listener)
+
+    def remove_fill_listener(self, listener: Callable[[Fill], None]) -> None:
+        if listener in self._fill_listeners:
+            self._fill_listeners.remove(listener)
+
+    def _notify_fill(self, order: Order, quantity: float, price: float) -> None:
+        fill = Fill(
+            order_id=order.id,  # type: ignore[arg-type]
+            symbol=order.symbol,
+            side="BUY" if order.side == OrderSide.BUY else "SELL",
+            qty=quantity,  # type: ignore[arg-type]
+            avg_price=price,
+            ts=order.updated_at.isoformat(),
+        )
+        for listener in list(self._fill_listeners):
+            try:
+                listener(fill)
+            except Exception as e:
+                logger.warning(f"Fill listener failed: {e}")
 
     def set_broker_connector(self, connector):
         """Set the broker connector for live trading."""
@@ -365,6 +393,7 @@ class TradingSignalsManager:
             order.quantity if order.side == OrderSide.BUY else -order.quantity,
             fill_price,
         )
+        self._notify_fill(order, order.quantity, fill_price)
 
     async def _update_position(self, symbol: str, quantity: float, price: float):
         """Update position with a new fill."""
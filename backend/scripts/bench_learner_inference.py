@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+CPU micro-benchmark of OnlineLearner inference: per-row vs batched.
+
+Compares one predict() + explain() call per symbol against a single
+predict_batch() over the whole universe.
+
+Usage:
+    python scripts/bench_learner_inference.py [--backend auto] [--features 16]
+        [--rows 10,100,500,2000] [--repeats 5]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.paper.learner import OnlineLearner, benchmark_inference
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--backend", default="auto")
+    parser.add_argument("--features", type=int, default=16)
+    parser.add_argument("--rows", default="10,100,500,2000")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    learner = OnlineLearner(backend=args.backend, feature_dim=args.features)
+    X_train = rng.normal(size=(2000, args.features))
+    learner.partial_fit(X_train, (X_train[:, 0] > 0).astype(int))
+
+    print(f"backend={learner.backend} threads={learner.inference_threads}")
+    for rows in (int(r) for r in args.rows.split(",")):
+        X = rng.normal(size=(rows, args.features))
+        result = benchmark_inference(learner, X, repeats=args.repeats)
+        print(
+            f"rows={rows:5d}  per-row {result['per_row_ms']:9.2f} ms "
+            f"({result['per_row_us_per_row']:7.1f} us/row)  "
+            f"batch {result['batch_ms']:7.3f} ms "
+            f"({result['batch_us_per_row']:6.2f} us/row)  "
+            f"x{result['speedup']:.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import random
+
+import numpy as np
+import pytest
+
+from app.paper.allocator import BanditAlgorithm, BanditAllocator
+
+
+class _EagerReference:
+    """Per-arm loop decay exactly as the allocator applied it before."""
+
+    def __init__(self, decay):
+        self.decay = decay
+        self.arms = {}
+
+    def ensure(self, tid):
+        self.arms.setdefault(
+            tid,
+            {
+                "recent_alpha": 1.0,
+                "recent_beta": 1.0,
+                "recent_reward": 0.0,
+                "recent_selections": 0,
+            },
+        )
+
+    def decay_all(self):
+        for arm in self.arms.values():
+            arm["recent_alpha"] = max(1.0, arm["recent_alpha"] * self.decay)
+            arm["recent_beta"] = max(1.0, arm["recent_beta"] * self.decay)
+            arm["recent_reward"] *= self.decay
+            arm["recent_selections"] = int(arm["recent_selections"] * self.decay)
+
+
+@pytest.mark.parametrize(
+    "algorithm", [BanditAlgorithm.THOMPSON_SAMPLING, BanditAlgorithm.UCB1]
+)
+def test_lazy_decay_matches_eager_per_arm_decay(algorithm):
+    rnd = random.Random(5)
+    theories = [f"theory_{i}" for i in range(40)]
+    allocator = BanditAllocator(algorithm=algorithm, decay_factor=0.9, random_seed=1)
+    ref = _EagerReference(0.9)
+
+    for step in range(300):
+        subset = rnd.sample(theories, 5)
+        allocator.allocate(subset)
+        for tid in subset:
+            ref.ensure(tid)
+        ref.decay_all()
+
+        tid = rnd.choice(theories)
+        pnl = rnd.uniform(-80, 120)
+        allocator.update_performance(tid, pnl, 1.0, pnl > 1.0)
+        ref.ensure(tid)
+        arm = ref.arms[tid]
+        if algorithm == BanditAlgorithm.THOMPSON_SAMPLING:
+            arm["recent_alpha" if pnl - 1.0 > 0 else "recent_beta"] += 1
+        else:
+            arm["recent_reward"] += max(0.0, min(1.0, (pnl - 1.0 + 100) / 200))
+            arm["recent_selections"] += 1
+
+    state = allocator.get_state()["arms"]
+    for tid, expected in ref.arms.items():
+        for key, value in expected.items():
+            assert state[tid][key] == pytest.approx(value, rel=1e-9), (tid, key)
+
+
+def test_state_round_trip_keeps_payload_format():
+    allocator = BanditAllocator(random_seed=2)
+    allocator.allocate(["a", "b", "c"])
+    allocator.update_performance("a", 50.0, 2.0, True)
+    allocator.update_performance("b", -20.0, 2.0, False)
+    state = allocator.get_state()
+
+    assert set(state["arms"]["a"]) == {
+        "alpha",
+        "beta",
+        "total_reward",
+        "num_selections",
+        "total_trades",
+        "winning_trades",
+        "total_pnl_bps",
+        "total_fees_bps",
+        "recent_alpha",
+        "recent_beta",
+        "recent_reward",
+        "recent_selections",
+        "last_allocation",
+    }
+    assert isinstance(state["arms"]["a"]["total_trades"], int)
+
+    restored = BanditAllocator(random_seed=2)
+    restored.set_state(state)
+    assert restored.get_state() == state
+    assert restored.arms["a"].alpha == 2.0 and restored.arms["b"].beta == 2.0
+
+
+def test_vectorized_allocation_over_many_arms():
+    arms = [f"theory_{i}:SYM{j}" for i in range(5) for j in range(60)]
+    allocator = BanditAllocator(random_seed=3, min_allocation=0.001)
+    for tid in arms[:10]:
+        for _ in range(30):
+            allocator.update_performance(tid, 40.0, 1.0, True)
+
+    result = allocator.allocate(arms)
+    samples = result.algorithm_state["samples"]
+    assert result.selected_theory == max(samples, key=samples.get)
+    assert sum(result.allocations.values()) == pytest.approx(1.0)
+    assert result.selected_theory in arms[:10]
+
+    assert np.isfinite(list(samples.values())).all()
+
+    ucb = BanditAllocator(algorithm=BanditAlgorithm.UCB1, ucb_c=0.0)
+    for _ in range(5):  # recent_selections survives the decay step
+        ucb.update_performance("seen", 100.0, 0.0, True)
+    result = ucb.allocate(["seen", "unseen"])
+    assert result.selected_theory == "unseen"
+    assert result.algorithm_state["ucb_values"]["unseen"] == float("inf")
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("sklearn")
+
+from app.services.evaluation import (
+    BootstrapEngine,
+    calculate_hit_rate,
+    calculate_sharpe_ratio,
+    calculate_sortino_ratio,
+    evaluate_trading_performance,
+)
+
+
+def test_vectorized_metrics_match_per_resample_reference():
+    rng = np.random.default_rng(0)
+    pnl = rng.normal(2, 20, 60)
+    engine = BootstrapEngine(n_bootstrap=200, seed=11)
+
+    dists = engine.metric_distributions(pnl)
+    samples = pnl[engine.resample_indices(len(pnl))]
+    for i, sample in enumerate(samples):
+        df = pd.DataFrame({"realized_pnl": sample})
+        assert dists["hit_rate"][i] == pytest.approx(calculate_hit_rate(df))
+        assert dists["expectancy"][i] == pytest.approx(sample.mean())
+        assert dists["sharpe"][i] == pytest.approx(calculate_sharpe_ratio(df))
+        assert dists["sortino"][i] == pytest.approx(
+            calculate_sortino_ratio(df), nan_ok=True
+        )
+
+
+def test_seeded_intervals_are_deterministic():
+    pnl = np.random.default_rng(1).normal(1, 10, 300)
+    df = pd.DataFrame({"realized_pnl": pnl, "predicted_prob": np.full(300, 0.5)})
+
+    first = evaluate_trading_performance(df, bootstrap=BootstrapEngine(seed=5))
+    second = evaluate_trading_performance(df, bootstrap=BootstrapEngine(seed=5))
+    assert first.hit_rate_confidence_interval == second.hit_rate_confidence_interval
+    assert first.sharpe_confidence_interval == second.sharpe_confidence_interval
+
+    lower, upper = first.expectancy_confidence_interval
+    assert lower < pnl.mean() < upper
+    assert BootstrapEngine(seed=5).confidence_intervals(np.array([]))["sortino"] == (
+        0.0,
+        0.0,
+    )
@@ -0,0 +1,99 @@
+"""Tests for the shared incremental candle store used by ChartStreamer."""
+
+import asyncio
+import random
+
+import pytest
+
+from app.core.websocket import ConnectionManager
+from app.services.chart_streaming import (
+    CandleStore,
+    ChartStreamer,
+    IncrementalIndicators,
+)
+
+
+def _bar(ts, o, h, lo, c, v=100, timeframe="1m"):
+    return {
+        "timestamp": float(ts),
+        "open": o,
+        "high": h,
+        "low": lo,
+        "close": c,
+        "volume": v,
+        "symbol": "AAPL",
+        "timeframe": timeframe,
+    }
+
+
+def test_incremental_indicators_match_full_recompute():
+    streamer = ChartStreamer(ConnectionManager())
+    rng = random.Random(7)
+    closes = [100.0]
+    for _ in range(119):
+        closes.append(closes[-1] * (1 + rng.uniform(-0.02, 0.02)))
+
+    state = IncrementalIndicators()
+    for close in closes[:-1]:
+        state.push(close)
+
+    candles = [{"close": c} for c in closes]
+    expected = asyncio.run(streamer._calculate_indicators(candles, "AAPL", "1m"))
+    got = state.values(forming=closes[-1])
+    assert {i["name"] for i in expected} == set(got)
+    for item in expected:
+        assert got[item["name"]] == pytest.approx(item["value"], rel=1e-9)
+
+    state.push(closes[-1])
+    for name, value in state.values().items():
+        assert value == pytest.approx(got[name], rel=1e-9)
+
+
+def test_store_builds_higher_timeframe_from_minute_bars():
+    store = CandleStore({"1m": 60, "5m": 300})
+    store.seed("AAPL", "5m", [_bar(0, 10, 11, 9, 10.5, 500, "5m")])
+
+    changed = store.ingest_minute_bars(
+        "AAPL",
+        [_bar(300, 10, 12, 10, 11), _bar(360, 11, 11.5, 8, 9)],
+    )
+    assert changed == {"1m", "5m"}
+    five = store.get("AAPL", "5m")
+    assert len(five.closed) == 1
+    assert five.forming == _bar(300, 10, 12, 8, 9, 200, "5m")
+
+    # Updating the forming minute only rebuilds the forming 5m bar
+    changed = store.ingest_minute_bars("AAPL", [_bar(360, 11, 13, 8, 12.5)])
+    assert changed == {"1m", "5m"}
+    assert five.forming["high"] == 13
+    assert five.forming["close"] == 12.5
+    assert five.forming["volume"] == 200
+
+    # Unchanged and stale bars produce no update
+    assert store.ingest_minute_bars("AAPL", [_bar(300, 1, 1, 1, 1)]) == set()
+    assert store.ingest_minute_bars("AAPL", [_bar(360, 11, 13, 8, 12.5)]) == set()
+
+
+def test_streamer_polls_once_per_symbol_and_pushes_changed_timeframes():
+    async def _run():
+        streamer = ChartStreamer(ConnectionManager())
+        calls = []
+
+        async def fake_fetch(symbol, timeframe, since=None):
+            calls.append((timeframe, since))
+            if timeframe == "5m":
+                return [_bar(0, 10, 11, 9, 10.5, 500, "5m")]
+            return [_bar(300, 10, 12, 10, 11)]
+
+        streamer._fetch_bars = fake_fetch  # type: ignore[method-assign]
+
+        changed = await streamer._poll_symbol("AAPL", {"1m", "5m"})
+        assert changed == {"1m", "5m"}
+        changed = await streamer._poll_symbol("AAPL", {"1m", "5m"})
+        assert changed == set()
+        assert calls == [("5m", None), ("1m", None), ("1m", 300.0)]
+
+        data = await streamer._fetch_chart_data("AAPL", "5m")
+        assert [c["timestamp"] for c in data["candlesticks"]] == [0.0, 300.0]
+
+    asyncio.run(_run())
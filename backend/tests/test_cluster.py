@@ -0,0 +1,180 @@
+import asyncio
+import time
+
+import pytest
+
+from app.core import cluster
+from app.core.cluster import (
+    InProcessBackend,
+    LeaderElection,
+    RedisBackend,
+    SharedBackend,
+)
+from app.core.websocket import ConnectionManager
+
+
+def test_lock_file_election_single_leader(tmp_path):
+    lock = tmp_path / "leader.lock"
+    first = LeaderElection(lock)
+    second = LeaderElection(lock)
+
+    assert first.try_acquire()
+    assert not second.try_acquire()
+    assert lock.read_text().strip().isdigit()
+
+    first.release()
+    assert second.try_acquire()
+    assert second.is_leader and not first.is_leader
+    second.release()
+
+
+def test_follower_takes_over_when_leader_releases(tmp_path, monkeypatch):
+    monkeypatch.setenv("WORKER_MODE", "multi")
+    lock = tmp_path / "leader.lock"
+    leader = LeaderElection(lock)
+    assert leader.try_acquire()
+
+    async def _run():
+        started = []
+        follower = LeaderElection(lock, retry_interval=0.01)
+        task = asyncio.create_task(follower.watch(lambda: _record(started)))
+        await asyncio.sleep(0.05)
+        assert started == []
+        leader.release()
+        await asyncio.wait_for(task, timeout=2.0)
+        assert started == ["leader"]
+        follower.release()
+
+    async def _record(started):
+        started.append("leader")
+
+    asyncio.run(_run())
+
+
+def test_single_worker_mode_always_leads(monkeypatch):
+    monkeypatch.delenv("WORKER_MODE", raising=False)
+    ran = []
+
+    async def _on_leader():
+        ran.append(True)
+
+    assert asyncio.run(cluster.start_cluster(_on_leader))
+    assert ran == [True]
+    assert cluster.is_leader()
+
+
+def test_in_process_backend_ttl_and_pubsub():
+    backend = InProcessBackend()
+    backend.set("k", {"v": 1}, ttl=0.05)
+    assert backend.get("k") == {"v": 1}
+    time.sleep(0.08)
+    assert backend.get("k") is None
+
+    got = []
+    unsubscribe = backend.subscribe("ch", got.append)
+    backend.publish("ch", {"n": 1})
+    unsubscribe()
+    backend.publish("ch", {"n": 2})
+    assert got == [{"n": 1}]
+
+
+def test_redis_backend_with_local_stand_in():
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+    a = RedisBackend(client=fakeredis.FakeRedis(server=server), prefix="t:")
+    b = RedisBackend(client=fakeredis.FakeRedis(server=server), prefix="t:")
+
+    a.set("quote", {"AAPL": 1.5}, ttl=10)
+    assert b.get("quote") == {"AAPL": 1.5}
+
+    got = []
+    unsubscribe = b.subscribe("ch", got.append)
+    time.sleep(0.1)
+    a.publish("ch", {"hello": "world"})
+    deadline = time.time() + 2.0
+    while not got and time.time() < deadline:
+        time.sleep(0.02)
+    unsubscribe()
+    assert got == [{"hello": "world"}]
+
+
+def test_shared_backend_requires_full_interface():
+    class Partial(SharedBackend):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Partial()  # type: ignore[abstract]
+
+
+def test_in_process_fakeredis_is_not_reported_as_shared(monkeypatch):
+    pytest.importorskip("fakeredis")
+    monkeypatch.delenv("WORKER_MODE", raising=False)
+    backend = cluster.create_shared_backend("fakeredis")
+    assert backend.name == "fakeredis"
+    assert not backend.shared
+
+    monkeypatch.setenv("WORKER_MODE", "multi")
+    with pytest.raises(ValueError, match="per-process"):
+        cluster.create_shared_backend("fakeredis")
+
+    monkeypatch.setenv("SHARED_BACKEND", "fakeredis")
+    monkeypatch.setattr(cluster, "_backend", None)
+    assert isinstance(cluster.get_shared_backend(), InProcessBackend)
+
+
+def test_connection_manager_relays_broadcasts_between_workers():
+    backend = InProcessBackend()
+
+    async def _run():
+        leader, follower = ConnectionManager(), ConnectionManager()
+        leader.attach_backend(backend)
+        follower.attach_backend(backend)
+        received = []
+
+        async def _capture(channel, message):
+            received.append((channel, message))
+
+        follower._enqueue_broadcast = _capture
+        local = []
+
+        async def _capture_local(channel, message):
+            local.append(channel)
+
+        leader._enqueue_broadcast = _capture_local
+        await leader.broadcast_to_type({"type": "news", "id": 1}, "news")
+        await asyncio.sleep(0.01)
+        assert received == [("news", {"type": "news", "id": 1})]
+        assert local == ["news"]  # not echoed back to the origin
+        leader.detach_backend()
+        follower.detach_backend()
+
+    asyncio.run(_run())
+
+
+def test_market_streamer_follower_forwards_symbols_and_receives_ticks(monkeypatch):
+    from app.core.websocket import MarketDataStreamer
+
+    backend = InProcessBackend()
+
+    async def _run():
+        leader = MarketDataStreamer(ConnectionManager())
+        follower = MarketDataStreamer(ConnectionManager())
+        leader.attach_backend(backend)
+        follower.attach_backend(backend)
+        leader._ensure_stream_task = lambda: None  # no provider polling here
+
+        monkeypatch.setattr(cluster, "is_leader", lambda: False)
+        await follower.start_streaming(["AAPL"])
+        assert follower.stream_task is None
+        monkeypatch.setattr(cluster, "is_leader", lambda: True)
+        await asyncio.sleep(0.01)
+        assert leader._active_symbols() == {"AAPL"}
+
+        ticks = []
+        follower.add_tick_listener(lambda s, d: ticks.append((s, d["price"])))
+        leader._publish("market_ticks", {"ticks": {"AAPL": {"price": 1.0}}})
+        await asyncio.sleep(0.01)
+        assert ticks == [("AAPL", 1.0)]
+
+    asyncio.run(_run())
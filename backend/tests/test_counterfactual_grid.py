@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from app.cognitive.counterfactual import (
+    ActionType,
+    CounterfactualEngine,
+    Outcome,
+    TradingDecision,
+    simulate_counterfactual_grid,
+)
+
+
+def test_grid_matches_per_scenario_loop():
+    path = [101.0, 99.0, 104.0, 97.0]
+    grid = simulate_counterfactual_grid(
+        100.0, path, 10, size_multipliers=(0.5, 1.0, 2.0), horizons=(1, 3, 10)
+    )
+    assert grid.pnl.shape == (3, 3, 3)
+    for a, sign in enumerate((1, -1, 0)):
+        for s, mult in enumerate((0.5, 1.0, 2.0)):
+            for h, horizon in enumerate((1, 3, 10)):
+                exit_price = path[min(horizon, len(path)) - 1]
+                expected = sign * (exit_price - 100.0) * 10 * mult
+                assert grid.pnl[a, s, h] == pytest.approx(expected)
+    assert grid.alternative_pnls().size == 2 * 9 + 1
+    assert grid.best_variant(ActionType.SELL) == (2, 2)  # double size, exit at 97
+    with pytest.raises(ValueError):
+        simulate_counterfactual_grid(100.0, [], 10)
+
+
+def test_analysis_uses_grid_when_price_path_is_given():
+    engine = CounterfactualEngine(
+        enable_shadow_portfolios=False, holding_horizons=(1, 2, 4), bar_hours=0.5
+    )
+    decision = TradingDecision(
+        timestamp="2024-01-02T14:30:00",
+        ticker="AAPL",
+        action=ActionType.BUY,
+        quantity=100,
+        entry_price=100.0,
+        market_regime="RiskOn",
+        confidence=0.7,
+        reasoning=["test"],
+    )
+    outcome = Outcome("AAPL_1", "2024-01-02T16:30:00", 101.0, 100.0, 1.0, 2.0)
+    path = np.array([102.0, 103.0, 101.0, 101.0])
+
+    analysis = engine.analyze_decision(decision, outcome, {}, price_path=path)
+    assert analysis.best_alternative == ActionType.BUY
+    assert analysis.regret_score == pytest.approx(300 * 2 - 100)  # 2x size, 2 bars
+    best = max(analysis.counterfactuals, key=lambda cf: cf.simulated_outcome.pnl)
+    assert best.alternative_quantity == 200.0
+    assert best.simulated_outcome.holding_period_hours == 1.0
+    dist = analysis.regret_distribution
+    assert dist["n_alternatives"] == 2 * 5 * 3 + 1
+    assert dist["max"] == pytest.approx(analysis.regret_score)
+    assert 0.0 < dist["prob_better"] < 1.0
+
+    # Without a path the three point estimates still feed the distribution
+    fallback = engine.analyze_decision(decision, outcome, {"AAPL": 101.0})
+    assert fallback.regret_distribution["n_alternatives"] == 3
@@ -0,0 +1,135 @@
+import json
+from collections import deque
+
+import pytest
+
+from app.cognitive.counterfactual import (
+    ActionType,
+    CounterfactualEngine,
+    Outcome,
+    TradingDecision,
+)
+
+
+def _decision(i, ticker="AAPL", regime="RiskOn", action=ActionType.BUY):
+    return TradingDecision(
+        timestamp=f"2024-01-02T14:{i:02d}:00",
+        ticker=ticker,
+        action=action,
+        quantity=10,
+        entry_price=100.0,
+        market_regime=regime,
+        confidence=0.6,
+        reasoning=["test"],
+    )
+
+
+def _outcome(pnl):
+    return Outcome(
+        decision_id="x",
+        exit_timestamp="2024-01-02T16:00:00",
+        exit_price=100.0 + pnl / 10,
+        pnl=pnl,
+        pnl_percent=pnl / 10,
+        holding_period_hours=2.0,
+    )
+
+
+def test_bounded_history_keeps_full_aggregates_and_spills_evictions():
+    batches = []
+    engine = CounterfactualEngine(
+        max_history=4, spill_batch_size=3, spill_sink=batches.append
+    )
+    reference = CounterfactualEngine(max_history=100, spill_sink=batches.append)
+    cases = [
+        ("AAPL", "RiskOn", ActionType.BUY, -50.0, 95.0),
+        ("MSFT", "RiskOff", ActionType.SELL, 20.0, 97.0),
+        ("AAPL", "RiskOff", ActionType.HOLD, 0.0, 103.0),
+    ] * 4
+    for i, (ticker, regime, action, pnl, price) in enumerate(cases):
+        for eng in (engine, reference):
+            eng.analyze_decision(
+                _decision(i, ticker, regime, action), _outcome(pnl), {ticker: price}
+            )
+
+    assert len(engine.analyses) == 4
+    assert [len(b) for b in batches] == [3, 3]
+    assert engine.flush_spill() == 2 and engine.spilled_count == 8
+    spilled = [
+        event["counterfactual"]["decision_id"] for batch in batches for event in batch
+    ]
+    assert spilled == [a.decision_id for a in list(reference.analyses)[:8]]
+
+    insights = engine.get_aggregate_insights()
+    assert insights["decisions_analyzed"] == 12
+    assert insights["by_action"]["buy"]["decisions_analyzed"] == 4
+    by_regime = engine.get_regret_breakdown("regime")
+    assert by_regime["RiskOn"]["total_regret"] + by_regime["RiskOff"][
+        "total_regret"
+    ] == pytest.approx(insights["total_regret"])
+    aapl = engine.get_regret_breakdown("ticker", "AAPL")
+    assert aapl["decisions_analyzed"] == 8
+    assert aapl["total_opportunity_cost"] == pytest.approx(
+        sum(
+            a.total_opportunity_cost
+            for a in reference.analyses
+            if a.actual_decision.ticker == "AAPL"
+        )
+    )
+    assert (
+        "Strategy may not be optimal for RiskOn regime"
+        in insights["most_common_lessons"]
+    )
+    with pytest.raises(ValueError):
+        engine.get_regret_breakdown("strategy")
+
+
+def test_default_sink_writes_to_event_store(tmp_path, monkeypatch):
+    path = tmp_path / "events.jsonl"
+    monkeypatch.setenv("EVENT_STORE_PATH", str(path))
+    engine = CounterfactualEngine(max_history=1, spill_batch_size=1)
+    for i in range(3):
+        engine.analyze_decision(_decision(i), _outcome(10.0), {"AAPL": 101.0})
+
+    events = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [e["event_type"] for e in events] == ["counterfactual_analysis"] * 2
+    analysis = events[0]["counterfactual"]
+    assert analysis["ticker"] == "AAPL" and analysis["decision"]["action"] == "buy"
+    # Nothing at the top level that decision-event readers match on
+    assert not {"ticker", "decision", "outcome"} & set(events[0])
+
+
+def test_hub_shutdown_flushes_partial_spill_batch(tmp_path):
+    from app.cognitive.cognitive_hub import CognitiveHub
+
+    hub = CognitiveHub(
+        data_dir=tmp_path, enable_meta_learning=False, enable_episodic_memory=False
+    )
+    batches = []
+    engine = hub.counterfactual_engine
+    engine.analyses = deque(maxlen=1)
+    engine.spill_sink = batches.append
+    for i in range(3):
+        engine.analyze_decision(_decision(i), _outcome(10.0), {"AAPL": 101.0})
+    assert batches == [] and len(engine._spill_buffer) == 2
+
+    hub.shutdown()
+    assert [len(b) for b in batches] == [2] and engine._spill_buffer == []
+
+
+def test_failed_spill_is_dropped_and_shadow_history_is_bounded():
+    def _broken(batch):
+        raise OSError("disk full")
+
+    engine = CounterfactualEngine(max_history=1, spill_batch_size=1, spill_sink=_broken)
+    for i in range(5):
+        engine.analyze_decision(_decision(i), _outcome(10.0), {"AAPL": 101.0})
+    assert engine.spilled_count == 0 and engine._spill_buffer == []
+
+    portfolio = engine.shadow_portfolios["half_size"]
+    assert portfolio.trade_history.maxlen == 1000
+    assert portfolio.execute_trade("AAPL", ActionType.SELL, 25.0, 110.0, "t")
+    assert "AAPL" not in portfolio.positions
+    perf = engine.get_shadow_portfolio_performance({})
+    assert perf["half_size"]["win_rate"] == 1.0
+    assert perf["always_buy"]["win_rate"] == 0.0  # buys only, no closed trades
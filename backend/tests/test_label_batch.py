@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from app.paper.features import PriceData
+from app.paper.labels import LabelGenerator, TradeLabel
+
+T0 = datetime(2024, 1, 2, 14, 30)
+
+
+def _bar(symbol, minute, close):
+    return PriceData(
+        timestamp=T0 + timedelta(minutes=minute),
+        symbol=symbol,
+        open_price=close,
+        high=close,
+        low=close,
+        close=close,
+        volume=1000,
+    )
+
+
+def _reference_label(gen, history, symbol, entry_time, entry_price, side):
+    """The original per-trade linear-scan labeling."""
+
+    def closest(target):
+        diffs = [abs((p.timestamp - target).total_seconds()) for p in history]
+        return diffs.index(min(diffs)) if diffs else None
+
+    label = TradeLabel(symbol, entry_time, entry_price, side)
+    entry_idx = closest(entry_time)
+    if entry_idx is None:
+        return label
+    sign = 1 if side == "BUY" else -1
+    for h in gen.horizons_mins:
+        idx = closest(entry_time + timedelta(minutes=h))
+        if idx is not None and idx > entry_idx:
+            ret = sign * (history[idx].close - entry_price) / entry_price
+            setattr(label, f"return_{h}m", ret)
+            setattr(label, f"direction_{h}m", gen._classify_direction(ret))
+    if entry_idx < len(history) - 1:
+        exc = [
+            sign * (p.close - entry_price) / entry_price
+            for p in history[entry_idx + 1 :]
+        ]
+        label.max_favorable_excursion = max(0.0, max(exc))
+        label.max_adverse_excursion = abs(min(0.0, min(exc)))
+    return label
+
+
+def test_batch_labels_match_linear_scan_reference():
+    rng = np.random.default_rng(3)
+    gen = LabelGenerator(max_history=200)
+    for symbol in ("AAPL", "MSFT"):
+        price = 100.0
+        for minute in range(450):  # compacts the 2x max_history buffer
+            price *= 1 + float(rng.normal(0, 0.002))
+            gen.add_price_data(_bar(symbol, minute, price))
+    gen.add_price_data(_bar("AAPL", 400.5, 99.0))  # late, out-of-order bar
+
+    trades = [
+        (
+            str(rng.choice(["AAPL", "MSFT", "NONE"])),
+            T0 + timedelta(minutes=float(rng.uniform(240, 460))),
+            float(rng.uniform(95, 105)),
+            str(rng.choice(["BUY", "SELL"])),
+        )
+        for _ in range(300)
+    ]
+    labels = gen.generate_trade_labels(trades)
+
+    for trade, label in zip(trades, labels):
+        history = sorted(gen.price_history.get(trade[0], []), key=lambda p: p.timestamp)
+        assert label == _reference_label(gen, history, *trade)
+
+
+def test_pending_labels_resolve_when_horizon_elapses():
+    gen = LabelGenerator(horizons_mins=[5, 15])
+    for minute in range(10):
+        gen.add_price_data(_bar("AAPL", minute, 100.0 + minute))
+
+    gen.enqueue_trade("AAPL", T0, 100.0, "BUY")
+    gen.enqueue_trade("STALE", T0, 50.0, "SELL")
+    assert gen.resolve_pending() == []
+    assert gen.pending_count == 2
+
+    for minute in range(10, 16):
+        gen.add_price_data(_bar("AAPL", minute, 100.0 + minute))
+    (label,) = gen.resolve_pending()
+    assert label.symbol == "AAPL"
+    assert label.return_5m == 0.05 and label.return_15m == 0.15
+    assert label.direction_15m == "up"
+    assert label.max_favorable_excursion == 0.15
+    assert gen.pending_count == 1
+
+    # A stalled feed resolves after the grace period with whatever it has
+    (stale,) = gen.resolve_pending(now=T0 + timedelta(minutes=21))
+    assert stale.symbol == "STALE" and stale.return_5m is None
+    assert gen.pending_count == 0
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("sklearn")
+
+from app.services.learner import StrictLearner, create_default_rule_set
+
+
+def _trades(n=600, seed=4):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "realized_pnl": rng.normal(3, 25, n),
+            "predicted_prob": rng.uniform(0.3, 0.8, n),
+            "timestamp": np.linspace(1_700_000_000, 1_700_000_000 + 86400 * 60, n),
+        }
+    )
+
+
+def _learner(tmp_path, monkeypatch, **kwargs):
+    monkeypatch.chdir(tmp_path)
+    learner = StrictLearner(bootstrap_seed=7, **kwargs)
+    monkeypatch.setattr(learner, "load_recent_data", lambda: _trades())
+    return learner
+
+
+def test_parallel_scoring_matches_serial(tmp_path, monkeypatch):
+    serial = _learner(tmp_path, monkeypatch, parallel_workers=0)
+    parallel = _learner(tmp_path, monkeypatch, parallel_workers=2)
+    candidates = serial.generator.generate_candidates(create_default_rule_set())[:6]
+    train_df, valid_df, _ = serial.split_data_chronologically(_trades())
+
+    expected = serial.score_candidates(candidates, train_df, valid_df)
+    got = parallel.score_candidates(candidates, train_df, valid_df)
+    assert [s[0] for s in got] == [s[0] for s in expected]
+    assert [s[1].to_dict() for s in got] == [s[1].to_dict() for s in expected]
+
+    result = parallel.learn_iteration(create_default_rule_set())
+    assert result.candidate_version.startswith("v1.0_default_mod_")
+
+
+def test_hard_constraint_failure_skips_evaluation(tmp_path, monkeypatch):
+    learner = _learner(tmp_path, monkeypatch, parallel_workers=2)
+    learner.gates.max_daily_turnover_cap = 1.0  # ~10 trades/day in the split
+
+    def _fail(*args):
+        raise AssertionError("candidate evaluated after provable failure")
+
+    monkeypatch.setattr(learner, "evaluate_candidate_on_split", _fail)
+    result = learner.learn_iteration(create_default_rule_set())
+    assert result.candidate_version == "no_valid_candidates"
@@ -0,0 +1,70 @@
+"""Tests for batched quote polling and fixed-cadence streaming."""
+
+import asyncio
+
+import pandas as pd
+
+import app.services.provider_factory as provider_factory
+from app.core.config.time_tuning import QUEUE_LIMITS
+from app.core.websocket import ConnectionManager, MarketDataStreamer
+
+
+class FakeProvider:
+    def __init__(self, delay: float = 0.0):
+        self.calls: list[list[str]] = []
+        self.delay = delay
+
+    async def fetch_ohlc(self, symbols, period_days=3, adjusted=True):
+        self.calls.append(list(symbols))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return {s: pd.DataFrame({"Close": [100.0, 101.0]}) for s in symbols}
+
+
+def test_batch_quotes_use_one_call_per_chunk(monkeypatch):
+    provider = FakeProvider()
+    monkeypatch.setattr(provider_factory, "get_price_provider", lambda: provider)
+    monkeypatch.setitem(QUEUE_LIMITS, "market_stream_chunk_size", 10)
+
+    async def _run():
+        streamer = MarketDataStreamer(ConnectionManager())
+        symbols = [f"S{i}" for i in range(25)]
+
+        quotes = await streamer._get_market_data_batch(symbols)
+        assert set(quotes) == set(symbols)
+        assert quotes["S0"]["price"] == 101.0
+        assert quotes["S0"]["change"] == 1.0
+        assert sorted(len(c) for c in provider.calls) == [5, 10, 10]
+
+        # Fresh quotes come from the TTL cache without another provider call
+        await streamer._get_market_data_batch(symbols)
+        assert len(provider.calls) == 3
+
+        enhanced = streamer._enhance_market_data_batch(quotes)
+        assert set(enhanced) == set(symbols)
+        assert all(d["brain_enhanced"] for d in enhanced.values())
+
+    asyncio.run(_run())
+
+
+def test_stream_loop_reports_overruns(monkeypatch):
+    provider = FakeProvider(delay=0.05)
+    monkeypatch.setattr(provider_factory, "get_price_provider", lambda: provider)
+
+    async def _run():
+        cm = ConnectionManager()
+        streamer = MarketDataStreamer(cm)
+        streamer.interval = 0.02
+        streamer._quote_ttl = 0.0
+        await streamer.start_streaming(["AAA", "BBB"])
+        await asyncio.sleep(0.2)
+        await streamer.stop_streaming()
+        await cm.stop()
+
+        stats = streamer.get_stream_stats()
+        assert stats["passes"] >= 2
+        assert stats["overruns"] >= 1
+        assert stats["ticks_skipped"] >= stats["overruns"]
+        assert stats["last_pass_ms"] >= 40.0
+
+    asyncio.run(_run())
@@ -0,0 +1,145 @@
+import json
+
+import numpy as np
+import pytest
+
+from app.cognitive.meta_learner import (
+    LearningStrategy,
+    LearningStrategyType,
+    MetaLearner,
+)
+
+
+def _records(learner):
+    return {
+        name: {k: v for k, v in s.to_dict().items() if k != "created_at"}
+        for name, s in learner.strategies.items()
+        if s.total_predictions or s.generation
+    }
+
+
+def _reference_select(learner, regime):
+    """The original per-object selection loop."""
+    best, best_score = None, -float("inf")
+    for strategy in learner.strategies.values():
+        regime_data = strategy.regime_performance.get(regime, {})
+        if regime_data.get("predictions", 0) < learner.min_strategy_samples:
+            score = strategy.accuracy
+        else:
+            score = regime_data.get("accuracy", 0.0)
+        bonus = 0.1 * np.sqrt(
+            learner.min_strategy_samples / max(regime_data.get("predictions", 1), 1)
+        )
+        if score + bonus > best_score:
+            best, best_score = strategy.name, score + bonus
+    return best
+
+
+def test_vectorized_selection_matches_object_loop(tmp_path):
+    learner = MetaLearner(
+        strategies_dir=tmp_path, evolution_frequency=10_000, min_strategy_samples=5
+    )
+    rng = np.random.default_rng(4)
+    names = list(learner.strategies)
+    for _ in range(300):
+        learner.update_strategy_performance(
+            str(rng.choice(names)),
+            correct=bool(rng.random() < 0.55),
+            profit=float(rng.normal()),
+            regime=str(rng.choice(["RiskOn", "RiskOff", "Chop"])),
+        )
+
+    for regime in ("RiskOn", "RiskOff", "Chop", "Panic"):
+        assert learner.select_strategy(regime).name == _reference_select(
+            learner, regime
+        )
+
+    strategy = learner.get_strategy(names[0])
+    perf = strategy.regime_performance["RiskOn"]
+    assert perf["accuracy"] == perf["correct"] / perf["predictions"]
+    assert strategy.total_predictions == sum(
+        p["predictions"] for p in strategy.regime_performance.values()
+    )
+
+
+def test_evolution_crossover_and_pruning(tmp_path):
+    learner = MetaLearner(
+        strategies_dir=tmp_path, evolution_frequency=10, mutation_rate=0.0, seed=1
+    )
+    for _ in range(10):
+        learner.update_strategy_performance(
+            "momentum_aggressive", correct=True, profit=1.0, regime="RiskOn"
+        )
+    child = next(s for s in learner.strategies.values() if s.generation == 1)
+
+    # Top two by accuracy: momentum_aggressive, then the first untried strategy
+    assert child.parent_strategies == ["momentum_aggressive", "contrarian_conservative"]
+    assert child.parameters == {
+        "learning_rate": pytest.approx(0.055),
+        "lookback_period": 12,  # integers stay integers
+        "confidence_threshold": pytest.approx(0.675),
+    }
+    assert child.strategy_type.value == "momentum"
+
+    for _ in range(150):
+        learner.update_strategy_performance(
+            "balanced_default", correct=False, profit=-1.0, regime="Chop"
+        )
+    assert len(learner.strategies) <= 10
+    assert {
+        "momentum_aggressive",
+        "contrarian_conservative",
+        "balanced_default",
+        "volatility_adaptive",
+    } <= set(learner.strategies)
+    assert learner.get_strategy("balanced_default").total_predictions == 150
+
+
+def test_mutation_respects_parameter_kinds(tmp_path):
+    learner = MetaLearner(
+        strategies_dir=tmp_path, evolution_frequency=10_000, mutation_rate=1.0, seed=3
+    )
+    learner.add_strategy(
+        LearningStrategy(
+            name="kinds",
+            strategy_type=LearningStrategyType.BALANCED,
+            parameters={"use_filter": True, "window": 5, "decay": 0.5},
+        )
+    )
+    row = learner._index["kinds"]
+    for _ in range(20):
+        learner._mutate_strategy(row)
+
+    params = learner.get_strategy("kinds").parameters
+    assert params["use_filter"] is True  # booleans are never mutated
+    assert type(params["window"]) is int and params["window"] >= 1
+    assert type(params["decay"]) is float and params["decay"] != 0.5
+
+
+def test_generation_deltas_are_appended_and_replayed(tmp_path):
+    learner = MetaLearner(strategies_dir=tmp_path, evolution_frequency=5, seed=2)
+    for i in range(80):
+        learner.update_strategy_performance(
+            "volatility_adaptive", correct=i % 3 != 0, profit=2.0, regime="RiskOn"
+        )
+    learner._save_strategies()
+
+    journal = tmp_path / "strategies.jsonl"
+    lines = journal.read_text().splitlines()
+    assert len(lines) == 16  # one delta per evolution; nothing left to save
+    first = json.loads(lines[0])
+    assert {s["name"] for s in first["upserts"]} >= {"volatility_adaptive"}
+    assert any(json.loads(line)["removed"] for line in lines)
+
+    restored = MetaLearner(strategies_dir=tmp_path)
+    assert restored.get_status()["strategies"] == learner.get_status()["strategies"]
+    assert _records(restored) == _records(learner)
+
+    # Compaction rewrites the journal as one full snapshot that replays the same
+    learner.journal_compact_every = 1
+    learner.update_strategy_performance(
+        "volatility_adaptive", correct=True, profit=1.0, regime="Chop"
+    )
+    learner._save_strategies()
+    assert len(journal.read_text().splitlines()) == 1
+    assert _records(MetaLearner(strategies_dir=tmp_path)) == _records(learner)
@@ -0,0 +1,115 @@
+from app.services import news_nlp
+
+
+ARTICLES = [
+    {"title": "Apple beats earnings estimates", "url": "u1"},
+    {"title": "Tesla faces SEC probe over disclosures", "url": "u2"},
+    {"title": ""},
+    {"title": "Apple beats earnings estimates", "url": "u3"},
+    {"title": "Microsoft unveils new product line", "url": "u4"},
+]
+
+
+def test_batch_matches_serial_results_in_input_order():
+    news_nlp.clear_score_cache()
+    serial = news_nlp.analyze_news_batch(ARTICLES, persist_triples=False)
+    batched = news_nlp.analyze_news_batch_parallel(ARTICLES, persist_triples=False)
+
+    assert batched["processed_count"] == serial["processed_count"] == 4
+    assert batched["tickers_found"] == serial["tickers_found"]
+    assert batched["event_types"] == serial["event_types"]
+    assert batched["sentiment_distribution"] == serial["sentiment_distribution"]
+    for got, want in zip(batched["articles"], serial["articles"], strict=True):
+        assert got["headline"] == want["headline"]
+        assert got["tickers"] == want["tickers"]
+        assert got["sentiment"] == want["sentiment"]
+        assert got["event_type"] == want["event_type"]
+
+
+def test_batch_dedupes_and_memoizes_by_text_hash():
+    news_nlp.clear_score_cache()
+    first = news_nlp.analyze_news_batch_parallel(ARTICLES, persist_triples=False)
+    assert first["cache"]["unique_texts"] == 3
+    assert first["cache"]["duplicates"] == 1
+    assert first["cache"]["scored"] == 3
+
+    second = news_nlp.analyze_news_batch_parallel(ARTICLES, persist_triples=False)
+    assert second["cache"]["cache_hits"] == 3
+    assert second["cache"]["scored"] == 0
+    assert set(second["timings_ms"]) >= {"dedupe", "cache_lookup", "score", "total"}
+
+
+def test_batch_process_pool_preserves_order(monkeypatch):
+    news_nlp.clear_score_cache()
+    monkeypatch.setattr(news_nlp, "NLP_BATCH_MIN_PARALLEL", 1)
+    articles = [{"title": f"Nvidia headline number {i} beats"} for i in range(12)]
+    try:
+        result = news_nlp.analyze_news_batch_parallel(
+            articles, persist_triples=False, max_workers=2, chunk_size=3
+        )
+    finally:
+        news_nlp.shutdown_nlp_pool()
+
+    assert [a["headline"] for a in result["articles"]] == [a["title"] for a in articles]
+    assert result["cache"]["process_pool"] is True
+
+
+def test_batch_novelty_decays_within_batch_like_serial(tmp_path, monkeypatch):
+    from app.services import sentiment_state
+
+    burst = [
+        {"title": f"Apple beats earnings estimates in quarter {i}", "url": f"e{i}"}
+        for i in range(6)
+    ]
+    novelty = {}
+    for name, analyze in (
+        ("serial", news_nlp.analyze_news_batch),
+        ("batch", news_nlp.analyze_news_batch_parallel),
+    ):
+        monkeypatch.setenv("EVENT_STORE_PATH", str(tmp_path / f"{name}.jsonl"))
+        sentiment_state.reset_sentiment_state()
+        news_nlp.clear_score_cache()
+        result = analyze(burst, persist_triples=True)
+        novelty[name] = [a["novelty_scores"] for a in result["articles"]]
+    sentiment_state.reset_sentiment_state()
+
+    assert novelty["batch"] == novelty["serial"]
+    assert novelty["batch"][0]["AAPL"] == 1.0
+    assert novelty["batch"][-1]["AAPL"] < novelty["batch"][0]["AAPL"]
+
+
+def test_pool_is_resized_when_max_workers_changes():
+    try:
+        first = news_nlp._get_pool(2)
+        assert news_nlp._get_pool(2) is first
+        resized = news_nlp._get_pool(3)
+        assert resized is not first and resized._max_workers == 3
+    finally:
+        news_nlp.shutdown_nlp_pool()
+
+
+def test_batch_skips_poisoned_article_like_serial(monkeypatch):
+    real_extract = news_nlp.extract_entities_and_sentiment
+
+    def extract(text, date=None):
+        if "poison" in text.lower():
+            raise ValueError("bad article")
+        return real_extract(text, date)
+
+    monkeypatch.setattr(news_nlp, "extract_entities_and_sentiment", extract)
+    articles = [*ARTICLES, {"title": "Poison pill adopted", "url": "u5"}]
+    news_nlp.clear_score_cache()
+    serial = news_nlp.analyze_news_batch(articles, persist_triples=False)
+    batched = news_nlp.analyze_news_batch_parallel(
+        articles, persist_triples=False, max_workers=1
+    )
+
+    assert batched["processed_count"] == serial["processed_count"] == 4
+    assert [a["headline"] for a in batched["articles"]] == [
+        a["headline"] for a in serial["articles"]
+    ]
+    # Failed texts are not memoized, so they are retried on the next call
+    again = news_nlp.analyze_news_batch_parallel(
+        articles, persist_triples=False, max_workers=1
+    )
+    assert again["cache"]["scored"] == 1
@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+
+from app.paper.learner import OnlineLearner, ReplayBuffer, benchmark_inference
+
+
+def _batch(rng, n=16, dim=5):
+    X = rng.normal(size=(n, dim))
+    return X, (X[:, 0] + 0.3 * X[:, 1] > 0).astype(int)
+
+
+def test_replay_buffer_keeps_newest_rows_in_fixed_memory():
+    buf = ReplayBuffer(capacity=10)
+    for start in range(0, 27, 3):
+        rows = np.arange(start, start + 3, dtype=float)
+        buf.add(rows[:, None], rows, sample_weight=rows * 2)
+    X_before = buf.X
+
+    buf.add(np.arange(30, 44, dtype=float)[:, None], np.arange(30, 44))
+    assert buf.X is X_before  # no reallocation
+    assert len(buf) == 10
+    assert sorted(buf.y) == list(range(34, 44))
+    assert set(buf.w) == {1.0}
+
+    X, y, w = buf.sample(4, np.random.default_rng(0))
+    assert X.shape == (4, 1) and np.array_equal(X[:, 0], y)
+
+
+def test_sklearn_metrics_match_predict_without_second_pass():
+    pytest.importorskip("sklearn")
+    from sklearn.metrics import accuracy_score
+
+    rng = np.random.default_rng(1)
+    learner = OnlineLearner(backend="sklearn", buffer_size=64)
+    for _ in range(5):
+        X, y = _batch(rng)
+        w = rng.uniform(0.5, 2.0, len(y))
+        metrics = learner.partial_fit(X, y, sample_weight=w)
+        expected = accuracy_score(y, learner.predict(X).predictions, sample_weight=w)
+        assert metrics["accuracy"] == pytest.approx(expected)
+    assert len(learner.replay_buffer) == 64
+
+
+@pytest.mark.parametrize("backend", ["sklearn", "simple"])
+def test_replay_mode_trains_on_new_and_replayed_rows(backend, monkeypatch):
+    if backend == "sklearn":
+        pytest.importorskip("sklearn")
+    rng = np.random.default_rng(2)
+    learner = OnlineLearner(backend=backend, buffer_size=100, replay_batch_size=24)
+    fit_sizes = []
+    original = learner.model.partial_fit
+
+    def _spy(X, y, *args, **kwargs):
+        fit_sizes.append(len(X))
+        return original(X, y, *args, **kwargs)
+
+    monkeypatch.setattr(learner.model, "partial_fit", _spy)
+    for _ in range(4):
+        metrics = learner.partial_fit(*_batch(rng))
+
+    assert fit_sizes == [16, 32, 40, 40]
+    assert 0.0 <= metrics["accuracy"] <= 1.0
+    assert len(learner.training_metrics["accuracy"]) == 4
+
+
+@pytest.mark.parametrize("backend", ["sklearn", "simple"])
+def test_predict_batch_matches_per_row_predict_and_explain(backend):
+    if backend == "sklearn":
+        pytest.importorskip("sklearn")
+    rng = np.random.default_rng(3)
+    learner = OnlineLearner(backend=backend)
+    for _ in range(5):
+        learner.partial_fit(*_batch(rng, n=64))
+
+    X = rng.normal(size=(40, 5))
+    batch = learner.predict_batch(X)
+    buffer = learner._batch_buffer
+    for i, row in enumerate(X):
+        single = learner.predict(row.reshape(1, -1))
+        assert batch.predictions[i] == single.predictions[0]
+        np.testing.assert_allclose(batch.probabilities[i], single.probabilities[0])
+        explanation = learner.explain(row)
+        np.testing.assert_allclose(
+            batch.explanations["feature_importance"],
+            explanation["feature_importance"],
+        )
+        if "feature_contributions" in explanation:
+            np.testing.assert_allclose(
+                batch.explanations["feature_contributions"][i],
+                explanation["feature_contributions"],
+            )
+
+    learner.predict_batch(X[:7])
+    assert learner._batch_buffer is buffer  # input buffer reused
+
+
+def test_inference_benchmark_reports_both_paths():
+    learner = OnlineLearner(backend="simple")
+    rng = np.random.default_rng(4)
+    learner.partial_fit(*_batch(rng, n=64))
+    result = benchmark_inference(learner, rng.normal(size=(20, 5)), repeats=1)
+    assert result["rows"] == 20
+    assert result["per_row_ms"] > 0 and result["batch_ms"] > 0
+
+
+def test_torch_inference_threads_are_restored_after_predict_batch():
+    torch = pytest.importorskip("torch")
+    rng = np.random.default_rng(5)
+    learner = OnlineLearner(backend="torch", inference_threads=1)
+    learner.partial_fit(*_batch(rng, n=32))
+
+    before = torch.get_num_threads()
+    torch.set_num_threads(2)
+    try:
+        learner.predict_batch(rng.normal(size=(8, 5)), explain=False)
+        assert torch.get_num_threads() == 2
+    finally:
+        torch.set_num_threads(before)
+
+    assert OnlineLearner(backend="simple").inference_threads is None
@@ -0,0 +1,166 @@
+import asyncio
+
+import pytest
+
+from app.paper.engine import (
+    DelayQueue,
+    PaperEngine,
+    RunStatus,
+    Signal,
+    TokenBucket,
+    TradeRequest,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_reports_exact_wait():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=clock)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.5  # third token is due in 1/rate seconds
+    assert bucket.reserve() == 1.0
+    assert not bucket.try_acquire()
+
+    clock.now = 2.0
+    assert bucket.try_acquire()
+
+
+def test_token_bucket_refuses_reservations_past_max_wait():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1.0, capacity=1, clock=clock)
+
+    assert bucket.reserve(max_wait=2.0) == 0.0
+    assert bucket.reserve(max_wait=2.0) == 1.0
+    assert bucket.reserve(max_wait=2.0) == 2.0
+    assert bucket.reserve(max_wait=2.0) is None  # no further debt taken
+    assert bucket.tokens == -2.0
+
+    bucket.refund()
+    assert bucket.reserve(max_wait=2.0) == 2.0
+
+
+def test_delay_queue_is_bounded():
+    q = DelayQueue(maxsize=2)
+    q.put("a", key="A")
+    q.put("b", key="B")
+    assert q.full()
+    with pytest.raises(asyncio.QueueFull):
+        q.put("c", key="C")
+    assert len(q) == 2 and not q.pending("C")
+
+
+def test_delay_queue_pending_until_item_is_taken():
+    async def _run():
+        clock = FakeClock()
+        q = DelayQueue(clock=clock)
+        q.put("a1", delay=1.0, key="A")
+        clock.now = 5.0  # ready time has passed but a1 is still queued
+        still_pending = q.pending("A")
+        item = await q.get()
+        return still_pending, item, q.pending("A")
+
+    assert asyncio.run(_run()) == (True, "a1", False)
+
+
+def test_delay_queue_keeps_fifo_per_key():
+    async def _run():
+        q = DelayQueue()
+        q.put("a1", delay=0.05, key="A")
+        q.put("a2", delay=0.0, key="A")  # may not overtake a1
+        q.put("b1", delay=0.0, key="B")
+        return [await q.get() for _ in range(3)]
+
+    assert asyncio.run(_run()) == ["b1", "a1", "a2"]
+
+
+def test_engine_throttles_without_reordering_symbols():
+    async def _run():
+        engine = PaperEngine()
+        engine.status = RunStatus.RUNNING
+        engine.rate_limiter = TokenBucket(rate=100.0, capacity=2)
+        executed = []
+
+        async def _record(request):
+            executed.append(request.signal.features["n"])
+
+        engine._execute_trade = _record
+        for n in range(8):
+            signal = Signal(
+                theory_id="t",
+                symbol="AAPL" if n % 2 else "MSFT",
+                side="BUY",
+                confidence=0.5,
+                horizon_mins=5,
+                features={"n": n},
+            )
+            engine.trade_requests.put_nowait(
+                TradeRequest(signal=signal, notional=25.0, qty=1)
+            )
+
+        tasks = [
+            asyncio.create_task(engine._execute_trades()),
+            asyncio.create_task(engine._dispatch_delayed_trades()),
+        ]
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if len(executed) == 8:
+                break
+        engine.status = RunStatus.STOPPED
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return engine, executed
+
+    engine, executed = asyncio.run(_run())
+    assert sorted(executed) == list(range(8))
+    assert [n for n in executed if n % 2] == [1, 3, 5, 7]
+    assert [n for n in executed if not n % 2] == [0, 2, 4, 6]
+    assert engine.throttle_stats["throttled"] == 6
+    assert engine.throttle_stats["throttled_seconds"] > 0
+
+
+def test_engine_sheds_trades_when_delay_queue_is_full():
+    async def _run():
+        engine = PaperEngine(max_queue_size=2)
+        engine.status = RunStatus.RUNNING
+        engine.rate_limiter = TokenBucket(rate=1.0, capacity=1)
+        launched = []
+        engine._launch_trade = launched.append
+        for n in range(5):
+            signal = Signal(
+                theory_id="t",
+                symbol="AAPL",
+                side="BUY",
+                confidence=0.5,
+                horizon_mins=5,
+                features={"n": n},
+            )
+            engine.trade_requests.put_nowait(
+                TradeRequest(signal=signal, notional=25.0, qty=1)
+            )
+
+        task = asyncio.create_task(engine._execute_trades())
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if engine.trade_requests.empty():
+                break
+        engine.status = RunStatus.STOPPED
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        return engine, launched
+
+    engine, launched = asyncio.run(_run())
+    assert [r.signal.features["n"] for r in launched] == [0]
+    assert len(engine.delayed_trades) == 2
+    assert engine.throttle_stats["shed"] == 2
+    # Shed requests hand their token back: only the queued two are borrowed
+    assert engine.rate_limiter.tokens == pytest.approx(-2.0, abs=0.1)
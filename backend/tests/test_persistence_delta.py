@@ -0,0 +1,192 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models import base as models_base
+from app.persistence import models as pmodels
+from app.persistence import rehydrate, snapshotter
+from app.persistence import repository as repo
+
+
+class FakeEngine:
+    def __init__(self):
+        self.run_id = "run-1"
+        self.positions = {"AAPL": (10, 150.0), "MSFT": (5, 300.0)}
+        self.curve = []
+
+    def tick(self, i):
+        self.curve.append(
+            {"ts": f"2024-01-02T15:{i:02d}:00", "equity": 100.0 + i, "idx": i}
+        )
+
+    async def get_state(self):
+        return {
+            "run_id": self.run_id,
+            "params": {},
+            "positions": [
+                {"symbol": s, "qty": q, "avg_price": p}
+                for s, (q, p) in self.positions.items()
+            ],
+            "equity_curve": self.curve[-500:],
+        }
+
+
+class FakeAllocator:
+    def __init__(self):
+        self.arms = {"mean_revert": {"alpha": 1.0}, "breakout": {"alpha": 1.0}}
+
+    def get_state(self):
+        return {"algorithm": "thompson", "arms": json.loads(json.dumps(self.arms))}
+
+
+@pytest.fixture
+def worker(tmp_path, monkeypatch):
+    monkeypatch.setenv("AUDIT_LOG_PATH", str(tmp_path / "events.jsonl"))
+    monkeypatch.setenv("SNAPSHOT_DIR", str(tmp_path / "snapshots" / "x"))
+    monkeypatch.setenv("CHECKPOINT_FULL_EVERY", "3")
+    w = SimpleNamespace(engine=FakeEngine(), allocator=FakeAllocator(), learner=None)
+    monkeypatch.setattr(snapshotter, "get_paper_worker", lambda: w)
+    return w
+
+
+def _run_checkpoints(snap, w):
+    results = []
+    w.engine.tick(0)
+    results.append(asyncio.run(snap.checkpoint_once()))  # full
+    w.engine.tick(1)
+    w.engine.positions["AAPL"] = (12, 151.0)
+    w.allocator.arms["breakout"]["alpha"] = 2.0
+    results.append(asyncio.run(snap.checkpoint_once()))  # delta
+    w.engine.tick(2)
+    del w.engine.positions["MSFT"]
+    results.append(asyncio.run(snap.checkpoint_once()))  # delta
+    return results
+
+
+def test_delta_checkpoints_write_only_changes_and_replay(worker, monkeypatch):
+    monkeypatch.setattr(models_base, "SessionLocal", None)
+    snap = snapshotter.Snapshotter()
+    full, d1, d2 = _run_checkpoints(snap, worker)
+    snap.audit.flush()
+
+    assert full["full"] and not d1["full"] and not d2["full"]
+    assert d1["delta"]["pnl_points"] == 1
+    assert d1["delta"]["positions"] == 1
+    assert d1["delta"]["bandit_arms"] == 1
+    assert d2["delta"] == {
+        "pnl_points": 1,
+        "positions": 1,
+        "bandit_arms": 0,
+        "learner": 0,
+        "queues": 0,
+    }
+
+    events = list(snap.audit.replay_events())
+    assert [e["type"] for e in events] == [
+        "checkpoint",
+        "pnl",
+        "position",
+        "bandit",
+        "pnl",
+        "position",
+    ]
+    state = rehydrate.replay_audit_events(events)
+    assert state["positions"] == [{"symbol": "AAPL", "qty": 12, "avg_price": 151.0}]
+    assert [p["idx"] for p in state["equity_curve"]] == [0, 1, 2]
+    assert state["bandit"]["arms"] == worker.allocator.arms
+
+
+def test_delta_checkpoints_in_db_do_not_duplicate_history(worker, monkeypatch):
+    engine = create_engine("sqlite://")
+    tables = [
+        pmodels.PaperRun.__table__,
+        pmodels.Position.__table__,
+        pmodels.PnLPoint.__table__,
+        pmodels.BanditSnapshot.__table__,
+    ]
+    models_base.Base.metadata.create_all(engine, tables=tables)
+    Session = sessionmaker(bind=engine)
+    monkeypatch.setattr(models_base, "SessionLocal", Session)
+
+    snap = snapshotter.Snapshotter()
+    results = _run_checkpoints(snap, worker)
+    assert all(r["persisted"] for r in results)
+
+    # A restarted process reads the PnL high-water mark instead of re-appending
+    worker.engine.tick(3)
+    restarted = snapshotter.Snapshotter()
+    asyncio.run(restarted.checkpoint_once())
+
+    db = Session()
+    try:
+        assert [p.idx for p in repo.load_pnl_points(db, "run-1")] == [0, 1, 2, 3]
+        open_positions = {
+            p.symbol: p.qty for p in repo.load_positions(db, "run-1") if p.qty
+        }
+        assert open_positions == {"AAPL": 12}
+        chain = repo.load_bandit_since_full(db, "run-1")
+        assert [c.payload["kind"] for c in chain] == ["full"]
+        merged = rehydrate.merge_bandit_payloads(
+            [c.payload for c in repo.load_bandit_since_full(db, "run-1")]
+        )
+        assert merged["arms"] == worker.allocator.arms
+    finally:
+        db.close()
+
+
+def test_failed_db_write_is_retried_without_duplicating_history(worker, monkeypatch):
+    engine = create_engine("sqlite://")
+    tables = [
+        pmodels.PaperRun.__table__,
+        pmodels.Position.__table__,
+        pmodels.PnLPoint.__table__,
+        pmodels.BanditSnapshot.__table__,
+    ]
+    models_base.Base.metadata.create_all(engine, tables=tables)
+    Session = sessionmaker(bind=engine)
+    monkeypatch.setattr(models_base, "SessionLocal", Session)
+    snap = snapshotter.Snapshotter()
+
+    worker.engine.tick(0)
+    assert asyncio.run(snap.checkpoint_once())["persisted"]
+
+    # Positions and PnL points commit, then the bandit write fails mid-checkpoint
+    save_bandit = repo.save_bandit_snapshot
+
+    def failing_save(*args, **kwargs):
+        raise RuntimeError("db went away")
+
+    monkeypatch.setattr(repo, "save_bandit_snapshot", failing_save)
+    worker.engine.tick(1)
+    worker.engine.positions["AAPL"] = (12, 151.0)
+    worker.allocator.arms["breakout"]["alpha"] = 2.0
+    assert not asyncio.run(snap.checkpoint_once())["persisted"]
+
+    monkeypatch.setattr(repo, "save_bandit_snapshot", save_bandit)
+    worker.engine.tick(2)
+    del worker.engine.positions["MSFT"]
+    assert asyncio.run(snap.checkpoint_once())["persisted"]
+
+    db = Session()
+    try:
+        assert [p.idx for p in repo.load_pnl_points(db, "run-1")] == [0, 1, 2]
+        open_positions = {
+            p.symbol: p.qty for p in repo.load_positions(db, "run-1") if p.qty
+        }
+        assert open_positions == {"AAPL": 12}
+        merged = rehydrate.merge_bandit_payloads(
+            [c.payload for c in repo.load_bandit_since_full(db, "run-1")]
+        )
+        assert merged["arms"] == worker.allocator.arms
+    finally:
+        db.close()
+
+    # The audit log got each delta exactly once
+    snap.audit.flush()
+    state = rehydrate.replay_audit_events(list(snap.audit.replay_events()))
+    assert [p["idx"] for p in state["equity_curve"]] == [0, 1, 2]
+    assert state["bandit"]["arms"] == worker.allocator.arms
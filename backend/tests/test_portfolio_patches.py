@@ -0,0 +1,199 @@
+"""Tests for incremental portfolio state and event-driven patch streaming."""
+
+import asyncio
+import copy
+from types import SimpleNamespace
+from typing import cast
+
+import pytest
+
+from app.core.websocket import ConnectionManager
+from app.services.portfolio_streaming import PortfolioState, PortfolioStreamer
+from app.trading.models import Fill
+from app.trading.oms import OMS
+
+
+def _apply_ops(doc, ops):
+    for op in ops:
+        parts = op["path"].strip("/").split("/")
+        target = doc
+        for part in parts[:-1]:
+            target = target[part]
+        if op["op"] == "remove":
+            del target[parts[-1]]
+        else:
+            target[parts[-1]] = copy.deepcopy(op["value"])
+    return doc
+
+
+def _portfolio(cash=10_000.0):
+    return {
+        "total_value": cash,
+        "cash_balance": cash,
+        "daily_pnl": 0.0,
+        "market_value": 0.0,
+        "cost_basis": 0.0,
+        "unrealized_pnl": 0.0,
+        "realized_pnl": 0.0,
+    }
+
+
+def test_state_patches_replay_to_same_document():
+    state = PortfolioState()
+    state.load(_portfolio(), [])
+    state.mark_synced()
+    client = state.snapshot()
+
+    state.apply_fill("AAPL", "BUY", 10, 100.0)
+    ops = state.drain_ops()
+    assert {"op": "add", "path": "/positions/AAPL"} in [
+        {"op": o["op"], "path": o["path"]} for o in ops
+    ]
+    _apply_ops(client, ops)
+
+    assert state.apply_price("AAPL", 110.0)
+    assert not state.apply_price("MSFT", 50.0)
+    ops = state.drain_ops()
+    assert {o["path"] for o in ops} >= {
+        "/positions/AAPL/current_price",
+        "/positions/AAPL/market_value",
+        "/portfolio/total_value",
+    }
+    _apply_ops(client, ops)
+
+    state.apply_fill("AAPL", "SELL", 10, 110.0)
+    _apply_ops(client, state.drain_ops())
+
+    assert client == state.snapshot()
+    assert state.positions == {}
+    assert state.portfolio["realized_pnl"] == pytest.approx(100.0)
+    assert state.portfolio["total_value"] == pytest.approx(10_100.0)
+    assert state.portfolio["market_value"] == pytest.approx(0.0)
+    assert state.seq == 3
+
+
+def test_event_streaming_broadcasts_sequenced_patches(tmp_path):
+    sent = []
+    personal = []
+
+    async def broadcast_to_type(message, channel):
+        sent.append(message)
+
+    async def send_json_personal(message, websocket):
+        personal.append(message)
+
+    cm = SimpleNamespace(
+        broadcast_to_type=broadcast_to_type,
+        send_json_personal=send_json_personal,
+        set_metric=lambda *a: None,
+    )
+
+    async def _run():
+        streamer = PortfolioStreamer(connection_manager=cast(ConnectionManager, cm))
+        streamer.patch_debounce = 0.01
+
+        async def portfolio_data():
+            return _portfolio()
+
+        async def positions_data():
+            return []
+
+        streamer._get_portfolio_data = portfolio_data  # type: ignore[method-assign]
+        streamer._get_positions_data = positions_data  # type: ignore[method-assign]
+
+        oms = OMS(str(tmp_path / "oms.db"))
+        await streamer.start_event_streaming(oms=oms)
+
+        oms.record_fill(
+            Fill(order_id=1, symbol="MSFT", side="BUY", qty=5, avg_price=200)
+        )
+        await asyncio.sleep(0.1)
+        streamer.on_price_tick("MSFT", {"price": 210.0})
+        streamer.on_price_tick("TSLA", {"price": 1.0})
+        await asyncio.sleep(0.1)
+
+        await streamer.handle_client_message(None, {"action": "resync"})
+        await streamer.stop_streaming()
+        assert oms._fill_listeners == []
+        return streamer
+
+    streamer = asyncio.run(_run())
+
+    assert [m["type"] for m in sent] == ["portfolio_patch", "portfolio_patch"]
+    assert [m["seq"] for m in sent] == [1, 2]
+    assert sent[1]["base_seq"] == 1
+
+    snapshot = personal[-1]
+    assert snapshot["type"] == "portfolio_snapshot"
+    assert snapshot["seq"] == 2
+    assert snapshot["positions"]["MSFT"]["market_value"] == pytest.approx(1050.0)
+    assert streamer.state.portfolio["total_value"] == pytest.approx(10_050.0)
+
+
+def test_start_portfolio_streaming_events_mode_feeds_fills_and_held_ticks(
+    monkeypatch,
+):
+    from app.core import websocket
+    from app.services import portfolio_streaming
+    from app.trading import signals
+
+    manager = signals.TradingSignalsManager()
+    monkeypatch.setattr(signals, "_trading_manager", manager)
+    monkeypatch.setattr(portfolio_streaming, "portfolio_streamer", None)
+    monkeypatch.setenv("PORTFOLIO_STREAM_MODE", "events")
+
+    market = websocket.market_streamer
+    monkeypatch.setattr(market, "streaming_symbols", set())
+    monkeypatch.setattr(market, "_ensure_stream_task", lambda: None)
+
+    sent = []
+
+    async def broadcast_to_type(message, channel):
+        sent.append(message)
+
+    monkeypatch.setattr(
+        websocket.connection_manager, "broadcast_to_type", broadcast_to_type
+    )
+
+    async def _run():
+        await manager.enqueue_execute(
+            "s1", {"symbol": "AAPL", "side": "buy", "qty": 10, "limit_price": 150.0}
+        )
+        await portfolio_streaming.start_portfolio_streaming()
+        streamer = portfolio_streaming.portfolio_streamer
+        streamer.patch_debounce = 0.01
+        assert streamer.event_mode
+        assert set(streamer.state.positions) == {"AAPL"}
+        assert market.streaming_symbols == {"AAPL"}
+
+        # A paper fill on a new symbol patches the document and subscribes it
+        await manager.enqueue_execute(
+            "s2", {"symbol": "MSFT", "side": "buy", "qty": 5, "limit_price": 200.0}
+        )
+        await asyncio.sleep(0.1)
+        assert market.streaming_symbols == {"AAPL", "MSFT"}
+
+        market._deliver_remote_ticks({"MSFT": {"price": 210.0}})
+        await asyncio.sleep(0.1)
+
+        # Closing a position releases its symbol
+        await manager.enqueue_execute(
+            "s3", {"symbol": "AAPL", "side": "sell", "qty": 10, "limit_price": 155.0}
+        )
+        await asyncio.sleep(0.1)
+        assert market.streaming_symbols == {"MSFT"}
+
+        await portfolio_streaming.stop_portfolio_streaming()
+        return streamer
+
+    streamer = asyncio.run(_run())
+
+    patches = [m for m in sent if m["type"] == "portfolio_patch"]
+    assert [m["seq"] for m in patches] == [1, 2, 3]
+    assert "/positions/MSFT" in {op["path"] for op in patches[0]["ops"]}
+    assert {op["path"] for op in patches[2]["ops"]} >= {"/positions/AAPL"}
+    assert streamer.state.positions["MSFT"]["market_value"] == pytest.approx(1050.0)
+    assert "AAPL" not in streamer.state.positions
+    assert manager._fill_listeners == []
+    assert market.streaming_symbols == set()
+    assert streamer.on_price_tick not in market._tick_listeners
@@ -0,0 +1,80 @@
+import json
+import time
+
+import pytest
+
+from app.services import quarantine
+
+
+@pytest.fixture
+def qdir(tmp_path, monkeypatch):
+    monkeypatch.setattr(quarantine, "QUARANTINE_PATH", str(tmp_path))
+    return tmp_path
+
+
+def test_write_appends_to_segment_and_lists_from_index(qdir):
+    first = quarantine.write("ohlcv", "bad bar", {"close": -1}, {"ticker": "AAPL"})
+    second = quarantine.write("news", "empty title", {"title": "x" * 500})
+
+    assert not list(qdir.glob("*.json"))
+    assert len(list((qdir / "segments").glob("*.jsonl"))) == 1
+
+    entries = quarantine.list_recent()
+    assert [e["quarantine_id"] for e in entries] == [second, first]
+    assert entries[0]["payload_preview"].endswith("...")
+    assert len(entries[0]["payload_preview"]) == 203
+    assert entries[1]["metadata"] == {"ticker": "AAPL"}
+    assert "payload" not in entries[0]
+
+    only_news = quarantine.list_recent(dataset="news")
+    assert [e["quarantine_id"] for e in only_news] == [second]
+
+
+def test_get_by_id_reads_full_payload(qdir):
+    entry_id = quarantine.write("quotes", "crossed book", {"bid": 2, "ask": 1})
+
+    record = quarantine.get_by_id(entry_id)
+
+    assert record["reason"] == "crossed book"
+    assert json.loads(record["payload"]) == {"bid": 2, "ask": 1}
+    assert quarantine.get_by_id("missing") == {}
+
+
+def test_stats_and_cleanup_are_index_queries(qdir, monkeypatch):
+    quarantine.write("ohlcv", "a", {"v": 1})
+    quarantine.write("ohlcv", "b", {"v": 2})
+    quarantine.write("news", "c", {"v": 3})
+
+    stats = quarantine.get_stats()
+    assert stats["total_entries"] == 3
+    assert stats["datasets"] == {"ohlcv": 2, "news": 1}
+    assert stats["recent_24h"] == 3
+    assert stats["total_size_bytes"] > 0
+
+    assert quarantine.cleanup_old_entries(days=1) == 0
+    future = time.time() + 3 * 24 * 3600
+    monkeypatch.setattr(quarantine.time, "time", lambda: future)
+    assert quarantine.cleanup_old_entries(days=1) == 3
+    assert quarantine.get_stats()["total_entries"] == 0
+    assert not list((qdir / "segments").glob("*.jsonl"))
+
+
+def test_legacy_json_files_are_indexed(qdir):
+    legacy = qdir / "news_1700000000000_1.json"
+    legacy.write_text(
+        json.dumps(
+            {
+                "timestamp": "2023-11-14T22:13:20",
+                "dataset": "news",
+                "reason": "legacy",
+                "metadata": {},
+                "payload": "{}",
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    entries = quarantine.list_recent()
+
+    assert [e["quarantine_id"] for e in entries] == [legacy.stem]
+    assert quarantine.get_by_id(str(legacy))["reason"] == "legacy"
@@ -0,0 +1,160 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.memory import events
+from app.services import news_nlp, sentiment_state
+
+
+@pytest.fixture(autouse=True)
+def _fresh_state():
+    sentiment_state.reset_sentiment_state()
+    yield
+    sentiment_state.reset_sentiment_state()
+
+
+def _triple(ticker, event_type, polarity, strength, days_ago):
+    ts = (datetime.now(UTC) - timedelta(days=days_ago)).isoformat()
+    return {
+        "ts": ts.replace("+00:00", "Z"),
+        "ticker": ticker,
+        "event_type": "sentiment_triple",
+        "extracted_event_type": event_type,
+        "polarity": polarity,
+        "strength": strength,
+    }
+
+
+def _seed_store():
+    rows = [
+        _triple("AAPL", "earnings", "positive", 0.8, 0.5),
+        _triple("AAPL", "earnings", "negative", 0.4, 3.2),
+        _triple("AAPL", "legal", "negative", 0.6, 10.0),
+        _triple("AAPL", "product", "positive", 0.9, 40.0),  # outside both windows
+        _triple("MSFT", "earnings", "positive", 0.3, 1.0),
+    ]
+    for row in rows:
+        events.append_event(row)
+
+
+def test_streaming_aggregate_matches_store_scan():
+    _seed_store()
+    state = sentiment_state.get_sentiment_state()
+
+    streamed = news_nlp.aggregate_sentiment_with_decay("AAPL")
+    scanned = news_nlp._sentiment_result(
+        "AAPL",
+        state.half_life_days,
+        news_nlp._scan_sentiment_totals("AAPL", state.half_life_days),
+    )
+
+    assert state.cold_start is True
+    assert streamed["event_count"] == scanned["event_count"] == 3
+    assert streamed["aggregated_score"] == pytest.approx(
+        scanned["aggregated_score"], abs=1e-6
+    )
+    assert streamed["total_weight"] == pytest.approx(scanned["total_weight"], abs=1e-6)
+
+
+def test_novelty_uses_streaming_counts():
+    _seed_store()
+    assert news_nlp.calculate_novelty_score("AAPL", "earnings") == 0.6
+    assert news_nlp.calculate_novelty_score("AAPL", "product") == 1.0
+    assert news_nlp.calculate_novelty_score(
+        "AAPL", "earnings"
+    ) == news_nlp._novelty_from_count(
+        news_nlp._scan_similar_events(
+            "AAPL", "earnings", news_nlp.NLP_NOVELTY_WINDOW_DAYS
+        )
+    )
+
+
+def test_persist_updates_state_and_snapshot_survives_restart():
+    _seed_store()
+    before = news_nlp.aggregate_sentiment_with_decay("MSFT")
+
+    news_nlp.persist_sentiment_triple(
+        ticker="MSFT",
+        event_type="earnings",
+        polarity="negative",
+        strength=0.7,
+        novelty=1.0,
+        source_id="test",
+        headline="Microsoft misses",
+    )
+    after = news_nlp.aggregate_sentiment_with_decay("MSFT")
+    assert after["event_count"] == before["event_count"] + 1
+    assert after["aggregated_score"] < before["aggregated_score"]
+
+    sentiment_state.get_sentiment_state().save_snapshot()
+    events.append_event(_triple("MSFT", "earnings", "positive", 0.5, 0.1))
+
+    # Warm start: snapshot plus replay of the tail appended after it
+    sentiment_state.reset_sentiment_state()
+    restarted = news_nlp.aggregate_sentiment_with_decay("MSFT")
+    state = sentiment_state.get_sentiment_state()
+    assert state.cold_start is False
+    rescanned = news_nlp._scan_sentiment_totals("MSFT", state.half_life_days)
+    assert restarted["event_count"] == rescanned["event_count"] == 3
+    assert restarted["total_weight"] == pytest.approx(
+        rescanned["total_weight"], abs=1e-6
+    )
+
+
+@pytest.mark.parametrize("warm", [False, True])
+def test_first_persist_before_any_read_is_counted_once(warm):
+    _seed_store()
+    if warm:
+        news_nlp.aggregate_sentiment_with_decay("MSFT")  # writes the snapshot
+        sentiment_state.reset_sentiment_state()
+        events.append_event(_triple("MSFT", "earnings", "positive", 0.5, 0.2))
+
+    for strength in (0.7, 0.4):
+        news_nlp.persist_sentiment_triple(
+            ticker="MSFT",
+            event_type="earnings",
+            polarity="negative",
+            strength=strength,
+            novelty=1.0,
+            source_id="test",
+            headline="Microsoft misses",
+        )
+        state = sentiment_state.get_sentiment_state()
+        streamed = news_nlp.aggregate_sentiment_with_decay("MSFT")
+        scanned = news_nlp._scan_sentiment_totals("MSFT", state.half_life_days)
+        assert streamed["event_count"] == scanned["event_count"]
+        assert streamed["total_weight"] == pytest.approx(
+            scanned["total_weight"], abs=1e-6
+        )
+    assert state.cold_start is not warm
+
+
+def test_sqlite_store_replays_rows_written_after_snapshot(tmp_path, monkeypatch):
+    import threading
+
+    monkeypatch.setattr(events, "MODE", "SQLITE")
+    monkeypatch.setattr(events, "SQLITE_PATH", str(tmp_path / "events.db"))
+    monkeypatch.setattr(events, "_local", threading.local())
+    sentiment_state.reset_sentiment_state()
+
+    for strength in (0.2, 0.4, 0.6, 0.8, 0.9):
+        news_nlp.persist_sentiment_triple(
+            ticker="NVDA",
+            event_type="earnings",
+            polarity="positive",
+            strength=strength,
+            novelty=1.0,
+            source_id="test",
+            headline="Nvidia beats",
+        )
+    assert sentiment_state.get_sentiment_state().store_kind == "sqlite"
+
+    # Restart: the snapshot predates the five rows, which must be replayed
+    sentiment_state.reset_sentiment_state()
+    restarted = news_nlp.aggregate_sentiment_with_decay("NVDA")
+    state = sentiment_state.get_sentiment_state()
+    assert state.cold_start is False
+    scanned = news_nlp._scan_sentiment_totals("NVDA", state.half_life_days)
+    assert restarted["event_count"] == scanned["event_count"] == 5
+    assert restarted["total_weight"] == pytest.approx(scanned["total_weight"], abs=1e-6)
+    assert news_nlp.calculate_novelty_score("NVDA", "earnings") < 1.0
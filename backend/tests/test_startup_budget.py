@@ -0,0 +1,99 @@
+"""Startup import budget and lazy router registration."""
+
+import importlib
+import os
+import sys
+import types
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.import_profiler import parse_importtime, profile_import
+from app.core.router_auto import (
+    ROUTER_SPECS,
+    build_router_manifest,
+    install_lazy_routers,
+    load_router_manifest,
+)
+
+# Generous default so slow CI machines pass; tighten locally via the env var
+STARTUP_IMPORT_BUDGET_MS = float(os.getenv("STARTUP_IMPORT_BUDGET_MS", "4000"))
+HEAVY_MODULES = ("yfinance", "sklearn", "torch", "app.api.routes_market")
+
+
+def test_parse_importtime_lines():
+    output = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       100 |        100 |     b.sub",
+            "import time:       400 |        500 |   b",
+            "import time:        50 |        550 | a",
+        ]
+    )
+    report = parse_importtime(output, "a")
+    assert report.total_ms == 0.55
+    assert report.imported("b")
+    assert report.by_package() == {"b": 0.5, "a": 0.05}
+    assert report.top(1)[0].module == "b"
+
+
+def test_lazy_startup_stays_within_budget():
+    report = profile_import("app.main", env={"ROUTER_LOADING": "lazy"})
+    heavy = [m for m in HEAVY_MODULES if report.imported(m)]
+    assert heavy == [], report.format(15)
+    assert report.total_ms < STARTUP_IMPORT_BUDGET_MS, report.format(15)
+
+
+def _import_error(module_path):
+    try:
+        importlib.import_module(module_path)
+    except ImportError as e:
+        return e
+    return None
+
+
+def test_router_manifest_is_current():
+    manifest = load_router_manifest()
+    assert manifest is not None
+    assert [e["module"] for e in manifest["routers"]] == [m for m, _ in ROUTER_SPECS]
+
+    # Routers whose optional dependencies are missing here cannot be rebuilt;
+    # compare the ones that load and require the rest to fail on import only
+    built = build_router_manifest()
+    loaded = {e["module"] for e in built["routers"]}
+    skipped = [m for m, _ in ROUTER_SPECS if m not in loaded]
+    assert all(_import_error(m) for m in skipped), skipped
+    assert built["routers"] == [
+        e for e in manifest["routers"] if e["module"] in loaded
+    ], "Run `python -m app.core.router_auto --write-manifest`"
+
+
+def test_lazy_loader_registers_router_on_first_request(monkeypatch):
+    module = types.ModuleType("lazy_demo_routes")
+    module.router = APIRouter(prefix="/demo")
+
+    @module.router.get("/ping")
+    async def ping():
+        return {"pong": True}
+
+    monkeypatch.setitem(sys.modules, "lazy_demo_routes", module)
+    manifest = {
+        "version": 1,
+        "routers": [
+            {"module": "lazy_demo_routes", "prefix": "/x", "paths": ["/x/demo/ping"]}
+        ],
+    }
+
+    app = FastAPI()
+    loader = install_lazy_routers(app, [("lazy_demo_routes", "/x")], manifest)
+    assert loader is not None
+    client = TestClient(app)
+
+    assert client.get("/elsewhere").status_code == 404
+    assert loader.pending == ["lazy_demo_routes"]
+
+    response = client.get("/x/demo/ping")
+    assert response.status_code == 200
+    assert response.json() == {"pong": True}
+    assert loader.pending == []
+    assert "lazy_demo_routes" in loader.loaded
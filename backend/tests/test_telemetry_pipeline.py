@@ -0,0 +1,106 @@
+"""Tests for the columnar telemetry pipeline, spool and aggregation."""
+
+import json
+
+from app.services.telemetry import (
+    MetricAggregator,
+    TelemetryEmitter,
+    TelemetrySpool,
+    pack_columnar,
+)
+
+
+class FakeSink:
+    def __init__(self, accept=True):
+        self.accept = accept
+        self.payloads = []
+
+    def __call__(self, payload):
+        if self.accept:
+            self.payloads.append(payload)
+        return self.accept
+
+
+def _emitter(tmp_path, sink, **kwargs):
+    spool = TelemetrySpool(str(tmp_path / "spool.jsonl"), **kwargs)
+    return TelemetryEmitter(sink=sink, spool=spool, start=False)
+
+
+def test_pack_columnar_groups_by_event_type():
+    events = [
+        (1.0, "violation", {"kind": "a", "vendor": "x"}, {"c": 1}),
+        (2.0, "violation", {"kind": "b"}, {}),
+        (3.0, "brain_event", {"ok": True}, {}),
+    ]
+    batches = {b["event_type"]: b for b in pack_columnar(events)}
+
+    assert batches["violation"]["count"] == 2
+    assert batches["violation"]["ts"] == [1.0, 2.0]
+    assert batches["violation"]["data"] == {"kind": ["a", "b"], "vendor": ["x", None]}
+    assert batches["violation"]["metadata"] == {"c": [1, None]}
+    assert batches["brain_event"]["data"] == {"ok": [True]}
+
+
+def test_aggregator_drains_counters_and_histograms():
+    agg = MetricAggregator()
+    agg.increment("requests", tags={"vendor": "a"})
+    agg.increment("requests", 2, tags={"vendor": "a"})
+    for v in (3, 40, 700):
+        agg.observe("latency_ms", v)
+
+    series = {s["name"]: s for s in agg.drain()}
+    assert series["requests"]["value"] == 3
+    assert series["requests"]["tags"] == {"vendor": "a"}
+    hist = series["latency_ms"]
+    assert (hist["count"], hist["min"], hist["max"]) == (3, 3.0, 700.0)
+    assert sum(hist["buckets"]) == 3
+    assert agg.drain() == []
+
+
+def test_failed_batches_are_spooled_and_replayed(tmp_path):
+    sink = FakeSink(accept=False)
+    emitter = _emitter(tmp_path, sink)
+
+    emitter.emit("violation", {"kind": "stale"})
+    emitter.flush()
+    emitter.emit("violation", {"kind": "gap"})
+    emitter.flush()
+    assert emitter.stats["batches_spooled"] == 2
+    assert sink.payloads == []
+
+    sink.accept = True
+    emitter.emit("brain_event", {"ok": True})
+    emitter.flush()
+
+    kinds = [p["batches"][0]["data"].get("kind") for p in sink.payloads]
+    assert kinds == [None, ["stale"], ["gap"]]
+    assert emitter.stats["batches_replayed"] == 2
+    assert emitter.spool.pending_bytes() == 0
+
+
+def test_spool_rotation_drops_oldest(tmp_path):
+    spool = TelemetrySpool(str(tmp_path / "spool.jsonl"), max_bytes=200, max_files=2)
+    for i in range(20):
+        spool.append({"i": i, "pad": "x" * 40})
+
+    files = spool.files_oldest_first()
+    assert len(files) == 2
+    kept = [json.loads(line)["i"] for f in files for line in f.read_text().splitlines()]
+    assert kept == sorted(kept)
+    assert kept[-1] == 19
+    assert 0 not in kept
+
+
+def test_metric_metadata_is_shipped_as_series_exemplar():
+    agg = MetricAggregator()
+    agg.observe("latency_ms", 5, {"vendor": "a"}, {"endpoint": "/quote"})
+    agg.observe("latency_ms", 9, {"vendor": "a"}, {"endpoint": "/bars"})
+    agg.increment("requests", tags={"vendor": "a"}, exemplar={"status": 200})
+    agg.observe("latency_ms", 1, {"vendor": "b"})
+
+    series = {(s["name"], s["tags"]["vendor"]): s for s in agg.drain()}
+    assert series[("latency_ms", "a")]["exemplar"] == {"endpoint": "/bars"}
+    assert series[("requests", "a")]["exemplar"] == {"status": 200}
+    assert "exemplar" not in series[("latency_ms", "b")]
+    agg.observe("latency_ms", 2, {"vendor": "a"})
+    assert "exemplar" not in agg.drain()[0]
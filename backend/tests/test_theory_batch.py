@@ -0,0 +1,121 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from app.paper.theories import FeatureTable, MarketFeatures, theory_registry
+
+
+def _universe(n=400, seed=7):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for i in range(n):
+        price = float(rng.uniform(20, 200))
+        rows.append(
+            MarketFeatures(
+                symbol=f"S{i}",
+                timestamp=datetime(2024, 1, 2, 15, 30),
+                price=price,
+                open_price=price,
+                high=price * 1.01,
+                low=price * 0.99,
+                volume=int(rng.integers(0, 3)) * 1000,
+                sma_5=price * float(rng.uniform(0.97, 1.03)) * int(i % 17 != 0),
+                sma_20=price * float(rng.uniform(0.95, 1.05)) * int(i % 13 != 0),
+                rsi=float(rng.uniform(0, 100)),
+                bollinger_upper=price * float(rng.uniform(0.97, 1.05)),
+                bollinger_lower=price * float(rng.uniform(0.95, 1.03)),
+                atr=float(rng.uniform(0, 4)) * int(i % 7 != 0),
+                vol_regime=str(rng.choice(["low", "normal", "high"])),
+                trend_regime=str(rng.choice(["up", "down", "sideways"])),
+                news_sentiment=float(rng.uniform(-1, 1)),
+                news_urgency=float(rng.uniform(0, 1)),
+            )
+        )
+    return rows
+
+
+@pytest.mark.parametrize("theory_id", theory_registry.list_ids())
+def test_batch_matches_per_row_reference(theory_id):
+    theory = theory_registry.get(theory_id)
+    rows = _universe()
+    table = FeatureTable.from_features(rows)
+
+    expected = []
+    for features in rows:
+        risk = theory.risk_model(features)
+        for s in theory.generate_signals(features):
+            expected.append((s.symbol, s.side, s.confidence * risk, s.features))
+    got = [
+        (s.symbol, s.side, s.confidence, s.features)
+        for s in theory.evaluate_batch(table)
+    ]
+
+    assert expected, "fixture should trigger every theory"
+    key = lambda item: (item[0], item[1])  # noqa: E731
+    assert len(got) == len(expected)
+    for (sym, side, conf, feats), (esym, eside, econf, efeats) in zip(
+        sorted(got, key=key), sorted(expected, key=key)
+    ):
+        assert (sym, side) == (esym, eside)
+        assert conf == pytest.approx(econf)
+        assert feats == pytest.approx(efeats)
+
+
+def test_feature_table_columns():
+    rows = _universe(5)
+    table = FeatureTable.from_features(rows)
+    assert len(table) == 5
+    assert table["rsi"].dtype == np.float64
+    assert list(table["vol_regime"]) == [r.vol_regime for r in rows]
+
+
+@pytest.mark.parametrize("theory_id", ["mean_revert", "breakout"])
+def test_batch_skips_degenerate_rows_like_reference(theory_id):
+    theory = theory_registry.get(theory_id)
+    rows = _universe(40)
+    degenerate = [
+        (0.0, 100.0, 100.0),
+        (-5.0, 100.0, 100.0),
+        (100.0, 0.0, 0.0),
+        (100.0, np.inf, np.inf),
+        (100.0, np.nan, np.nan),
+        (np.inf, 100.0, 100.0),
+    ]
+    for i, (price, upper, lower) in enumerate(degenerate):
+        rows.append(
+            MarketFeatures(
+                symbol=f"D{i}",
+                timestamp=datetime(2024, 1, 2, 15, 30),
+                price=price,
+                open_price=100.0,
+                high=100.0,
+                low=100.0,
+                volume=1000,
+                sma_20=100.0,
+                rsi=(5.0, 95.0)[i % 2],
+                bollinger_upper=upper,
+                bollinger_lower=lower,
+            )
+        )
+    table = FeatureTable.from_features(rows)
+
+    expected = [
+        (s.symbol, s.side, s.confidence, s.features)
+        for features in rows
+        for s in theory.generate_signals(features)
+    ]
+    got = [
+        (s.symbol, s.side, s.confidence, s.features)
+        for s in theory.generate_signals_batch(table)
+    ]
+
+    assert not [item for item in got if item[0].startswith("D")]
+    key = lambda item: (item[0], item[1])  # noqa: E731
+    assert len(got) == len(expected)
+    for (sym, side, conf, feats), (esym, eside, econf, efeats) in zip(
+        sorted(got, key=key), sorted(expected, key=key), strict=True
+    ):
+        assert (sym, side) == (esym, eside)
+        assert conf == pytest.approx(econf)
+        assert feats == pytest.approx(efeats)
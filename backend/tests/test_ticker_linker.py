@@ -0,0 +1,44 @@
+from app.services.ticker_linker import FUZZY_MATCH_THRESHOLD, NameAutomaton, TickerLinker
+
+
+def test_automaton_finds_multi_word_names_at_word_boundaries():
+    automaton = NameAutomaton()
+    automaton.add(["bank", "of", "america"], "bank of america")
+    automaton.add(["america"], "america")
+    automaton.add(["meta"], "meta")
+    automaton.build()
+
+    found = automaton.find("shares of bank of america and metaverse".split())
+    assert found == {"bank of america", "america"}
+
+
+def test_map_org_to_tickers_resolves_names_aliases_and_subsidiaries():
+    linker = TickerLinker()
+    linker.add_mapping("Instagram", ["META"], mapping_type="subsidiary")
+
+    text = "Johnson & Johnson, Bank of America and Instagram moved; Apple Inc. rose"
+    assert linker.map_org_to_tickers(text) == ["AAPL", "BAC", "JNJ", "META"]
+
+
+def test_fuzzy_match_uses_index_with_same_results_as_full_scan():
+    linker = TickerLinker()
+    linker.add_mapping("Acme Widget Makers Ohio", ["ACME"])
+
+    name = "acme widget makers of ohio"
+    expected = {
+        ticker
+        for known, tickers in linker.exact_matches.items()
+        if linker._calculate_similarity(name, known) >= FUZZY_MATCH_THRESHOLD
+        for ticker in tickers
+    }
+    assert set(linker._fuzzy_match(name)) == expected == {"ACME"}
+
+
+def test_batch_api_preserves_input_order():
+    linker = TickerLinker()
+    texts = ["Microsoft earnings", "", "Nvidia and Tesla", "no companies here"]
+
+    results = linker.map_orgs_to_tickers_batch(texts)
+
+    assert results == [["MSFT"], [], ["NVDA", "TSLA"], []]
+    assert results == [linker.map_org_to_tickers(t) for t in texts]
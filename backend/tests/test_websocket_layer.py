@@ -1,24 +1,37 @@
 import asyncio
+import json
 from contextlib import suppress
 from typing import Any
 
-from app.core.websocket import ConnectionManager
+from app.core.websocket import ConflatingSubscriptions, ConnectionManager
 
 
 class DummyWebSocket:
-    def __init__(self, should_fail: bool = False):
+    def __init__(self, should_fail: bool = False, gate: asyncio.Event | None = None):
         self.accepted = False
         self.should_fail = should_fail
+        self.gate = gate
         self.sent: list[dict[str, Any]] = []
+        self.frames: list[bytes] = []
+        self.query_params: dict[str, str] = {}
 
     async def accept(self):
         self.accepted = True
 
     async def send_json(self, data: dict[str, Any]):
+        if self.gate is not None:
+            await self.gate.wait()
         if self.should_fail:
             raise RuntimeError("send failure")
         self.sent.append(data)
 
+    async def send_text(self, data: str):
+        await self.send_json(json.loads(data))
+
+    async def send_bytes(self, data: bytes):
+        self.frames.append(data)
+        await self.send_json(json.loads(data))
+
 
 def test_broadcast_prunes_failing_sockets():
     async def _run():
@@ -76,3 +89,111 @@ def test_queue_overflow_drops_messages():
         await asyncio.sleep(0.01)
 
     asyncio.run(_run())
+
+
+def test_broadcast_encodes_once_per_message(monkeypatch):
+    import app.core.websocket as ws_module
+
+    calls = []
+    real_encode = ws_module.encode_message
+
+    def counting_encode(payload):
+        calls.append(payload)
+        return real_encode(payload)
+
+    monkeypatch.setattr(ws_module, "encode_message", counting_encode)
+
+    async def _run():
+        cm = ConnectionManager()
+        ch = "fanout"
+        sockets = [DummyWebSocket() for _ in range(5)]
+        sockets[0].query_params = {"encoding": "binary"}
+        for ws in sockets:
+            await cm.connect(ws, ch)  # type: ignore[arg-type]
+
+        await cm.broadcast_to_type({"type": "tick", "price": 1.5}, ch)
+        await asyncio.sleep(0.05)
+
+        assert len(calls) == 1
+        assert all(ws.sent == [{"type": "tick", "price": 1.5}] for ws in sockets)
+        assert len(sockets[0].frames) == 1
+
+        stats = cm.get_connection_stats()["per_channel"][ch]
+        assert stats["broadcasts_attempted"] == 1
+        for key in ("encode_ms", "send_ms", "encode_ms_avg", "send_ms_avg"):
+            assert stats[key] >= 0.0
+        assert stats["bytes_encoded"] == len(sockets[0].frames[0])
+        await cm.stop()
+
+    asyncio.run(_run())
+
+
+def test_conflating_subscriptions_slow_client_gets_latest_delta():
+    async def _run():
+        cm = ConnectionManager()
+        subs = ConflatingSubscriptions(cm)
+        gate = asyncio.Event()
+        fast = DummyWebSocket()
+        slow = DummyWebSocket(gate=gate)
+        for ws in (fast, slow):
+            await cm.connect(ws, "market_data")  # type: ignore[arg-type]
+            subs.subscribe(ws, ["AAPL"])  # type: ignore[arg-type]
+
+        for price in (1.0, 2.0, 3.0):
+            subs.publish("AAPL", {"price": price, "volume": 10})
+            await asyncio.sleep(0.01)
+
+        # Fast client: snapshot then one delta per tick with changed fields only
+        assert fast.sent[0]["type"] == "market_data"
+        assert fast.sent[0]["data"] == {"price": 1.0, "volume": 10}
+        assert [m["changes"] for m in fast.sent[1:]] == [{"price": 2.0}, {"price": 3.0}]
+        assert slow.sent == []
+
+        # Slow client catches up with only the newest state
+        gate.set()
+        await asyncio.sleep(0.01)
+        assert [m["type"] for m in slow.sent] == ["market_data", "market_data_delta"]
+        assert slow.sent[1]["changes"] == {"price": 3.0}
+        assert slow.sent[1]["seq"] == 2
+        assert cm._metrics["market_data"]["conflated"] >= 1  # type: ignore[attr-defined]
+
+        # Per-client subscribers are excluded from the channel-wide fan-out
+        await cm.broadcast_to_type({"type": "legacy"}, "market_data")
+        await asyncio.sleep(0.01)
+        assert all(m.get("type") != "legacy" for m in fast.sent)
+
+        assert subs.unsubscribe(fast, ["AAPL"]) == set()  # type: ignore[arg-type]
+        assert subs.unsubscribe(slow) == {"AAPL"}  # type: ignore[arg-type]
+        await cm.stop()
+
+    asyncio.run(_run())
+
+
+def test_conflating_send_failure_releases_client_symbols():
+    async def _run():
+        cm = ConnectionManager()
+        released: list[list[str]] = []
+
+        async def _release(symbols: list[str]) -> None:
+            released.append(symbols)
+
+        subs = ConflatingSubscriptions(cm, on_release=_release)
+        healthy = DummyWebSocket()
+        broken = DummyWebSocket(should_fail=True)
+        for ws in (healthy, broken):
+            await cm.connect(ws, "market_data")  # type: ignore[arg-type]
+        subs.subscribe(healthy, ["AAPL"])  # type: ignore[arg-type]
+        subs.subscribe(broken, ["AAPL", "MSFT"])  # type: ignore[arg-type]
+
+        subs.publish("MSFT", {"price": 1.0})
+        await asyncio.sleep(0.01)
+
+        assert released == [["MSFT"]]
+        assert subs.symbols() == {"AAPL"}
+        assert subs.subscribers("AAPL") == 1
+        assert broken not in cm.connection_metadata
+        # The route's own cleanup on disconnect is now a no-op
+        assert subs.unsubscribe(broken) == set()  # type: ignore[arg-type]
+        await cm.stop()
+
+    asyncio.run(_run())